@@ -2,7 +2,8 @@
 """Load semantic coordinates into PostgreSQL.
 
 This script loads derived_coordinates.json into the word_coordinates table.
-Run after the database schema is created.
+Run after the database schema is created. Rows are streamed through COPY
+and merged in one upsert by docker/scripts/copy_pipeline.py.
 
 Usage:
     python 02_load_coordinates.py
@@ -17,6 +18,10 @@ import sys
 import psycopg2
 from pathlib import Path
 
+# Shared COPY pipeline (docker/scripts)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'scripts'))
+from copy_pipeline import CopyLoader, coordinate_rows
+
 
 def get_connection():
     """Get PostgreSQL connection."""
@@ -37,53 +42,15 @@ def load_coordinates(json_path: str):
         data = json.load(f)
 
     conn = get_connection()
-    cur = conn.cursor()
-
-    # Prepare batch insert
-    batch_size = 1000
-    batch = []
-    total = 0
-
-    for word, coords in data.items():
-        if isinstance(coords, dict):
-            A = coords.get('A', 0.0)
-            S = coords.get('S', 0.0)
-            tau = coords.get('tau', 2.5)
-        elif isinstance(coords, (list, tuple)) and len(coords) >= 3:
-            A, S, tau = coords[0], coords[1], coords[2]
-        else:
-            continue
-
-        batch.append((word.lower(), float(A), float(S), float(tau), 'json'))
-
-        if len(batch) >= batch_size:
-            cur.executemany("""
-                INSERT INTO word_coordinates (word, A, S, tau, source)
-                VALUES (%s, %s, %s, %s, %s)
-                ON CONFLICT (word) DO UPDATE
-                SET A = EXCLUDED.A, S = EXCLUDED.S, tau = EXCLUDED.tau, source = EXCLUDED.source
-            """, batch)
-            conn.commit()
-            total += len(batch)
-            print(f"  Loaded {total:,} words...")
-            batch = []
-
-    # Insert remaining
-    if batch:
-        cur.executemany("""
-            INSERT INTO word_coordinates (word, A, S, tau, source)
-            VALUES (%s, %s, %s, %s, %s)
-            ON CONFLICT (word) DO UPDATE
-            SET A = EXCLUDED.A, S = EXCLUDED.S, tau = EXCLUDED.tau, source = EXCLUDED.source
-        """, batch)
-        conn.commit()
-        total += len(batch)
-
-    cur.close()
+    loader = CopyLoader(conn, 'word_coordinates',
+                        columns=['word', 'a', 's', 'tau', 'source'],
+                        key=['word'], update=['a', 's', 'tau', 'source'],
+                        progress_every=10000)
+    stats = loader.load(coordinate_rows(data))
     conn.close()
 
-    print(f"Loaded {total:,} word coordinates into PostgreSQL")
-    return total
+    print(f"Loaded {stats['rows']:,} word coordinates into PostgreSQL")
+    return stats['rows']
 
 
 def main():
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""Streaming COPY pipeline shared by the PostgreSQL data loaders.
+
+Rows are streamed into a temporary staging table with COPY (no
+per-row statements), then merged into the target in one
+INSERT ... SELECT ... ON CONFLICT. Duplicate keys in the input are
+resolved like sequential upserts (the last row wins), so loads stay
+idempotent and can be rerun on a populated database.
+
+Fast path: with unique_keys=True (the input has no duplicate keys,
+e.g. a dump of the table itself) and an empty target (fresh or
+truncated), rows are COPYed straight into the target, skipping the
+staging table, the DISTINCT ON sort and the upsert.
+
+Used by init_postgres.py, load_data.py and
+init-scripts/postgres/02_load_coordinates.py. Needs only psycopg2.
+
+Usage:
+    from copy_pipeline import CopyLoader, coordinate_rows
+
+    loader = CopyLoader(conn, 'word_coordinates',
+                        columns=['word', 'a', 's', 'tau', 'source'],
+                        key=['word'], update=['a', 's', 'tau'])
+    stats = loader.load(coordinate_rows(data))      # Python rows
+    stats = loader.load_csv(open('table.csv'))      # CSV passthrough
+    print(stats['mode'], stats['rows_per_second'])  # 'direct' or 'merge'
+"""
+
+import csv
+import io
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+
+class _RowReader:
+    """File-like view of rows as CSV text, for cursor.copy_expert()."""
+
+    def __init__(self, chunks: Iterator[str]):
+        self._chunks = chunks
+        self._buffer = ''
+
+    def read(self, size: int = -1) -> str:
+        while size < 0 or len(self._buffer) < size:
+            try:
+                self._buffer += next(self._chunks)
+            except StopIteration:
+                break
+        if size < 0:
+            size = len(self._buffer)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+class CopyLoader:
+    """COPY rows into a staging table, then merge them into the target."""
+
+    def __init__(self, conn, table: str, columns: Sequence[str], key: Sequence[str],
+                 update: Optional[Sequence[str]] = None,
+                 progress_every: int = 100000, batch_rows: int = 5000,
+                 unique_keys: bool = False):
+        """Initialize loader.
+
+        Args:
+            conn: psycopg2 connection (committed after each load)
+            table: Target table
+            columns: Columns provided for each row, in order
+            key: Conflict key (unique constraint of the target)
+            update: Columns overwritten on conflict (None/empty = keep existing rows)
+            progress_every: Print progress every this many rows (0 = quiet)
+            batch_rows: Rows encoded per chunk handed to COPY
+            unique_keys: Input keys are unique: COPY straight into an empty target
+        """
+        self.conn = conn
+        self.table = table
+        self.columns = list(columns)
+        self.key = list(key)
+        self.update = list(update or [])
+        self.progress_every = progress_every
+        self.batch_rows = batch_rows
+        self.unique_keys = unique_keys
+        self.stage = f'_stage_{table}'
+        self._rows = 0
+        self._start = 0.0
+
+    # ========================================================================
+    # LOADING
+    # ========================================================================
+
+    def load(self, rows: Iterable[Sequence]) -> Dict:
+        """Stream Python rows (tuples aligned with columns) into the table."""
+        return self._run(_RowReader(self._encode(rows)))
+
+    def load_csv(self, f, header: bool = True) -> Dict:
+        """Stream a CSV file (columns in order) into the table without parsing it."""
+        if header:
+            next(f, None)
+        return self._run(_RowReader(self._count_lines(f)))
+
+    def _run(self, reader: _RowReader) -> Dict:
+        cols = ', '.join(self.columns)
+        self._rows = 0
+        self._start = time.perf_counter()
+
+        cur = self.conn.cursor()
+        try:
+            if self.unique_keys and self._is_empty(cur):
+                # Nothing to merge with: straight into the target
+                mode = 'direct'
+                cur.copy_expert(
+                    f"COPY {self.table} ({cols}) FROM STDIN WITH (FORMAT csv)",
+                    reader,
+                )
+                copied = time.perf_counter()
+                merged = self._rows
+            else:
+                mode = 'merge'
+                # Same column types as the target; _ord keeps input order for the merge
+                cur.execute(f"DROP TABLE IF EXISTS {self.stage}")
+                cur.execute(f"""
+                    CREATE TEMP TABLE {self.stage} ON COMMIT DROP AS
+                    SELECT {cols} FROM {self.table} WITH NO DATA
+                """)
+                cur.execute(f"ALTER TABLE {self.stage} ADD COLUMN _ord BIGSERIAL")
+
+                cur.copy_expert(
+                    f"COPY {self.stage} ({cols}) FROM STDIN WITH (FORMAT csv)",
+                    reader,
+                )
+                copied = time.perf_counter()
+
+                cur.execute(self._merge_sql())
+                merged = cur.rowcount
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        finally:
+            cur.close()
+
+        elapsed = time.perf_counter() - self._start
+        stats = {
+            'table': self.table,
+            'mode': mode,
+            'rows': self._rows,
+            'merged': merged,
+            'copy_seconds': copied - self._start,
+            'merge_seconds': elapsed - (copied - self._start),
+            'seconds': elapsed,
+            'rows_per_second': self._rows / elapsed if elapsed else 0.0,
+        }
+        print(f"  {self.table}: {stats['rows']:,} rows in {elapsed:.1f}s "
+              f"({stats['rows_per_second']:,.0f} rows/s, {mode}; copy {stats['copy_seconds']:.1f}s, "
+              f"merge {stats['merge_seconds']:.1f}s, {merged:,} written)")
+        return stats
+
+    def _is_empty(self, cur) -> bool:
+        cur.execute(f"SELECT NOT EXISTS (SELECT 1 FROM {self.table})")
+        return bool(cur.fetchone()[0])
+
+    def _merge_sql(self) -> str:
+        cols = ', '.join(self.columns)
+        key = ', '.join(self.key)
+        if self.update:
+            action = 'DO UPDATE SET ' + ', '.join(f"{c} = EXCLUDED.{c}" for c in self.update)
+        else:
+            action = 'DO NOTHING'
+        # Last row per key wins, like a sequence of single-row upserts
+        return f"""
+            INSERT INTO {self.table} ({cols})
+            SELECT DISTINCT ON ({key}) {cols}
+            FROM {self.stage}
+            ORDER BY {key}, _ord DESC
+            ON CONFLICT ({key}) {action}
+        """
+
+    # ========================================================================
+    # STREAMS
+    # ========================================================================
+
+    def _encode(self, rows: Iterable[Sequence]) -> Iterator[str]:
+        """CSV text for rows, batch_rows at a time."""
+        buf = io.StringIO()
+        writer = csv.writer(buf, lineterminator='\n')
+        n = 0
+        for row in rows:
+            writer.writerow(row)
+            n += 1
+            if n == self.batch_rows:
+                self._progress(n)
+                yield buf.getvalue()
+                buf.seek(0)
+                buf.truncate()
+                n = 0
+        if n:
+            self._progress(n)
+            yield buf.getvalue()
+
+    def _count_lines(self, f) -> Iterator[str]:
+        """Pass a CSV file through, counting data lines."""
+        lines: List[str] = []
+        for line in f:
+            lines.append(line)
+            if len(lines) == self.batch_rows:
+                yield ''.join(lines)
+                self._progress(len(lines))
+                lines = []
+        if lines:
+            yield ''.join(lines)
+            self._progress(len(lines))
+
+    def _progress(self, n: int):
+        before = self._rows
+        self._rows += n
+        every = self.progress_every
+        if every and self._rows // every > before // every:
+            elapsed = time.perf_counter() - self._start
+            rate = self._rows / elapsed if elapsed else 0.0
+            print(f"  {self.table}: {self._rows:,} rows ({rate:,.0f} rows/s)")
+
+
+# ============================================================================
+# SOURCE PARSERS
+# ============================================================================
+
+def coordinate_rows(data: Dict, source: str = 'json') -> Iterator[Tuple[str, float, float, float, str]]:
+    """(word, A, S, tau, source) rows from derived_coordinates.json data.
+
+    Accepts {word: {A, S, tau}} and {word: [A, S, tau]} entries and the
+    {'coordinates': {...}} wrapper.
+    """
+    if isinstance(data, dict) and 'coordinates' in data:
+        data = data['coordinates']
+
+    for word, coords in data.items():
+        if isinstance(coords, dict):
+            A = coords.get('A', 0.0)
+            S = coords.get('S', 0.0)
+            tau = coords.get('tau', 2.5)
+        elif isinstance(coords, (list, tuple)) and len(coords) >= 3:
+            A, S, tau = coords[0], coords[1], coords[2]
+        else:
+            continue
+        yield (word.lower(), float(A), float(S), float(tau), source)
+
+
+def bond_rows(lines: Iterable[str]) -> Iterator[Tuple[str, str, float, float, float]]:
+    """(adj, noun, A, S, tau) rows from neo4j_bonds.csv lines.
+
+    Line format: "id", "adj", "noun", A, S, tau, "source"
+    """
+    for line in lines:
+        parts = line.strip().split(', ')
+        if len(parts) < 6:
+            continue
+        try:
+            A, S, tau = float(parts[3]), float(parts[4]), float(parts[5])
+        except ValueError:
+            continue
+        yield (parts[1].strip('"').lower(), parts[2].strip('"').lower(), A, S, tau)
@@ -6,6 +6,11 @@ This script loads:
 2. Bonds from neo4j_bonds.csv (85K bonds with A, S, tau)
 3. Bond vocabulary from hyp_bond_vocab.csv (6M+ corpus bonds)
 
+All three stream through COPY into a staging table and are merged with
+one upsert each (see copy_pipeline.py), so reruns are safe. The bond
+vocabulary (a dump of the table, unique keys) is COPYed straight into
+hyp_bond_vocab when the table is empty, as on a fresh bring-up.
+
 Usage:
     python init_postgres.py
 
@@ -13,7 +18,6 @@ Or with Docker:
     docker exec storm-postgres python /app/scripts/init_postgres.py
 """
 
-import csv
 import json
 import os
 import sys
@@ -22,6 +26,8 @@ from pathlib import Path
 
 import psycopg2
 
+from copy_pipeline import CopyLoader, bond_rows, coordinate_rows
+
 
 def get_connection(max_retries=30, delay=2):
     """Get PostgreSQL connection with retry."""
@@ -49,53 +55,13 @@ def load_coordinates(conn, json_path: str):
     with open(json_path, 'r') as f:
         raw_data = json.load(f)
 
-    # Handle nested structure
-    if isinstance(raw_data, dict) and 'coordinates' in raw_data:
-        data = raw_data['coordinates']
-    else:
-        data = raw_data
-
-    print(f"Found {len(data):,} words")
-
-    cur = conn.cursor()
-    batch_size = 1000
-    batch = []
-    total = 0
-
-    for word, coords in data.items():
-        if isinstance(coords, dict):
-            A = coords.get('A', 0.0)
-            S = coords.get('S', 0.0)
-            tau = coords.get('tau', 2.5)
-        else:
-            continue
-
-        batch.append((word.lower(), float(A), float(S), float(tau), 'json'))
-
-        if len(batch) >= batch_size:
-            cur.executemany("""
-                INSERT INTO word_coordinates (word, A, S, tau, source)
-                VALUES (%s, %s, %s, %s, %s)
-                ON CONFLICT (word) DO UPDATE
-                SET A = EXCLUDED.A, S = EXCLUDED.S, tau = EXCLUDED.tau
-            """, batch)
-            conn.commit()
-            total += len(batch)
-            batch = []
-
-    if batch:
-        cur.executemany("""
-            INSERT INTO word_coordinates (word, A, S, tau, source)
-            VALUES (%s, %s, %s, %s, %s)
-            ON CONFLICT (word) DO UPDATE
-            SET A = EXCLUDED.A, S = EXCLUDED.S, tau = EXCLUDED.tau
-        """, batch)
-        conn.commit()
-        total += len(batch)
+    loader = CopyLoader(conn, 'word_coordinates',
+                        columns=['word', 'a', 's', 'tau', 'source'],
+                        key=['word'], update=['a', 's', 'tau'])
+    stats = loader.load(coordinate_rows(raw_data))
 
-    cur.close()
-    print(f"Loaded {total:,} word coordinates")
-    return total
+    print(f"Loaded {stats['rows']:,} word coordinates")
+    return stats['rows']
 
 
 def load_bonds(conn, csv_path: str):
@@ -103,39 +69,15 @@ def load_bonds(conn, csv_path: str):
     print(f"\n=== Loading Bonds ===")
     print(f"From: {csv_path}")
 
-    cur = conn.cursor()
-    total = 0
-
+    loader = CopyLoader(conn, 'bonds',
+                        columns=['adj', 'noun', 'a', 's', 'tau'],
+                        key=['adj', 'noun'], update=['a', 's', 'tau'],
+                        progress_every=10000)
     with open(csv_path, 'r') as f:
-        for line in f:
-            # Format: "id", "adj", "noun", A, S, tau, "source"
-            parts = line.strip().split(', ')
-            if len(parts) >= 6:
-                adj = parts[1].strip('"')
-                noun = parts[2].strip('"')
-                try:
-                    A = float(parts[3])
-                    S = float(parts[4])
-                    tau = float(parts[5])
-                except ValueError:
-                    continue
-
-                cur.execute("""
-                    INSERT INTO bonds (adj, noun, A, S, tau)
-                    VALUES (%s, %s, %s, %s, %s)
-                    ON CONFLICT (adj, noun) DO UPDATE
-                    SET A = EXCLUDED.A, S = EXCLUDED.S, tau = EXCLUDED.tau
-                """, (adj.lower(), noun.lower(), A, S, tau))
-                total += 1
-
-                if total % 10000 == 0:
-                    conn.commit()
-                    print(f"  Loaded {total:,} bonds...")
-
-    conn.commit()
-    cur.close()
-    print(f"Loaded {total:,} bonds")
-    return total
+        stats = loader.load(bond_rows(f))
+
+    print(f"Loaded {stats['rows']:,} bonds")
+    return stats['rows']
 
 
 def load_bond_vocab(conn, csv_path: str):
@@ -143,25 +85,16 @@ def load_bond_vocab(conn, csv_path: str):
     print(f"\n=== Loading Bond Vocabulary ===")
     print(f"From: {csv_path}")
 
-    cur = conn.cursor()
-
-    # Use COPY for fast loading
+    loader = CopyLoader(conn, 'hyp_bond_vocab',
+                        columns=['bond', 'first_seen_order', 'first_seen_book',
+                                 'total_count', 'book_count', 'created_at'],
+                        key=['bond'], update=['total_count', 'book_count'],
+                        progress_every=1000000, unique_keys=True)
     with open(csv_path, 'r') as f:
-        # Skip header
-        next(f)
-        cur.copy_expert("""
-            COPY hyp_bond_vocab (bond, first_seen_order, first_seen_book, total_count, book_count, created_at)
-            FROM STDIN WITH CSV
-        """, f)
-
-    conn.commit()
-
-    cur.execute("SELECT COUNT(*) FROM hyp_bond_vocab")
-    total = cur.fetchone()[0]
-    cur.close()
+        stats = loader.load_csv(f, header=True)
 
-    print(f"Loaded {total:,} bond vocabulary entries")
-    return total
+    print(f"Loaded {stats['rows']:,} bond vocabulary entries")
+    return stats['rows']
 
 
 def main():
@@ -207,6 +140,7 @@ def main():
     print("Connected!")
 
     # Load data
+    started = time.perf_counter()
     if coord_file:
         load_coordinates(conn, coord_file)
 
@@ -235,6 +169,7 @@ def main():
     print(f"  word_coordinates: {n_coords:,}")
     print(f"  bonds: {n_bonds:,}")
     print(f"  hyp_bond_vocab: {n_vocab:,}")
+    print(f"  time: {time.perf_counter() - started:.1f}s")
 
 
 if __name__ == '__main__':
@@ -73,6 +73,7 @@ def wait_for_neo4j(max_retries=30, delay=2):
 def load_coordinates(json_path: str):
     """Load coordinates from JSON file into PostgreSQL."""
     import psycopg2
+    from copy_pipeline import CopyLoader, coordinate_rows
 
     print(f"\n{'='*60}")
     print("Loading Word Coordinates into PostgreSQL")
@@ -112,52 +113,18 @@ def load_coordinates(json_path: str):
         )
     """)
     conn.commit()
-
-    # Batch insert
-    batch_size = 1000
-    batch = []
-    total = 0
-
-    for word, coords in data.items():
-        if isinstance(coords, dict):
-            A = coords.get('A', 0.0)
-            S = coords.get('S', 0.0)
-            tau = coords.get('tau', 2.5)
-        elif isinstance(coords, (list, tuple)) and len(coords) >= 3:
-            A, S, tau = coords[0], coords[1], coords[2]
-        else:
-            continue
-
-        batch.append((word.lower(), float(A), float(S), float(tau), 'json'))
-
-        if len(batch) >= batch_size:
-            cur.executemany("""
-                INSERT INTO word_coordinates (word, A, S, tau, source)
-                VALUES (%s, %s, %s, %s, %s)
-                ON CONFLICT (word) DO UPDATE
-                SET A = EXCLUDED.A, S = EXCLUDED.S, tau = EXCLUDED.tau
-            """, batch)
-            conn.commit()
-            total += len(batch)
-            print(f"  Loaded {total:,} words...")
-            batch = []
-
-    # Insert remaining
-    if batch:
-        cur.executemany("""
-            INSERT INTO word_coordinates (word, A, S, tau, source)
-            VALUES (%s, %s, %s, %s, %s)
-            ON CONFLICT (word) DO UPDATE
-            SET A = EXCLUDED.A, S = EXCLUDED.S, tau = EXCLUDED.tau
-        """, batch)
-        conn.commit()
-        total += len(batch)
-
     cur.close()
+
+    # Stream through COPY + one merge (see copy_pipeline.py)
+    loader = CopyLoader(conn, 'word_coordinates',
+                        columns=['word', 'a', 's', 'tau', 'source'],
+                        key=['word'], update=['a', 's', 'tau'],
+                        progress_every=10000)
+    stats = loader.load(coordinate_rows(data))
     conn.close()
 
-    print(f"\nLoaded {total:,} word coordinates into PostgreSQL")
-    return total
+    print(f"\nLoaded {stats['rows']:,} word coordinates into PostgreSQL")
+    return stats['rows']
 
 
 def load_books(gutenberg_dir: str, limit: int = None, priority_only: bool = False):
@@ -2,6 +2,7 @@
 
 Applications:
     - Therapist: Therapeutic conversation agent
+    - TherapistPool: Per-session therapist state with LRU/TTL eviction
     - Generator: Text generation agent
     - Navigator: Semantic navigation agent
     - Analyzer: Analysis-only agent
@@ -9,6 +10,7 @@ Applications:
 """
 
 from .therapist import Therapist
+from .therapist_pool import TherapistPool
 from .generator import Generator
 from .navigator import Navigator
 from .analyzer import Analyzer
@@ -6,22 +6,23 @@ Uses Storm-Logos for Jungian dream interpretation:
 - Corpus resonance (finding similar themes in literature)
 - Interactive dream exploration with LLM
 
-Supports Claude, Groq, and Ollama backends.
+Supports Claude, Groq, and Ollama backends via the shared
+storm_logos.llm client.
 """
 
 from typing import Optional, List, Dict, Any
-import os
 import json
 from datetime import datetime
 from pathlib import Path
-import requests
 
 from ..data.models import (
     Bond, SemanticState, DreamState, DreamSymbol, DreamAnalysis
 )
 from ..data.postgres import get_data
 from ..data.neo4j import get_neo4j
+from ..data.nlp import get_nlp_service
 from ..metrics.analyzers.archetype import get_archetype_analyzer
+from ..llm import LLMClient, LLMError, get_llm
 
 
 class DreamEngine:
@@ -37,32 +38,22 @@ class DreamEngine:
 
     def __init__(self,
                  model: str = 'groq:llama-3.3-70b-versatile',
-                 api_key: str = None):
+                 api_key: str = None,
+                 llm: Optional[LLMClient] = None):
         """Initialize dream engine.
 
         Args:
             model: 'claude' for Claude API, 'groq:model-name' for Groq API,
                    or Ollama model name (e.g., 'mistral:7b')
             api_key: API key (reads from env if not provided)
+            llm: LLM client (defaults to the shared client for model)
+
+        Raises:
+            ValueError: If the model's API key is not set
         """
         self.model = model
-        self.use_claude = model.lower().startswith('claude')
-        self.use_groq = model.lower().startswith('groq:')
-
-        if self.use_claude:
-            self.api_key = api_key or os.environ.get('ANTHROPIC_API_KEY')
-            if not self.api_key:
-                raise ValueError("ANTHROPIC_API_KEY not set")
-            self._client = None
-        elif self.use_groq:
-            self.api_key = api_key or os.environ.get('GROQ_API_KEY')
-            if not self.api_key:
-                raise ValueError("GROQ_API_KEY not set")
-            self.groq_model = model.split(':', 1)[1]
-            self._client = None
-        else:
-            self.base_url = 'http://localhost:11434'
-            self._client = None
+        self.api_key = api_key
+        self.llm = llm or get_llm(model, api_key=api_key)
 
         # Data sources
         self._data = None
@@ -83,19 +74,22 @@ class DreamEngine:
 
         # Set LLM caller on archetype analyzer for dynamic detection
         archetype_analyzer = get_archetype_analyzer()
-        archetype_analyzer.set_llm_caller(self._call_llm_short)
+        archetype_analyzer.set_llm_caller(self._call_llm_short, self._call_llm_batch)
 
         return True
 
     def _call_llm_short(self, system: str, user: str) -> str:
-        """Short LLM call for archetype detection."""
+        """Short LLM call for archetype detection (cached per symbol prompt)."""
         return self._call_llm(system, user, max_tokens=100)
 
+    def _call_llm_batch(self, system: str, user: str) -> str:
+        """LLM call for batched archetype detection (one per dream)."""
+        return self._call_llm(system, user, max_tokens=1024)
+
     def _get_nlp(self):
-        """Lazy-load spaCy model."""
+        """Shared spaCy pipeline (loaded on first parse)."""
         if self._nlp is None:
-            import spacy
-            self._nlp = spacy.load("en_core_web_sm")
+            self._nlp = get_nlp_service()
         return self._nlp
 
     def extract_symbols(self, text: str) -> List[DreamSymbol]:
@@ -110,13 +104,11 @@ class DreamEngine:
         Returns:
             List of DreamSymbol objects with coordinates
         """
-        nlp = self._get_nlp()
-        doc = nlp(text)
-        symbols = []
+        # Repeated calls for the same message reuse the parsed Doc
+        doc = self._get_nlp().parse(text)
+        candidates = []  # (bond, raw_text)
         seen = set()
 
-        archetype_analyzer = get_archetype_analyzer()
-
         for token in doc:
             # Adjective + Noun pairs
             if token.pos_ == "ADJ" and token.dep_ == "amod":
@@ -127,14 +119,9 @@ class DreamEngine:
 
                     if key not in seen:
                         seen.add(key)
-                        bond, arch, interp = self._create_symbol(adj, noun, text)
+                        bond = self._symbol_bond(adj, noun)
                         if bond:
-                            symbols.append(DreamSymbol(
-                                bond=bond,
-                                raw_text=f"{adj} {noun}",
-                                archetype=arch,
-                                interpretation=interp,
-                            ))
+                            candidates.append((bond, f"{adj} {noun}"))
 
             # Significant nouns
             elif token.pos_ == "NOUN" and token.dep_ in ("nsubj", "dobj", "pobj"):
@@ -147,22 +134,27 @@ class DreamEngine:
                             noun=noun,
                             A=coords.A, S=coords.S, tau=coords.tau,
                         )
-                        arch, interp = archetype_analyzer.get_symbol_interpretation(bond)
-                        symbols.append(DreamSymbol(
-                            bond=bond,
-                            raw_text=noun,
-                            archetype=arch,
-                            interpretation=interp,
-                        ))
+                        candidates.append((bond, noun))
 
-        return symbols[:15]  # Limit
+        candidates = candidates[:15]  # Limit
 
-    def _create_symbol(self, adj: str, noun: str, context: str) -> tuple:
-        """Create a DreamSymbol from adjective+noun pair.
+        # One batched LLM call for all symbols the static config doesn't know
+        archetype_analyzer = get_archetype_analyzer()
+        interpretations = archetype_analyzer.get_symbol_interpretations(
+            [bond for bond, _ in candidates])
+
+        return [
+            DreamSymbol(
+                bond=bond,
+                raw_text=raw_text,
+                archetype=arch,
+                interpretation=interp,
+            )
+            for (bond, raw_text), (arch, interp) in zip(candidates, interpretations)
+        ]
 
-        Returns:
-            (Bond, archetype, interpretation) or (None, "", "")
-        """
+    def _symbol_bond(self, adj: str, noun: str) -> Optional[Bond]:
+        """Bond for an adjective+noun pair (averaged word coordinates)."""
         adj_coords = self._data.get(adj) if self._data else None
         noun_coords = self._data.get(noun) if self._data else None
 
@@ -175,14 +167,9 @@ class DreamEngine:
         elif noun_coords:
             A, S, tau = noun_coords.A, noun_coords.S, noun_coords.tau
         else:
-            return None, "", ""
+            return None
 
-        bond = Bond(noun=noun, adj=adj, A=A, S=S, tau=tau)
-
-        archetype_analyzer = get_archetype_analyzer()
-        arch, interp = archetype_analyzer.get_symbol_interpretation(bond)
-
-        return bond, arch, interp
+        return Bond(noun=noun, adj=adj, A=A, S=S, tau=tau)
 
     def find_corpus_resonances(self, symbols: List[DreamSymbol],
                                 limit: int = 5) -> List[Dict]:
@@ -227,11 +214,12 @@ class DreamEngine:
 
         return resonances[:limit]
 
-    def analyze(self, dream_text: str) -> DreamAnalysis:
+    def analyze(self, dream_text: str, use_cache: bool = True) -> DreamAnalysis:
         """Perform full dream analysis.
 
         Args:
             dream_text: The dream narrative
+            use_cache: Reuse a cached interpretation of an identical prompt
 
         Returns:
             DreamAnalysis with symbols, state, and interpretation
@@ -257,7 +245,7 @@ class DreamEngine:
 
         # Generate interpretation
         interpretation = self._generate_interpretation(
-            dream_text, symbols, state, resonances
+            dream_text, symbols, state, resonances, use_cache=use_cache
         )
 
         analysis = DreamAnalysis(
@@ -276,7 +264,8 @@ class DreamEngine:
                                   dream_text: str,
                                   symbols: List[DreamSymbol],
                                   state: DreamState,
-                                  resonances: List[Dict]) -> str:
+                                  resonances: List[Dict],
+                                  use_cache: bool = True) -> str:
         """Generate LLM interpretation of dream.
 
         Args:
@@ -330,90 +319,29 @@ Coordinates: A={state.A:+.2f} (affirmation), S={state.S:+.2f} (sacred)
 
 Provide a psychological interpretation of this dream."""
 
-        return self._call_llm(system, prompt)
-
-    def _call_llm(self, system: str, user: str, max_tokens: int = 512) -> str:
-        """Call LLM for interpretation."""
-        if self.use_claude:
-            return self._call_claude(system, user, max_tokens)
-        elif self.use_groq:
-            return self._call_groq(system, user, max_tokens)
-        else:
-            return self._call_ollama(system, user, max_tokens)
-
-    def _call_claude(self, system: str, user: str, max_tokens: int) -> str:
-        """Call Claude API."""
-        try:
-            import anthropic
-
-            if self._client is None:
-                self._client = anthropic.Anthropic(api_key=self.api_key)
-
-            response = self._client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=max_tokens,
-                system=system,
-                messages=[{"role": "user", "content": user}]
-            )
-            return response.content[0].text.strip()
-
-        except Exception as e:
-            return f"[Claude error: {e}]"
-
-    def _call_groq(self, system: str, user: str, max_tokens: int) -> str:
-        """Call Groq API."""
-        try:
-            from groq import Groq
-
-            if self._client is None:
-                self._client = Groq(api_key=self.api_key)
-
-            response = self._client.chat.completions.create(
-                model=self.groq_model,
-                max_tokens=max_tokens,
-                temperature=0.7,
-                messages=[
-                    {"role": "system", "content": system},
-                    {"role": "user", "content": user}
-                ]
-            )
-            return response.choices[0].message.content.strip()
+        return self._call_llm(system, prompt, use_cache=use_cache)
 
-        except Exception as e:
-            return f"[Groq error: {e}]"
-
-    def _call_ollama(self, system: str, user: str, max_tokens: int) -> str:
-        """Call Ollama API."""
-        prompt = f"{system}\n\n{user}"
+    def _call_llm(self, system: str, user: str, max_tokens: int = 512,
+                  use_cache: bool = True) -> str:
+        """Call LLM for interpretation.
 
+        Responses are served from the LLM response cache when the same
+        normalized prompt was answered before; pass use_cache=False for
+        conversational turns that must not repeat themselves.
+        """
         try:
-            response = requests.post(
-                f'{self.base_url}/api/generate',
-                json={
-                    'model': self.model,
-                    'prompt': prompt,
-                    'stream': False,
-                    'options': {
-                        'num_predict': max_tokens,
-                        'temperature': 0.7,
-                    }
-                },
-                timeout=60,
-            )
-
-            if response.status_code == 200:
-                return response.json().get('response', '')
-            return "[Unable to generate response]"
-
-        except Exception as e:
-            return f"[Ollama error: {e}]"
+            return self.llm.generate(system, user, max_tokens=max_tokens,
+                                     temperature=0.7, cache=use_cache).strip()
+        except LLMError as e:
+            return f"[{self.llm.label} error: {e}]"
 
-    def explore(self, dream_text: str, question: str) -> str:
+    def explore(self, dream_text: str, question: str, use_cache: bool = True) -> str:
         """Explore a specific aspect of a dream.
 
         Args:
             dream_text: The dream to explore
             question: Question about the dream
+            use_cache: Reuse a cached answer to an identical prompt
 
         Returns:
             LLM response
@@ -436,7 +364,7 @@ SYMBOLS:
 QUESTION:
 {question}"""
 
-        return self._call_llm(system, prompt, max_tokens=256)
+        return self._call_llm(system, prompt, max_tokens=256, use_cache=use_cache)
 
     def get_session_data(self) -> Dict[str, Any]:
         """Get full session data for export."""
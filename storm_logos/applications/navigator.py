@@ -6,6 +6,8 @@ Navigates through semantic space with goal-directed behavior.
 from typing import Optional, List, Tuple
 import math
 
+import numpy as np
+
 from ..data.models import SemanticState, Bond
 from ..semantic.storm import Storm, get_storm
 from ..semantic.physics import therapeutic_vector
@@ -71,14 +73,18 @@ class Navigator:
         target_S = current.S + direction[1] * 0.3
         target_tau = current.tau + direction[2] * 0.3
 
-        # Get candidates near target
-        candidates = self.storm.get_candidates_by_coords(
-            target_A, target_S, target_tau, radius=0.5
-        )
+        # Get candidates near target from the shared spatial index
+        index = self.storm.index
+        indices = index.query_radius((target_A, target_S, target_tau), 0.5)
 
-        if not candidates:
-            # Widen search
-            candidates = self.storm.explode(current, radius=1.0)
+        if len(indices):
+            # Score = how well each bond aligns with direction
+            deltas = index.coords[indices] - (current.A, current.S, current.tau)
+            scores = deltas @ np.asarray(direction, dtype=np.float64)
+            return self.storm.data.bonds.bond(int(indices[np.argmax(scores)]))
+
+        # Widen search
+        candidates = self.storm.explode(current, radius=1.0)
 
         if not candidates:
             return None
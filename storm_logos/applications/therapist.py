@@ -6,22 +6,22 @@ Uses the full Storm-Logos system for therapy:
 - Generates therapeutic responses
 - Adapts approach based on feedback
 
-Supports Ollama (local), Claude (API), and Groq (API) backends.
+Supports Ollama (local), Claude (API), and Groq (API) backends via
+the shared storm_logos.llm client.
 """
 
-from typing import Optional, List, Dict, Any
-import os
+from typing import Optional, List, Dict, Any, Tuple
 import json
 from datetime import datetime
 from pathlib import Path
-import requests
 
 from ..data.models import SemanticState, Metrics, ConversationTrajectory
 from ..metrics.engine import MetricsEngine
 from ..feedback.engine import FeedbackEngine
 from ..controller.engine import AdaptiveController
 from ..semantic.dialectic import Dialectic
-from ..generation.renderer import Renderer
+from ..llm import LLMClient, LLMError, get_llm
+from ..config import get_config, TherapistConfig
 
 
 class Therapist:
@@ -46,7 +46,11 @@ class Therapist:
     def __init__(self,
                  model: str = 'claude',
                  base_url: str = 'http://localhost:11434',
-                 api_key: str = None):
+                 api_key: str = None,
+                 metrics: Optional[MetricsEngine] = None,
+                 dialectic: Optional[Dialectic] = None,
+                 llm: Optional[LLMClient] = None,
+                 config: Optional[TherapistConfig] = None):
         """Initialize therapist.
 
         Args:
@@ -54,31 +58,28 @@ class Therapist:
                    or Ollama model name (e.g., 'mistral:7b')
             base_url: Ollama base URL (only used for Ollama models)
             api_key: API key (reads from env if not provided)
+            metrics: Shared MetricsEngine (created if not provided)
+            dialectic: Shared Dialectic (created if not provided)
+            llm: LLM client (defaults to the shared client for model)
+            config: Candidate/hedging settings (defaults to get_config().therapist)
+
+        Raises:
+            ValueError: If the model's API key is not set
         """
-        self.metrics = MetricsEngine()
+        # Stateless, heavy components: safe to share between sessions
+        self.metrics = metrics or MetricsEngine()
+        self.dialectic = dialectic or Dialectic()
+
+        # Per-session state: PI integrators and error history
         self.feedback = FeedbackEngine()
         self.feedback.use_preset('therapeutic')
         self.controller = AdaptiveController(context='therapeutic')
-        self.dialectic = Dialectic()
 
         self.model = model
-        self.use_claude = model.lower().startswith('claude')
-        self.use_groq = model.lower().startswith('groq:')
-
-        if self.use_claude:
-            self.api_key = api_key or os.environ.get('ANTHROPIC_API_KEY')
-            if not self.api_key:
-                raise ValueError("ANTHROPIC_API_KEY not set")
-            self._claude_client = None
-        elif self.use_groq:
-            self.api_key = api_key or os.environ.get('GROQ_API_KEY')
-            if not self.api_key:
-                raise ValueError("GROQ_API_KEY not set")
-            self.groq_model = model.split(':', 1)[1]  # e.g., 'llama-3.3-70b-versatile'
-            self._groq_client = None
-        else:
-            self.renderer = Renderer(model=model, base_url=base_url)
-            self.base_url = base_url
+        self.base_url = base_url
+        self.api_key = api_key
+        self.llm = llm or get_llm(model, api_key=api_key, base_url=base_url)
+        self.config = config or get_config().therapist
 
         self.trajectory = ConversationTrajectory()
         self._prev_irony = 0.0
@@ -86,16 +87,97 @@ class Therapist:
         self._turns: List[Dict[str, Any]] = []  # Full conversation record
         self._session_start = datetime.now()
 
+    def fork(self) -> 'Therapist':
+        """Create a fresh therapist for a new session.
+
+        The fork shares the MetricsEngine, Dialectic and LLM client
+        of this instance, but gets its own trajectory,
+        feedback integrals, controller state and turn record.
+
+        Returns:
+            New Therapist with empty session state
+        """
+        clone = Therapist(
+            model=self.model,
+            base_url=self.base_url,
+            api_key=self.api_key,
+            metrics=self.metrics,
+            dialectic=self.dialectic,
+            llm=self.llm,
+            config=self.config,
+        )
+        return clone
+
     def respond(self, patient_text: str, max_retries: int = 3) -> str:
         """Generate therapeutic response to patient.
 
+        With config.candidates > 1, candidates are generated concurrently
+        and the first scoring above config.score_threshold is used (best
+        of all otherwise); else generates serially, regenerating up to
+        max_retries times with feedback.
+
         Args:
             patient_text: Patient's utterance
-            max_retries: Maximum regeneration attempts
+            max_retries: Maximum regeneration attempts (serial mode)
 
         Returns:
             Therapeutic response
         """
+        turn = self.prepare_turn(patient_text)
+
+        # 6. Generate response
+        if self.config.candidates > 1:
+            response = self._generate_candidates(turn)
+        else:
+            for attempt in range(max_retries):
+                response = self._generate_response(patient_text, turn['context'], turn['params'])
+
+                # Evaluate
+                score = self._evaluate_response(response, turn['state'], turn['dial'])
+
+                if score >= self.config.score_threshold:
+                    break
+
+                # Add feedback for retry
+                turn['context'] += f"\n[Previous attempt scored {score:.2f}. Be more direct.]"
+
+        self._record_turn(turn, response)
+        return response
+
+    def _generate_candidates(self, turn: Dict[str, Any]) -> str:
+        """Best of config.candidates concurrent generations."""
+        def score(text: str) -> float:
+            return self._evaluate_response(text.strip(), turn['state'], turn['dial'])
+
+        try:
+            completion, _ = self.llm.best_of_sync(
+                turn['system'], turn['user'],
+                n=self.config.candidates,
+                score=score,
+                threshold=self.config.score_threshold,
+                hedge_percentile=self.config.hedge_percentile or None,
+                max_tokens=turn['max_tokens'],
+                temperature=0.7,
+            )
+        except LLMError as e:
+            return f"[{self.llm.label} error: {e}]"
+        return completion.text.strip()
+
+    def prepare_turn(self, patient_text: str) -> Dict[str, Any]:
+        """Analyze the patient and build the LLM prompt for one turn.
+
+        Runs steps 1-5 of the loop (metrics, irony, PI control, dialectic,
+        context). Callers that stream the completion themselves send
+        turn['system'] / turn['user'] to self.llm and then call
+        finish_turn() with the text.
+
+        Args:
+            patient_text: Patient's utterance
+
+        Returns:
+            Turn dict: patient, state, metrics, dial, params, context,
+            system, user, max_tokens
+        """
         # 1. Analyze patient
         metrics = self.metrics.measure(text=patient_text)
         state = SemanticState(
@@ -119,24 +201,41 @@ class Therapist:
 
         # 5. Build context for LLM
         context = self._build_context(state, dial, metrics, irony_rising)
+        system, user, max_tokens = self._build_prompt(patient_text, context)
 
-        # 6. Generate response (with retries)
-        for attempt in range(max_retries):
-            response = self._generate_response(patient_text, context, params)
-
-            # Evaluate
-            score = self._evaluate_response(response, state, dial)
+        return {
+            'patient': patient_text,
+            'state': state,
+            'metrics': metrics,
+            'dial': dial,
+            'params': params,
+            'context': context,
+            'system': system,
+            'user': user,
+            'max_tokens': max_tokens,
+        }
 
-            if score >= 0.6:
-                break
+    def finish_turn(self, turn: Dict[str, Any], response: str) -> float:
+        """Score and record a response generated outside respond().
 
-            # Add feedback for retry
-            context += f"\n[Previous attempt scored {score:.2f}. Be more direct.]"
+        Args:
+            turn: Dict from prepare_turn()
+            response: Full response text
 
-        # Record turn
+        Returns:
+            Response score (0-1)
+        """
+        score = self._evaluate_response(response, turn['state'], turn['dial'])
+        self._record_turn(turn, response)
+        return score
+
+    def _record_turn(self, turn: Dict[str, Any], response: str):
+        """Append a turn to the session record."""
+        state = turn['state']
+        metrics = turn['metrics']
         self._turns.append({
             'turn': len(self._turns) + 1,
-            'patient': patient_text,
+            'patient': turn['patient'],
             'therapist': response,
             'state': {
                 'A': state.A,
@@ -152,8 +251,6 @@ class Therapist:
             'timestamp': datetime.now().isoformat(),
         })
 
-        return response
-
     def _build_context(self, state: SemanticState, dial: dict,
                        metrics: Metrics, irony_rising: bool) -> str:
         """Build context for LLM prompt."""
@@ -191,7 +288,16 @@ Mirror the darkness BEFORE offering anything else.
 
     def _generate_response(self, patient_text: str, context: str,
                            params) -> str:
-        """Generate response via LLM (Claude or Ollama)."""
+        """Generate response via the configured LLM."""
+        system_prompt, user_message, max_tokens = self._build_prompt(patient_text, context)
+        try:
+            return self.llm.generate(system_prompt, user_message,
+                                     max_tokens=max_tokens, temperature=0.7).strip()
+        except LLMError as e:
+            return f"[{self.llm.label} error: {e}]"
+
+    def _build_prompt(self, patient_text: str, context: str) -> Tuple[str, str, int]:
+        """Build (system, user, max_tokens) for the LLM call."""
         # Compute response length from receptivity
         receptivity = self._compute_receptivity()
         max_tokens = int(15 + 85 * receptivity)  # 15-100 tokens
@@ -223,84 +329,7 @@ Examples of GOOD responses:
 
 [YOUR RESPONSE]"""
 
-        if self.use_claude:
-            return self._generate_claude(system_prompt, user_message, max_tokens)
-        elif self.use_groq:
-            return self._generate_groq(system_prompt, user_message, max_tokens)
-        else:
-            return self._generate_ollama(system_prompt, user_message, max_tokens)
-
-    def _generate_claude(self, system: str, user: str, max_tokens: int) -> str:
-        """Generate response via Claude API."""
-        try:
-            import anthropic
-
-            if self._claude_client is None:
-                self._claude_client = anthropic.Anthropic(api_key=self.api_key)
-
-            response = self._claude_client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=max_tokens,
-                system=system,
-                messages=[
-                    {"role": "user", "content": user}
-                ]
-            )
-
-            return response.content[0].text.strip()
-
-        except Exception as e:
-            return f"[Claude error: {e}]"
-
-    def _generate_groq(self, system: str, user: str, max_tokens: int) -> str:
-        """Generate response via Groq API."""
-        try:
-            from groq import Groq
-
-            if self._groq_client is None:
-                self._groq_client = Groq(api_key=self.api_key)
-
-            response = self._groq_client.chat.completions.create(
-                model=self.groq_model,
-                max_tokens=max_tokens,
-                temperature=0.7,
-                messages=[
-                    {"role": "system", "content": system},
-                    {"role": "user", "content": user}
-                ]
-            )
-
-            return response.choices[0].message.content.strip()
-
-        except Exception as e:
-            return f"[Groq error: {e}]"
-
-    def _generate_ollama(self, system: str, user: str, max_tokens: int) -> str:
-        """Generate response via Ollama."""
-        prompt = f"{system}\n\n{user}"
-
-        try:
-            response = requests.post(
-                f'{self.base_url}/api/generate',
-                json={
-                    'model': self.model,
-                    'prompt': prompt,
-                    'stream': False,
-                    'options': {
-                        'num_predict': max_tokens,
-                        'temperature': 0.7,
-                    }
-                },
-                timeout=60,
-            )
-
-            if response.status_code == 200:
-                return response.json().get('response', '')
-            else:
-                return "[Unable to generate response]"
-
-        except Exception as e:
-            return f"[Ollama error: {e}]"
+        return system_prompt, user_message, max_tokens
 
     def _evaluate_response(self, response: str, patient_state: SemanticState,
                            dial: dict) -> float:
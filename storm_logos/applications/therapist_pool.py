@@ -0,0 +1,186 @@
+"""Therapist Pool: Session-keyed therapist state with bounded memory.
+
+Each session gets its own Therapist (trajectory, PI integrators, turns),
+forked from a template so the heavy components are built once:
+
+    - MetricsEngine (spaCy model, analyzers)
+    - Dialectic
+    - Coordinate tables (via the get_data() singleton)
+
+The pool evicts least-recently-used sessions beyond max_size and drops
+sessions idle for longer than ttl_seconds.
+
+Usage:
+    template = Therapist(model='groq:llama-3.3-70b-versatile')
+    pool = TherapistPool(factory=template.fork, max_size=1000)
+    therapist = pool.get(session_id)
+    ...
+    pool.release(session_id)
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .therapist import Therapist
+
+
+class TherapistPool:
+    """LRU/TTL pool of per-session Therapist instances."""
+
+    def __init__(self,
+                 factory: Callable[[], Therapist],
+                 max_size: int = 1000,
+                 ttl_seconds: float = 3600.0):
+        """Initialize pool.
+
+        Args:
+            factory: Creates a fresh Therapist (typically template.fork)
+            max_size: Maximum number of sessions held in memory
+            ttl_seconds: Idle time after which a session is dropped (0 = never)
+        """
+        self.factory = factory
+        self.max_size = max(1, max_size)
+        self.ttl_seconds = ttl_seconds
+
+        # session_id -> (therapist, last_access)
+        self._entries: 'OrderedDict[str, Tuple[Therapist, float]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    # ========================================================================
+    # MAIN INTERFACE
+    # ========================================================================
+
+    def get(self, session_id: str) -> Therapist:
+        """Get the therapist for a session, creating it if needed.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            Therapist holding this session's state
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is not None and not self._is_expired(entry, now):
+                self._hits += 1
+                self._entries[session_id] = (entry[0], now)
+                self._entries.move_to_end(session_id)
+                return entry[0]
+
+            if entry is not None:
+                del self._entries[session_id]
+                self._expirations += 1
+            self._misses += 1
+
+        # Build outside the lock: forking is cheap but never free
+        therapist = self.factory()
+
+        with self._lock:
+            # Another request may have created it meanwhile
+            entry = self._entries.get(session_id)
+            if entry is not None:
+                self._entries.move_to_end(session_id)
+                return entry[0]
+
+            self._entries[session_id] = (therapist, now)
+            self._evict_locked(now)
+        return therapist
+
+    def peek(self, session_id: str) -> Optional[Therapist]:
+        """Get the therapist for a session without creating or touching it."""
+        with self._lock:
+            entry = self._entries.get(session_id)
+            return entry[0] if entry else None
+
+    def session_ids(self) -> List[str]:
+        """Session IDs currently held, least recently used first."""
+        with self._lock:
+            return list(self._entries)
+
+    def release(self, session_id: str) -> bool:
+        """Drop a session's therapist (session ended or discarded).
+
+        Returns:
+            True if the session was in the pool
+        """
+        with self._lock:
+            return self._entries.pop(session_id, None) is not None
+
+    def evict_expired(self) -> int:
+        """Drop all sessions idle for longer than the TTL.
+
+        Returns:
+            Number of sessions dropped
+        """
+        now = time.monotonic()
+        with self._lock:
+            return self._expire_locked(now)
+
+    def clear(self):
+        """Drop all sessions."""
+        with self._lock:
+            self._entries.clear()
+
+    # ========================================================================
+    # EVICTION
+    # ========================================================================
+
+    def _is_expired(self, entry: Tuple[Therapist, float], now: float) -> bool:
+        return self.ttl_seconds > 0 and now - entry[1] > self.ttl_seconds
+
+    def _expire_locked(self, now: float) -> int:
+        # Entries are kept in access order, so the oldest come first
+        expired = 0
+        while self._entries:
+            session_id, entry = next(iter(self._entries.items()))
+            if not self._is_expired(entry, now):
+                break
+            del self._entries[session_id]
+            expired += 1
+        self._expirations += expired
+        return expired
+
+    def _evict_locked(self, now: float):
+        self._expire_locked(now)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    # ========================================================================
+    # STATS
+    # ========================================================================
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self._entries
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of get() calls served by an existing session."""
+        total = self._hits + self._misses
+        if total == 0:
+            return 0.0
+        return self._hits / total
+
+    def stats(self) -> Dict:
+        """Get pool statistics."""
+        return {
+            'size': len(self._entries),
+            'max_size': self.max_size,
+            'ttl_seconds': self.ttl_seconds,
+            'hits': self._hits,
+            'misses': self._misses,
+            'evictions': self._evictions,
+            'expirations': self._expirations,
+            'hit_rate': self.hit_rate,
+        }
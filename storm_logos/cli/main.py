@@ -35,6 +35,17 @@ def main():
     # Info command
     subparsers.add_parser('info', help='Show system info')
 
+    # Snapshot command
+    snap_parser = subparsers.add_parser(
+        'snapshot', help='Rebuild binary snapshot of coordinates and bonds')
+    snap_parser.add_argument('--dir', '-d', help='Snapshot directory')
+    snap_parser.add_argument('--bond-limit', type=int, default=500000,
+                             help='Maximum bonds to include')
+    snap_parser.add_argument('--keep', type=int, default=2,
+                             help='Snapshots to keep on disk')
+    snap_parser.add_argument('--info', action='store_true',
+                             help='Show the current snapshot and exit')
+
     args = parser.parse_args()
 
     if args.command == 'generate':
@@ -45,6 +56,8 @@ def main():
         cmd_therapy(args)
     elif args.command == 'info':
         cmd_info()
+    elif args.command == 'snapshot':
+        cmd_snapshot(args)
     else:
         parser.print_help()
 
@@ -157,5 +170,46 @@ def cmd_info():
         print(f"Data: Error loading ({e})")
 
 
+def cmd_snapshot(args):
+    """Snapshot command."""
+    import time
+    from pathlib import Path
+    from ..config import get_config
+    from ..data.postgres import PostgresData
+    from ..data.snapshot import load_snapshot
+
+    root = Path(args.dir) if args.dir else get_config().snapshot.path
+
+    if args.info:
+        snapshot = load_snapshot(root)
+        if snapshot is None:
+            print(f"No snapshot in {root}")
+            return
+        manifest = snapshot.manifest
+        print(f"Snapshot: {snapshot.path}")
+        print(f"  Hash:    {manifest['content_hash']}")
+        print(f"  Created: {manifest['created_at']}")
+        print(f"  Words:   {manifest['n_words']:,}")
+        print(f"  Bonds:   {manifest['n_bonds']:,}")
+        vocab_filter = manifest.get('vocab_filter')
+        if vocab_filter:
+            print(f"  Filter:  {vocab_filter['n_items']:,} keys, "
+                  f"{vocab_filter['n_bits'] / 8e6:.1f} MB, fp {vocab_filter['fp_rate']:.3%}")
+        return
+
+    start = time.time()
+    data = PostgresData(use_snapshot=False)
+    try:
+        path = data.build_snapshot(bond_limit=args.bond_limit, root=root, keep=args.keep)
+    finally:
+        data.close()
+
+    if path is None:
+        print("Snapshot not written: could not read coordinates/bonds from PostgreSQL")
+        sys.exit(1)
+    print(f"Snapshot written to {path} in {time.time() - start:.1f}s "
+          f"({data.n_coordinates:,} words, {data.n_bonds:,} bonds)")
+
+
 if __name__ == '__main__':
     main()
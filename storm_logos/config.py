@@ -6,7 +6,7 @@ Central configuration for all system parameters.
 import math
 import os
 from dataclasses import dataclass, field
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
 
@@ -58,6 +58,20 @@ class DatabaseConfig:
     password: str = field(default_factory=lambda: os.environ.get('POSTGRES_PASSWORD', 'postgres'))
     port: int = field(default_factory=lambda: int(os.environ.get('POSTGRES_PORT', 5432)))
 
+    # Connection pool
+    pool_min: int = field(default_factory=lambda: int(os.environ.get('POSTGRES_POOL_MIN', 1)))
+    pool_max: int = field(default_factory=lambda: int(os.environ.get('POSTGRES_POOL_MAX', 10)))
+    pool_timeout: float = field(default_factory=lambda: float(os.environ.get('POSTGRES_POOL_TIMEOUT', 5.0)))
+    pool_health_check_interval: float = field(
+        default_factory=lambda: float(os.environ.get('POSTGRES_POOL_HEALTH_CHECK', 30.0)))
+
+    # Streaming loaders: rows per server-side cursor fetch
+    stream_batch_size: int = field(
+        default_factory=lambda: int(os.environ.get('POSTGRES_STREAM_BATCH_SIZE', 20000)))
+    # load_bonds() returns after this many top bonds, the rest load in the background (0 = all)
+    bonds_ready_after: int = field(
+        default_factory=lambda: int(os.environ.get('STORM_BONDS_READY_AFTER', 0)))
+
     def as_dict(self) -> Dict:
         return {
             'host': self.host,
@@ -68,12 +82,152 @@ class DatabaseConfig:
         }
 
 
+@dataclass
+class SnapshotConfig:
+    """Binary snapshot of coordinates and bonds (see data/snapshot.py)."""
+    enabled: bool = field(
+        default_factory=lambda: os.environ.get('STORM_SNAPSHOT', 'true').lower() == 'true')
+    # Outside the package tree: $XDG_CACHE_HOME (~/.cache)/storm_logos/snapshot
+    path: Path = field(default_factory=lambda: Path(os.environ.get(
+        'STORM_SNAPSHOT_DIR',
+        str(Path(os.environ.get('XDG_CACHE_HOME', str(Path.home() / '.cache')))
+            / 'storm_logos' / 'snapshot'))))
+    # Recompute the DB content hash at startup and ignore a stale snapshot
+    # (one scan per table; the vocab filter is only used after a match)
+    verify: bool = field(
+        default_factory=lambda: os.environ.get('STORM_SNAPSHOT_VERIFY', 'true').lower() == 'true')
+    # Bloom filter over corpus bond keys, built with the snapshot
+    vocab_filter: bool = field(
+        default_factory=lambda: os.environ.get('STORM_VOCAB_FILTER', 'true').lower() == 'true')
+    vocab_filter_fp_rate: float = field(
+        default_factory=lambda: float(os.environ.get('STORM_VOCAB_FILTER_FP_RATE', 0.01)))
+
+
+@dataclass
+class CacheConfig:
+    """Two-tier coordinate cache (see data/cache.py)."""
+    max_size: int = field(default_factory=lambda: int(os.environ.get('COORD_CACHE_SIZE', 50000)))
+    # Shared tier TTLs
+    ttl: float = field(default_factory=lambda: float(os.environ.get('COORD_CACHE_TTL', 3600)))
+    negative_ttl: float = field(
+        default_factory=lambda: float(os.environ.get('COORD_CACHE_NEGATIVE_TTL', 300)))
+    # Local tier TTL with a shared tier (bounds staleness after another worker
+    # invalidates); local-only caches use ttl
+    local_ttl: float = field(
+        default_factory=lambda: float(os.environ.get('COORD_CACHE_LOCAL_TTL', 60)))
+    # Shared tier; empty = local only
+    redis_url: str = field(default_factory=lambda: os.environ.get(
+        'COORD_CACHE_REDIS_URL', os.environ.get('REDIS_URL', '')))
+    redis_prefix: str = 'storm:coords'
+
+
+@dataclass
+class LLMConfig:
+    """LLM provider layer (see llm/client.py)."""
+    # 'claude[:model-id]', 'groq:model', 'fake', or an Ollama model name
+    model: str = field(default_factory=lambda: os.environ.get('LLM_MODEL', 'groq:llama-3.3-70b-versatile'))
+    claude_model: str = field(
+        default_factory=lambda: os.environ.get('LLM_CLAUDE_MODEL', 'claude-sonnet-4-20250514'))
+    ollama_url: str = field(default_factory=lambda: os.environ.get('OLLAMA_URL', 'http://localhost:11434'))
+    # Per-call deadline in seconds (covers retries)
+    timeout: float = field(default_factory=lambda: float(os.environ.get('LLM_TIMEOUT', 60)))
+    max_retries: int = field(default_factory=lambda: int(os.environ.get('LLM_MAX_RETRIES', 2)))
+    # Full-jitter backoff: sleep uniform(0, min(backoff_max, backoff_base * 2^attempt))
+    backoff_base: float = field(default_factory=lambda: float(os.environ.get('LLM_BACKOFF_BASE', 0.5)))
+    backoff_max: float = field(default_factory=lambda: float(os.environ.get('LLM_BACKOFF_MAX', 8.0)))
+    # In-flight calls across all clients in this process
+    max_concurrency: int = field(default_factory=lambda: int(os.environ.get('LLM_MAX_CONCURRENCY', 16)))
+    max_connections: int = field(default_factory=lambda: int(os.environ.get('LLM_MAX_CONNECTIONS', 32)))
+    # Response cache (see llm/cache.py); used by calls made with cache=True
+    cache_enabled: bool = field(
+        default_factory=lambda: os.environ.get('LLM_CACHE', 'true').lower() in ('1', 'true', 'yes'))
+    cache_size: int = field(default_factory=lambda: int(os.environ.get('LLM_CACHE_SIZE', 10000)))
+    cache_ttl: float = field(default_factory=lambda: float(os.environ.get('LLM_CACHE_TTL', 7 * 86400)))
+    cache_redis_url: str = field(default_factory=lambda: os.environ.get(
+        'LLM_CACHE_REDIS_URL', os.environ.get('REDIS_URL', '')))
+
+
+@dataclass
+class TherapistConfig:
+    """Therapist response generation (see applications/therapist.py)."""
+    # Concurrent candidates per turn; 1 = generate, score, regenerate serially
+    candidates: int = field(default_factory=lambda: int(os.environ.get('THERAPIST_CANDIDATES', 1)))
+    # Start one extra candidate at this latency quantile (0 = no hedging)
+    hedge_percentile: float = field(
+        default_factory=lambda: float(os.environ.get('THERAPIST_HEDGE_PERCENTILE', 0.9)))
+    # Accept the first response scoring at least this
+    score_threshold: float = field(
+        default_factory=lambda: float(os.environ.get('THERAPIST_SCORE_THRESHOLD', 0.6)))
+
+
+@dataclass
+class NLPConfig:
+    """Shared spaCy pipeline (see data/nlp.py)."""
+    model: str = field(default_factory=lambda: os.environ.get('SPACY_MODEL', 'en_core_web_sm'))
+    # Components not loaded at all; bond extraction needs tagger, parser and lemmatizer
+    exclude: List[str] = field(default_factory=lambda: [
+        name.strip() for name in os.environ.get('SPACY_EXCLUDE', 'ner').split(',') if name.strip()])
+    batch_size: int = field(default_factory=lambda: int(os.environ.get('SPACY_BATCH_SIZE', 64)))
+    n_process: int = field(default_factory=lambda: int(os.environ.get('SPACY_N_PROCESS', 1)))
+    # Recently parsed short texts kept for reuse (0 = off)
+    doc_cache_size: int = field(default_factory=lambda: int(os.environ.get('SPACY_DOC_CACHE_SIZE', 256)))
+
+
+@dataclass
+class LearningConfig:
+    """Write-behind buffer for learned bonds (see data/write_behind.py)."""
+    # Buffer learn_bond/mark_bond_used writes (false = write each call synchronously)
+    write_behind: bool = field(
+        default_factory=lambda: os.environ.get('LEARN_WRITE_BEHIND', 'true').lower() == 'true')
+    # Flush when this many distinct bonds are pending ...
+    flush_size: int = field(default_factory=lambda: int(os.environ.get('LEARN_FLUSH_SIZE', 500)))
+    # ... or this many seconds after the oldest pending write
+    flush_interval: float = field(
+        default_factory=lambda: float(os.environ.get('LEARN_FLUSH_INTERVAL', 2.0)))
+    # Failed writes (other than connection errors) before an entry is dead-lettered
+    max_retries: int = field(default_factory=lambda: int(os.environ.get('LEARN_MAX_RETRIES', 3)))
+    # Buffered pairs; writes for new pairs beyond this go straight to the database
+    max_pending: int = field(default_factory=lambda: int(os.environ.get('LEARN_MAX_PENDING', 20000)))
+
+
+@dataclass
+class ExecutorConfig:
+    """Worker pools for blocking work in async handlers (see orchestration/executor.py)."""
+    # Thread pool shared by I/O stages
+    io_workers: int = field(default_factory=lambda: int(os.environ.get('EXEC_IO_WORKERS', 32)))
+    # Process pool for CPU stages (0 = run them in the thread pool). Each worker
+    # is a separate interpreter with its own copy of what its tasks load
+    cpu_workers: int = field(default_factory=lambda: int(os.environ.get(
+        'EXEC_CPU_WORKERS', min(2, os.cpu_count() or 1))))
+    # Callers allowed to wait per stage before StageOverloaded (0 = unbounded)
+    max_queue: int = field(default_factory=lambda: int(os.environ.get('EXEC_MAX_QUEUE', 256)))
+    # Concurrent calls per stage
+    limits: Dict[str, int] = field(default_factory=lambda: {
+        'llm': int(os.environ.get('EXEC_LIMIT_LLM', 16)),
+        'neo4j': int(os.environ.get('EXEC_LIMIT_NEO4J', 8)),
+        'postgres': int(os.environ.get('EXEC_LIMIT_POSTGRES', 8)),
+        'engine': int(os.environ.get('EXEC_LIMIT_ENGINE', 8)),
+        'nlp': int(os.environ.get('EXEC_LIMIT_NLP', 4)),
+        'metrics': int(os.environ.get('EXEC_LIMIT_METRICS', 4)),
+    })
+
+
 @dataclass
 class Neo4jConfig:
     """Neo4j database configuration."""
     uri: str = field(default_factory=lambda: os.environ.get('NEO4J_URI', 'bolt://localhost:7687'))
     user: str = field(default_factory=lambda: os.environ.get('NEO4J_USER', 'neo4j'))
     password: str = field(default_factory=lambda: os.environ.get('NEO4J_PASSWORD', 'password'))
+    # In-memory FOLLOWS adjacency (see data/follows_graph.py)
+    follows_cache: bool = field(
+        default_factory=lambda: os.environ.get('NEO4J_FOLLOWS_CACHE', 'true').lower() == 'true')
+    follows_max_staleness: float = field(
+        default_factory=lambda: float(os.environ.get('NEO4J_FOLLOWS_MAX_STALENESS', 60)))
+    follows_reload_interval: float = field(
+        default_factory=lambda: float(os.environ.get('NEO4J_FOLLOWS_RELOAD_INTERVAL', 3600)))
+    # Rows per transaction for batched UNWIND writes (book ingestion)
+    write_batch_size: int = field(
+        default_factory=lambda: int(os.environ.get('NEO4J_WRITE_BATCH_SIZE', 5000)))
 
 
 # ============================================================================
@@ -181,6 +335,13 @@ class Config:
     # Database
     db: DatabaseConfig = field(default_factory=DatabaseConfig)
     neo4j: Neo4jConfig = field(default_factory=Neo4jConfig)
+    snapshot: SnapshotConfig = field(default_factory=SnapshotConfig)
+    cache: CacheConfig = field(default_factory=CacheConfig)
+    executor: ExecutorConfig = field(default_factory=ExecutorConfig)
+    llm: LLMConfig = field(default_factory=LLMConfig)
+    therapist: TherapistConfig = field(default_factory=TherapistConfig)
+    nlp: NLPConfig = field(default_factory=NLPConfig)
+    learning: LearningConfig = field(default_factory=LearningConfig)
 
     # Semantic layer
     storm: StormConfig = field(default_factory=StormConfig)
@@ -5,9 +5,19 @@ Provides:
     - WordCoordinates: (A, S, τ) position for a word
     - Trajectory: sequence of bonds
     - PostgresData: PostgreSQL connection for bonds/coordinates
+    - ConnectionPool: Thread-safe PostgreSQL connection pool
+    - BondTable: Columnar, array-backed bond store
+    - WordTable: Columnar word coordinate store
+    - Snapshot: Memory-mapped binary snapshot of coordinates and bonds
+    - BloomFilter: Corpus bond-key filter stored with the snapshot
+    - SpatialIndex: KD-tree over bond coordinates
+    - LearnedBondBuffer: Write-behind buffer for learned_bonds upserts
     - Neo4jData: Neo4j connection for trajectories
+    - FollowsGraph: In-memory CSR adjacency of FOLLOWS edges
+    - NLPService: Shared spaCy pipeline (parse, parse_many, doc LRU)
     - BookParser: spaCy-based book parser
     - BookProcessor: Process books into Neo4j
+    - BookIngestor: Parallel, resumable BookProcessor pipeline
 """
 
 from .models import (
@@ -15,20 +25,36 @@ from .models import (
     SessionMode, DreamSymbol, DreamState, DreamAnalysis
 )
 from .postgres import PostgresData, get_data
+from .connection_pool import ConnectionPool, PoolTimeout
+from .bond_table import BondTable, Vocabulary
+from .word_table import WordTable
+from .snapshot import Snapshot, load_snapshot, write_snapshot
+from .bloom import BloomFilter
+from .spatial import SpatialIndex
 from .cache import CoordinateCache
+from .write_behind import LearnedBondBuffer
 from .neo4j import Neo4jData, Author, Book, get_neo4j
+from .follows_graph import FollowsGraph
+from .nlp import NLPService, get_nlp_service
 from .book_parser import BookParser, BookProcessor, ParsedBook, ExtractedBond
+from .ingest import BookIngestor, IngestCheckpoint
 
 __all__ = [
     # Models
     'Bond', 'WordCoordinates', 'Trajectory', 'SemanticState',
     'SessionMode', 'DreamSymbol', 'DreamState', 'DreamAnalysis',
     # PostgreSQL
-    'PostgresData', 'get_data',
+    'PostgresData', 'get_data', 'ConnectionPool', 'PoolTimeout',
+    # Bond storage
+    'BondTable', 'Vocabulary', 'WordTable', 'SpatialIndex',
+    'Snapshot', 'load_snapshot', 'write_snapshot', 'BloomFilter',
     # Cache
-    'CoordinateCache',
+    'CoordinateCache', 'LearnedBondBuffer',
     # Neo4j
-    'Neo4jData', 'Author', 'Book', 'get_neo4j',
+    'Neo4jData', 'Author', 'Book', 'get_neo4j', 'FollowsGraph',
+    # NLP
+    'NLPService', 'get_nlp_service',
     # Book Processing
     'BookParser', 'BookProcessor', 'ParsedBook', 'ExtractedBond',
+    'BookIngestor', 'IngestCheckpoint',
 ]
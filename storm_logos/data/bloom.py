@@ -0,0 +1,134 @@
+"""Bloom Filter: Compact membership test for corpus bond keys.
+
+Most lookups for novel conversational bonds miss in both the bonds
+table and the 6M-row hyp_bond_vocab table. A Bloom filter over the
+keys of both tables answers "definitely not in the corpus" from memory,
+so those lookups skip the database entirely. "Maybe" still goes to
+PostgreSQL.
+
+The filter is built offline with the snapshot (storm-logos snapshot)
+and stored as a bit array next to it, so workers memory-map one shared
+copy. At the default 1% false-positive rate it costs ~1.2 bytes per key
+(~7 MB for 6M bonds). PostgresData only uses it when the snapshot's
+content hash was checked against the database at startup: a stale
+filter would report bonds loaded since as absent.
+
+Hashing is blake2b (stable across processes, unlike hash()) with double
+hashing for the k probe positions.
+
+Usage:
+    from storm_logos.data.bloom import BloomFilter
+
+    bloom = BloomFilter.create(n_items=6_000_000, fp_rate=0.01)
+    bloom.add_many(keys)
+    bloom.save(path / 'vocab_filter.npy')
+
+    bloom = BloomFilter.load(path / 'vocab_filter.npy', n_hashes=7)
+    if 'dark|forest' not in bloom:
+        ...   # definitely absent
+"""
+
+import hashlib
+import math
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+import numpy as np
+
+
+class BloomFilter:
+    """Bit-array Bloom filter over string keys (no false negatives)."""
+
+    def __init__(self, bits: np.ndarray, n_hashes: int, n_items: int = 0):
+        """Initialize filter.
+
+        Args:
+            bits: uint8 bit array (may be memory-mapped)
+            n_hashes: Probe positions per key
+            n_items: Keys added (informational)
+        """
+        self.bits = bits
+        self.n_hashes = n_hashes
+        self.n_items = n_items
+        self.n_bits = len(bits) * 8
+
+    @classmethod
+    def create(cls, n_items: int, fp_rate: float = 0.01) -> 'BloomFilter':
+        """Empty filter sized for n_items at the given false-positive rate."""
+        n_items = max(1, n_items)
+        n_bits = max(64, math.ceil(-n_items * math.log(fp_rate) / math.log(2) ** 2))
+        n_hashes = max(1, round(n_bits / n_items * math.log(2)))
+        return cls(np.zeros((n_bits + 7) // 8, dtype=np.uint8), n_hashes)
+
+    # ========================================================================
+    # BUILD / QUERY
+    # ========================================================================
+
+    def add_many(self, keys: Iterable[str]):
+        """Add keys (batch them: hashing is vectorized per call)."""
+        keys = list(keys)
+        if not keys:
+            return
+        index, mask = self._probes(keys)
+        np.bitwise_or.at(self.bits, index.ravel(), mask.ravel())
+        self.n_items += len(keys)
+
+    def add(self, key: str):
+        self.add_many([key])
+
+    def contains_many(self, keys: List[str]) -> np.ndarray:
+        """Membership for many keys (False = definitely absent)."""
+        if not keys:
+            return np.zeros(0, dtype=bool)
+        index, mask = self._probes(keys)
+        return np.all(self.bits[index] & mask, axis=1)
+
+    def __contains__(self, key: str) -> bool:
+        return bool(self.contains_many([key])[0])
+
+    def _probes(self, keys: List[str]):
+        """(byte index, bit mask) arrays of shape (len(keys), n_hashes)."""
+        digests = b''.join(
+            hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest() for key in keys
+        )
+        h = np.frombuffer(digests, dtype='<u8').reshape(-1, 2)
+        h1, h2 = h[:, :1], h[:, 1:] | np.uint64(1)
+        i = np.arange(self.n_hashes, dtype=np.uint64)
+        # uint64 arithmetic wraps, which is fine for hashing
+        positions = (h1 + i * h2) % np.uint64(self.n_bits)
+        index = (positions >> np.uint64(3)).astype(np.int64)
+        mask = (np.uint8(1) << (positions & np.uint64(7)).astype(np.uint8))
+        return index, mask
+
+    # ========================================================================
+    # PERSISTENCE
+    # ========================================================================
+
+    def meta(self) -> Dict:
+        """Parameters needed to load the bit array (stored in the manifest)."""
+        return {
+            'n_hashes': self.n_hashes,
+            'n_items': self.n_items,
+            'n_bits': self.n_bits,
+            'fp_rate': self.fp_rate,
+        }
+
+    @property
+    def fp_rate(self) -> float:
+        """Expected false-positive rate at the current fill."""
+        if not self.n_items:
+            return 0.0
+        return (1 - math.exp(-self.n_hashes * self.n_items / self.n_bits)) ** self.n_hashes
+
+    def save(self, path: Path):
+        np.save(path, np.ascontiguousarray(self.bits, dtype=np.uint8))
+
+    @classmethod
+    def load(cls, path: Path, n_hashes: int, n_items: int = 0,
+             mmap: bool = True) -> 'BloomFilter':
+        """Load a saved bit array (memory-mapped read-only by default)."""
+        bits = np.load(path, mmap_mode='r' if mmap else None)
+        return cls(bits, n_hashes, n_items)
+
+    def __len__(self) -> int:
+        return self.n_items
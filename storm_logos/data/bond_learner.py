@@ -34,18 +34,17 @@ Architecture:
     - Both are kept in sync by this module
 """
 
+import importlib.util
 import re
 import uuid
 from typing import List, Tuple, Optional, Dict
 from dataclasses import dataclass, field
 
-try:
-    import spacy
-    SPACY_AVAILABLE = True
-except ImportError:
-    SPACY_AVAILABLE = False
+# spaCy itself is loaded by the shared NLP service
+SPACY_AVAILABLE = importlib.util.find_spec('spacy') is not None
 
 from .models import Bond, Trajectory
+from .nlp import NLPService, get_nlp_service
 from .postgres import PostgresData, get_data
 from .neo4j import Neo4jData, get_neo4j
 
@@ -84,6 +83,8 @@ class LearningResult:
     new_bonds: int = 0
     reinforced_bonds: int = 0
     trajectory_edges: int = 0
+    edges_created: int = 0
+    edges_reinforced: int = 0
     conversation_id: str = ''
 
     def summary(self) -> str:
@@ -109,7 +110,7 @@ class BondLearner:
             spacy_model: spaCy model to use for extraction
         """
         self.spacy_model = spacy_model
-        self.nlp = None
+        self.nlp: Optional[NLPService] = None
         self.postgres: Optional[PostgresData] = None
         self.neo4j: Optional[Neo4jData] = None
         self._connected = False
@@ -123,18 +124,15 @@ class BondLearner:
         Returns:
             True if all connections successful
         """
-        # Load spaCy model
+        # Load spaCy model (shared pipeline)
         if SPACY_AVAILABLE and self.nlp is None:
+            service = get_nlp_service(self.spacy_model)
             try:
-                self.nlp = spacy.load(self.spacy_model)
-            except OSError:
-                print(f"spaCy model '{self.spacy_model}' not found. Downloading...")
-                try:
-                    spacy.cli.download(self.spacy_model)
-                    self.nlp = spacy.load(self.spacy_model)
-                except Exception as e:
-                    print(f"Failed to download spaCy model: {e}")
-                    return False
+                service.load(download=True)
+            except OSError as e:
+                print(e)
+                return False
+            self.nlp = service
 
         # Connect to PostgreSQL
         self.postgres = get_data()
@@ -164,7 +162,7 @@ class BondLearner:
         if self.nlp is None:
             return self._extract_bonds_simple(text)
 
-        doc = self.nlp(text)
+        doc = self.nlp.parse(text)
         bonds = []
 
         for token in doc:
@@ -218,7 +216,9 @@ class BondLearner:
 
     def learn_bond(self, adj: str, noun: str,
                    source: str = 'conversation',
-                   confidence: float = 0.5) -> LearnedBond:
+                   confidence: float = 0.5,
+                   sync: bool = True,
+                   coords: Optional[Tuple[float, float, float]] = None) -> LearnedBond:
         """Learn a single bond.
 
         1. Compute/lookup coordinates
@@ -230,6 +230,9 @@ class BondLearner:
             noun: Noun
             source: Source type
             confidence: Confidence in coordinates
+            sync: Sync the node to Neo4j (False when the caller merges it
+                  with learn_trajectory)
+            coords: Precomputed (A, S, tau) (None = look up)
 
         Returns:
             LearnedBond with coordinates
@@ -242,7 +245,8 @@ class BondLearner:
         is_new = existing is None
 
         # Compute coordinates
-        coords = self._get_coordinates(adj, noun)
+        if coords is None:
+            coords = self._get_coordinates(adj, noun)
         A, S, tau = coords
 
         # Store in PostgreSQL
@@ -251,7 +255,8 @@ class BondLearner:
                 adj=adj, noun=noun,
                 A=A, S=S, tau=tau,
                 source=source,
-                confidence=confidence
+                confidence=confidence,
+                existing=existing,
             )
             if bond:
                 A, S, tau = bond.A, bond.S, bond.tau
@@ -266,7 +271,7 @@ class BondLearner:
         )
 
         # Sync to Neo4j
-        if self.neo4j and self._connected:
+        if sync and self.neo4j and self._connected:
             self.neo4j.learn_bond(learned.to_bond(), source=source)
 
         return learned
@@ -293,11 +298,15 @@ class BondLearner:
         # Extract bonds
         bond_pairs = self.extract_bonds(text)
 
+        # Corpus coordinates for all bonds (one round-trip)
+        all_coords = self._get_coordinates_many(bond_pairs)
+
         result = LearningResult(conversation_id=conversation_id)
         bonds_for_trajectory = []
 
-        for adj, noun in bond_pairs:
-            learned = self.learn_bond(adj, noun, source=source)
+        for (adj, noun), coords in zip(bond_pairs, all_coords):
+            # Neo4j nodes are merged below, together with the edges
+            learned = self.learn_bond(adj, noun, source=source, sync=False, coords=coords)
             result.bonds.append(learned)
             bonds_for_trajectory.append(learned.to_bond())
 
@@ -306,13 +315,16 @@ class BondLearner:
             else:
                 result.reinforced_bonds += 1
 
-        # Create trajectory edges in Neo4j
-        if self.neo4j and self._connected and len(bonds_for_trajectory) >= 2:
-            result.trajectory_edges = self.neo4j.learn_trajectory(
+        # Bond nodes and trajectory edges in Neo4j (one round-trip)
+        if self.neo4j and self._connected and bonds_for_trajectory:
+            learned_edges = self.neo4j.learn_trajectory(
                 bonds_for_trajectory,
                 conversation_id=conversation_id,
                 source_type=source
             )
+            result.trajectory_edges = learned_edges['edges']
+            result.edges_created = learned_edges['created']
+            result.edges_reinforced = learned_edges['reinforced']
 
         return result
 
@@ -376,6 +388,22 @@ class BondLearner:
         # Fallback without postgres
         return self._estimate_coordinates(adj, noun)
 
+    def _get_coordinates_many(self, pairs: List[Tuple[str, str]]) -> List[Tuple[float, float, float]]:
+        """Get or compute coordinates for many bonds (corpus lookup batched).
+
+        Args:
+            pairs: List of (adj, noun) tuples
+
+        Returns:
+            (A, S, tau) tuples aligned with pairs
+        """
+        if not pairs:
+            return []
+        if self.postgres:
+            return self.postgres._compute_bond_coordinates_many(pairs)
+
+        return [self._estimate_coordinates(adj, noun) for adj, noun in pairs]
+
     def _estimate_coordinates(self, adj: str, noun: str) -> Tuple[float, float, float]:
         """Estimate coordinates using word heuristics.
 
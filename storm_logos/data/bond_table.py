@@ -0,0 +1,394 @@
+"""Bond Table: Columnar, array-backed bond store.
+
+Replaces a List[Bond] of dataclass instances with NumPy columns:
+
+    coords:  (N, 3) float64  - A, S, τ (same precision as Bond floats)
+    variety: (N,)   int32    - corpus frequency
+    adj:     (N,)   int32    - code into adj vocabulary (-1 = no adjective)
+    noun:    (N,)   int32    - code into noun vocabulary
+
+Strings are interned once per vocabulary. Bond objects are only
+materialized for rows that are actually returned to callers; the table
+is a read-only Sequence of Bonds (len, indexing, slicing, iteration).
+
+Usage:
+    table = BondTable()
+    table.extend(['dark', 'old'], ['forest', 'house'], [50, 20], coords)
+    bond = table[0]                      # Bond(dark forest, ...)
+    row = table.find('old', 'house')     # 1
+    rows = table.rows_for_noun('forest') # array([0])
+"""
+
+import collections.abc
+import threading
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .models import Bond
+
+
+# ============================================================================
+# VOCABULARY
+# ============================================================================
+
+class Vocabulary:
+    """Interned string <-> integer code mapping."""
+
+    def __init__(self, words: Optional[Sequence[str]] = None):
+        self._words: List[str] = []
+        self._codes: Dict[str, int] = {}
+        for word in words or ():
+            self.add(word)
+
+    def add(self, word: str) -> int:
+        """Get code for word, adding it if new."""
+        code = self._codes.get(word)
+        if code is None:
+            code = len(self._words)
+            self._words.append(word)
+            self._codes[word] = code
+        return code
+
+    def code(self, word: str) -> int:
+        """Get code for word (-1 if unknown)."""
+        return self._codes.get(word, -1)
+
+    def word(self, code: int) -> str:
+        """Get word for code."""
+        return self._words[code]
+
+    @property
+    def words(self) -> List[str]:
+        """All words in code order."""
+        return self._words
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self._codes
+
+
+# ============================================================================
+# BOND TABLE
+# ============================================================================
+
+class BondTable(collections.abc.Sequence):
+    """Columnar bond store with lazy Bond materialization.
+
+    Rows are append-only. For duplicate (adj, noun) pairs the first row
+    wins in find(), matching the load order (highest variety first).
+    """
+
+    def __init__(self, capacity: int = 1024):
+        capacity = max(1, capacity)
+        self.adj_vocab = Vocabulary()
+        self.noun_vocab = Vocabulary()
+        self._n = 0
+        self._coords = np.zeros((capacity, 3), dtype=np.float64)
+        self._variety = np.zeros(capacity, dtype=np.int32)
+        self._adj = np.zeros(capacity, dtype=np.int32)
+        self._noun = np.zeros(capacity, dtype=np.int32)
+
+        # Pair index: sorted ((adj_code + 1) << 32 | noun_code) keys with
+        # their first rows, plus a small dict for rows appended since.
+        # Published as one (keys, rows, tail) tuple so lock-free readers
+        # never pair keys with rows of another build
+        self._pair_index: Optional[Tuple[np.ndarray, np.ndarray, Dict[int, int]]] = None
+        self._pair_n = 0
+        # CSR noun index, rebuilt lazily after appends
+        self._noun_order: Optional[np.ndarray] = None
+        self._noun_offsets: Optional[np.ndarray] = None
+        self._index_lock = threading.Lock()
+
+    @classmethod
+    def from_arrays(cls, coords: np.ndarray, variety: np.ndarray,
+                    adj_codes: np.ndarray, noun_codes: np.ndarray,
+                    adj_words: Sequence[str], noun_words: Sequence[str],
+                    indexes: Optional[Dict[str, np.ndarray]] = None) -> 'BondTable':
+        """Wrap existing columns (e.g. memory-mapped from a snapshot).
+
+        Arrays are used as-is; the first append copies them.
+
+        Args:
+            coords, variety, adj_codes, noun_codes: Column arrays
+            adj_words, noun_words: Vocabularies in code order
+            indexes: Prebuilt lookup arrays from index_arrays()
+        """
+        table = cls(capacity=1)
+        table.adj_vocab = Vocabulary(adj_words)
+        table.noun_vocab = Vocabulary(noun_words)
+        table._coords = coords
+        table._variety = variety
+        table._adj = adj_codes
+        table._noun = noun_codes
+        table._n = len(variety)
+        if indexes:
+            table._pair_index = (indexes['pair_keys'], indexes['pair_rows'], {})
+            table._pair_n = table._n
+            table._noun_order = indexes['noun_order']
+            table._noun_offsets = indexes['noun_offsets']
+        return table
+
+    def head(self, n: int) -> 'BondTable':
+        """First n rows as a new table (columns are views, indexes are rebuilt)."""
+        n = max(0, min(n, self._n))
+        return BondTable.from_arrays(
+            self._coords[:n], self._variety[:n], self._adj[:n], self._noun[:n],
+            self.adj_vocab.words, self.noun_vocab.words,
+        )
+
+    def index_arrays(self) -> Dict[str, np.ndarray]:
+        """Lookup index arrays, for persisting next to the columns."""
+        with self._index_lock:
+            self._build_pair_index()
+            keys, rows, _ = self._pair_index
+        order, offsets = self._noun_csr()
+        return {
+            'pair_keys': keys,
+            'pair_rows': rows,
+            'noun_order': order,
+            'noun_offsets': offsets,
+        }
+
+    # ========================================================================
+    # COLUMNS
+    # ========================================================================
+
+    @property
+    def coords(self) -> np.ndarray:
+        """(N, 3) view of A, S, τ."""
+        return self._coords[:self._n]
+
+    @property
+    def A(self) -> np.ndarray:
+        return self._coords[:self._n, 0]
+
+    @property
+    def S(self) -> np.ndarray:
+        return self._coords[:self._n, 1]
+
+    @property
+    def tau(self) -> np.ndarray:
+        return self._coords[:self._n, 2]
+
+    @property
+    def variety(self) -> np.ndarray:
+        return self._variety[:self._n]
+
+    @property
+    def adj_codes(self) -> np.ndarray:
+        return self._adj[:self._n]
+
+    @property
+    def noun_codes(self) -> np.ndarray:
+        return self._noun[:self._n]
+
+    def __len__(self) -> int:
+        return self._n
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes used by the column arrays (excluding vocabularies)."""
+        return (self._coords.nbytes + self._variety.nbytes +
+                self._adj.nbytes + self._noun.nbytes)
+
+    # ========================================================================
+    # APPEND
+    # ========================================================================
+
+    def append(self, bond: Bond) -> int:
+        """Append a single bond. Returns its row."""
+        self.extend([bond.adj], [bond.noun], [bond.variety],
+                    [(bond.A, bond.S, bond.tau)])
+        return self._n - 1
+
+    def extend(self, adjs: Sequence[Optional[str]], nouns: Sequence[str],
+               varieties, coords) -> None:
+        """Append many bonds column-wise.
+
+        Args:
+            adjs: Adjectives (None for noun-only bonds)
+            nouns: Nouns
+            varieties: Corpus frequencies
+            coords: (M, 3) array-like of A, S, τ
+        """
+        m = len(nouns)
+        if m == 0:
+            return
+        self._reserve(self._n + m)
+
+        start, end = self._n, self._n + m
+        adj_add = self.adj_vocab.add
+        noun_add = self.noun_vocab.add
+        adj_codes = np.fromiter(
+            (adj_add(a) if a is not None else -1 for a in adjs),
+            dtype=np.int32, count=m,
+        )
+        noun_codes = np.fromiter((noun_add(n) for n in nouns),
+                                 dtype=np.int32, count=m)
+
+        self._coords[start:end] = np.asarray(coords, dtype=np.float64).reshape(m, 3)
+        self._variety[start:end] = np.asarray(varieties, dtype=np.int32)
+        self._adj[start:end] = adj_codes
+        self._noun[start:end] = noun_codes
+
+        self._n = end
+        self._noun_order = None
+        self._noun_offsets = None
+
+    def _reserve(self, size: int):
+        capacity = len(self._variety)
+        if size <= capacity:
+            return
+        while capacity < size:
+            capacity *= 2
+        self._coords = self._grow(self._coords, capacity)
+        self._variety = self._grow(self._variety, capacity)
+        self._adj = self._grow(self._adj, capacity)
+        self._noun = self._grow(self._noun, capacity)
+
+    @staticmethod
+    def _grow(array: np.ndarray, capacity: int) -> np.ndarray:
+        grown = np.zeros((capacity,) + array.shape[1:], dtype=array.dtype)
+        grown[:len(array)] = array
+        return grown
+
+    @staticmethod
+    def _pair_keys(adj_codes: np.ndarray, noun_codes: np.ndarray) -> np.ndarray:
+        # Shift adj codes by one so -1 (no adjective) maps to 0
+        return (adj_codes.astype(np.int64) + 1) << 32 | noun_codes.astype(np.int64)
+
+    def compact(self):
+        """Release spare capacity once loading is finished."""
+        n = max(1, self._n)
+        self._coords = self._coords[:n].copy()
+        self._variety = self._variety[:n].copy()
+        self._adj = self._adj[:n].copy()
+        self._noun = self._noun[:n].copy()
+
+    # ========================================================================
+    # LOOKUP
+    # ========================================================================
+
+    def find(self, adj: Optional[str], noun: str) -> int:
+        """Row of the first (adj, noun) bond, or -1."""
+        noun_code = self.noun_vocab.code(noun)
+        if noun_code < 0:
+            return -1
+        if adj is None:
+            adj_code = -1
+        else:
+            adj_code = self.adj_vocab.code(adj)
+            if adj_code < 0:
+                return -1
+        key = (adj_code + 1) << 32 | noun_code
+
+        if self._pair_n < self._n:
+            self._update_pair_index()
+        index = self._pair_index
+        if index is None:
+            return -1
+        keys, rows, tail = index
+        pos = int(np.searchsorted(keys, key))
+        if pos < len(keys) and keys[pos] == key:
+            return int(rows[pos])
+        return tail.get(key, -1)
+
+    # Appended rows kept in the dict before the sorted index is rebuilt
+    PAIR_TAIL_MAX = 4096
+
+    def _update_pair_index(self):
+        with self._index_lock:
+            if self._pair_n >= self._n:
+                return
+            index = self._pair_index
+            if index is None or len(index[2]) + self._n - self._pair_n > self.PAIR_TAIL_MAX:
+                self._build_pair_index()
+                return
+
+            start, end = self._pair_n, self._n
+            keys = self._pair_keys(self._adj[start:end], self._noun[start:end])
+            sorted_keys, _, tail = index
+            pos = np.searchsorted(sorted_keys, keys)
+            in_sorted = (pos < len(sorted_keys)) & (
+                sorted_keys[np.minimum(pos, len(sorted_keys) - 1)] == keys
+            ) if len(sorted_keys) else np.zeros(len(keys), dtype=bool)
+            for row, key, known in zip(range(start, end), keys.tolist(), in_sorted):
+                if not known and key not in tail:
+                    tail[key] = row
+            self._pair_n = end
+
+    def _build_pair_index(self):
+        """Rebuild sorted pair keys over all rows (caller holds the lock)."""
+        index = self._pair_index
+        if index is not None and self._pair_n >= self._n and not index[2]:
+            return
+        n = self._n
+        keys = self._pair_keys(self._adj[:n], self._noun[:n])
+        order = np.argsort(keys, kind='stable')
+        sorted_keys = keys[order]
+        # Keep the first row for each key
+        first = np.ones(len(sorted_keys), dtype=bool)
+        first[1:] = sorted_keys[1:] != sorted_keys[:-1]
+        self._pair_index = (sorted_keys[first], order[first].astype(np.intp), {})
+        self._pair_n = n
+
+    def pair_keys(self, rows) -> np.ndarray:
+        """Packed (adj, noun) keys for rows; equal keys mean the same pair."""
+        rows = np.asarray(rows, dtype=np.intp)
+        return self._pair_keys(self._adj[rows], self._noun[rows])
+
+    def rows_for_noun(self, noun: str) -> np.ndarray:
+        """Rows with this noun, in insertion order."""
+        code = self.noun_vocab.code(noun)
+        if code < 0:
+            return np.empty(0, dtype=np.intp)
+        order, offsets = self._noun_csr()
+        return order[offsets[code]:offsets[code + 1]]
+
+    def _noun_csr(self):
+        order, offsets = self._noun_order, self._noun_offsets
+        if order is None:
+            with self._index_lock:
+                if self._noun_order is None:
+                    codes = self.noun_codes
+                    self._noun_offsets = np.concatenate((
+                        [0], np.cumsum(np.bincount(codes, minlength=len(self.noun_vocab)))
+                    )).astype(np.intp)
+                    self._noun_order = np.argsort(codes, kind='stable').astype(np.intp)
+                order, offsets = self._noun_order, self._noun_offsets
+        return order, offsets
+
+    # ========================================================================
+    # MATERIALIZATION
+    # ========================================================================
+
+    def bond(self, row: int) -> Bond:
+        """Materialize a single row as a Bond."""
+        if row < 0:
+            row += self._n
+        if not 0 <= row < self._n:
+            raise IndexError(f"bond row {row} out of range")
+        adj_code = int(self._adj[row])
+        A, S, tau = self._coords[row].tolist()
+        return Bond(
+            noun=self.noun_vocab.word(int(self._noun[row])),
+            adj=self.adj_vocab.word(adj_code) if adj_code >= 0 else None,
+            variety=int(self._variety[row]),
+            A=A, S=S, tau=tau,
+        )
+
+    def bonds(self, rows) -> List[Bond]:
+        """Materialize many rows as Bonds."""
+        return [self.bond(int(row)) for row in rows]
+
+    def __getitem__(self, row):
+        if isinstance(row, slice):
+            return self.bonds(range(*row.indices(self._n)))
+        return self.bond(int(row))
+
+    def __iter__(self) -> Iterator[Bond]:
+        for row in range(self._n):
+            yield self.bond(row)
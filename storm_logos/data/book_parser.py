@@ -4,17 +4,17 @@ Extracts noun-adjective bonds from Gutenberg books and stores them in Neo4j.
 """
 
 import re
+import time
 from pathlib import Path
-from typing import List, Tuple, Optional, Dict, Generator
+from typing import List, Tuple, Optional, Dict, Generator, Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 
-import spacy
-from spacy.tokens import Doc
-
 from .models import Bond
+from ..config import get_config
+from .nlp import NLPService, get_nlp_service
 from .postgres import get_data
-from .neo4j import Neo4jData, Author, Book as BookRecord
+from .neo4j import Neo4jData, Author, Book as BookRecord, bond_node_id
 
 
 @dataclass
@@ -72,19 +72,17 @@ class BookParser:
         r'^FINIS',
     ]
 
-    def __init__(self, model: str = 'en_core_web_sm'):
+    def __init__(self, model: str = 'en_core_web_sm', nlp: Optional[NLPService] = None):
         """Initialize parser with spaCy model.
 
         Args:
             model: spaCy model name. Use 'en_core_web_sm' for speed,
                    'en_core_web_md' or 'en_core_web_lg' for accuracy.
+            nlp: NLP service to parse with (defaults to the shared one for model)
         """
-        try:
-            self.nlp = spacy.load(model)
-        except OSError:
-            print(f"spaCy model '{model}' not found. Downloading...")
-            spacy.cli.download(model)
-            self.nlp = spacy.load(model)
+        # Shared pipeline (NER excluded); loaded once per process
+        self.nlp = nlp or get_nlp_service(model)
+        self.nlp.load(download=True)
 
         # Compile patterns
         self.chapter_re = [re.compile(p, re.MULTILINE) for p in self.CHAPTER_PATTERNS]
@@ -101,13 +99,14 @@ class BookParser:
         return self._data
 
     def parse_file(self, filepath: Path, author: str = '',
-                   title: str = '') -> ParsedBook:
+                   title: str = '', n_process: int = 1) -> ParsedBook:
         """Parse a book file and extract bonds.
 
         Args:
             filepath: Path to text file
             author: Author name (optional, will try to detect)
             title: Book title (optional, will try to detect)
+            n_process: spaCy worker processes (chapters are sharded across them)
 
         Returns:
             ParsedBook with extracted bonds
@@ -124,46 +123,17 @@ class BookParser:
         # Clean text
         text = self._clean_gutenberg_text(text)
 
-        # Detect chapters
-        chapters = self._detect_chapters(text)
-
-        # Parse and extract bonds
-        result = ParsedBook(
-            title=title,
-            author=author,
-            n_chapters=len(chapters) if chapters else 1,
-        )
-
-        if chapters:
-            for i, chapter in enumerate(chapters):
-                # Get chapter text
-                start = chapter.start_char
-                end = chapters[i + 1].start_char if i + 1 < len(chapters) else len(text)
-                chapter_text = text[start:end]
-
-                bonds, n_sents = self._extract_bonds_from_text(
-                    chapter_text,
-                    chapter_num=chapter.number,
-                    position_offset=len(result.bonds)
-                )
-                result.bonds.extend(bonds)
-                result.n_sentences += n_sents
-        else:
-            # No chapters detected, process as single unit
-            bonds, n_sents = self._extract_bonds_from_text(text, chapter_num=0)
-            result.bonds = bonds
-            result.n_sentences = n_sents
-
-        return result
+        return self.parse_text(text, author=author, title=title, n_process=n_process)
 
     def parse_text(self, text: str, author: str = 'Unknown',
-                   title: str = 'Untitled') -> ParsedBook:
+                   title: str = 'Untitled', n_process: int = 1) -> ParsedBook:
         """Parse raw text and extract bonds.
 
         Args:
             text: Raw text content
             author: Author name
             title: Book title
+            n_process: spaCy worker processes (chapters are sharded across them)
 
         Returns:
             ParsedBook with extracted bonds
@@ -171,7 +141,6 @@ class BookParser:
         # Detect chapters
         chapters = self._detect_chapters(text)
 
-        # Parse and extract bonds
         result = ParsedBook(
             title=title,
             author=author,
@@ -179,22 +148,18 @@ class BookParser:
         )
 
         if chapters:
+            sections = []
             for i, chapter in enumerate(chapters):
                 start = chapter.start_char
                 end = chapters[i + 1].start_char if i + 1 < len(chapters) else len(text)
-                chapter_text = text[start:end]
-
-                bonds, n_sents = self._extract_bonds_from_text(
-                    chapter_text,
-                    chapter_num=chapter.number,
-                    position_offset=len(result.bonds)
-                )
-                result.bonds.extend(bonds)
-                result.n_sentences += n_sents
+                sections.append((chapter.number, text[start:end]))
         else:
-            bonds, n_sents = self._extract_bonds_from_text(text, chapter_num=0)
-            result.bonds = bonds
-            result.n_sentences = n_sents
+            # No chapters detected, process as single unit
+            sections = [(0, text)]
+
+        # All chapters go through one nlp.pipe, so n_process > 1 parses them in parallel
+        result.bonds, result.n_sentences = self._extract_bonds_from_sections(
+            sections, n_process=n_process)
 
         return result
 
@@ -304,27 +269,43 @@ class BookParser:
         Returns:
             Tuple of (bonds list, sentence count)
         """
-        bonds = []
-        n_sentences = 0
-        position = position_offset
+        return self._extract_bonds_from_sections([(chapter_num, text)],
+                                                 position_offset=position_offset)
 
-        # Process in chunks to avoid memory issues
-        chunk_size = 100000  # Characters
+    def _extract_bonds_from_sections(self, sections: List[Tuple[int, str]],
+                                     position_offset: int = 0,
+                                     n_process: int = 1) -> Tuple[List[ExtractedBond], int]:
+        """Extract bonds from (chapter_num, text) sections using spaCy.
 
-        for chunk_start in range(0, len(text), chunk_size):
-            chunk = text[chunk_start:chunk_start + chunk_size]
+        Sections are split into chunks and parsed in one nlp.pipe, so
+        n_process > 1 shards them across worker processes. Sentence
+        numbers restart at 1 in every section; positions run on.
 
-            # Don't cut in middle of sentence
-            if chunk_start + chunk_size < len(text):
-                last_period = chunk.rfind('.')
-                if last_period > chunk_size * 0.8:
-                    chunk = chunk[:last_period + 1]
+        Args:
+            sections: (chapter_num, text) per chapter
+            position_offset: Starting position
+            n_process: spaCy worker processes
 
-            # Process with spaCy
-            doc = self.nlp(chunk)
+        Returns:
+            Tuple of (bonds list, sentence count)
+        """
+        chunks = []  # (section index, chunk text)
+        for index, (_, text) in enumerate(sections):
+            for chunk in self._chunk_text(text):
+                chunks.append((index, chunk))
 
-            for sent_idx, sent in enumerate(doc.sents):
+        bonds = []
+        n_sentences = 0
+        sentence_counts = [0] * len(sections)
+        position = position_offset
+
+        docs = self.nlp.pipe((chunk for _, chunk in chunks), batch_size=4, n_process=n_process)
+        for (index, _), doc in zip(chunks, docs):
+            chapter_num = sections[index][0]
+
+            for sent in doc.sents:
                 n_sentences += 1
+                sentence_counts[index] += 1
 
                 # Skip short sentences
                 if len(sent) < 3:
@@ -338,13 +319,35 @@ class BookParser:
                         adj=adj,
                         noun=noun,
                         chapter=chapter_num,
-                        sentence=n_sentences,
+                        sentence=sentence_counts[index],
                         position=position,
                     ))
                     position += 1
 
         return bonds, n_sentences
 
+    def _chunk_text(self, text: str, chunk_size: int = 100000) -> List[str]:
+        """Split text into chunks of at most chunk_size characters.
+
+        Chunks end at a sentence boundary when one is near the end.
+        """
+        chunks = []
+        chunk_start = 0
+
+        while chunk_start < len(text):
+            chunk = text[chunk_start:chunk_start + chunk_size]
+
+            # Don't cut in middle of sentence (the rest starts the next chunk)
+            if chunk_start + chunk_size < len(text):
+                last_period = chunk.rfind('.')
+                if last_period > chunk_size * 0.8:
+                    chunk = chunk[:last_period + 1]
+
+            chunks.append(chunk)
+            chunk_start += len(chunk)
+
+        return chunks
+
     def _extract_bonds_from_sentence(self, sent) -> List[Tuple[str, str]]:
         """Extract noun-adjective bonds from a spaCy sentence.
 
@@ -641,14 +644,18 @@ class BookProcessor:
         },
     }
 
-    def __init__(self, neo4j: Neo4jData = None):
+    def __init__(self, neo4j: Neo4jData = None, parser: Optional[BookParser] = None,
+                 batch_size: Optional[int] = None):
         """Initialize processor.
 
         Args:
             neo4j: Neo4jData instance. If None, will create one.
+            parser: BookParser instance. If None, will create one.
+            batch_size: Bonds per write transaction (default NEO4J_WRITE_BATCH_SIZE)
         """
-        self.parser = BookParser()
+        self.parser = parser or BookParser()
         self.neo4j = neo4j
+        self.batch_size = batch_size or get_config().neo4j.write_batch_size
 
     def connect(self) -> bool:
         """Connect to Neo4j."""
@@ -667,20 +674,33 @@ class BookProcessor:
         Returns:
             Processing result with stats
         """
+        return self.load_book(self.parse_book(filepath, metadata))
+
+    def parse_book(self, filepath: Path, metadata: Dict = None,
+                   n_process: int = 1) -> Dict:
+        """Parse a book and look up bond coordinates (no Neo4j access).
+
+        Args:
+            filepath: Path to book file
+            metadata: Optional metadata dict with title, author, genre, etc.
+            n_process: spaCy worker processes for this book's chapters
+
+        Returns:
+            Parsed book ready for load_book()
+        """
         filename = filepath.name
 
         # Get metadata
         meta = metadata or self.BOOK_METADATA.get(filename, {})
         author_name = meta.get('author', 'Unknown')
         title = meta.get('title', filepath.stem)
-        genre = meta.get('genre', '')
-        era = meta.get('era', '')
-        domain = meta.get('domain', '')
 
         print(f"Processing: {title} by {author_name}")
+        started = time.monotonic()
 
         # Parse book
-        parsed = self.parser.parse_file(filepath, author=author_name, title=title)
+        parsed = self.parser.parse_file(filepath, author=author_name, title=title,
+                                        n_process=n_process)
         print(f"  Extracted {len(parsed.bonds)} bonds from {parsed.n_sentences} sentences")
 
         # Look up coordinates
@@ -688,71 +708,105 @@ class BookProcessor:
         found_coords = sum(1 for eb, b in bonds_with_coords if b.A != 0 or b.S != 0 or b.tau != 2.5)
         print(f"  Found coordinates for {found_coords}/{len(bonds_with_coords)} bonds")
 
+        return {
+            # Create book ID from filename
+            'book_id': self.book_id(filepath),
+            'filename': filename,
+            'title': title,
+            'author': author_name,
+            'genre': meta.get('genre', ''),
+            'era': meta.get('era', ''),
+            'domain': meta.get('domain', ''),
+            'n_sentences': parsed.n_sentences,
+            'n_chapters': parsed.n_chapters,
+            'bonds': bonds_with_coords,
+            'coords_found': found_coords,
+            'parse_seconds': time.monotonic() - started,
+        }
+
+    def load_book(self, book: Dict, start: int = 0,
+                  progress: Optional[Callable[[int], None]] = None) -> Dict:
+        """Load a parsed book into Neo4j.
+
+        Args:
+            book: Result of parse_book()
+            start: Skip bonds before this index (resume; writes are MERGEs)
+            progress: Called with the number of bonds loaded so far
+
+        Returns:
+            Processing result with stats
+        """
+        book_id = book['book_id']
+        bonds_with_coords = book['bonds']
+        started = time.monotonic()
+
         # Create author
-        author = Author(name=author_name, era=era, domain=domain)
+        author = Author(name=book['author'], era=book['era'], domain=book['domain'])
         self.neo4j.add_author(author)
 
-        # Create book ID from filename
-        book_id = filepath.stem.replace(' ', '_').lower()
-
         # Create book record
-        book = BookRecord(
+        record = BookRecord(
             id=book_id,
-            title=title,
-            author=author_name,
-            filename=filename,
-            genre=genre,
+            title=book['title'],
+            author=book['author'],
+            filename=book['filename'],
+            genre=book['genre'],
             processed_at=datetime.now(),
             n_bonds=len(bonds_with_coords),
-            n_sentences=parsed.n_sentences,
-            n_chapters=parsed.n_chapters,
+            n_sentences=book['n_sentences'],
+            n_chapters=book['n_chapters'],
         )
-        self.neo4j.add_book(book)
-
-        # Add bonds and relationships
-        prev_bond = None
-        for i, (eb, bond) in enumerate(bonds_with_coords):
-            # Add bond node
-            bond_id = self.neo4j.add_bond(bond)
-
-            # Add CONTAINS relationship
-            self.neo4j.add_bond_to_book(
-                bond_id=bond_id,
-                book_id=book_id,
-                chapter=eb.chapter,
-                sentence=eb.sentence,
-                position=eb.position,
-            )
-
-            # Add FOLLOWS relationship
-            if prev_bond is not None:
-                self.neo4j.add_follows(
-                    source=prev_bond,
-                    target=bond,
-                    book_id=book_id,
-                    chapter=eb.chapter,
-                    sentence=eb.sentence,
-                    position=eb.position,
-                )
-
-            prev_bond = bond
+        self.neo4j.add_book(record)
+
+        # Add bonds, CONTAINS and FOLLOWS in chunks (one UNWIND transaction per
+        # chunk and edge type instead of three round-trips per bond)
+        batch_size = max(1, self.batch_size)
+        for chunk_start in range(start, len(bonds_with_coords), batch_size):
+            chunk_end = min(chunk_start + batch_size, len(bonds_with_coords))
+            chunk = bonds_with_coords[chunk_start:chunk_end]
+
+            self.neo4j.write_bonds([bond for _, bond in chunk], batch_size=batch_size)
+
+            contains = []
+            follows = []
+            for i in range(chunk_start, chunk_end):
+                eb, bond = bonds_with_coords[i]
+                position = {'chapter': eb.chapter, 'sentence': eb.sentence, 'position': eb.position}
+                contains.append(dict(position, bond_id=bond_node_id(bond)))
+                if i > 0:
+                    # The first edge of a chunk links back to the previous chunk
+                    follows.append(dict(position,
+                                        source_id=bond_node_id(bonds_with_coords[i - 1][1]),
+                                        target_id=bond_node_id(bond)))
+
+            self.neo4j.write_contains(book_id, contains, batch_size=batch_size)
+            self.neo4j.write_follows(book_id, follows, batch_size=batch_size)
 
             # Progress
-            if (i + 1) % 1000 == 0:
-                print(f"  Loaded {i + 1}/{len(bonds_with_coords)} bonds...")
+            print(f"  Loaded {chunk_end}/{len(bonds_with_coords)} bonds...")
+            if progress:
+                progress(chunk_end)
 
+        load_seconds = time.monotonic() - started
         print(f"  Done: {len(bonds_with_coords)} bonds loaded")
 
         return {
             'book_id': book_id,
-            'title': title,
-            'author': author_name,
+            'title': book['title'],
+            'author': book['author'],
             'n_bonds': len(bonds_with_coords),
-            'n_sentences': parsed.n_sentences,
-            'n_chapters': parsed.n_chapters,
-            'coords_found': found_coords,
+            'n_sentences': book['n_sentences'],
+            'n_chapters': book['n_chapters'],
+            'coords_found': book['coords_found'],
+            'parse_seconds': book.get('parse_seconds', 0.0),
+            'load_seconds': load_seconds,
         }
 
+    @staticmethod
+    def book_id(filepath: Path) -> str:
+        """Neo4j Book id for a file."""
+        return filepath.stem.replace(' ', '_').lower()
+
     def process_directory(self, directory: Path,
                           pattern: str = '*.txt',
                           limit: int = None) -> List[Dict]:
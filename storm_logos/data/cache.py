@@ -1,46 +1,423 @@
 """Coordinate Cache.
 
-Fast caching layer for coordinate lookups.
+Two-tier cache for coordinate lookups that would otherwise hit PostgreSQL.
+
+Tiers:
+    1. Local:  in-process LRU, bounded size, short TTL
+    2. Shared: Redis (REDIS_URL), shared by all workers, longer TTL
+
+Values are cached per namespace:
+    word          learned word coordinates (get_learned_word)
+    bond          corpus bond lookups (lookup_bond)
+    learned_bond  learned bond lookups (get_learned_bond)
+    estimate      estimate_word_coordinates results
+
+Misses are cached too (negative entries, shorter TTL), so repeated
+lookups of unknown words or bonds skip the database. Writers call
+invalidate() (or invalidate_word() for the bonds of a learned word)
+so the next read sees the new value; other workers' local tiers catch
+up within the local TTL.
+
+Bond keys ('adj|noun') are indexed by each of their words in both
+tiers, so invalidate_word() deletes exactly those keys instead of
+scanning the cache.
+
+Usage:
+    cache = get_cache()
+    found, bond = cache.lookup('bond', 'dark|forest')
+    if not found:
+        bond = query_db(...)
+        cache.store('bond', 'dark|forest', bond)   # None = negative entry
 """
 
-from typing import Dict, Optional, Tuple
 import json
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Set, Tuple
 
-from .models import WordCoordinates
+from .models import Bond, WordCoordinates
+from ..config import get_config, CacheConfig
 
 
-class CoordinateCache:
-    """In-memory cache for word coordinates.
+# Marker for cached misses (None is a valid "not found" value to return)
+_MISSING = object()
+
+# Namespaces whose 'adj|noun' keys are indexed by word (invalidate_word)
+_WORD_INDEXED = ('bond',)
+
+
+def _key_words(namespace: str, key: str) -> Tuple[str, ...]:
+    if namespace not in _WORD_INDEXED:
+        return ()
+    return tuple(dict.fromkeys(key.split('|')))
+
+
+# ============================================================================
+# SERIALIZATION
+# ============================================================================
+
+def _encode(namespace: str, value) -> str:
+    if value is None:
+        return 'null'
+    if isinstance(value, WordCoordinates):
+        return json.dumps({'word': value.word, 'A': value.A, 'S': value.S,
+                           'tau': value.tau, 'source': value.source})
+    if isinstance(value, Bond):
+        return json.dumps({'adj': value.adj, 'noun': value.noun, 'variety': value.variety,
+                           'A': value.A, 'S': value.S, 'tau': value.tau})
+    return json.dumps(value)
+
+
+def _decode(namespace: str, raw) -> Any:
+    data = json.loads(raw)
+    if data is None:
+        return None
+    if namespace == 'word':
+        return WordCoordinates(**data)
+    if namespace in ('bond', 'learned_bond'):
+        return Bond(**data)
+    if namespace == 'estimate':
+        return tuple(data)
+    return data
+
+
+# ============================================================================
+# TIER 1: LOCAL LRU
+# ============================================================================
+
+class LocalTier:
+    """Thread-safe in-process LRU with per-entry expiry."""
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max(1, max_size)
+        self.ttl = ttl
+        self._items: 'OrderedDict[Tuple[str, str], Tuple[Any, float]]' = OrderedDict()
+        # (namespace, word) -> keys, and key -> its indexed words
+        self._index: Dict[Tuple[str, str], Set[Tuple[str, str]]] = {}
+        self._words: Dict[Tuple[str, str], Tuple[str, ...]] = {}
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def get(self, key: Tuple[str, str]):
+        """Get value (None for a cached miss) or _MISSING."""
+        now = time.monotonic()
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return _MISSING
+            value, expires = item
+            if expires <= now:
+                del self._items[key]
+                self._unindex(key)
+                return _MISSING
+            self._items.move_to_end(key)
+            return value
+
+    def set(self, key: Tuple[str, str], value, ttl: Optional[float] = None,
+            words: Tuple[str, ...] = ()):
+        """Store a value; words index the key for delete_word()."""
+        expires = time.monotonic() + min(ttl or self.ttl, self.ttl)
+        with self._lock:
+            self._items[key] = (value, expires)
+            self._items.move_to_end(key)
+            if words and key not in self._words:
+                self._words[key] = words
+                for word in words:
+                    self._index.setdefault((key[0], word), set()).add(key)
+            while len(self._items) > self.max_size:
+                old, _ = self._items.popitem(last=False)
+                self._unindex(old)
+                self.evictions += 1
+
+    def delete(self, key: Tuple[str, str]):
+        with self._lock:
+            self._items.pop(key, None)
+            self._unindex(key)
 
-    Provides fast lookups with optional persistence.
+    def delete_word(self, namespace: str, word: str) -> int:
+        """Delete the keys indexed under a word."""
+        with self._lock:
+            keys = self._index.pop((namespace, word), set())
+            for key in keys:
+                self._items.pop(key, None)
+                self._unindex(key)
+        return len(keys)
+
+    def _unindex(self, key: Tuple[str, str]):
+        # Caller holds the lock
+        for word in self._words.pop(key, ()):
+            keys = self._index.get((key[0], word))
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._index[(key[0], word)]
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self._index.clear()
+            self._words.clear()
+
+    def items(self):
+        with self._lock:
+            return list(self._items.items())
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+# ============================================================================
+# TIER 2: SHARED (REDIS)
+# ============================================================================
+
+class RedisTier:
+    """Redis-backed shared tier.
+
+    Errors never propagate: after a failure the tier is skipped for
+    retry_after seconds and the cache runs on the local tier alone.
     """
 
-    def __init__(self, cache_path: Optional[Path] = None):
-        self._cache: Dict[str, WordCoordinates] = {}
+    def __init__(self, url: str, prefix: str = 'storm:coords',
+                 timeout: float = 0.05, retry_after: float = 30.0):
+        import redis
+        self._client = redis.Redis.from_url(
+            url, socket_timeout=timeout, socket_connect_timeout=timeout,
+        )
+        self.prefix = prefix
+        self.retry_after = retry_after
+        self._down_until = 0.0
+        self.errors = 0
+
+    def _key(self, key: Tuple[str, str]) -> str:
+        return f"{self.prefix}:{key[0]}:{key[1]}"
+
+    def _index_key(self, namespace: str, word: str) -> str:
+        return f"{self.prefix}:idx:{namespace}:{word}"
+
+    @property
+    def available(self) -> bool:
+        return time.monotonic() >= self._down_until
+
+    def _failed(self):
+        self.errors += 1
+        self._down_until = time.monotonic() + self.retry_after
+
+    def get(self, key: Tuple[str, str]):
+        """Get raw encoded value, or None if absent/unavailable."""
+        if not self.available:
+            return None
+        try:
+            return self._client.get(self._key(key))
+        except Exception:
+            self._failed()
+            return None
+
+    def set(self, key: Tuple[str, str], raw: str, ttl: float,
+            words: Tuple[str, ...] = (), index_ttl: Optional[float] = None):
+        """Store a raw value; words add the key to per-word index sets.
+
+        Index sets expire after max(ttl, index_ttl), so they outlive the
+        keys they list and are refreshed by every store.
+        """
+        if not self.available:
+            return
+        try:
+            if not words:
+                self._client.set(self._key(key), raw, px=max(1, int(ttl * 1000)))
+                return
+            index_px = max(1, int(max(ttl, index_ttl or ttl) * 1000))
+            pipe = self._client.pipeline(transaction=False)
+            pipe.set(self._key(key), raw, px=max(1, int(ttl * 1000)))
+            for word in words:
+                index = self._index_key(key[0], word)
+                pipe.sadd(index, key[1])
+                pipe.pexpire(index, index_px)
+            pipe.execute()
+        except Exception:
+            self._failed()
+
+    def delete(self, key: Tuple[str, str]):
+        if not self.available:
+            return
+        try:
+            self._client.delete(self._key(key))
+        except Exception:
+            self._failed()
+
+    def delete_word(self, namespace: str, word: str):
+        """Delete the keys indexed under a word, and the index."""
+        if not self.available:
+            return
+        try:
+            index = self._index_key(namespace, word)
+            members = self._client.smembers(index)
+            keys = [self._key((namespace, m.decode() if isinstance(m, bytes) else m))
+                    for m in members]
+            for start in range(0, len(keys), 1000):
+                self._client.delete(*keys[start:start + 1000])
+            self._client.delete(index)
+        except Exception:
+            self._failed()
+
+
+# ============================================================================
+# COORDINATE CACHE
+# ============================================================================
+
+class CoordinateCache:
+    """Two-tier cache (local LRU + optional Redis) for coordinate lookups."""
+
+    def __init__(self, config: Optional[CacheConfig] = None,
+                 cache_path: Optional[Path] = None,
+                 shared: Optional[RedisTier] = None):
+        """Initialize cache.
+
+        Args:
+            config: Cache configuration (defaults to get_config().cache)
+            cache_path: Optional JSON file for save()/load() of word entries
+            shared: Shared tier (defaults to Redis if config.redis_url is set)
+        """
+        self.config = config or get_config().cache
         self.cache_path = cache_path
+        self._shared = shared
+        if self._shared is None and self.config.redis_url:
+            try:
+                self._shared = RedisTier(self.config.redis_url, self.config.redis_prefix)
+            except ImportError:
+                print("  Warning (Cache): redis not installed, using local tier only")
+
+        # local_ttl only bounds staleness against other workers' writes;
+        # without a shared tier the local entries live as long as ttl
+        local_ttl = self.config.local_ttl if self._shared is not None else self.config.ttl
+        self._local = LocalTier(self.config.max_size, local_ttl)
+
+        self._stats_lock = threading.Lock()
         self._hits = 0
         self._misses = 0
+        self._local_hits = 0
+        self._shared_hits = 0
+        self._negative_hits = 0
+        self._invalidations = 0
 
         if cache_path and cache_path.exists():
             self.load()
 
-    def get(self, word: str) -> Optional[WordCoordinates]:
-        """Get coordinates from cache."""
-        coords = self._cache.get(word.lower())
-        if coords:
+    # ========================================================================
+    # MAIN INTERFACE
+    # ========================================================================
+
+    def lookup(self, namespace: str, key: str) -> Tuple[bool, Any]:
+        """Look up a cached value.
+
+        Returns:
+            (found, value). value is None for a cached miss.
+        """
+        full_key = (namespace, key)
+
+        value = self._local.get(full_key)
+        if value is not _MISSING:
+            self._count(hit=True, local=True, negative=value is None)
+            return True, value
+
+        if self._shared is not None:
+            raw = self._shared.get(full_key)
+            if raw is not None:
+                try:
+                    value = _decode(namespace, raw)
+                except (ValueError, TypeError):
+                    value = _MISSING
+                if value is not _MISSING:
+                    self._local.set(full_key, value, words=_key_words(namespace, key))
+                    self._count(hit=True, local=False, negative=value is None)
+                    return True, value
+
+        self._count(hit=False)
+        return False, None
+
+    def store(self, namespace: str, key: str, value,
+              ttl: Optional[float] = None):
+        """Cache a value. None stores a negative entry.
+
+        Args:
+            namespace: Value namespace ('word', 'bond', ...)
+            key: Key within the namespace
+            value: Value to cache (None = known miss)
+            ttl: Seconds to keep (defaults to config ttl / negative_ttl)
+        """
+        if ttl is None:
+            ttl = self.config.negative_ttl if value is None else self.config.ttl
+        full_key = (namespace, key)
+        words = _key_words(namespace, key)
+        self._local.set(full_key, value, ttl, words)
+        if self._shared is not None:
+            self._shared.set(full_key, _encode(namespace, value), ttl,
+                             words=words, index_ttl=self.config.ttl)
+
+    def invalidate(self, namespace: str, key: str):
+        """Drop a key from both tiers."""
+        full_key = (namespace, key)
+        self._local.delete(full_key)
+        if self._shared is not None:
+            self._shared.delete(full_key)
+        with self._stats_lock:
+            self._invalidations += 1
+
+    def invalidate_word(self, namespace: str, word: str) -> int:
+        """Drop every key of a word-indexed namespace that contains word.
+
+        Only the keys indexed under the word are touched, in both tiers.
+
+        Returns:
+            Number of local entries dropped
+        """
+        dropped = self._local.delete_word(namespace, word)
+        if self._shared is not None:
+            self._shared.delete_word(namespace, word)
+        with self._stats_lock:
+            self._invalidations += dropped
+        return dropped
+
+    def get_or_load(self, namespace: str, key: str,
+                    loader: Callable[[], Any]):
+        """Return cached value, or call loader and cache its result."""
+        found, value = self.lookup(namespace, key)
+        if found:
+            return value
+        value = loader()
+        self.store(namespace, key, value)
+        return value
+
+    def _count(self, hit: bool, local: bool = False, negative: bool = False):
+        with self._stats_lock:
+            if not hit:
+                self._misses += 1
+                return
             self._hits += 1
-        else:
-            self._misses += 1
+            if local:
+                self._local_hits += 1
+            else:
+                self._shared_hits += 1
+            if negative:
+                self._negative_hits += 1
+
+    # ========================================================================
+    # WORD SHORTCUTS
+    # ========================================================================
+
+    def get(self, word: str) -> Optional[WordCoordinates]:
+        """Get word coordinates from cache."""
+        _, coords = self.lookup('word', word.lower())
         return coords
 
     def set(self, word: str, coords: WordCoordinates):
-        """Add coordinates to cache."""
-        self._cache[word.lower()] = coords
+        """Add word coordinates to cache."""
+        self.store('word', word.lower(), coords)
 
     def has(self, word: str) -> bool:
-        """Check if word is in cache."""
-        return word.lower() in self._cache
+        """Check if word has (positive) coordinates in cache."""
+        return self.get(word) is not None
 
     def get_coords(self, word: str) -> Optional[Tuple[float, float, float]]:
         """Get (A, S, τ) tuple from cache."""
@@ -52,18 +429,24 @@ class CoordinateCache:
     def bulk_set(self, items: Dict[str, WordCoordinates]):
         """Add multiple items to cache."""
         for word, coords in items.items():
-            self._cache[word.lower()] = coords
+            self.set(word, coords)
 
     def clear(self):
-        """Clear the cache."""
-        self._cache.clear()
-        self._hits = 0
-        self._misses = 0
+        """Clear the local tier and statistics."""
+        self._local.clear()
+        with self._stats_lock:
+            self._hits = self._misses = 0
+            self._local_hits = self._shared_hits = self._negative_hits = 0
+            self._invalidations = 0
+
+    # ========================================================================
+    # STATS
+    # ========================================================================
 
     @property
     def size(self) -> int:
-        """Number of items in cache."""
-        return len(self._cache)
+        """Number of items in the local tier."""
+        return len(self._local)
 
     @property
     def hit_rate(self) -> float:
@@ -75,38 +458,48 @@ class CoordinateCache:
 
     def stats(self) -> Dict:
         """Get cache statistics."""
-        return {
-            'size': self.size,
-            'hits': self._hits,
-            'misses': self._misses,
-            'hit_rate': self.hit_rate,
-        }
+        with self._stats_lock:
+            return {
+                'size': self.size,
+                'max_size': self._local.max_size,
+                'hits': self._hits,
+                'misses': self._misses,
+                'local_hits': self._local_hits,
+                'shared_hits': self._shared_hits,
+                'negative_hits': self._negative_hits,
+                'invalidations': self._invalidations,
+                'evictions': self._local.evictions,
+                'hit_rate': self.hit_rate,
+                'shared': self._shared is not None,
+                'shared_errors': self._shared.errors if self._shared else 0,
+            }
 
     # ========================================================================
     # PERSISTENCE
     # ========================================================================
 
     def save(self, path: Optional[Path] = None):
-        """Save cache to disk."""
+        """Save cached word coordinates (local tier) to disk."""
         path = path or self.cache_path
         if not path:
             raise ValueError("No cache path specified")
 
         data = {
-            word: {
+            key: {
                 'A': coords.A,
                 'S': coords.S,
                 'tau': coords.tau,
                 'source': coords.source,
             }
-            for word, coords in self._cache.items()
+            for (namespace, key), (coords, _) in self._local.items()
+            if namespace == 'word' and coords is not None
         }
 
         with open(path, 'w') as f:
             json.dump(data, f)
 
     def load(self, path: Optional[Path] = None):
-        """Load cache from disk."""
+        """Load word coordinates from disk into the cache."""
         path = path or self.cache_path
         if not path or not path.exists():
             return
@@ -115,10 +508,25 @@ class CoordinateCache:
             data = json.load(f)
 
         for word, coords in data.items():
-            self._cache[word] = WordCoordinates(
+            self.set(word, WordCoordinates(
                 word=word,
                 A=coords['A'],
                 S=coords['S'],
                 tau=coords['tau'],
                 source=coords.get('source', 'cache'),
-            )
+            ))
+
+
+# ============================================================================
+# SINGLETON
+# ============================================================================
+
+_cache_instance: Optional[CoordinateCache] = None
+
+
+def get_cache() -> CoordinateCache:
+    """Get singleton CoordinateCache instance."""
+    global _cache_instance
+    if _cache_instance is None:
+        _cache_instance = CoordinateCache()
+    return _cache_instance
@@ -0,0 +1,216 @@
+"""PostgreSQL Connection Pool.
+
+Thread-safe pool shared by all PostgresData operations, replacing a
+psycopg2.connect() per call.
+
+Features:
+    - Bounded size (minconn..maxconn) with an acquire timeout
+    - Health check: closed connections are replaced, connections idle
+      longer than health_check_interval are pinged before use
+    - Broken connections (OperationalError/InterfaceError) are discarded
+    - Checkout and wait-time statistics
+
+Usage:
+    pool = ConnectionPool(get_config().db)
+    with pool.connection() as conn:
+        cur = conn.cursor()
+        cur.execute('SELECT 1')
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+import psycopg2
+from psycopg2.pool import ThreadedConnectionPool
+
+from ..config import DatabaseConfig
+
+
+class PoolTimeout(Exception):
+    """Raised when no connection becomes available within the timeout."""
+
+
+class ConnectionPool:
+    """Thread-safe PostgreSQL connection pool with acquire timeout."""
+
+    def __init__(self, config: DatabaseConfig,
+                 minconn: Optional[int] = None,
+                 maxconn: Optional[int] = None,
+                 timeout: Optional[float] = None,
+                 health_check_interval: Optional[float] = None):
+        """Initialize pool. Connections are opened lazily on first use.
+
+        Args:
+            config: Database configuration
+            minconn: Connections kept open (defaults to config.pool_min)
+            maxconn: Maximum open connections (defaults to config.pool_max)
+            timeout: Seconds to wait for a free connection (config.pool_timeout)
+            health_check_interval: Idle seconds before a connection is
+                pinged with SELECT 1 (config.pool_health_check_interval)
+        """
+        self.config = config
+        self.minconn = minconn if minconn is not None else config.pool_min
+        self.maxconn = max(1, maxconn if maxconn is not None else config.pool_max)
+        self.timeout = timeout if timeout is not None else config.pool_timeout
+        self.health_check_interval = (
+            health_check_interval if health_check_interval is not None
+            else config.pool_health_check_interval
+        )
+
+        self._pool: Optional[ThreadedConnectionPool] = None
+        self._init_lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.maxconn)
+        self._stats_lock = threading.Lock()
+        self._last_used: Dict[int, float] = {}
+
+        self._checkouts = 0
+        self._timeouts = 0
+        self._discarded = 0
+        self._health_failures = 0
+        self._in_use = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    # ========================================================================
+    # MAIN INTERFACE
+    # ========================================================================
+
+    @contextmanager
+    def connection(self) -> Iterator['psycopg2.extensions.connection']:
+        """Check out a connection for the duration of the block.
+
+        Open transactions are rolled back when the connection is returned,
+        so writers must commit explicitly.
+
+        Raises:
+            PoolTimeout: No connection available within the timeout
+        """
+        start = time.perf_counter()
+        if not self._slots.acquire(timeout=self.timeout):
+            with self._stats_lock:
+                self._timeouts += 1
+            raise PoolTimeout(
+                f"No PostgreSQL connection available after {self.timeout:.1f}s "
+                f"(pool size {self.maxconn})"
+            )
+
+        try:
+            conn = self._checkout()
+        except Exception:
+            self._slots.release()
+            raise
+
+        waited = time.perf_counter() - start
+        with self._stats_lock:
+            self._checkouts += 1
+            self._in_use += 1
+            self._wait_total += waited
+            self._wait_max = max(self._wait_max, waited)
+
+        broken = False
+        try:
+            yield conn
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            broken = True
+            raise
+        finally:
+            self._checkin(conn, broken)
+            with self._stats_lock:
+                self._in_use -= 1
+            self._slots.release()
+
+    def close(self):
+        """Close all pooled connections."""
+        with self._init_lock:
+            if self._pool is not None:
+                self._pool.closeall()
+                self._pool = None
+            self._last_used.clear()
+
+    # ========================================================================
+    # CHECKOUT / CHECKIN
+    # ========================================================================
+
+    def _get_pool(self) -> ThreadedConnectionPool:
+        if self._pool is None:
+            with self._init_lock:
+                if self._pool is None:
+                    self._pool = ThreadedConnectionPool(
+                        self.minconn, self.maxconn, **self.config.as_dict()
+                    )
+        return self._pool
+
+    def _checkout(self):
+        pool = self._get_pool()
+
+        # Idle connections may all have gone stale (e.g. DB restart)
+        for _ in range(self.maxconn):
+            conn = pool.getconn()
+            if self._is_healthy(conn):
+                return conn
+
+            with self._stats_lock:
+                self._health_failures += 1
+                self._discarded += 1
+            self._last_used.pop(id(conn), None)
+            pool.putconn(conn, close=True)
+
+        return pool.getconn()
+
+    def _checkin(self, conn, broken: bool):
+        pool = self._pool
+        if pool is None:
+            # Pool was closed while the connection was out
+            conn.close()
+            return
+
+        if broken or conn.closed:
+            with self._stats_lock:
+                self._discarded += 1
+            self._last_used.pop(id(conn), None)
+            pool.putconn(conn, close=True)
+            return
+
+        self._last_used[id(conn)] = time.monotonic()
+        pool.putconn(conn)
+
+    def _is_healthy(self, conn) -> bool:
+        """Check a connection before handing it out."""
+        if conn.closed:
+            return False
+
+        last_used = self._last_used.get(id(conn))
+        if last_used is None or time.monotonic() - last_used < self.health_check_interval:
+            return True
+
+        try:
+            cur = conn.cursor()
+            cur.execute('SELECT 1')
+            cur.close()
+            conn.rollback()
+            return True
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            return False
+
+    # ========================================================================
+    # STATS
+    # ========================================================================
+
+    def stats(self) -> Dict:
+        """Get pool statistics."""
+        with self._stats_lock:
+            return {
+                'max_size': self.maxconn,
+                'in_use': self._in_use,
+                'checkouts': self._checkouts,
+                'timeouts': self._timeouts,
+                'discarded': self._discarded,
+                'health_failures': self._health_failures,
+                'wait_seconds_total': self._wait_total,
+                'wait_seconds_max': self._wait_max,
+                'wait_seconds_avg': (
+                    self._wait_total / self._checkouts if self._checkouts else 0.0
+                ),
+            }
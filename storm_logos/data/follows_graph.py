@@ -0,0 +1,453 @@
+"""Follows Graph: In-memory CSR adjacency of the FOLLOWS graph.
+
+Storm asks Neo4j "where did authors go from here?" for every step.
+The answer changes slowly, so it is served from a local copy:
+
+    ids:     bond id -> int node (insertion order)
+    indptr:  (N+1,) int64   row offsets
+    indices: (E,)   int32   target nodes, each row sorted by weight desc
+    weights: (E,)   float32 edge weight (max over parallel edges)
+    coords:  (N, 3) float32 A, S, τ of each node
+
+Parallel FOLLOWS edges (one per book position) collapse into one
+weighted edge per (source, target) pair.
+
+Freshness:
+    - load() pulls every Bond node and edge in two bulk queries
+    - refresh() pulls only pairs with an edge whose last_used/created_at
+      is newer than the watermark; they land in a small delta overlay
+      that is folded into the CSR arrays when it grows. The lookup is
+      backed by relationship indexes on FOLLOWS.last_used/created_at
+      (ensure_indexes), so it does not scan every edge
+    - a full reload every reload_interval picks up decayed weights,
+      which do not move the timestamps
+    - start() runs the initial load and all refreshes/reloads on a
+      background thread (every max_staleness seconds); readers never
+      wait on Neo4j, and get_followers() answers None (ask Neo4j)
+      until the first load has finished
+
+Usage:
+    graph = FollowsGraph(driver, max_staleness=60)
+    graph.start()
+    followers = graph.get_followers('dark_forest', limit=50)
+    if followers is None:
+        ...  # not loaded yet, or unknown bond id: ask Neo4j
+    graph.stop()
+"""
+
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .models import Bond
+
+
+# Delta edges kept before folding them into the CSR arrays
+DELTA_MAX = 50_000
+
+
+# ============================================================================
+# QUERIES
+# ============================================================================
+
+_NODES_QUERY = """
+MATCH (b:Bond)
+RETURN b.id AS id, b.adj AS adj, b.noun AS noun, b.A AS A, b.S AS S, b.tau AS tau
+"""
+
+_EDGES_QUERY = """
+MATCH (s:Bond)-[f:FOLLOWS]->(t:Bond)
+WITH s.id AS source, t.id AS target,
+     max(coalesce(f.weight, 1.0)) AS weight,
+     max(coalesce(f.last_used, f.created_at)) AS ts
+RETURN source, target, weight, ts.epochMillis AS ts
+"""
+
+# One index-seekable range predicate per branch (coalesce() would not use them)
+_CHANGED_QUERY = """
+CALL {
+    MATCH (s:Bond)-[f:FOLLOWS]->(t:Bond)
+    WHERE f.last_used >= datetime({epochMillis: $since})
+    RETURN s, t
+    UNION
+    MATCH (s:Bond)-[f:FOLLOWS]->(t:Bond)
+    WHERE f.created_at >= datetime({epochMillis: $since})
+    RETURN s, t
+}
+WITH DISTINCT s, t
+MATCH (s)-[f:FOLLOWS]->(t)
+WITH s, t,
+     max(coalesce(f.weight, 1.0)) AS weight,
+     max(coalesce(f.last_used, f.created_at)) AS ts
+RETURN s.id AS source, s.adj AS source_adj, s.noun AS source_noun,
+       s.A AS source_A, s.S AS source_S, s.tau AS source_tau,
+       t.id AS target, t.adj AS target_adj, t.noun AS target_noun,
+       t.A AS target_A, t.S AS target_S, t.tau AS target_tau,
+       weight, ts.epochMillis AS ts
+"""
+
+_INDEX_QUERIES = (
+    "CREATE INDEX follows_last_used IF NOT EXISTS FOR ()-[f:FOLLOWS]-() ON (f.last_used)",
+    "CREATE INDEX follows_created_at IF NOT EXISTS FOR ()-[f:FOLLOWS]-() ON (f.created_at)",
+)
+
+
+class FollowsGraph:
+    """CSR snapshot of FOLLOWS edges with incremental refresh."""
+
+    def __init__(self, driver=None, max_staleness: float = 60.0,
+                 reload_interval: float = 3600.0, delta_max: int = DELTA_MAX):
+        """Initialize (empty until load()).
+
+        Args:
+            driver: neo4j Driver (anything with session() -> run())
+            max_staleness: Seconds between background refreshes
+            reload_interval: Seconds between full reloads (0 = never)
+            delta_max: Delta edges kept before compaction
+        """
+        self._driver = driver
+        self.max_staleness = max_staleness
+        self.reload_interval = reload_interval
+        self.delta_max = delta_max
+
+        # Nodes
+        self._ids: Dict[str, int] = {}
+        self._adj: List[Optional[str]] = []
+        self._noun: List[str] = []
+        self._coords = np.zeros((0, 3), dtype=np.float32)
+
+        # Edges: CSR over the first n_csr nodes + overlay {src: {dst: w}}
+        self._csr = self._empty_csr()
+        self._delta: Dict[int, Dict[int, float]] = {}
+        self._delta_size = 0
+
+        self._watermark: Optional[int] = None   # epoch millis
+        self._loaded_at = 0.0
+        self._refreshed_at = 0.0
+        self._write_lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._loaded_event = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.reloads = 0
+        self.refresh_errors = 0
+
+    @staticmethod
+    def _empty_csr() -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        return (np.zeros(1, dtype=np.int64),
+                np.zeros(0, dtype=np.int32),
+                np.zeros(0, dtype=np.float32))
+
+    # ========================================================================
+    # PROPERTIES
+    # ========================================================================
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded_at > 0
+
+    @property
+    def n_nodes(self) -> int:
+        return len(self._noun)
+
+    @property
+    def n_edges(self) -> int:
+        return len(self._csr[1]) + self._delta_size
+
+    @property
+    def age(self) -> float:
+        """Seconds since the last load or refresh."""
+        if not self.loaded:
+            return float('inf')
+        return time.monotonic() - self._refreshed_at
+
+    # ========================================================================
+    # BACKGROUND
+    # ========================================================================
+
+    def start(self):
+        """Load and keep refreshing on a daemon thread (returns immediately)."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='follows-graph', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = 5.0):
+        """Stop the background thread."""
+        self._stop.set()
+        thread, self._thread = self._thread, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def wait_loaded(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the first load. Returns True once the graph is loaded."""
+        return self._loaded_event.wait(timeout)
+
+    def _run(self):
+        try:
+            self.ensure_indexes()
+        except Exception as e:
+            print(f"  Warning (FollowsGraph): could not create FOLLOWS indexes: {e}")
+
+        while not self._stop.is_set():
+            self._refresh_if_idle()
+            self._stop.wait(self.max_staleness)
+
+    def ensure_indexes(self):
+        """Create the relationship indexes refresh() relies on."""
+        with self._driver.session() as session:
+            for query in _INDEX_QUERIES:
+                session.run(query).consume()
+
+    # ========================================================================
+    # LOADING
+    # ========================================================================
+
+    def load(self):
+        """Bulk-load all Bond nodes and FOLLOWS edges."""
+        with self._driver.session() as session:
+            nodes = list(session.run(_NODES_QUERY))
+            edges = list(session.run(_EDGES_QUERY))
+        self.load_records(nodes, edges)
+
+    def load_records(self, nodes, edges):
+        """Replace the graph with node and edge records.
+
+        Args:
+            nodes: Records with id, adj, noun, A, S, tau
+            edges: Records with source, target, weight, ts (epoch millis)
+        """
+        ids: Dict[str, int] = {}
+        adj: List[Optional[str]] = []
+        noun: List[str] = []
+        coords = np.empty((len(nodes), 3), dtype=np.float32)
+        for record in nodes:
+            node = ids.setdefault(record['id'], len(noun))
+            if node == len(noun):
+                adj.append(record['adj'])
+                noun.append(record['noun'])
+            coords[node] = _coords(record)
+        coords = coords[:len(noun)]
+
+        src = np.empty(len(edges), dtype=np.int64)
+        dst = np.empty(len(edges), dtype=np.int64)
+        weights = np.empty(len(edges), dtype=np.float32)
+        watermark = None
+        n = 0
+        for record in edges:
+            s = ids.get(record['source'])
+            t = ids.get(record['target'])
+            if s is None or t is None:
+                continue
+            src[n], dst[n], weights[n] = s, t, record['weight']
+            ts = record['ts']
+            if ts is not None and (watermark is None or ts > watermark):
+                watermark = ts
+            n += 1
+
+        csr = _build_csr(src[:n], dst[:n], weights[:n], len(noun))
+        now = time.monotonic()
+        with self._write_lock:
+            self._ids, self._adj, self._noun, self._coords = ids, adj, noun, coords
+            self._csr = csr
+            self._delta, self._delta_size = {}, 0
+            self._watermark = watermark
+            self._loaded_at = self._refreshed_at = now
+        self.reloads += 1
+        self._loaded_event.set()
+
+    def refresh(self) -> int:
+        """Pull pairs whose edges changed since the watermark.
+
+        Falls back to a full load() when due (reload_interval) or when
+        nothing has been loaded yet.
+
+        Returns:
+            Number of changed pairs applied
+        """
+        if not self.loaded or (
+            self.reload_interval and
+            time.monotonic() - self._loaded_at >= self.reload_interval
+        ):
+            self.load()
+            return self.n_edges
+
+        since = self._watermark or 0
+        with self._driver.session() as session:
+            records = list(session.run(_CHANGED_QUERY, since=since))
+        return self.apply_changes(records)
+
+    def apply_changes(self, records) -> int:
+        """Merge changed-pair records (see _CHANGED_QUERY) into the delta."""
+        with self._write_lock:
+            for record in records:
+                s = self._node(record, 'source')
+                t = self._node(record, 'target')
+                row = self._delta.setdefault(s, {})
+                if t not in row:
+                    self._delta_size += 1
+                row[t] = float(record['weight'])
+                ts = record['ts']
+                if ts is not None and (self._watermark is None or ts > self._watermark):
+                    self._watermark = ts
+
+            if self._delta_size > self.delta_max:
+                self._compact()
+            self._refreshed_at = time.monotonic()
+        self.refreshes += 1
+        return len(records)
+
+    def _node(self, record, prefix: str) -> int:
+        """Node for a record's source/target, adding or updating it."""
+        bond_id = record[prefix]
+        node = self._ids.get(bond_id)
+        values = {key: record[f'{prefix}_{key}'] for key in ('A', 'S', 'tau')}
+        if node is None:
+            node = len(self._noun)
+            if node == len(self._coords):
+                grown = np.zeros((max(16, 2 * node), 3), dtype=np.float32)
+                grown[:node] = self._coords
+                self._coords = grown
+            self._adj.append(record[f'{prefix}_adj'])
+            self._noun.append(record[f'{prefix}_noun'])
+            self._ids[bond_id] = node
+        self._coords[node] = _coords(values)
+        return node
+
+    def _compact(self):
+        """Fold the delta overlay into new CSR arrays."""
+        indptr, indices, weights = self._csr
+        n_csr = len(indptr) - 1
+        src = np.repeat(np.arange(n_csr, dtype=np.int64), np.diff(indptr))
+        dst = indices.astype(np.int64)
+        w = weights.copy()
+
+        d_src, d_dst, d_w = [], [], []
+        for s, row in self._delta.items():
+            for t, weight in row.items():
+                d_src.append(s)
+                d_dst.append(t)
+                d_w.append(weight)
+
+        # Delta entries come last, so keeping the last duplicate lets them win
+        src = np.concatenate([src, np.asarray(d_src, dtype=np.int64)])
+        dst = np.concatenate([dst, np.asarray(d_dst, dtype=np.int64)])
+        w = np.concatenate([w, np.asarray(d_w, dtype=np.float32)])
+        keys = (src << 32) | dst
+        _, last = np.unique(keys[::-1], return_index=True)
+        keep = len(keys) - 1 - last
+
+        self._csr = _build_csr(src[keep], dst[keep], w[keep], self.n_nodes)
+        self._delta, self._delta_size = {}, 0
+
+    # ========================================================================
+    # QUERIES
+    # ========================================================================
+
+    def get_followers(self, bond_id: str, limit: int = 50) -> Optional[List[Bond]]:
+        """Followers of a bond, strongest edges first.
+
+        Never touches Neo4j: refreshes run on the background thread.
+
+        Returns:
+            List of bonds ([] if the bond has no FOLLOWS edges), or None
+            if the graph is not loaded yet or the bond id is unknown to it
+            (caller asks Neo4j)
+        """
+        node = self._ids.get(bond_id)
+        if node is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+
+        targets, weights = self.neighbors(node)
+        order = np.argsort(-weights, kind='stable')[:limit]
+        return [self._bond(int(t)) for t in targets[order]]
+
+    def neighbors(self, node: int) -> Tuple[np.ndarray, np.ndarray]:
+        """(targets, weights) of a node, CSR row merged with the delta."""
+        indptr, indices, weights = self._csr
+        if node < len(indptr) - 1:
+            start, end = indptr[node], indptr[node + 1]
+            targets, w = indices[start:end], weights[start:end]
+        else:
+            targets = np.zeros(0, dtype=np.int32)
+            w = np.zeros(0, dtype=np.float32)
+
+        if node in self._delta:
+            with self._write_lock:
+                row = dict(self._delta.get(node, {}))
+            merged = dict(zip(targets.tolist(), w.tolist()))
+            merged.update(row)
+            targets = np.fromiter(merged.keys(), dtype=np.int32, count=len(merged))
+            w = np.fromiter(merged.values(), dtype=np.float32, count=len(merged))
+        return targets, w
+
+    def _refresh_if_idle(self):
+        """Refresh unless another thread already is (it keeps serving)."""
+        if not self._refresh_lock.acquire(blocking=False):
+            return
+        try:
+            self.refresh()
+        except Exception as e:
+            self.refresh_errors += 1
+            # Keep serving the old graph; retry after another staleness window
+            print(f"  Warning (FollowsGraph): refresh failed: {e}")
+        finally:
+            self._refresh_lock.release()
+
+    def _bond(self, node: int) -> Bond:
+        A, S, tau = self._coords[node].tolist()
+        return Bond(noun=self._noun[node], adj=self._adj[node], A=A, S=S, tau=tau)
+
+    # ========================================================================
+    # STATS
+    # ========================================================================
+
+    def stats(self) -> Dict:
+        """Graph size, freshness and hit counters."""
+        indptr, indices, weights = self._csr
+        total = self.hits + self.misses
+        return {
+            'loaded': self.loaded,
+            'n_nodes': self.n_nodes,
+            'n_edges': self.n_edges,
+            'delta_edges': self._delta_size,
+            'age_seconds': self.age if self.loaded else None,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+            'refreshes': self.refreshes,
+            'reloads': self.reloads,
+            'refresh_errors': self.refresh_errors,
+            'nbytes': (indptr.nbytes + indices.nbytes + weights.nbytes
+                       + self._coords.nbytes),
+        }
+
+
+# ============================================================================
+# HELPERS
+# ============================================================================
+
+def _coords(record) -> Tuple[float, float, float]:
+    """(A, S, τ) with the defaults Neo4jData.get_followers uses."""
+    return (record['A'] or 0.0, record['S'] or 0.0, record['tau'] or 2.5)
+
+
+def _build_csr(src: np.ndarray, dst: np.ndarray, weights: np.ndarray,
+               n_nodes: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """CSR arrays with each row sorted by weight (descending)."""
+    order = np.lexsort((-weights, src))
+    counts = np.bincount(src, minlength=n_nodes) if len(src) else np.zeros(n_nodes, dtype=np.int64)
+    indptr = np.zeros(n_nodes + 1, dtype=np.int64)
+    np.cumsum(counts, out=indptr[1:])
+    return (indptr,
+            dst[order].astype(np.int32),
+            weights[order].astype(np.float32))
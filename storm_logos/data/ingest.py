@@ -0,0 +1,319 @@
+"""Book Ingestion: Parallel, resumable BookProcessor pipeline.
+
+Parsing (spaCy + coordinate lookup) is CPU-bound and independent per
+book; loading into Neo4j goes through one connection. The pipeline
+overlaps the two:
+
+    books → [parse workers (processes)] → bounded queue → [Neo4j writer]
+
+    - workers:    books parsed concurrently, one process each
+    - n_process:  spaCy processes per book (chapters sharded via nlp.pipe)
+    - queue_size: parsed books waiting for the writer; parsing pauses
+                  when the writer falls behind (bounds memory)
+
+A book that fails to load (including checkpoint errors) is reported and
+the writer moves on. If the writer thread itself dies, the producer
+stops parsing instead of blocking on the full queue, and run() raises
+the writer's error.
+
+Progress is checkpointed per book to a JSON file. A rerun skips books
+already loaded (unless the file changed) and resumes a partly loaded
+book from its last checkpoint; Neo4j writes are MERGEs, so the overlap
+is harmless.
+
+Usage:
+    from storm_logos.data.book_parser import BookProcessor
+    from storm_logos.data.ingest import BookIngestor
+
+    processor = BookProcessor()
+    processor.connect()
+
+    ingestor = BookIngestor(processor, workers=4, checkpoint_path=Path('ingest.json'))
+    report = ingestor.run([(path, None) for path in sorted(books_dir.glob('*.txt'))])
+    print(report['bonds_per_second'])
+"""
+
+import json
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .book_parser import BookProcessor
+
+
+# ============================================================================
+# CHECKPOINTS
+# ============================================================================
+
+class IngestCheckpoint:
+    """Per-book ingestion progress, persisted as JSON."""
+
+    def __init__(self, path: Optional[Path] = None):
+        """Initialize checkpoint.
+
+        Args:
+            path: JSON file (None = in memory only)
+        """
+        self.path = Path(path) if path else None
+        self._lock = threading.Lock()
+        self._books: Dict[str, Dict] = {}
+        if self.path and self.path.exists():
+            with open(self.path) as f:
+                self._books = json.load(f).get('books', {})
+
+    @staticmethod
+    def fingerprint(filepath: Path) -> str:
+        """Size and mtime of a book file (changes trigger reprocessing)."""
+        stat = filepath.stat()
+        return f"{stat.st_size}:{int(stat.st_mtime)}"
+
+    def get(self, book_id: str) -> Dict:
+        with self._lock:
+            return dict(self._books.get(book_id, {}))
+
+    def is_done(self, book_id: str, fingerprint: str) -> bool:
+        entry = self.get(book_id)
+        return entry.get('status') == 'done' and entry.get('fingerprint') == fingerprint
+
+    def resume_from(self, book_id: str, fingerprint: str) -> int:
+        """Bonds of a partly loaded book that are already in Neo4j."""
+        entry = self.get(book_id)
+        if entry.get('status') == 'loading' and entry.get('fingerprint') == fingerprint:
+            return entry.get('loaded', 0)
+        return 0
+
+    def update(self, book_id: str, **fields):
+        """Update a book's entry and persist."""
+        with self._lock:
+            entry = self._books.setdefault(book_id, {})
+            entry.update(fields)
+            entry['updated_at'] = datetime.now().isoformat()
+            self._save()
+
+    def _save(self):
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp, 'w') as f:
+            json.dump({'books': self._books}, f, indent=2)
+        os.replace(tmp, self.path)
+
+
+# ============================================================================
+# PARSE WORKERS
+# ============================================================================
+
+_worker_processor: Optional[BookProcessor] = None
+
+
+def _init_worker(model: str):
+    """Load the spaCy pipeline once per worker process."""
+    global _worker_processor
+    from .book_parser import BookParser
+    _worker_processor = BookProcessor(parser=BookParser(model))
+
+
+def _parse_worker(filepath: Path, metadata: Optional[Dict], n_process: int) -> Dict:
+    return _worker_processor.parse_book(filepath, metadata, n_process=n_process)
+
+
+# ============================================================================
+# PIPELINE
+# ============================================================================
+
+_DONE = object()
+
+
+class BookIngestor:
+    """Parse books in parallel and stream them into one Neo4j writer."""
+
+    # Seconds between writer liveness checks while the queue is full
+    put_timeout = 1.0
+
+    def __init__(self, processor: BookProcessor, workers: int = 1, n_process: int = 1,
+                 queue_size: int = 2, checkpoint_path: Optional[Path] = None):
+        """Initialize ingestor.
+
+        Args:
+            processor: Connected BookProcessor (its Neo4j connection is the writer)
+            workers: Books parsed concurrently (1 = parse in this process)
+            n_process: spaCy processes per book
+            queue_size: Parsed books buffered ahead of the writer
+            checkpoint_path: JSON checkpoint file (None = no resume)
+        """
+        self.processor = processor
+        self.workers = max(1, workers)
+        self.n_process = max(1, n_process)
+        self.queue_size = max(1, queue_size)
+        self.checkpoint = IngestCheckpoint(checkpoint_path)
+        self._writer_error: Optional[BaseException] = None
+
+    def run(self, books: List[Tuple[Path, Optional[Dict]]]) -> Dict:
+        """Ingest books.
+
+        Args:
+            books: (filepath, metadata or None) per book
+
+        Returns:
+            Report with per-book results and throughput (bonds per second)
+        """
+        started = time.monotonic()
+        results: List[Dict] = []
+        pending = []
+
+        for filepath, meta in books:
+            book_id = self.processor.book_id(filepath)
+            try:
+                fingerprint = IngestCheckpoint.fingerprint(filepath)
+            except OSError as e:
+                self._failed(results, filepath, e)
+                continue
+            if self.checkpoint.is_done(book_id, fingerprint):
+                print(f"Skipping (already loaded): {filepath.name}")
+                results.append({'book_id': book_id, 'file': str(filepath), 'skipped': True})
+                continue
+            pending.append((filepath, meta, fingerprint))
+
+        parsed: 'queue.Queue' = queue.Queue(maxsize=self.queue_size)
+        self._writer_error = None
+        writer = threading.Thread(target=self._write_loop, args=(parsed, results),
+                                  name='book-ingest-writer', daemon=True)
+        writer.start()
+        try:
+            self._parse_all(pending, parsed, results, writer)
+        finally:
+            self._put(parsed, _DONE, writer)
+            writer.join()
+
+        if self._writer_error is not None:
+            raise self._writer_error
+        return self._report(results, time.monotonic() - started)
+
+    # ------------------------------------------------------------------------
+    # Stages
+    # ------------------------------------------------------------------------
+
+    def _put(self, parsed: 'queue.Queue', item, writer: threading.Thread) -> bool:
+        """Hand an item to the writer; False if the writer has died."""
+        while writer.is_alive():
+            try:
+                parsed.put(item, timeout=self.put_timeout)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _parse_all(self, pending, parsed: 'queue.Queue', results: List[Dict],
+                   writer: threading.Thread):
+        """Producer: parse books and hand them to the writer."""
+        if self.workers == 1:
+            for filepath, meta, fingerprint in pending:
+                try:
+                    book = self.processor.parse_book(filepath, meta, n_process=self.n_process)
+                except Exception as e:
+                    self._failed(results, filepath, e)
+                    continue
+                if not self._put(parsed, (book, fingerprint), writer):
+                    return
+            return
+
+        model = self.processor.parser.nlp.model
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=self.workers, mp_context=context,
+                                 initializer=_init_worker, initargs=(model,)) as pool:
+            todo = list(pending)
+            running = {}
+
+            # At most `workers` books in flight; put() blocks while the queue is full
+            while todo or running:
+                while todo and len(running) < self.workers:
+                    filepath, meta, fingerprint = todo.pop(0)
+                    future = pool.submit(_parse_worker, filepath, meta, self.n_process)
+                    running[future] = (filepath, fingerprint)
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    filepath, fingerprint = running.pop(future)
+                    try:
+                        book = future.result()
+                    except Exception as e:
+                        self._failed(results, filepath, e)
+                        continue
+                    if not self._put(parsed, (book, fingerprint), writer):
+                        for other in running:
+                            other.cancel()
+                        return
+
+    def _write_loop(self, parsed: 'queue.Queue', results: List[Dict]):
+        """Consumer: load parsed books into Neo4j, checkpointing progress.
+
+        Per-book errors are reported and the loop keeps draining the
+        queue; anything else is kept in _writer_error for run() to raise.
+        """
+        try:
+            while True:
+                item = parsed.get()
+                if item is _DONE:
+                    return
+                book = item[0] if isinstance(item, tuple) and item else None
+                try:
+                    self._write_book(*item, results)
+                except Exception as e:
+                    filename = book.get('filename', '?') if isinstance(book, dict) else '?'
+                    self._failed(results, Path(str(filename)), e)
+        except BaseException as e:
+            self._writer_error = e
+
+    def _write_book(self, book: Dict, fingerprint: str, results: List[Dict]):
+        """Load one parsed book, resuming from its checkpoint."""
+        book_id = book['book_id']
+        start = self.checkpoint.resume_from(book_id, fingerprint)
+        if start:
+            print(f"  Resuming {book['title']} at bond {start:,}")
+
+        self.checkpoint.update(book_id, file=book['filename'], fingerprint=fingerprint,
+                               status='loading', loaded=start, n_bonds=len(book['bonds']))
+        result = self.processor.load_book(
+            book, start=start,
+            progress=lambda n, b=book_id: self.checkpoint.update(b, loaded=n),
+        )
+
+        result['bonds_loaded'] = result['n_bonds'] - start
+        self.checkpoint.update(book_id, status='done', loaded=result['n_bonds'])
+        rate = result['bonds_loaded'] / result['load_seconds'] if result['load_seconds'] else 0.0
+        print(f"  {result['title']}: {result['n_bonds']:,} bonds "
+              f"(parse {result['parse_seconds']:.1f}s, load {result['load_seconds']:.1f}s, "
+              f"{rate:,.0f} bonds/s)")
+        results.append(result)
+
+    @staticmethod
+    def _failed(results: List[Dict], filepath: Path, error: Exception):
+        print(f"Error processing {filepath}: {error}")
+        results.append({'file': str(filepath), 'error': str(error)})
+
+    def _report(self, results: List[Dict], elapsed: float) -> Dict:
+        loaded = [r for r in results if 'n_bonds' in r]
+        bonds = sum(r['bonds_loaded'] for r in loaded)
+        parse_seconds = sum(r['parse_seconds'] for r in loaded)
+        load_seconds = sum(r['load_seconds'] for r in loaded)
+        return {
+            'results': results,
+            'books_loaded': len(loaded),
+            'books_skipped': sum(1 for r in results if r.get('skipped')),
+            'books_failed': sum(1 for r in results if 'error' in r),
+            'bonds': bonds,
+            'elapsed_seconds': elapsed,
+            'parse_seconds': parse_seconds,
+            'load_seconds': load_seconds,
+            'bonds_per_second': bonds / elapsed if elapsed else 0.0,
+            'load_bonds_per_second': bonds / load_seconds if load_seconds else 0.0,
+            'workers': self.workers,
+            'n_process': self.n_process,
+        }
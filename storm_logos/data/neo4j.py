@@ -11,6 +11,10 @@ Extended Schema:
     (:Book)-[:CONTAINS {chapter, sentence, position}]->(:Bond)
     (:Bond)-[:FOLLOWS {book_id, chapter, sentence, position, weight, last_used, last_reinforced, source}]->(:Bond)
 
+    get_followers() is served from an in-memory copy of the FOLLOWS
+    graph (FollowsGraph), loaded at connect() and refreshed
+    incrementally by edge timestamps on a background thread.
+
 Weight Dynamics:
     dw/dt = lambda * (w_target - w)
 
@@ -29,11 +33,13 @@ Weight Dynamics:
         Context-inferred:   0.1   - Weakest, most uncertain
 """
 
+import threading
 from typing import List, Optional, Dict
 from dataclasses import dataclass, field
 from datetime import datetime
 
 from .models import Bond, Trajectory
+from .follows_graph import FollowsGraph
 
 
 @dataclass
@@ -91,6 +97,14 @@ class Neo4jData:
         self.password = password or config.password
         self._driver = None
         self._connected = False
+        # Rows per transaction for write_bonds / write_contains / write_follows
+        self.write_batch_size = config.write_batch_size
+
+        # In-memory FOLLOWS adjacency, loaded in the background after connect()
+        self.follows_cache_enabled = config.follows_cache
+        self._follows_config = config
+        self._follows: Optional[FollowsGraph] = None
+        self._follows_lock = threading.Lock()
 
     def connect(self) -> bool:
         """Connect to Neo4j."""
@@ -103,6 +117,8 @@ class Neo4jData:
             # Verify connection works
             self._driver.verify_connectivity()
             self._connected = True
+            # Start loading the FOLLOWS graph now, off the request path
+            _ = self.follows_graph
             return True
         except ImportError:
             print("Neo4j driver not installed. Run: pip install neo4j")
@@ -113,30 +129,103 @@ class Neo4jData:
 
     def close(self):
         """Close connection."""
+        if self._follows is not None:
+            self._follows.stop()
         if self._driver:
             self._driver.close()
             self._connected = False
+        self._follows = None
 
     # ========================================================================
     # QUERIES
     # ========================================================================
 
+    @property
+    def follows_graph(self) -> Optional[FollowsGraph]:
+        """In-memory FOLLOWS adjacency (None if disabled or not connected).
+
+        The first access starts the graph's background thread, which does
+        the bulk load and all later refreshes; until the load finishes
+        the graph answers None and lookups go to Neo4j.
+        """
+        if self._follows is not None or not self.follows_cache_enabled or not self._connected:
+            return self._follows
+
+        with self._follows_lock:
+            if self._follows is None and self.follows_cache_enabled:
+                graph = FollowsGraph(
+                    self._driver,
+                    max_staleness=self._follows_config.follows_max_staleness,
+                    reload_interval=self._follows_config.follows_reload_interval,
+                )
+                graph.start()
+                self._follows = graph
+        return self._follows
+
     def get_followers(self, bond_id: str, limit: int = 50) -> List[Bond]:
-        """Get bonds that FOLLOW this bond (where authors went next)."""
+        """Get bonds that FOLLOW this bond (where authors went next).
+
+        Served from the in-memory FOLLOWS graph; Neo4j is queried only
+        for bonds the graph does not know yet.
+        """
         if not self._connected:
             return []
 
+        graph = self.follows_graph
+        if graph is not None:
+            followers = graph.get_followers(bond_id, limit)
+            if followers is not None:
+                return followers
+
+        return self._query_followers_many([bond_id], limit)[bond_id]
+
+    def get_followers_many(self, bond_ids: List[str],
+                           limit: int = 50) -> Dict[str, List[Bond]]:
+        """Get FOLLOWS targets for many bonds in one round trip.
+
+        Args:
+            bond_ids: Source bond ids
+            limit: Maximum followers per bond
+
+        Returns:
+            Dict of bond_id -> followers (missing ids map to [])
+        """
+        results: Dict[str, List[Bond]] = {bond_id: [] for bond_id in bond_ids}
+        if not self._connected or not bond_ids:
+            return results
+
+        missing = list(results)
+        graph = self.follows_graph
+        if graph is not None:
+            missing = []
+            for bond_id in results:
+                followers = graph.get_followers(bond_id, limit)
+                if followers is None:
+                    missing.append(bond_id)
+                else:
+                    results[bond_id] = followers
+
+        if missing:
+            results.update(self._query_followers_many(missing, limit))
+        return results
+
+    def _query_followers_many(self, bond_ids: List[str],
+                              limit: int = 50) -> Dict[str, List[Bond]]:
+        """Query FOLLOWS targets from Neo4j, bypassing the FOLLOWS graph."""
+        results: Dict[str, List[Bond]] = {bond_id: [] for bond_id in bond_ids}
+
         query = """
-        MATCH (b:Bond {id: $bond_id})-[:FOLLOWS]->(next:Bond)
-        RETURN next.adj, next.noun, next.A, next.S, next.tau
-        LIMIT $limit
+        UNWIND $bond_ids AS bond_id
+        MATCH (b:Bond {id: bond_id})-[:FOLLOWS]->(next:Bond)
+        WITH bond_id, collect(next)[..$limit] AS nexts
+        UNWIND nexts AS next
+        RETURN bond_id, next.adj, next.noun, next.A, next.S, next.tau
         """
 
-        results = []
         with self._driver.session() as session:
-            records = session.run(query, bond_id=bond_id, limit=limit)
+            records = session.run(query, bond_ids=list(results), limit=limit)
             for record in records:
-                results.append(Bond(
+                results[record['bond_id']].append(Bond(
                     noun=record['next.noun'],
                     adj=record['next.adj'],
                     A=record['next.A'] or 0.0,
@@ -414,6 +503,7 @@ class Neo4jData:
             'n_follows': n_follows,
             'n_books': n_books,
             'n_authors': n_authors,
+            'follows_cache': self._follows.stats() if self._follows else None,
         }
 
     def get_all_books(self) -> List[Book]:
@@ -1001,10 +1091,13 @@ class Neo4jData:
 
     def learn_trajectory(self, bonds: List[Bond],
                          conversation_id: str = 'default',
-                         source_type: str = 'conversation') -> int:
+                         source_type: str = 'conversation') -> Dict[str, int]:
         """Learn a sequence of bonds from conversation.
 
-        Creates Bond nodes and FOLLOWS edges for the trajectory.
+        Merges all Bond nodes and the FOLLOWS edges between consecutive
+        bonds in one statement (one round-trip), with the same semantics
+        as learn_bond() and learn_transition(): new edges start at the
+        conversation/context weight, existing ones gain 0.05 up to 1.0.
 
         Args:
             bonds: List of bonds in order
@@ -1012,26 +1105,98 @@ class Neo4jData:
             source_type: 'conversation' or 'context'
 
         Returns:
-            Number of edges created
+            {'bonds': nodes merged, 'edges': edges learned,
+             'created': new edges, 'reinforced': existing edges}
         """
-        if not self._connected or len(bonds) < 2:
-            return 0
+        counts = {'bonds': 0, 'edges': 0, 'created': 0, 'reinforced': 0}
+        if not self._connected or not bonds:
+            return counts
 
-        count = 0
-        for i in range(len(bonds)):
-            # Create/update bond node
-            self.learn_bond(bonds[i], source=source_type)
+        from .weight_dynamics import WEIGHT_CONVERSATION, WEIGHT_CONTEXT
 
-            # Create transition to next bond
-            if i > 0:
-                self.learn_transition(
-                    bonds[i-1], bonds[i],
-                    conversation_id=conversation_id,
-                    source_type=source_type
-                )
-                count += 1
+        # Determine initial weight based on source type
+        init_weight = WEIGHT_CONVERSATION if source_type == 'conversation' else WEIGHT_CONTEXT
 
-        return count
+        # Nodes: first occurrence wins (later ones would only touch last_used)
+        nodes = {}
+        for bond in bonds:
+            bond_id = bond_node_id(bond)
+            if bond_id not in nodes:
+                nodes[bond_id] = {
+                    'id': bond_id,
+                    'adj': bond.adj,
+                    'noun': bond.noun,
+                    'A': bond.A,
+                    'S': bond.S,
+                    'tau': bond.tau,
+                }
+
+        # Edges: in order, so a repeated transition is created then reinforced
+        ids = [bond_node_id(bond) for bond in bonds]
+        edges = [
+            {'index': i, 'source_id': ids[i - 1], 'target_id': ids[i]}
+            for i in range(1, len(ids))
+        ]
+
+        # datetime() is fixed per statement, so created_at = datetime()
+        # identifies edges created by this call
+        query = """
+        UNWIND $nodes AS node
+        MERGE (b:Bond {id: node.id})
+        ON CREATE SET
+            b.adj = node.adj,
+            b.noun = node.noun,
+            b.A = node.A,
+            b.S = node.S,
+            b.tau = node.tau,
+            b.source = $source_type,
+            b.created_at = datetime()
+        ON MATCH SET
+            b.last_used = datetime()
+        WITH count(*) AS merged
+        UNWIND $edges AS edge
+        MATCH (s:Bond {id: edge.source_id}), (t:Bond {id: edge.target_id})
+        MERGE (s)-[f:FOLLOWS {conversation_id: $conv_id}]->(t)
+        ON CREATE SET
+            f.weight = $init_weight,
+            f.source = $source_type,
+            f.created_at = datetime(),
+            f.last_used = datetime()
+        ON MATCH SET
+            f.weight = CASE
+                WHEN f.weight < 1.0 THEN f.weight + 0.05
+                ELSE f.weight
+            END,
+            f.last_used = datetime()
+        RETURN edge.index AS index, f.created_at = datetime() AS created
+        """
+
+        def run(tx):
+            result = tx.run(query,
+                nodes=list(nodes.values()),
+                edges=edges,
+                conv_id=conversation_id,
+                init_weight=init_weight,
+                source_type=source_type,
+            )
+            return [(record['index'], record['created']) for record in result]
+
+        with self._driver.session() as session:
+            rows = session.execute_write(run)
+
+        counts['bonds'] = len(nodes)
+        seen = set()
+        for index, created in sorted(rows):
+            pair = (ids[index - 1], ids[index])
+            # Only the first occurrence of a pair can have created the edge
+            if created and pair not in seen:
+                counts['created'] += 1
+            else:
+                counts['reinforced'] += 1
+            seen.add(pair)
+        counts['edges'] = len(rows)
+
+        return counts
 
     def get_learned_bonds(self, limit: int = 100) -> List[Bond]:
         """Get bonds learned from conversations (not corpus).
@@ -1166,6 +1331,108 @@ class Neo4jData:
                 "conversations": n_conversations,
             }
 
+    # ========================================================================
+    # BATCHED WRITES
+    # ========================================================================
+
+    def write_bonds(self, bonds: List[Bond], batch_size: Optional[int] = None) -> int:
+        """MERGE bond nodes with chunked UNWIND, one transaction per chunk.
+
+        Args:
+            bonds: Bonds to write (duplicates are written once)
+            batch_size: Rows per transaction (default NEO4J_WRITE_BATCH_SIZE)
+
+        Returns:
+            Number of distinct bonds written
+        """
+        query = """
+        UNWIND $rows AS row
+        MERGE (b:Bond {id: row.id})
+        SET b.adj = row.adj, b.noun = row.noun,
+            b.A = row.A, b.S = row.S, b.tau = row.tau
+        """
+
+        rows = {}
+        for bond in bonds:
+            bond_id = bond_node_id(bond)
+            if bond_id not in rows:
+                rows[bond_id] = {
+                    'id': bond_id,
+                    'adj': bond.adj,
+                    'noun': bond.noun,
+                    'A': bond.A,
+                    'S': bond.S,
+                    'tau': bond.tau,
+                }
+
+        return self._write_batches(query, list(rows.values()), batch_size)
+
+    def write_contains(self, book_id: str, rows: List[Dict],
+                       batch_size: Optional[int] = None) -> int:
+        """MERGE CONTAINS relationships from a book with chunked UNWIND.
+
+        Args:
+            book_id: Book ID
+            rows: Dicts with bond_id, chapter, sentence, position
+            batch_size: Rows per transaction (default NEO4J_WRITE_BATCH_SIZE)
+
+        Returns:
+            Number of rows written
+        """
+        query = """
+        MATCH (book:Book {id: $book_id})
+        UNWIND $rows AS row
+        MATCH (bond:Bond {id: row.bond_id})
+        MERGE (book)-[:CONTAINS {chapter: row.chapter, sentence: row.sentence,
+                                 position: row.position}]->(bond)
+        """
+        return self._write_batches(query, rows, batch_size, book_id=book_id)
+
+    def write_follows(self, book_id: str, rows: List[Dict], weight: float = 1.0,
+                      edge_source: str = 'corpus', batch_size: Optional[int] = None) -> int:
+        """MERGE FOLLOWS edges with chunked UNWIND (same keys as add_follows).
+
+        Args:
+            book_id: Book ID
+            rows: Dicts with source_id, target_id, chapter, sentence, position
+            weight: Initial weight for new edges (default 1.0 for corpus)
+            edge_source: Source type ('corpus', 'conversation', 'context')
+            batch_size: Rows per transaction (default NEO4J_WRITE_BATCH_SIZE)
+
+        Returns:
+            Number of rows written
+        """
+        query = """
+        UNWIND $rows AS row
+        MATCH (s:Bond {id: row.source_id}), (t:Bond {id: row.target_id})
+        MERGE (s)-[f:FOLLOWS {book_id: $book_id, chapter: row.chapter,
+                              sentence: row.sentence, position: row.position}]->(t)
+        ON CREATE SET
+            f.weight = $weight,
+            f.source = $edge_source,
+            f.created_at = datetime(),
+            f.last_used = datetime()
+        """
+        return self._write_batches(query, rows, batch_size, book_id=book_id,
+                                   weight=weight, edge_source=edge_source)
+
+    def _write_batches(self, query: str, rows: List[Dict],
+                       batch_size: Optional[int] = None, **params) -> int:
+        """Run an UNWIND $rows query in chunks, one write transaction each."""
+        if not self._connected or not rows:
+            return 0
+
+        batch_size = max(1, batch_size or self.write_batch_size)
+
+        def run(tx, chunk):
+            tx.run(query, rows=chunk, **params).consume()
+
+        with self._driver.session() as session:
+            for start in range(0, len(rows), batch_size):
+                session.execute_write(run, rows[start:start + batch_size])
+
+        return len(rows)
+
     # ========================================================================
     # SYNC HELPERS
     # ========================================================================
@@ -1279,6 +1546,11 @@ class Neo4jData:
         return len(edge_data)
 
 
+def bond_node_id(bond: Bond) -> str:
+    """Bond node id ("{adj}_{noun}", or the noun alone)."""
+    return f"{bond.adj}_{bond.noun}" if bond.adj else bond.noun
+
+
 # ============================================================================
 # SINGLETON
 # ============================================================================
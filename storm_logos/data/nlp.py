@@ -0,0 +1,249 @@
+"""NLP Service: One shared spaCy pipeline per process.
+
+TextExtractor, BondLearner, BookParser, DreamEngine and the scripts all
+parse through get_nlp_service(), so the model is loaded once (lazily, on
+first use) instead of once per component.
+
+Only the components bond extraction needs are loaded: tok2vec, tagger,
+attribute_ruler, lemmatizer and parser. NER and anything else listed in
+SPACY_EXCLUDE is excluded at load time.
+
+Recently parsed short texts are kept in a small LRU, so the session
+router calling extract_symbols() on the same message twice parses it once.
+Cached Docs are shared between callers and must be treated as read-only.
+
+Usage:
+    from storm_logos.data.nlp import get_nlp_service
+
+    nlp = get_nlp_service()
+    doc = nlp.parse("The dark forest held ancient secrets.")
+
+    # Many texts: batched through nlp.pipe
+    docs = nlp.parse_many(messages, batch_size=64)
+
+    # Long inputs (book chunks): streamed, never cached
+    for doc in nlp.pipe(chunks, batch_size=4, n_process=4):
+        ...
+
+    nlp.stats()   # loaded, cache hits/misses, ...
+"""
+
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from .cache import LocalTier, _MISSING
+from ..config import get_config, NLPConfig
+
+
+class NLPService:
+    """Lazily loaded, trimmed spaCy pipeline with a parsed-doc LRU."""
+
+    # Longer texts (book chunks) are never cached
+    MAX_CACHED_CHARS = 10000
+
+    def __init__(self, model: Optional[str] = None,
+                 config: Optional[NLPConfig] = None, nlp=None):
+        """Initialize service.
+
+        Args:
+            model: spaCy model name (defaults to config.model)
+            config: NLP configuration (defaults to get_config().nlp)
+            nlp: Already loaded spaCy Language (skips loading)
+        """
+        self.config = config or get_config().nlp
+        self.model = model or self.config.model
+        self._nlp = nlp
+        self._load_lock = threading.Lock()
+        self._download_attempted = False
+
+        self._docs = (LocalTier(self.config.doc_cache_size, float('inf'))
+                      if self.config.doc_cache_size > 0 else None)
+        self._stats_lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._parsed = 0
+
+    # ========================================================================
+    # LOADING
+    # ========================================================================
+
+    def load(self, download: bool = False):
+        """Load the spaCy pipeline (once).
+
+        Args:
+            download: Download the model if it is not installed
+
+        Returns:
+            spaCy Language
+
+        Raises:
+            ImportError: spaCy is not installed
+            OSError: Model not installed (and not downloaded)
+        """
+        if self._nlp is not None:
+            return self._nlp
+
+        with self._load_lock:
+            if self._nlp is None:
+                import spacy
+                try:
+                    self._nlp = spacy.load(self.model, exclude=self.config.exclude)
+                except OSError:
+                    if not download or self._download_attempted:
+                        raise
+                    self._download_attempted = True
+                    print(f"spaCy model '{self.model}' not found. Downloading...")
+                    try:
+                        spacy.cli.download(self.model)
+                    except (Exception, SystemExit) as e:
+                        raise OSError(f"Failed to download spaCy model: {e}") from e
+                    self._nlp = spacy.load(self.model, exclude=self.config.exclude)
+        return self._nlp
+
+    def available(self, download: bool = False) -> bool:
+        """Whether the pipeline can be loaded."""
+        try:
+            self.load(download=download)
+            return True
+        except (ImportError, OSError):
+            return False
+
+    @property
+    def nlp(self):
+        """The spaCy Language (loaded on first access)."""
+        return self.load()
+
+    @property
+    def loaded(self) -> bool:
+        return self._nlp is not None
+
+    # ========================================================================
+    # PARSING
+    # ========================================================================
+
+    def parse(self, text: str, cache: bool = True):
+        """Parse one text.
+
+        Args:
+            text: Input text
+            cache: Reuse / keep the Doc in the recent-docs LRU
+
+        Returns:
+            spaCy Doc
+        """
+        cache = cache and self._cacheable(text)
+        if cache:
+            doc = self._docs.get(('doc', text))
+            if doc is not _MISSING:
+                self._count(hits=1)
+                return doc
+
+        doc = self.nlp(text)
+        self._count(misses=1 if cache else 0, parsed=1)
+        if cache:
+            self._docs.set(('doc', text), doc)
+        return doc
+
+    def parse_many(self, texts: Iterable[str], batch_size: Optional[int] = None,
+                   n_process: Optional[int] = None, cache: bool = True) -> List:
+        """Parse many texts with nlp.pipe.
+
+        Args:
+            texts: Input texts
+            batch_size: Texts per pipe batch (defaults to config.batch_size)
+            n_process: Worker processes (defaults to config.n_process)
+            cache: Reuse / keep short texts' Docs in the recent-docs LRU
+
+        Returns:
+            spaCy Docs, in input order
+        """
+        texts = list(texts)
+        docs: List = [None] * len(texts)
+        pending: Dict[str, List[int]] = {}
+
+        for i, text in enumerate(texts):
+            if cache and self._cacheable(text):
+                doc = self._docs.get(('doc', text))
+                if doc is not _MISSING:
+                    docs[i] = doc
+                    self._count(hits=1)
+                    continue
+            pending.setdefault(text, []).append(i)
+
+        if pending:
+            unique = list(pending)
+            for text, doc in zip(unique, self.pipe(unique, batch_size, n_process)):
+                for i in pending[text]:
+                    docs[i] = doc
+                if cache and self._cacheable(text):
+                    self._docs.set(('doc', text), doc)
+                    self._count(misses=1)
+
+        return docs
+
+    def pipe(self, texts: Iterable[str], batch_size: Optional[int] = None,
+             n_process: Optional[int] = None) -> Iterator:
+        """Stream Docs from nlp.pipe without caching (for long inputs like books).
+
+        Args:
+            texts: Input texts
+            batch_size: Texts per pipe batch (defaults to config.batch_size)
+            n_process: Worker processes (defaults to config.n_process)
+
+        Yields:
+            spaCy Docs, in input order
+        """
+        for doc in self.nlp.pipe(
+            texts,
+            batch_size=batch_size or self.config.batch_size,
+            n_process=n_process or self.config.n_process,
+        ):
+            self._count(parsed=1)
+            yield doc
+
+    def clear(self):
+        """Drop cached Docs."""
+        if self._docs is not None:
+            self._docs.clear()
+
+    def _cacheable(self, text: str) -> bool:
+        return self._docs is not None and len(text) <= self.MAX_CACHED_CHARS
+
+    def _count(self, hits: int = 0, misses: int = 0, parsed: int = 0):
+        with self._stats_lock:
+            self._hits += hits
+            self._misses += misses
+            self._parsed += parsed
+
+    def stats(self) -> Dict:
+        """Get service statistics."""
+        with self._stats_lock:
+            total = self._hits + self._misses
+            return {
+                'model': self.model,
+                'loaded': self.loaded,
+                'pipeline': list(self._nlp.pipe_names) if self._nlp is not None else [],
+                'parsed': self._parsed,
+                'cache_size': len(self._docs) if self._docs is not None else 0,
+                'cache_hits': self._hits,
+                'cache_misses': self._misses,
+                'cache_hit_rate': self._hits / total if total else 0.0,
+            }
+
+
+# ============================================================================
+# SINGLETON
+# ============================================================================
+
+_services: Dict[str, NLPService] = {}
+_services_lock = threading.Lock()
+
+
+def get_nlp_service(model: Optional[str] = None) -> NLPService:
+    """Get the shared NLPService for a spaCy model (defaults to SPACY_MODEL)."""
+    model = model or get_config().nlp.model
+    with _services_lock:
+        service = _services.get(model)
+        if service is None:
+            service = _services[model] = NLPService(model)
+        return service
@@ -13,22 +13,41 @@ Learning Flow:
     3. Store in learned_bonds table
     4. Sync to Neo4j for trajectory
 
+Loading:
+    word_coordinates and hyp_bond_vocab are read through server-side
+    (named) cursors in chunks of POSTGRES_STREAM_BATCH_SIZE rows, so
+    startup never holds the full result set next to the tables built
+    from it. load_bonds(ready_after=N) returns once the top N bonds by
+    total_count are indexed and fills in the rest in the background.
+
 Tables:
     learned_bonds:  id, adj, noun, A, S, tau, source, confidence,
                     created_at, last_used, use_count
     learned_words:  word, A, S, tau, source, confidence,
                     created_at, last_used
+
+learn_bond() and mark_bond_used() go through a write-behind buffer
+(data/write_behind.py) unless LEARN_WRITE_BEHIND=false; pending writes
+are folded into get_learned_bond() and flushed before learned-bond
+listings and stats.
 """
 
 import json
-import math
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
-import psycopg2
-from psycopg2 import sql
 
 from .models import Bond, WordCoordinates
+from .bond_table import BondTable
+from .word_table import WordTable
+from .bloom import BloomFilter
+from .snapshot import Snapshot, content_hash, load_snapshot, write_snapshot, prune_snapshots
+from .connection_pool import ConnectionPool
+from .cache import CoordinateCache, get_cache, _MISSING
+from .spatial import SpatialIndex
+from .write_behind import LearnedBondBuffer
 from ..config import get_config, DatabaseConfig
 
 
@@ -39,14 +58,38 @@ class PostgresData:
     """
 
     def __init__(self, db_config: Optional[DatabaseConfig] = None,
-                 load_bonds: bool = False):
+                 load_bonds: bool = False,
+                 use_snapshot: Optional[bool] = None,
+                 cache: Optional[CoordinateCache] = None,
+                 write_behind: Optional[bool] = None):
         self.config = db_config or get_config().db
-        self._coordinates: Dict[str, WordCoordinates] = {}
-        self._bonds: List[Bond] = []
-        self._nouns: Dict[str, WordCoordinates] = {}
-        self._adjectives: Dict[str, WordCoordinates] = {}
+        self.cache = cache or get_cache()
+        self.snapshot_config = get_config().snapshot
+        self.use_snapshot = (self.snapshot_config.enabled
+                             if use_snapshot is None else use_snapshot)
+        self._pool = ConnectionPool(self.config)
+        self._coordinates = WordTable()
+        self._bonds = BondTable()
+        self._snapshot: Optional[Snapshot] = None
+        self._vocab_filter: Optional[BloomFilter] = None
+        self._filter_skips = 0
+        self._filter_lock = threading.Lock()
+        self._spatial: Optional[SpatialIndex] = None
+        self._spatial_lock = threading.Lock()
+        self._nouns: WordTable = self._coordinates
+        self._adjectives: Optional[Dict[str, WordCoordinates]] = None
         self._loaded = False
         self._bonds_loaded = False
+        self._bonds_thread: Optional[threading.Thread] = None
+        self._pending_bonds: Optional[List[Bond]] = None   # add_bond() while loading
+        self._source: Optional[str] = None   # snapshot / database / json
+
+        if write_behind is None:
+            write_behind = get_config().learning.write_behind
+        self._write_buffer: Optional[LearnedBondBuffer] = (
+            LearnedBondBuffer(lambda: self._connection(), on_flush=self._flushed_bonds)
+            if write_behind else None
+        )
 
         self.load_coordinates()
         if load_bonds:
@@ -57,23 +100,42 @@ class PostgresData:
     # ========================================================================
 
     @property
-    def coordinates(self) -> Dict[str, WordCoordinates]:
-        """All word coordinates."""
+    def coordinates(self) -> WordTable:
+        """All word coordinates (columnar mapping of word -> WordCoordinates)."""
         return self._coordinates
 
     @property
-    def bonds(self) -> List[Bond]:
-        """All loaded bonds."""
+    def bonds(self) -> BondTable:
+        """All loaded bonds (columnar; indexing materializes a Bond)."""
         return self._bonds
 
     @property
-    def nouns(self) -> Dict[str, WordCoordinates]:
+    def spatial_index(self) -> SpatialIndex:
+        """KD-tree over bond coordinates (rows align with self.bonds).
+
+        Built on first use and rebuilt after bonds are added.
+        """
+        index = self._spatial
+        if index is None:
+            with self._spatial_lock:
+                if self._spatial is None:
+                    self._spatial = SpatialIndex(self._bonds.coords)
+                index = self._spatial
+        return index
+
+    @property
+    def nouns(self) -> WordTable:
         """All nouns with coordinates."""
         return self._nouns
 
     @property
     def adjectives(self) -> Dict[str, WordCoordinates]:
-        """All adjectives with coordinates."""
+        """All adjectives with coordinates (built on first access)."""
+        if self._adjectives is None:
+            self._adjectives = {
+                word: coords for word, coords in self._coordinates.items()
+                if coords.source != 'abstraction'
+            }
         return self._adjectives
 
     @property
@@ -88,6 +150,52 @@ class PostgresData:
     def n_nouns(self) -> int:
         return len(self._nouns)
 
+    # ========================================================================
+    # CONNECTIONS
+    # ========================================================================
+
+    @contextmanager
+    def _connection(self):
+        """Check out a pooled connection (returned and rolled back on exit)."""
+        with self._pool.connection() as conn:
+            yield conn
+
+    def _stream(self, conn, query: str, params: Tuple = (),
+                name: str = 'storm_stream') -> Iterator[List[Tuple]]:
+        """Run a query on a server-side cursor and yield its rows in chunks.
+
+        Args:
+            conn: Pooled connection (the cursor lives in its transaction)
+            query: SELECT to run
+            params: Query parameters
+            name: Cursor name
+
+        Yields:
+            Lists of up to config.stream_batch_size rows
+        """
+        batch_size = self.config.stream_batch_size
+        cur = conn.cursor(name=name)
+        cur.itersize = batch_size
+        try:
+            cur.execute(query, params)
+            while True:
+                rows = cur.fetchmany(batch_size)
+                if not rows:
+                    return
+                yield rows
+        finally:
+            cur.close()
+
+    def pool_stats(self) -> Dict:
+        """Connection pool statistics (checkouts, waits, timeouts)."""
+        return self._pool.stats()
+
+    def close(self):
+        """Flush buffered learning writes and close all pooled connections."""
+        if self._write_buffer is not None:
+            self._write_buffer.close()
+        self._pool.close()
+
     # ========================================================================
     # LOADERS
     # ========================================================================
@@ -97,8 +205,10 @@ class PostgresData:
         if self._loaded:
             return self.n_coordinates
 
-        # 1. Load from word_coordinates table (primary source)
-        self._load_from_database()
+        # 1. Memory-mapped snapshot (shared between workers)
+        # 2. word_coordinates table (primary source)
+        if not self._load_from_snapshot():
+            self._load_from_database()
 
         # 2. Separate into nouns and adjectives
         self._categorize_words()
@@ -106,33 +216,71 @@ class PostgresData:
         self._loaded = True
         return self.n_coordinates
 
-    def _load_from_database(self):
+    def _load_from_snapshot(self) -> bool:
+        """Load coordinates (and bonds, if present) from the binary snapshot."""
+        if not self.use_snapshot:
+            return False
+
+        snapshot = load_snapshot(self.snapshot_config.path)
+        if snapshot is None:
+            return False
+
+        verified = False
+        if self.snapshot_config.verify:
+            try:
+                with self._connection() as conn:
+                    digest = content_hash(conn, snapshot.manifest.get('bond_limit') or 0)
+                if digest != snapshot.content_hash:
+                    print(f"  Snapshot {snapshot.content_hash} is stale (DB {digest}), ignoring")
+                    return False
+                verified = True
+            except Exception as e:
+                # DB unreachable: a stale snapshot beats the JSON fallback
+                print(f"  Warning (Snapshot verify): {e}")
+
+        self._snapshot = snapshot
+        if self.snapshot_config.vocab_filter and snapshot.vocab_filter is not None:
+            # The filter answers "definitely absent": only trust it when the
+            # snapshot is known to match the tables, else it hides real bonds
+            if verified:
+                self._vocab_filter = snapshot.vocab_filter
+            else:
+                print("  Vocab filter: snapshot not verified against the database, not used")
+        self._coordinates = snapshot.words
+        self._source = 'snapshot'
+        print(f"  Snapshot {snapshot.content_hash}: {len(self._coordinates):,} words mapped")
+        return True
+
+    def _load_from_database(self) -> bool:
         """Load coordinates from word_coordinates table in PostgreSQL."""
         try:
-            conn = psycopg2.connect(**self.config.as_dict())
-            cur = conn.cursor()
-
-            cur.execute('''
-                SELECT word, a, s, tau, source
-                FROM word_coordinates
-            ''')
-
-            for word, a, s, tau, source in cur.fetchall():
-                self._coordinates[word.lower()] = WordCoordinates(
-                    word=word.lower(),
-                    A=float(a) if a else 0.0,
-                    S=float(s) if s else 0.0,
-                    tau=float(tau) if tau else 2.5,
-                    source=source or 'db'
+            with self._connection() as conn:
+                chunks = self._stream(conn, '''
+                    SELECT word, a, s, tau, source
+                    FROM word_coordinates
+                ''', name='word_coordinates_stream')
+
+                self._coordinates = WordTable.from_rows(
+                    (
+                        word.lower(),
+                        float(a) if a else 0.0,
+                        float(s) if s else 0.0,
+                        float(tau) if tau else 2.5,
+                        source or 'db',
+                    )
+                    for rows in chunks
+                    for word, a, s, tau, source in rows
                 )
 
-            conn.close()
+            self._source = 'database'
             print(f"  Database: {len(self._coordinates):,} words loaded")
+            return True
 
         except Exception as e:
             print(f"  Warning (DB): {e}")
             # Fallback to JSON if database fails
             self._load_from_json_fallback()
+            return False
 
     def _load_from_json_fallback(self):
         """Fallback: Load coordinates from derived_coordinates.json."""
@@ -143,20 +291,15 @@ class PostgresData:
             with open(coord_path) as f:
                 data = json.load(f)
 
+            rows = []
             for word, coords in data.get('coordinates', {}).items():
                 if isinstance(coords, dict):
-                    self._coordinates[word] = WordCoordinates(
-                        word=word,
-                        A=coords.get('A', 0.0),
-                        S=coords.get('S', 0.0),
-                        tau=coords.get('n', 2.5),
-                        source='json'
-                    )
+                    rows.append((word, coords.get('A', 0.0), coords.get('S', 0.0),
+                                 coords.get('n', 2.5), 'json'))
                 else:
-                    self._coordinates[word] = WordCoordinates(
-                        word=word, A=coords[0], S=coords[1], tau=coords[2],
-                        source='json'
-                    )
+                    rows.append((word, coords[0], coords[1], coords[2], 'json'))
+            self._coordinates = WordTable.from_rows(rows)
+            self._source = 'json'
 
             print(f"  JSON fallback: {len(self._coordinates):,} words")
 
@@ -164,63 +307,270 @@ class PostgresData:
             print(f"  Warning (JSON fallback): {e}")
 
     def _categorize_words(self):
-        """Separate coordinates into nouns and adjectives."""
-        for word, coords in self._coordinates.items():
-            if coords.source == 'abstraction':
-                self._nouns[word] = coords
-            else:
-                # JSON words could be either
-                self._nouns[word] = coords
-                self._adjectives[word] = coords
+        """Separate coordinates into nouns and adjectives.
+
+        Every word can act as a noun; all but 'abstraction' words can
+        also be adjectives (built lazily, see adjectives).
+        """
+        self._nouns = self._coordinates
+        self._adjectives = None
+
+    def load_bonds(self, limit: int = 500000,
+                   progress: Optional[Callable[[int, int], None]] = None,
+                   ready_after: Optional[int] = None) -> int:
+        """Load bonds from hyp_bond_vocab, streamed in chunks.
 
-    def load_bonds(self, limit: int = 500000) -> int:
-        """Load bonds from hyp_bond_vocab."""
+        Args:
+            limit: Maximum hyp_bond_vocab rows (highest total_count first;
+                   from a snapshot: its first `limit` bonds)
+            progress: Called as progress(rows_read, bonds_loaded) per chunk
+            ready_after: Return once this many rows are indexed and load
+                         the rest in the background (defaults to
+                         config.bonds_ready_after; 0 = wait for all)
+
+        Returns:
+            Number of bonds available when the call returns
+        """
         if self._bonds_loaded:
             return self.n_bonds
 
+        if self._snapshot is not None and self._snapshot.bonds is not None:
+            bonds = self._snapshot.bonds
+            built_with = self._snapshot.manifest.get('bond_limit')
+            if limit < len(bonds):
+                # Rows are in load order (highest total_count first)
+                bonds = bonds.head(limit)
+            elif built_with and limit > built_with:
+                print(f"  Warning (Bonds): snapshot was built with limit {built_with:,}, "
+                      f"serving its {len(bonds):,} bonds (rebuild it for limit {limit:,})")
+            # Bonds added before loading are kept (appended after the snapshot's)
+            self._pending_bonds = list(self._bonds)
+            self._publish_bonds(bonds, final=True)
+            print(f"  Bonds: {len(bonds):,} mapped from snapshot")
+            return self.n_bonds
+
+        # Bonds added before loading are kept (appended after the corpus)
+        self._pending_bonds = list(self._bonds)
+
+        if ready_after is None:
+            ready_after = self.config.bonds_ready_after
+        if not ready_after or ready_after >= limit:
+            self._stream_bonds(limit, progress)
+            return self.n_bonds
+
+        ready = threading.Event()
+        self._bonds_thread = threading.Thread(
+            target=self._stream_bonds, args=(limit, progress, ready_after, ready),
+            name='bond-loader', daemon=True,
+        )
+        self._bonds_thread.start()
+        ready.wait()
+        return self.n_bonds
+
+    def wait_for_bonds(self, timeout: Optional[float] = None) -> bool:
+        """Wait for a background bond load to finish.
+
+        Returns:
+            True if no load is running any more
+        """
+        thread = self._bonds_thread
+        if thread is not None:
+            thread.join(timeout)
+            return not thread.is_alive()
+        return True
+
+    def _stream_bonds(self, limit: int,
+                      progress: Optional[Callable[[int, int], None]] = None,
+                      ready_after: int = 0,
+                      ready: Optional[threading.Event] = None):
+        """Build the bond table chunk by chunk from a server-side cursor.
+
+        With ready_after, a copy of the first rows (the highest
+        total_count) is published as soon as they are read; the full
+        table replaces it at the end. The early table is a prefix of the
+        full one, so row numbers stay valid across the swap.
+        """
+        table = BondTable()
+        n_rows = 0
+        published = False
+
         try:
-            conn = psycopg2.connect(**self.config.as_dict())
-            cur = conn.cursor()
+            with self._connection() as conn:
+                chunks = self._stream(conn, '''
+                    SELECT bond, total_count
+                    FROM hyp_bond_vocab
+                    WHERE total_count >= 3
+                    ORDER BY total_count DESC
+                    LIMIT %s
+                ''', (limit,), name='hyp_bond_vocab_stream')
+
+                for rows in chunks:
+                    self._extend_bonds(table, rows)
+                    n_rows += len(rows)
+                    if progress:
+                        progress(n_rows, len(table))
+
+                    if ready is not None and not published and n_rows >= ready_after:
+                        self._publish_bonds(self._copy_bonds(table))
+                        published = True
+                        print(f"  Bonds: {len(table):,} ready, loading the rest in the background")
+                        ready.set()
+
+            table.compact()
+            self._publish_bonds(table, final=True)
+            print(f"  Bonds: {len(table):,} loaded")
 
-            cur.execute('''
-                SELECT bond, total_count
-                FROM hyp_bond_vocab
-                WHERE total_count >= 3
-                ORDER BY total_count DESC
-                LIMIT %s
-            ''', (limit,))
-
-            for bond_str, variety in cur.fetchall():
-                parts = bond_str.split('|')
-                if len(parts) != 2:
-                    continue
-
-                adj, noun = parts[0].lower(), parts[1].lower()
-
-                # Skip non-English
-                if not self._is_english(adj) or not self._is_english(noun):
-                    continue
-
-                # Get coordinates from noun
-                if noun in self._coordinates:
-                    coords = self._coordinates[noun]
-                    self._bonds.append(Bond(
-                        noun=noun,
-                        adj=adj,
-                        variety=variety,
-                        A=coords.A,
-                        S=coords.S,
-                        tau=coords.tau,
-                    ))
+        except Exception as e:
+            print(f"  Warning (Bonds): {e}")
+            self._pending_bonds = None
+
+        finally:
+            if ready is not None:
+                ready.set()
+
+    def _extend_bonds(self, table: BondTable, rows: List[Tuple[str, int]]):
+        """Append one chunk of (bond, total_count) rows to a table."""
+        adjs, nouns, varieties, coords = [], [], [], []
+        for bond_str, variety in rows:
+            parts = bond_str.split('|')
+            if len(parts) != 2:
+                continue
+
+            adj, noun = parts[0].lower(), parts[1].lower()
+
+            # Skip non-English
+            if not self._is_english(adj) or not self._is_english(noun):
+                continue
 
-            conn.close()
+            # Get coordinates from noun
+            word = self._coordinates.get(noun)
+            if word:
+                adjs.append(adj)
+                nouns.append(noun)
+                varieties.append(variety)
+                coords.append((word.A, word.S, word.tau))
+
+        table.extend(adjs, nouns, varieties, coords)
+
+    @staticmethod
+    def _copy_bonds(table: BondTable) -> BondTable:
+        """Independent copy of a table that is still being appended to."""
+        return BondTable.from_arrays(
+            table.coords.copy(), table.variety.copy(),
+            table.adj_codes.copy(), table.noun_codes.copy(),
+            table.adj_vocab.words, table.noun_vocab.words,
+        )
+
+    def _publish_bonds(self, table: BondTable, final: bool = False):
+        """Make a bond table visible to readers."""
+        with self._spatial_lock:
+            if final and self._pending_bonds:
+                # Bonds added before or during the load
+                for bond in self._pending_bonds:
+                    table.append(bond)
+            if final:
+                self._pending_bonds = None
+            self._bonds = table
+            self._spatial = None
             self._bonds_loaded = True
-            print(f"  Bonds: {len(self._bonds):,} loaded")
+
+    def build_snapshot(self, bond_limit: int = 500000,
+                       root: Optional[Path] = None, keep: int = 2) -> Optional[Path]:
+        """Reload coordinates and bonds from PostgreSQL and write a snapshot.
+
+        Args:
+            bond_limit: Bond limit passed to load_bonds
+            root: Snapshot root (defaults to config snapshot path)
+            keep: Number of snapshot directories to keep
+
+        Returns:
+            Snapshot path, or None if the database could not be read
+        """
+        root = Path(root or self.snapshot_config.path)
+
+        with self._connection() as conn:
+            digest = content_hash(conn, bond_limit)
+
+        # Always build from the tables, never from an existing snapshot
+        if self._source != 'database':
+            self._snapshot = None
+            self._bonds_loaded = False
+            self._bonds = BondTable()
+            self._spatial = None
+            if not self._load_from_database():
+                return None
+            self._categorize_words()
+            self._loaded = True
+        self.load_bonds(limit=bond_limit, ready_after=0)
+        if not self._bonds_loaded:
+            return None
+
+        vocab_filter = None
+        if self.snapshot_config.vocab_filter:
+            vocab_filter = self.build_vocab_filter(self.snapshot_config.vocab_filter_fp_rate)
+
+        path = write_snapshot(root, digest, self._coordinates, self._bonds,
+                              bond_limit=bond_limit, vocab_filter=vocab_filter)
+        prune_snapshots(root, keep=keep)
+        return path
+
+    def build_vocab_filter(self, fp_rate: float = 0.01) -> Optional[BloomFilter]:
+        """Build a Bloom filter over every hyp_bond_vocab and bonds key.
+
+        Keys are streamed through a server-side cursor, so the 6M rows
+        are never held in memory at once.
+
+        Args:
+            fp_rate: Target false-positive rate
+
+        Returns:
+            BloomFilter, or None if the tables could not be read
+        """
+        try:
+            with self._connection() as conn:
+                cur = conn.cursor()
+                cur.execute('''
+                    SELECT (SELECT count(*) FROM hyp_bond_vocab)
+                         + (SELECT count(*) FROM bonds)
+                ''')
+                bloom = BloomFilter.create(cur.fetchone()[0], fp_rate)
+                cur.close()
+
+                for rows in self._stream(conn, '''
+                    SELECT bond FROM hyp_bond_vocab
+                    UNION ALL
+                    SELECT adj || '|' || noun FROM bonds WHERE adj IS NOT NULL
+                ''', name='vocab_filter_keys'):
+                    bloom.add_many(row[0] for row in rows)
 
         except Exception as e:
-            print(f"  Warning (Bonds): {e}")
+            print(f"  Warning (Vocab filter): {e}")
+            return None
 
-        return self.n_bonds
+        print(f"  Vocab filter: {bloom.n_items:,} keys, {len(bloom.bits) / 1e6:.1f} MB, "
+              f"k={bloom.n_hashes}, fp={bloom.fp_rate:.3%}")
+        return bloom
+
+    def _maybe_in_corpus(self, key: str) -> bool:
+        """False if the vocab filter rules the "adj|noun" key out of the corpus."""
+        if self._vocab_filter is None or key in self._vocab_filter:
+            return True
+        with self._filter_lock:
+            self._filter_skips += 1
+        return False
+
+    def add_bond(self, bond: Bond):
+        """Append a bond to the in-memory bond table.
+
+        The first bond for an (adj, noun) pair wins in get_bond(), matching
+        the load order (highest variety first).
+        """
+        with self._spatial_lock:
+            self._bonds.append(bond)
+            if self._pending_bonds is not None:
+                # Background load still running: re-add to the full table
+                self._pending_bonds.append(bond)
+            self._spatial = None
 
     @staticmethod
     def _is_english(word: str) -> bool:
@@ -250,10 +600,21 @@ class PostgresData:
 
     def get_bond(self, adj: str, noun: str) -> Optional[Bond]:
         """Get a specific bond by adj+noun from in-memory cache."""
-        for bond in self._bonds:
-            if bond.adj == adj.lower() and bond.noun == noun.lower():
-                return bond
-        return None
+        row = self._bonds.find(adj.lower(), noun.lower())
+        return self._bonds.bond(row) if row >= 0 else None
+
+    def get_bonds_many(self, pairs: List[Tuple[str, str]]) -> List[Optional[Bond]]:
+        """Get bonds for many (adj, noun) pairs from in-memory cache.
+
+        Args:
+            pairs: List of (adj, noun) tuples
+
+        Returns:
+            Bonds aligned with pairs (None where not loaded)
+        """
+        table = self._bonds
+        rows = [table.find(adj.lower(), noun.lower()) for adj, noun in pairs]
+        return [table.bond(row) if row >= 0 else None for row in rows]
 
     def lookup_bond(self, adj: str, noun: str) -> Optional[Bond]:
         """Look up a bond from PostgreSQL.
@@ -263,6 +624,8 @@ class PostgresData:
         2. hyp_bond_vocab table - 6M+ corpus bonds (adj|noun format)
 
         If found in hyp_bond_vocab, computes coordinates from individual words.
+        Pairs the snapshot's vocab filter rules out return None without a
+        cache or database lookup.
 
         Args:
             adj: Adjective
@@ -271,8 +634,28 @@ class PostgresData:
         Returns:
             Bond with coordinates, or None if not found in corpus
         """
+        adj, noun = adj.lower(), noun.lower()
+        key = f"{adj}|{noun}"
+
+        if not self._maybe_in_corpus(key):
+            return None
+
+        found, bond = self.cache.lookup('bond', key)
+        if found:
+            return bond
+
         try:
-            conn = psycopg2.connect(**self.config.as_dict())
+            bond = self._lookup_bond_db(adj, noun)
+        except Exception as e:
+            # Table might not exist or connection failed (not cached)
+            return None
+
+        self.cache.store('bond', key, bond)
+        return bond
+
+    def _lookup_bond_db(self, adj: str, noun: str) -> Optional[Bond]:
+        """Query bonds, then hyp_bond_vocab, for a lowercased adj+noun."""
+        with self._connection() as conn:
             cur = conn.cursor()
 
             # First check bonds table (pre-computed coordinates)
@@ -280,66 +663,135 @@ class PostgresData:
                 SELECT adj, noun, A, S, tau
                 FROM bonds
                 WHERE adj = %s AND noun = %s
-            """, (adj.lower(), noun.lower()))
+            """, (adj, noun))
             row = cur.fetchone()
 
             if row:
-                cur.close()
-                conn.close()
                 return Bond(adj=row[0], noun=row[1], A=row[2], S=row[3], tau=row[4])
 
             # Check hyp_bond_vocab (6M corpus bonds)
-            bond_key = f"{adj.lower()}|{noun.lower()}"
+            bond_key = f"{adj}|{noun}"
             cur.execute("""
                 SELECT bond, total_count
                 FROM hyp_bond_vocab
                 WHERE bond = %s
             """, (bond_key,))
             row = cur.fetchone()
-            cur.close()
-            conn.close()
 
-            if row:
-                # Bond exists in corpus, compute coordinates from words
-                adj_coords = self.get(adj)
-                noun_coords = self.get(noun)
-
-                if adj_coords and noun_coords:
-                    A = (adj_coords.A + noun_coords.A) / 2
-                    S = (adj_coords.S + noun_coords.S) / 2
-                    tau = (adj_coords.tau + noun_coords.tau) / 2
-                elif adj_coords:
-                    A, S, tau = adj_coords.A, adj_coords.S, adj_coords.tau
-                elif noun_coords:
-                    A, S, tau = noun_coords.A, noun_coords.S, noun_coords.tau
-                else:
-                    A, S, tau = 0.0, 0.0, 2.5
+        if row:
+            # Bond exists in corpus, compute coordinates from words
+            return self._corpus_bond(adj, noun)
+
+        return None
 
-                return Bond(adj=adj.lower(), noun=noun.lower(), A=A, S=S, tau=tau)
+    def lookup_bonds_many(self, pairs: List[Tuple[str, str]]) -> List[Optional[Bond]]:
+        """Look up many bonds from PostgreSQL in one query.
 
-            return None
-        except Exception as e:
-            # Table might not exist or connection failed
-            return None
+        Same sources and coordinates as lookup_bond(). Cached pairs are
+        served from the coordinate cache; the rest are resolved together
+        and cached (misses included).
+
+        Args:
+            pairs: List of (adj, noun) tuples
+
+        Returns:
+            Bonds aligned with pairs (None where not found in corpus)
+        """
+        keys = [(adj.lower(), noun.lower()) for adj, noun in pairs]
+        resolved: Dict[Tuple[str, str], Optional[Bond]] = {}
+        missing = []
+
+        for key in dict.fromkeys(keys):
+            if not self._maybe_in_corpus(f"{key[0]}|{key[1]}"):
+                resolved[key] = None
+                continue
+            found, bond = self.cache.lookup('bond', f"{key[0]}|{key[1]}")
+            if found:
+                resolved[key] = bond
+            else:
+                missing.append(key)
+
+        if missing:
+            try:
+                fetched = self._lookup_bonds_many_db(missing)
+            except Exception as e:
+                # Table might not exist or connection failed (not cached)
+                fetched = {}
+            else:
+                for (adj, noun), bond in fetched.items():
+                    self.cache.store('bond', f"{adj}|{noun}", bond)
+            resolved.update(fetched)
+
+        return [resolved.get(key) for key in keys]
+
+    def _lookup_bonds_many_db(self, keys: List[Tuple[str, str]]) -> Dict[Tuple[str, str], Optional[Bond]]:
+        """Resolve lowercased (adj, noun) pairs against bonds and hyp_bond_vocab at once."""
+        with self._connection() as conn:
+            cur = conn.cursor()
+            cur.execute("""
+                SELECT q.ord, b.A, b.S, b.tau, v.bond IS NOT NULL
+                FROM unnest(%s::text[], %s::text[]) WITH ORDINALITY AS q(adj, noun, ord)
+                LEFT JOIN bonds b ON b.adj = q.adj AND b.noun = q.noun
+                LEFT JOIN hyp_bond_vocab v ON v.bond = q.adj || '|' || q.noun
+                ORDER BY q.ord
+            """, ([adj for adj, _ in keys], [noun for _, noun in keys]))
+            rows = cur.fetchall()
+
+        results: Dict[Tuple[str, str], Optional[Bond]] = {}
+        for ord_, A, S, tau, in_vocab in rows:
+            adj, noun = keys[ord_ - 1]
+            if (adj, noun) in results:
+                continue  # duplicate rows: first bond wins
+            if A is not None:
+                results[(adj, noun)] = Bond(adj=adj, noun=noun, A=A, S=S, tau=tau)
+            elif in_vocab:
+                results[(adj, noun)] = self._corpus_bond(adj, noun)
+            else:
+                results[(adj, noun)] = None
+        return results
+
+    def _corpus_bond(self, adj: str, noun: str) -> Bond:
+        """Bond for a hyp_bond_vocab entry, coordinates averaged from its words."""
+        adj_coords = self.get(adj)
+        noun_coords = self.get(noun)
+
+        if adj_coords and noun_coords:
+            A = (adj_coords.A + noun_coords.A) / 2
+            S = (adj_coords.S + noun_coords.S) / 2
+            tau = (adj_coords.tau + noun_coords.tau) / 2
+        elif adj_coords:
+            A, S, tau = adj_coords.A, adj_coords.S, adj_coords.tau
+        elif noun_coords:
+            A, S, tau = noun_coords.A, noun_coords.S, noun_coords.tau
+        else:
+            A, S, tau = 0.0, 0.0, 2.5
+
+        return Bond(adj=adj, noun=noun, A=A, S=S, tau=tau)
 
     def get_bonds_for_noun(self, noun: str) -> List[Bond]:
         """Get all bonds containing a noun."""
-        noun_lower = noun.lower()
-        return [b for b in self._bonds if b.noun == noun_lower]
+        return self._bonds.bonds(self._bonds.rows_for_noun(noun.lower()))
 
     def get_neighbors(self, A: float, S: float, tau: float,
                       radius: float = 0.5) -> List[Bond]:
         """Get bonds within radius of (A, S, τ)."""
-        neighbors = []
-        for bond in self._bonds:
-            dist = math.sqrt(
-                (bond.A - A)**2 +
-                (bond.S - S)**2 +
-                (bond.tau - tau)**2
-            )
-            if dist <= radius:
-                neighbors.append(bond)
-        return neighbors
+        indices = self.spatial_index.query_radius((A, S, tau), radius)
+        return self._bonds.bonds(indices)
+
+    def get_neighbors_many(self, points: List[Tuple[float, float, float]],
+                           radius: float = 0.5) -> List[List[Bond]]:
+        """Get bonds within radius of each of several (A, S, τ) points."""
+        table = self._bonds
+        return [
+            table.bonds(indices)
+            for indices in self.spatial_index.query_radius_many(points, radius)
+        ]
+
+    def get_nearest(self, A: float, S: float, tau: float,
+                    k: int = 1) -> List[Bond]:
+        """Get the k bonds nearest to (A, S, τ), closest first."""
+        _, indices = self.spatial_index.query_knn((A, S, tau), k)
+        return self._bonds.bonds(indices)
 
     def stats(self) -> Dict:
         """Return statistics about loaded data."""
@@ -349,6 +801,14 @@ class PostgresData:
             'n_bonds': self.n_bonds,
             'loaded': self._loaded,
             'bonds_loaded': self._bonds_loaded,
+            'bonds_loading': self._bonds_thread is not None and self._bonds_thread.is_alive(),
+            'source': self._source,
+            'snapshot': self._snapshot.content_hash if self._snapshot else None,
+            'vocab_filter': self._vocab_filter.meta() if self._vocab_filter is not None else None,
+            'vocab_filter_skips': self._filter_skips,
+            'cache': self.cache.stats(),
+            'write_behind': self._write_buffer.stats() if self._write_buffer is not None else None,
+            'pool': self.pool_stats(),
         }
 
     # ========================================================================
@@ -366,54 +826,53 @@ class PostgresData:
             True if tables were created/verified
         """
         try:
-            conn = psycopg2.connect(**self.config.as_dict())
-            cur = conn.cursor()
+            with self._connection() as conn:
+                cur = conn.cursor()
+
+                # Create learned_bonds table
+                cur.execute('''
+                    CREATE TABLE IF NOT EXISTS learned_bonds (
+                        id SERIAL PRIMARY KEY,
+                        adj VARCHAR(100) NOT NULL,
+                        noun VARCHAR(100) NOT NULL,
+                        A FLOAT DEFAULT 0.0,
+                        S FLOAT DEFAULT 0.0,
+                        tau FLOAT DEFAULT 2.5,
+                        source VARCHAR(50) DEFAULT 'conversation',
+                        confidence FLOAT DEFAULT 0.5,
+                        created_at TIMESTAMP DEFAULT NOW(),
+                        last_used TIMESTAMP DEFAULT NOW(),
+                        use_count INTEGER DEFAULT 1,
+                        UNIQUE(adj, noun)
+                    )
+                ''')
+
+                # Create learned_words table
+                cur.execute('''
+                    CREATE TABLE IF NOT EXISTS learned_words (
+                        word VARCHAR(100) PRIMARY KEY,
+                        A FLOAT DEFAULT 0.0,
+                        S FLOAT DEFAULT 0.0,
+                        tau FLOAT DEFAULT 2.5,
+                        source VARCHAR(50) DEFAULT 'conversation',
+                        confidence FLOAT DEFAULT 0.5,
+                        created_at TIMESTAMP DEFAULT NOW(),
+                        last_used TIMESTAMP DEFAULT NOW()
+                    )
+                ''')
 
-            # Create learned_bonds table
-            cur.execute('''
-                CREATE TABLE IF NOT EXISTS learned_bonds (
-                    id SERIAL PRIMARY KEY,
-                    adj VARCHAR(100) NOT NULL,
-                    noun VARCHAR(100) NOT NULL,
-                    A FLOAT DEFAULT 0.0,
-                    S FLOAT DEFAULT 0.0,
-                    tau FLOAT DEFAULT 2.5,
-                    source VARCHAR(50) DEFAULT 'conversation',
-                    confidence FLOAT DEFAULT 0.5,
-                    created_at TIMESTAMP DEFAULT NOW(),
-                    last_used TIMESTAMP DEFAULT NOW(),
-                    use_count INTEGER DEFAULT 1,
-                    UNIQUE(adj, noun)
-                )
-            ''')
-
-            # Create learned_words table
-            cur.execute('''
-                CREATE TABLE IF NOT EXISTS learned_words (
-                    word VARCHAR(100) PRIMARY KEY,
-                    A FLOAT DEFAULT 0.0,
-                    S FLOAT DEFAULT 0.0,
-                    tau FLOAT DEFAULT 2.5,
-                    source VARCHAR(50) DEFAULT 'conversation',
-                    confidence FLOAT DEFAULT 0.5,
-                    created_at TIMESTAMP DEFAULT NOW(),
-                    last_used TIMESTAMP DEFAULT NOW()
-                )
-            ''')
-
-            # Create indexes for faster lookups
-            cur.execute('''
-                CREATE INDEX IF NOT EXISTS idx_learned_bonds_adj_noun
-                ON learned_bonds(adj, noun)
-            ''')
-            cur.execute('''
-                CREATE INDEX IF NOT EXISTS idx_learned_bonds_last_used
-                ON learned_bonds(last_used)
-            ''')
-
-            conn.commit()
-            conn.close()
-            return True
+                # Create indexes for faster lookups
+                cur.execute('''
+                    CREATE INDEX IF NOT EXISTS idx_learned_bonds_adj_noun
+                    ON learned_bonds(adj, noun)
+                ''')
+                cur.execute('''
+                    CREATE INDEX IF NOT EXISTS idx_learned_bonds_last_used
+                    ON learned_bonds(last_used)
+                ''')
+
+                conn.commit()
+                return True
 
         except Exception as e:
             print(f"Error creating learning tables: {e}")
@@ -426,12 +885,17 @@ class PostgresData:
     def learn_bond(self, adj: str, noun: str,
                    A: float = None, S: float = None, tau: float = None,
                    source: str = 'conversation',
-                   confidence: float = 0.5) -> Optional[Bond]:
+                   confidence: float = 0.5,
+                   existing: Optional[Bond] = _MISSING) -> Optional[Bond]:
         """Learn a new bond or reinforce an existing one.
 
         If bond exists, increments use_count and updates last_used.
         If bond is new, computes coordinates and stores it.
 
+        With the write-behind buffer the table is not read: the returned
+        bond comes from existing, the cached learned bond and pending
+        writes, falling back to the given/computed coordinates.
+
         Args:
             adj: Adjective
             noun: Noun
@@ -440,9 +904,12 @@ class PostgresData:
             tau: Abstraction level (computed if None)
             source: Source type ('conversation', 'context')
             confidence: Confidence in coordinates [0-1]
+            existing: The caller's get_learned_bond() result (None = not
+                learned), to skip looking it up again
 
         Returns:
-            Bond with coordinates, or None on error
+            Bond with coordinates (stored ones if already learned;
+            variety = use count), or None on error
         """
         adj = adj.lower().strip()
         noun = noun.lower().strip()
@@ -454,26 +921,35 @@ class PostgresData:
             S = S if S is not None else coords[1]
             tau = tau if tau is not None else coords[2]
 
-        try:
-            conn = psycopg2.connect(**self.config.as_dict())
-            cur = conn.cursor()
-
-            # Upsert: insert or update on conflict
-            cur.execute('''
-                INSERT INTO learned_bonds (adj, noun, A, S, tau, source, confidence)
-                VALUES (%s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (adj, noun) DO UPDATE SET
-                    last_used = NOW(),
-                    use_count = learned_bonds.use_count + 1,
-                    confidence = GREATEST(learned_bonds.confidence, EXCLUDED.confidence)
-                RETURNING id, A, S, tau, use_count
-            ''', (adj, noun, A, S, tau, source, confidence))
+        if self._write_buffer is not None:
+            if existing is _MISSING:
+                found, cached = self.cache.lookup('learned_bond', f"{adj}|{noun}")
+                existing = self._with_pending(adj, noun, cached if found else None)
+            self._write_buffer.learn(adj, noun, A, S, tau, source=source, confidence=confidence)
+            if existing:
+                return Bond(adj=adj, noun=noun, A=existing.A, S=existing.S, tau=existing.tau,
+                            variety=existing.variety + 1)
+            return Bond(adj=adj, noun=noun, A=A, S=S, tau=tau, variety=1)
 
-            row = cur.fetchone()
-            conn.commit()
-            conn.close()
-
-            return Bond(
+        try:
+            with self._connection() as conn:
+                cur = conn.cursor()
+
+                # Upsert: insert or update on conflict
+                cur.execute('''
+                    INSERT INTO learned_bonds (adj, noun, A, S, tau, source, confidence)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s)
+                    ON CONFLICT (adj, noun) DO UPDATE SET
+                        last_used = NOW(),
+                        use_count = learned_bonds.use_count + 1,
+                        confidence = GREATEST(learned_bonds.confidence, EXCLUDED.confidence)
+                    RETURNING id, A, S, tau, use_count
+                ''', (adj, noun, A, S, tau, source, confidence))
+
+                row = cur.fetchone()
+                conn.commit()
+
+            bond = Bond(
                 adj=adj,
                 noun=noun,
                 A=row[1],
@@ -481,11 +957,48 @@ class PostgresData:
                 tau=row[3],
                 variety=row[4],  # use_count as variety
             )
+            self._invalidate_bond(adj, noun)
+            return bond
 
         except Exception as e:
             print(f"Error learning bond: {e}")
             return None
 
+    def flush_learned(self) -> int:
+        """Write buffered learn_bond/mark_bond_used calls now.
+
+        Returns:
+            Number of bonds written
+        """
+        if self._write_buffer is None:
+            return 0
+        return self._write_buffer.flush()
+
+    def _flushed_bonds(self, keys: List[Tuple[str, str]]):
+        for adj, noun in keys:
+            self._invalidate_bond(adj, noun)
+
+    def _with_pending(self, adj: str, noun: str, bond: Optional[Bond]) -> Optional[Bond]:
+        """Fold buffered, not yet written uses of a learned bond into a read."""
+        if self._write_buffer is None:
+            return bond
+        pending = self._write_buffer.pending(adj, noun)
+        if pending is None:
+            return bond
+        if bond is not None:
+            return Bond(adj=bond.adj, noun=bond.noun, A=bond.A, S=bond.S, tau=bond.tau,
+                        variety=bond.variety + pending.uses)
+        if pending.insert:
+            return Bond(adj=adj, noun=noun, A=pending.A, S=pending.S, tau=pending.tau,
+                        variety=pending.uses)
+        return None
+
+    def _invalidate_bond(self, adj: str, noun: str):
+        """Drop cached lookups for a bond after it was written."""
+        key = f"{adj}|{noun}"
+        self.cache.invalidate('bond', key)
+        self.cache.invalidate('learned_bond', key)
+
     def get_learned_bond(self, adj: str, noun: str) -> Optional[Bond]:
         """Get a learned bond by adj+noun.
 
@@ -498,22 +1011,27 @@ class PostgresData:
         """
         adj = adj.lower().strip()
         noun = noun.lower().strip()
+        key = f"{adj}|{noun}"
+
+        found, bond = self.cache.lookup('learned_bond', key)
+        if found:
+            return self._with_pending(adj, noun, bond)
 
         try:
-            conn = psycopg2.connect(**self.config.as_dict())
-            cur = conn.cursor()
+            with self._connection() as conn:
+                cur = conn.cursor()
 
-            cur.execute('''
-                SELECT adj, noun, A, S, tau, use_count
-                FROM learned_bonds
-                WHERE adj = %s AND noun = %s
-            ''', (adj, noun))
+                cur.execute('''
+                    SELECT adj, noun, A, S, tau, use_count
+                    FROM learned_bonds
+                    WHERE adj = %s AND noun = %s
+                ''', (adj, noun))
 
-            row = cur.fetchone()
-            conn.close()
+                row = cur.fetchone()
 
+            bond = None
             if row:
-                return Bond(
+                bond = Bond(
                     adj=row[0],
                     noun=row[1],
                     A=row[2],
@@ -521,11 +1039,12 @@ class PostgresData:
                     tau=row[4],
                     variety=row[5],
                 )
-            return None
+            self.cache.store('learned_bond', key, bond)
+            return self._with_pending(adj, noun, bond)
 
         except Exception as e:
             print(f"Error getting learned bond: {e}")
-            return None
+            return self._with_pending(adj, noun, None)
 
     def get_all_learned_bonds(self, limit: int = 1000,
                                min_use_count: int = 1) -> List[Bond]:
@@ -538,31 +1057,31 @@ class PostgresData:
         Returns:
             List of learned bonds
         """
+        self.flush_learned()
         try:
-            conn = psycopg2.connect(**self.config.as_dict())
-            cur = conn.cursor()
-
-            cur.execute('''
-                SELECT adj, noun, A, S, tau, use_count
-                FROM learned_bonds
-                WHERE use_count >= %s
-                ORDER BY use_count DESC, last_used DESC
-                LIMIT %s
-            ''', (min_use_count, limit))
-
-            bonds = []
-            for row in cur.fetchall():
-                bonds.append(Bond(
-                    adj=row[0],
-                    noun=row[1],
-                    A=row[2],
-                    S=row[3],
-                    tau=row[4],
-                    variety=row[5],
-                ))
+            with self._connection() as conn:
+                cur = conn.cursor()
+
+                cur.execute('''
+                    SELECT adj, noun, A, S, tau, use_count
+                    FROM learned_bonds
+                    WHERE use_count >= %s
+                    ORDER BY use_count DESC, last_used DESC
+                    LIMIT %s
+                ''', (min_use_count, limit))
+
+                bonds = []
+                for row in cur.fetchall():
+                    bonds.append(Bond(
+                        adj=row[0],
+                        noun=row[1],
+                        A=row[2],
+                        S=row[3],
+                        tau=row[4],
+                        variety=row[5],
+                    ))
 
-            conn.close()
-            return bonds
+                return bonds
 
         except Exception as e:
             print(f"Error getting learned bonds: {e}")
@@ -576,21 +1095,30 @@ class PostgresData:
             noun: Noun
 
         Returns:
-            True if updated
+            True if updated (buffered: True if the bond exists and the bump was queued)
         """
+        if self._write_buffer is not None:
+            # Like the UPDATE below, a bond that was never learned is not touched
+            if self.get_learned_bond(adj, noun) is None:
+                return False
+            self._write_buffer.touch(adj.lower().strip(), noun.lower().strip())
+            return True
+
         try:
-            conn = psycopg2.connect(**self.config.as_dict())
-            cur = conn.cursor()
+            with self._connection() as conn:
+                cur = conn.cursor()
 
-            cur.execute('''
-                UPDATE learned_bonds
-                SET last_used = NOW(), use_count = use_count + 1
-                WHERE adj = %s AND noun = %s
-            ''', (adj.lower(), noun.lower()))
+                cur.execute('''
+                    UPDATE learned_bonds
+                    SET last_used = NOW(), use_count = use_count + 1
+                    WHERE adj = %s AND noun = %s
+                ''', (adj.lower(), noun.lower()))
 
-            updated = cur.rowcount > 0
-            conn.commit()
-            conn.close()
+                updated = cur.rowcount > 0
+                conn.commit()
+
+            if updated:
+                self.cache.invalidate('learned_bond', f"{adj.lower()}|{noun.lower()}")
             return updated
 
         except Exception as e:
@@ -621,33 +1149,36 @@ class PostgresData:
         word = word.lower().strip()
 
         try:
-            conn = psycopg2.connect(**self.config.as_dict())
-            cur = conn.cursor()
-
-            cur.execute('''
-                INSERT INTO learned_words (word, A, S, tau, source, confidence)
-                VALUES (%s, %s, %s, %s, %s, %s)
-                ON CONFLICT (word) DO UPDATE SET
-                    last_used = NOW(),
-                    confidence = GREATEST(learned_words.confidence, EXCLUDED.confidence)
-                RETURNING A, S, tau
-            ''', (word, A, S, tau, source, confidence))
-
-            row = cur.fetchone()
-            conn.commit()
-            conn.close()
-
-            coords = WordCoordinates(
-                word=word,
-                A=row[0],
-                S=row[1],
-                tau=row[2],
-                source='learned'
-            )
+            with self._connection() as conn:
+                cur = conn.cursor()
+
+                cur.execute('''
+                    INSERT INTO learned_words (word, A, S, tau, source, confidence)
+                    VALUES (%s, %s, %s, %s, %s, %s)
+                    ON CONFLICT (word) DO UPDATE SET
+                        last_used = NOW(),
+                        confidence = GREATEST(learned_words.confidence, EXCLUDED.confidence)
+                    RETURNING A, S, tau
+                ''', (word, A, S, tau, source, confidence))
+
+                row = cur.fetchone()
+                conn.commit()
+
+                coords = WordCoordinates(
+                    word=word,
+                    A=row[0],
+                    S=row[1],
+                    tau=row[2],
+                    source='learned'
+                )
 
-            # Also add to in-memory cache
-            self._coordinates[word] = coords
-            return coords
+                # Also add to in-memory table and refresh cached lookups
+                self._coordinates[word] = coords
+                self.cache.store('word', word, coords)
+                self.cache.invalidate('estimate', word)
+                # Corpus bonds average their words' coordinates
+                self.cache.invalidate_word('bond', word)
+                return coords
 
         except Exception as e:
             print(f"Error learning word: {e}")
@@ -664,28 +1195,33 @@ class PostgresData:
         """
         word = word.lower().strip()
 
+        found, coords = self.cache.lookup('word', word)
+        if found:
+            return coords
+
         try:
-            conn = psycopg2.connect(**self.config.as_dict())
-            cur = conn.cursor()
+            with self._connection() as conn:
+                cur = conn.cursor()
 
-            cur.execute('''
-                SELECT word, A, S, tau
-                FROM learned_words
-                WHERE word = %s
-            ''', (word,))
+                cur.execute('''
+                    SELECT word, A, S, tau
+                    FROM learned_words
+                    WHERE word = %s
+                ''', (word,))
 
-            row = cur.fetchone()
-            conn.close()
+                row = cur.fetchone()
 
+            coords = None
             if row:
-                return WordCoordinates(
+                coords = WordCoordinates(
                     word=row[0],
                     A=row[1],
                     S=row[2],
                     tau=row[3],
                     source='learned'
                 )
-            return None
+            self.cache.store('word', word, coords)
+            return coords
 
         except Exception as e:
             print(f"Error getting learned word: {e}")
@@ -716,7 +1252,10 @@ class PostgresData:
         bond = self.lookup_bond(adj, noun)
         if bond:
             return (bond.A, bond.S, bond.tau)
+        return self._word_bond_coordinates(adj, noun)
 
+    def _word_bond_coordinates(self, adj: str, noun: str) -> Tuple[float, float, float]:
+        """Coordinates for a bond not in the corpus, from its words (steps 2-5)."""
         adj_coords = self.get(adj) or self.get_learned_word(adj)
         noun_coords = self.get(noun) or self.get_learned_word(noun)
 
@@ -735,6 +1274,21 @@ class PostgresData:
             # Unknown - use neutral defaults
             return (0.0, 0.0, 2.5)
 
+    def _compute_bond_coordinates_many(self, pairs: List[Tuple[str, str]]) -> List[Tuple[float, float, float]]:
+        """Compute coordinates for many bonds, resolving corpus bonds in one query.
+
+        Args:
+            pairs: List of (adj, noun) tuples
+
+        Returns:
+            (A, S, tau) tuples aligned with pairs
+        """
+        bonds = self.lookup_bonds_many(pairs)
+        return [
+            (bond.A, bond.S, bond.tau) if bond else self._word_bond_coordinates(adj, noun)
+            for (adj, noun), bond in zip(pairs, bonds)
+        ]
+
     def estimate_word_coordinates(self, word: str) -> Tuple[float, float, float]:
         """Estimate coordinates for an unknown word.
 
@@ -754,6 +1308,17 @@ class PostgresData:
         if coords:
             return (coords.A, coords.S, coords.tau)
 
+        found, estimate = self.cache.lookup('estimate', word)
+        if found:
+            return estimate
+
+        estimate = self._estimate_from_pattern(word)
+        self.cache.store('estimate', word, estimate)
+        return estimate
+
+    @staticmethod
+    def _estimate_from_pattern(word: str) -> Tuple[float, float, float]:
+        """Heuristic (A, S, τ) from prefixes, suffixes and sacred stems."""
         # Simple heuristics based on word patterns
         A, S, tau = 0.0, 0.0, 2.5
 
@@ -795,42 +1360,42 @@ class PostgresData:
         Returns:
             Dictionary with counts and stats
         """
+        self.flush_learned()
         try:
-            conn = psycopg2.connect(**self.config.as_dict())
-            cur = conn.cursor()
+            with self._connection() as conn:
+                cur = conn.cursor()
 
-            stats = {}
+                stats = {}
 
-            # Learned bonds count
-            cur.execute('SELECT COUNT(*) FROM learned_bonds')
-            stats['n_learned_bonds'] = cur.fetchone()[0]
+                # Learned bonds count
+                cur.execute('SELECT COUNT(*) FROM learned_bonds')
+                stats['n_learned_bonds'] = cur.fetchone()[0]
 
-            # Learned words count
-            cur.execute('SELECT COUNT(*) FROM learned_words')
-            stats['n_learned_words'] = cur.fetchone()[0]
+                # Learned words count
+                cur.execute('SELECT COUNT(*) FROM learned_words')
+                stats['n_learned_words'] = cur.fetchone()[0]
 
-            # Total uses
-            cur.execute('SELECT SUM(use_count) FROM learned_bonds')
-            stats['total_bond_uses'] = cur.fetchone()[0] or 0
+                # Total uses
+                cur.execute('SELECT SUM(use_count) FROM learned_bonds')
+                stats['total_bond_uses'] = cur.fetchone()[0] or 0
 
-            # Most used bonds
-            cur.execute('''
-                SELECT adj, noun, use_count
-                FROM learned_bonds
-                ORDER BY use_count DESC
-                LIMIT 5
-            ''')
-            stats['top_bonds'] = [
-                {'bond': f"{r[0]} {r[1]}", 'uses': r[2]}
-                for r in cur.fetchall()
-            ]
+                # Most used bonds
+                cur.execute('''
+                    SELECT adj, noun, use_count
+                    FROM learned_bonds
+                    ORDER BY use_count DESC
+                    LIMIT 5
+                ''')
+                stats['top_bonds'] = [
+                    {'bond': f"{r[0]} {r[1]}", 'uses': r[2]}
+                    for r in cur.fetchall()
+                ]
 
-            # Average confidence
-            cur.execute('SELECT AVG(confidence) FROM learned_bonds')
-            stats['avg_confidence'] = cur.fetchone()[0] or 0.0
+                # Average confidence
+                cur.execute('SELECT AVG(confidence) FROM learned_bonds')
+                stats['avg_confidence'] = cur.fetchone()[0] or 0.0
 
-            conn.close()
-            return stats
+                return stats
 
         except Exception as e:
             # Tables might not exist yet
@@ -858,6 +1423,9 @@ def get_data(load_bonds: bool = False) -> PostgresData:
         print("Loading semantic data...")
         _data_instance = PostgresData(load_bonds=load_bonds)
         print(f"Total: {_data_instance.n_coordinates:,} coordinates")
+    elif load_bonds and not _data_instance._bonds_loaded:
+        # Singleton was created coordinates-only; bonds are needed now
+        _data_instance.load_bonds()
     return _data_instance
 
 
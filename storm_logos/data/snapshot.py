@@ -0,0 +1,297 @@
+"""Snapshot: Versioned binary snapshot of word coordinates and bonds.
+
+Workers start from memory-mapped .npy files instead of pulling
+word_coordinates and hyp_bond_vocab row by row. Pages are shared
+between processes that map the same snapshot.
+
+Layout:
+    <root>/CURRENT                      name of the active snapshot
+    <root>/<hash>/manifest.json         version, content hash, counts
+    <root>/<hash>/words.txt             word vocabulary (one per line)
+    <root>/<hash>/word_coords.npy       (N, 3) float64
+    <root>/<hash>/word_source.npy       (N,) int8
+    <root>/<hash>/adj_vocab.txt         bond adjective vocabulary
+    <root>/<hash>/noun_vocab.txt        bond noun vocabulary
+    <root>/<hash>/bond_*.npy            BondTable columns and indexes
+    <root>/<hash>/vocab_filter.npy      Bloom filter over corpus bond keys
+                                        (hyp_bond_vocab + bonds, optional)
+
+Snapshots are keyed by a content hash of the source tables, so a
+rebuild only writes a new directory when the data actually changed.
+
+Usage:
+    # Rebuild (CLI: storm-logos snapshot)
+    path = PostgresData().build_snapshot()
+
+    # Load (done automatically by PostgresData)
+    snap = load_snapshot(get_config().snapshot.path)
+    if snap:
+        words, bonds = snap.words, snap.bonds
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+
+from .bloom import BloomFilter
+from .bond_table import BondTable
+from .word_table import WordTable
+
+
+# Bump when the on-disk layout changes
+SNAPSHOT_VERSION = 2
+
+_BOND_COLUMNS = ('coords', 'variety', 'adj', 'noun')
+_BOND_INDEXES = ('pair_keys', 'pair_rows', 'noun_order', 'noun_offsets')
+
+
+@dataclass
+class Snapshot:
+    """A loaded snapshot."""
+    path: Path
+    manifest: Dict
+    words: WordTable
+    bonds: Optional[BondTable]
+    vocab_filter: Optional[BloomFilter] = None
+
+    @property
+    def content_hash(self) -> str:
+        return self.manifest['content_hash']
+
+
+# ============================================================================
+# CONTENT HASH
+# ============================================================================
+
+def content_hash(conn, bond_limit: int) -> str:
+    """Hash the source tables without transferring their rows.
+
+    Aggregates are computed server-side, so this costs one scan of each
+    table but no per-row network traffic. All of hyp_bond_vocab and
+    bonds is covered (not just the loaded bonds), since the vocab filter
+    is built from every key.
+
+    Args:
+        conn: psycopg2 connection
+        bond_limit: Bond limit used by load_bonds (part of the key)
+
+    Returns:
+        Hex digest identifying the table contents
+    """
+    cur = conn.cursor()
+    cur.execute('''
+        SELECT count(*),
+               coalesce(sum(hashtext(concat_ws('|', word, a, s, tau, source))::bigint), 0)
+        FROM word_coordinates
+    ''')
+    words = cur.fetchone()
+    cur.execute('''
+        SELECT count(*),
+               coalesce(sum(hashtext(bond || '|' || total_count)::bigint), 0)
+        FROM hyp_bond_vocab
+    ''')
+    vocab = cur.fetchone()
+    cur.execute('''
+        SELECT count(*),
+               coalesce(sum(hashtext(concat_ws('|', adj, noun))::bigint), 0)
+        FROM bonds
+    ''')
+    bonds = cur.fetchone()
+    cur.close()
+
+    key = (f"v{SNAPSHOT_VERSION}:{bond_limit}:{words[0]}:{words[1]}:"
+           f"{vocab[0]}:{vocab[1]}:{bonds[0]}:{bonds[1]}")
+    return hashlib.sha256(key.encode()).hexdigest()[:16]
+
+
+# ============================================================================
+# WRITE
+# ============================================================================
+
+def write_snapshot(root: Path, digest: str, words: WordTable,
+                   bonds: Optional[BondTable] = None,
+                   bond_limit: Optional[int] = None,
+                   vocab_filter: Optional[BloomFilter] = None) -> Path:
+    """Write a snapshot and point CURRENT at it.
+
+    Files are written to a temporary directory and renamed into place,
+    so readers never see a partial snapshot.
+
+    Args:
+        root: Snapshot root directory
+        digest: Content hash (directory name)
+        words: Word coordinates
+        bonds: Corpus bonds (optional)
+        bond_limit: Bond limit the bonds were loaded with
+        vocab_filter: Bloom filter over corpus bond keys (optional)
+
+    Returns:
+        Path of the snapshot directory
+    """
+    root = Path(root)
+    root.mkdir(parents=True, exist_ok=True)
+    target = root / digest
+
+    if not target.exists():
+        tmp = Path(tempfile.mkdtemp(prefix=f".{digest}-", dir=root))
+        try:
+            _write_lines(tmp / 'words.txt', words.words)
+            np.save(tmp / 'word_coords.npy', np.ascontiguousarray(words.coords, dtype=np.float64))
+            np.save(tmp / 'word_source.npy', np.ascontiguousarray(words.source_codes, dtype=np.int8))
+
+            if bonds is not None:
+                _write_lines(tmp / 'adj_vocab.txt', bonds.adj_vocab.words)
+                _write_lines(tmp / 'noun_vocab.txt', bonds.noun_vocab.words)
+                columns = {
+                    'coords': bonds.coords, 'variety': bonds.variety,
+                    'adj': bonds.adj_codes, 'noun': bonds.noun_codes,
+                }
+                columns.update(bonds.index_arrays())
+                for name, array in columns.items():
+                    np.save(tmp / f'bond_{name}.npy', np.ascontiguousarray(array))
+
+            if vocab_filter is not None:
+                vocab_filter.save(tmp / 'vocab_filter.npy')
+
+            manifest = {
+                'version': SNAPSHOT_VERSION,
+                'content_hash': digest,
+                'created_at': datetime.now().isoformat(),
+                'n_words': len(words.words),
+                'n_bonds': len(bonds) if bonds is not None else 0,
+                'has_bonds': bonds is not None,
+                'bond_limit': bond_limit,
+                'sources': words.sources,
+                'vocab_filter': vocab_filter.meta() if vocab_filter is not None else None,
+            }
+            (tmp / 'manifest.json').write_text(json.dumps(manifest, indent=2))
+            os.replace(tmp, target)
+        except BaseException:
+            shutil.rmtree(tmp, ignore_errors=True)
+            raise
+
+    _write_current(root, digest)
+    return target
+
+
+def _write_lines(path: Path, words) -> None:
+    with open(path, 'w', encoding='utf-8') as f:
+        for word in words:
+            f.write(word)
+            f.write('\n')
+
+
+def _write_current(root: Path, digest: str) -> None:
+    tmp = root / f'.CURRENT.{os.getpid()}'
+    tmp.write_text(digest)
+    os.replace(tmp, root / 'CURRENT')
+
+
+# ============================================================================
+# READ
+# ============================================================================
+
+def current_digest(root: Path) -> Optional[str]:
+    """Name of the active snapshot, or None."""
+    try:
+        return (Path(root) / 'CURRENT').read_text().strip() or None
+    except OSError:
+        return None
+
+
+def load_snapshot(root: Path, digest: Optional[str] = None,
+                  mmap: bool = True) -> Optional[Snapshot]:
+    """Load a snapshot, memory-mapping its arrays.
+
+    Args:
+        root: Snapshot root directory
+        digest: Snapshot to load (defaults to CURRENT)
+        mmap: Memory-map arrays read-only (False reads them into memory)
+
+    Returns:
+        Snapshot, or None if missing, incompatible or unreadable
+    """
+    digest = digest or current_digest(root)
+    if not digest:
+        return None
+    path = Path(root) / digest
+    mode = 'r' if mmap else None
+
+    try:
+        manifest = json.loads((path / 'manifest.json').read_text())
+        if manifest.get('version') != SNAPSHOT_VERSION:
+            return None
+
+        words = WordTable(
+            _read_lines(path / 'words.txt'),
+            np.load(path / 'word_coords.npy', mmap_mode=mode),
+            np.load(path / 'word_source.npy', mmap_mode=mode),
+            manifest.get('sources'),
+        )
+
+        bonds = None
+        if manifest.get('has_bonds'):
+            arrays = {
+                name: np.load(path / f'bond_{name}.npy', mmap_mode=mode)
+                for name in _BOND_COLUMNS + _BOND_INDEXES
+            }
+            bonds = BondTable.from_arrays(
+                arrays['coords'], arrays['variety'], arrays['adj'], arrays['noun'],
+                _read_lines(path / 'adj_vocab.txt'),
+                _read_lines(path / 'noun_vocab.txt'),
+                indexes={name: arrays[name] for name in _BOND_INDEXES},
+            )
+
+        vocab_filter = None
+        filter_meta = manifest.get('vocab_filter')
+        if filter_meta:
+            vocab_filter = BloomFilter.load(
+                path / 'vocab_filter.npy', filter_meta['n_hashes'],
+                filter_meta.get('n_items', 0), mmap=mmap,
+            )
+
+        return Snapshot(path=path, manifest=manifest, words=words, bonds=bonds,
+                        vocab_filter=vocab_filter)
+
+    except (OSError, ValueError, KeyError) as e:
+        print(f"  Warning (Snapshot): {e}")
+        return None
+
+
+def _read_lines(path: Path):
+    with open(path, encoding='utf-8') as f:
+        return f.read().split('\n')[:-1]
+
+
+def prune_snapshots(root: Path, keep: int = 2) -> int:
+    """Delete old snapshot directories, keeping CURRENT and the newest others.
+
+    Returns:
+        Number of snapshots deleted
+    """
+    root = Path(root)
+    current = current_digest(root)
+    dirs = sorted(
+        (p for p in root.iterdir() if p.is_dir() and not p.name.startswith('.')),
+        key=lambda p: p.stat().st_mtime, reverse=True,
+    ) if root.exists() else []
+
+    kept = [p for p in dirs if p.name == current]
+    removed = 0
+    for path in dirs:
+        if path.name == current:
+            continue
+        if len(kept) < keep:
+            kept.append(path)
+            continue
+        shutil.rmtree(path, ignore_errors=True)
+        removed += 1
+    return removed
@@ -0,0 +1,102 @@
+"""Spatial Index: KD-tree over bond coordinates in (A, S, τ) space.
+
+One index per PostgresData, built once over a contiguous (N, 3) float
+array and shared by every consumer (Storm, Navigator, BondExtractor,
+PostgresData.get_neighbors).
+
+Query modes:
+    - radius: all points within r of a query point
+    - k-NN:   k nearest points to a query point
+    - batch:  both of the above for an (M, 3) array of query points
+
+All queries return integer row indices into the indexed array; callers
+map them back to bonds.
+"""
+
+from typing import List, Tuple
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+
+class SpatialIndex:
+    """KD-tree over (A, S, τ) coordinates."""
+
+    def __init__(self, coords: np.ndarray, workers: int = -1):
+        """Build index.
+
+        Args:
+            coords: (N, 3) array of coordinates
+            workers: Threads for batch queries (-1 = all cores)
+        """
+        self.coords = np.ascontiguousarray(coords, dtype=np.float64).reshape(-1, 3)
+        self.workers = workers
+        self._tree = cKDTree(self.coords) if len(self.coords) else None
+
+    @property
+    def n(self) -> int:
+        """Number of indexed points."""
+        return len(self.coords)
+
+    def __len__(self) -> int:
+        return self.n
+
+    # ========================================================================
+    # RADIUS QUERIES
+    # ========================================================================
+
+    def query_radius(self, point, radius: float) -> np.ndarray:
+        """Indices of points within radius of a point (sorted)."""
+        if self._tree is None:
+            return np.empty(0, dtype=np.intp)
+        idx = self._tree.query_ball_point(
+            np.asarray(point, dtype=np.float64), radius, return_sorted=True
+        )
+        return np.asarray(idx, dtype=np.intp)
+
+    def query_radius_many(self, points, radius: float) -> List[np.ndarray]:
+        """Indices within radius for each of M query points.
+
+        Args:
+            points: (M, 3) array of query points
+            radius: Search radius
+
+        Returns:
+            List of M sorted index arrays
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        if self._tree is None:
+            return [np.empty(0, dtype=np.intp) for _ in range(len(points))]
+        results = self._tree.query_ball_point(
+            points, radius, workers=self.workers, return_sorted=True
+        )
+        return [np.asarray(idx, dtype=np.intp) for idx in results]
+
+    # ========================================================================
+    # K-NN QUERIES
+    # ========================================================================
+
+    def query_knn(self, point, k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """k nearest points to a point.
+
+        Returns:
+            (distances, indices), each of length min(k, n)
+        """
+        dist, idx = self.query_knn_many(np.asarray(point).reshape(1, 3), k)
+        return dist[0], idx[0]
+
+    def query_knn_many(self, points, k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """k nearest points for each of M query points.
+
+        Returns:
+            (distances, indices) arrays of shape (M, min(k, n))
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        k = min(k, self.n)
+        if self._tree is None or k == 0:
+            empty = np.empty((len(points), 0))
+            return empty, empty.astype(np.intp)
+        dist, idx = self._tree.query(points, k=k, workers=self.workers)
+        dist = np.asarray(dist).reshape(len(points), k)
+        idx = np.asarray(idx, dtype=np.intp).reshape(len(points), k)
+        return dist, idx
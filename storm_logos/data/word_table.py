@@ -0,0 +1,149 @@
+"""Word Table: Columnar word coordinate store.
+
+A read-mostly Mapping[str, WordCoordinates] backed by NumPy columns:
+
+    coords: (N, 3) float64 - A, S, τ
+    source: (N,)   int8    - code into the source name list
+
+The columns may be memory-mapped from a snapshot so that worker
+processes share pages. WordCoordinates are materialized on lookup.
+Writes (learned words) go to a small overlay dict.
+
+Usage:
+    table = WordTable.from_rows([('dog', 0.1, 0.0, 1.2, 'db')])
+    table['dog']        # WordCoordinates(word='dog', ...)
+    'cat' in table      # False
+"""
+
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .models import WordCoordinates
+
+
+class WordTable:
+    """Columnar Mapping[str, WordCoordinates] with a writable overlay."""
+
+    def __init__(self, words: Optional[Sequence[str]] = None,
+                 coords: Optional[np.ndarray] = None,
+                 source_codes: Optional[np.ndarray] = None,
+                 sources: Optional[Sequence[str]] = None):
+        """Wrap existing columns (e.g. memory-mapped from a snapshot).
+
+        Args:
+            words: Words in row order
+            coords: (N, 3) array of A, S, τ
+            source_codes: (N,) codes into sources
+            sources: Source names
+        """
+        self._words: List[str] = list(words or [])
+        self._codes: Dict[str, int] = {w: i for i, w in enumerate(self._words)}
+        n = len(self._words)
+        self._coords = coords if coords is not None else np.zeros((n, 3), dtype=np.float64)
+        self._source_codes = (source_codes if source_codes is not None
+                              else np.zeros(n, dtype=np.int8))
+        self._sources: List[str] = list(sources or ['unknown'])
+        self._overlay: Dict[str, WordCoordinates] = {}
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Tuple[str, float, float, float, str]]) -> 'WordTable':
+        """Build from (word, A, S, τ, source) rows; later duplicates win."""
+        codes: Dict[str, int] = {}
+        words: List[str] = []
+        coords: List[Tuple[float, float, float]] = []
+        source_ids: List[int] = []
+        sources: Dict[str, int] = {}
+
+        for word, A, S, tau, source in rows:
+            sid = sources.setdefault(source, len(sources))
+            row = codes.get(word)
+            if row is None:
+                codes[word] = len(words)
+                words.append(word)
+                coords.append((A, S, tau))
+                source_ids.append(sid)
+            else:
+                coords[row] = (A, S, tau)
+                source_ids[row] = sid
+
+        return cls(
+            words,
+            np.asarray(coords, dtype=np.float64).reshape(-1, 3),
+            np.asarray(source_ids, dtype=np.int8),
+            list(sources) or ['unknown'],
+        )
+
+    # ========================================================================
+    # COLUMNS
+    # ========================================================================
+
+    @property
+    def words(self) -> List[str]:
+        """Base words in row order (excluding the overlay)."""
+        return self._words
+
+    @property
+    def coords(self) -> np.ndarray:
+        return self._coords
+
+    @property
+    def source_codes(self) -> np.ndarray:
+        return self._source_codes
+
+    @property
+    def sources(self) -> List[str]:
+        return self._sources
+
+    # ========================================================================
+    # MAPPING
+    # ========================================================================
+
+    def get(self, word: str, default=None) -> Optional[WordCoordinates]:
+        coords = self._overlay.get(word)
+        if coords is not None:
+            return coords
+        row = self._codes.get(word)
+        if row is None:
+            return default
+        return self._materialize(word, row)
+
+    def __getitem__(self, word: str) -> WordCoordinates:
+        coords = self.get(word)
+        if coords is None:
+            raise KeyError(word)
+        return coords
+
+    def __setitem__(self, word: str, coords: WordCoordinates):
+        self._overlay[word] = coords
+
+    def __contains__(self, word) -> bool:
+        return word in self._overlay or word in self._codes
+
+    def __len__(self) -> int:
+        extra = sum(1 for w in self._overlay if w not in self._codes)
+        return len(self._words) + extra
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._words
+        for word in self._overlay:
+            if word not in self._codes:
+                yield word
+
+    def keys(self) -> Iterator[str]:
+        return iter(self)
+
+    def items(self) -> Iterator[Tuple[str, WordCoordinates]]:
+        for word in self:
+            yield word, self[word]
+
+    def values(self) -> Iterator[WordCoordinates]:
+        for _, coords in self.items():
+            yield coords
+
+    def _materialize(self, word: str, row: int) -> WordCoordinates:
+        A, S, tau = self._coords[row].tolist()
+        return WordCoordinates(
+            word=word, A=A, S=S, tau=tau,
+            source=self._sources[int(self._source_codes[row])],
+        )
@@ -0,0 +1,348 @@
+"""Write-Behind Buffer: Coalesced learned_bonds writes.
+
+During a live conversation every bond mention used to upsert
+learned_bonds (learn_bond) or bump use_count/last_used (mark_bond_used)
+synchronously. The buffer takes those writes off the request path:
+
+    - Repeated mentions of a bond coalesce into one pending entry whose
+      use count is the number of mentions.
+    - A background thread flushes when LEARN_FLUSH_SIZE distinct bonds
+      are pending or every LEARN_FLUSH_INTERVAL seconds, as one
+      multi-row INSERT ... ON CONFLICT DO UPDATE (execute_values) plus
+      one multi-row UPDATE for counter-only bumps.
+    - close() (also registered with atexit) flushes whatever is left.
+
+Failures:
+    - Connection errors (database down, pool timeout) put the entries
+      back unchanged; they are retried with the next flush.
+    - Any other error counts against each entry in the failed write.
+      Entries that failed before are retried one row at a time, so a
+      bad row cannot keep sinking the rows batched with it; after
+      LEARN_MAX_RETRIES failures an entry is dead-lettered (logged,
+      kept in dead_letters, dropped from the buffer). Later writes for
+      the same pair fold into the retried entry and share its fate.
+    - At most LEARN_MAX_PENDING pairs are buffered. A write for a new
+      pair beyond that goes straight to the database (dropped, with a
+      warning, if that fails too), so an outage cannot grow the buffer
+      without bound.
+
+Pending entries are visible through pending(), which PostgresData
+uses to keep get_learned_bond() read-your-writes.
+
+Usage:
+    from storm_logos.data.write_behind import LearnedBondBuffer
+
+    buffer = LearnedBondBuffer(data._connection, on_flush=invalidate)
+    buffer.learn('dark', 'forest', A=0.1, S=0.2, tau=1.5)
+    buffer.touch('dark', 'forest')
+    buffer.flush()      # normally done by the background thread
+    buffer.close()
+"""
+
+import atexit
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, replace
+from typing import Callable, ContextManager, Dict, List, Optional, Tuple
+
+import psycopg2
+from psycopg2.extras import execute_values
+
+from .connection_pool import PoolTimeout
+from ..config import get_config, LearningConfig
+
+
+# Errors that say nothing about the rows: retry without counting them
+_TRANSIENT = (psycopg2.OperationalError, psycopg2.InterfaceError, PoolTimeout, ConnectionError)
+
+# Dead-lettered entries kept for inspection
+DEAD_LETTERS_MAX = 1000
+
+
+@dataclass
+class PendingBond:
+    """Buffered writes for one (adj, noun) pair."""
+    adj: str
+    noun: str
+    A: float = 0.0
+    S: float = 0.0
+    tau: float = 2.5
+    source: str = 'conversation'
+    confidence: float = 0.0
+    uses: int = 0
+    insert: bool = False    # learned (upsert); False = counter bump only
+    failures: int = 0       # failed writes not caused by the connection
+
+    def merge(self, other: 'PendingBond'):
+        """Fold a later entry for the same pair into this one."""
+        if other.insert and not self.insert:
+            self.A, self.S, self.tau = other.A, other.S, other.tau
+            self.source = other.source
+            self.insert = True
+        self.confidence = max(self.confidence, other.confidence)
+        self.uses += other.uses
+
+
+_UPSERT = '''
+    INSERT INTO learned_bonds (adj, noun, A, S, tau, source, confidence, use_count)
+    VALUES %s
+    ON CONFLICT (adj, noun) DO UPDATE SET
+        last_used = NOW(),
+        use_count = learned_bonds.use_count + EXCLUDED.use_count,
+        confidence = GREATEST(learned_bonds.confidence, EXCLUDED.confidence)
+'''
+
+_BUMP = '''
+    UPDATE learned_bonds AS lb
+    SET last_used = NOW(), use_count = lb.use_count + v.uses
+    FROM (VALUES %s) AS v(adj, noun, uses)
+    WHERE lb.adj = v.adj AND lb.noun = v.noun
+'''
+
+
+class LearnedBondBuffer:
+    """In-process write-behind buffer for learned_bonds."""
+
+    def __init__(self, connection: Callable[[], ContextManager],
+                 config: Optional[LearningConfig] = None,
+                 on_flush: Optional[Callable[[List[Tuple[str, str]]], None]] = None):
+        """Initialize buffer.
+
+        Args:
+            connection: Returns a context manager yielding a psycopg2 connection
+            config: Learning configuration (defaults to get_config().learning)
+            on_flush: Called with the (adj, noun) keys written by each flush
+        """
+        self.config = config or get_config().learning
+        self._connection = connection
+        self._on_flush = on_flush
+
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending: Dict[Tuple[str, str], PendingBond] = {}
+        self._flushing: Dict[Tuple[str, str], PendingBond] = {}
+        self.dead_letters: deque = deque(maxlen=DEAD_LETTERS_MAX)
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+        self._writes = 0
+        self._flushes = 0
+        self._rows = 0
+        self._failures = 0
+        self._dead = 0
+        self._dropped = 0
+        self._flush_seconds = 0.0
+
+    # ========================================================================
+    # BUFFERING
+    # ========================================================================
+
+    def learn(self, adj: str, noun: str, A: float, S: float, tau: float,
+              source: str = 'conversation', confidence: float = 0.5):
+        """Queue a learn_bond upsert (first coordinates win, like the table)."""
+        self._add(PendingBond(adj, noun, A, S, tau, source, confidence, uses=1, insert=True))
+
+    def touch(self, adj: str, noun: str):
+        """Queue a use_count/last_used bump for an existing learned bond."""
+        self._add(PendingBond(adj, noun, uses=1))
+
+    def _add(self, entry: PendingBond):
+        key = (entry.adj, entry.noun)
+        overflow = False
+        with self._lock:
+            existing = self._pending.get(key)
+            if existing is not None:
+                existing.merge(entry)
+            elif len(self._pending) < self.config.max_pending:
+                self._pending[key] = entry
+            else:
+                overflow = True
+            self._writes += 1
+            size = len(self._pending)
+
+        if overflow:
+            self._write_through(key, entry)
+            return
+        if self._closed:
+            # After shutdown, write through
+            self.flush()
+            return
+        self._ensure_thread()
+        if size >= self.config.flush_size:
+            self._wake.set()
+
+    def pending(self, adj: str, noun: str) -> Optional[PendingBond]:
+        """Writes for a pair not yet committed (None if there are none)."""
+        key = (adj, noun)
+        with self._lock:
+            flushing = self._flushing.get(key)
+            queued = self._pending.get(key)
+            if flushing is None and queued is None:
+                return None
+            entry = replace(flushing or queued)
+            if flushing is not None and queued is not None:
+                entry.merge(queued)
+            return entry
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    # ========================================================================
+    # FLUSHING
+    # ========================================================================
+
+    def flush(self) -> int:
+        """Write all pending entries now.
+
+        Returns:
+            Number of bonds written (0 if nothing was pending or every write failed)
+        """
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending:
+                    return 0
+                batch = self._pending
+                self._pending = {}
+                self._flushing = batch
+
+            start = time.perf_counter()
+            # Entries that failed before go one row at a time
+            groups = [{key: e for key, e in batch.items() if not e.failures}]
+            groups += [{key: e} for key, e in batch.items() if e.failures]
+
+            written: List[Tuple[str, str]] = []
+            retry: Dict[Tuple[str, str], PendingBond] = {}
+            for i, group in enumerate(groups):
+                if not group:
+                    continue
+                try:
+                    self._write(group)
+                except Exception as e:
+                    self._failed(group, e, retry)
+                    if isinstance(e, _TRANSIENT):
+                        # Database unavailable: leave the rest for the next flush
+                        for rest in groups[i + 1:]:
+                            retry.update(rest)
+                        break
+                else:
+                    written.extend(group)
+
+            # Entries stay visible through pending() until caches are dropped
+            if written and self._on_flush:
+                self._on_flush(written)
+            with self._lock:
+                # Retry with the next flush; later writes fold into the older ones
+                for key, entry in self._pending.items():
+                    if key in retry:
+                        retry[key].merge(entry)
+                    else:
+                        retry[key] = entry
+                self._pending = retry
+                self._flushing = {}
+                if written:
+                    self._flushes += 1
+                    self._rows += len(written)
+                    self._flush_seconds += time.perf_counter() - start
+
+        return len(written)
+
+    def _failed(self, group: Dict[Tuple[str, str], PendingBond], error: Exception,
+                retry: Dict[Tuple[str, str], PendingBond]):
+        """Count a failed write and sort its entries into retry / dead letters."""
+        transient = isinstance(error, _TRANSIENT)
+        dead = []
+        for key, entry in group.items():
+            if not transient:
+                entry.failures += 1
+                if entry.failures >= self.config.max_retries:
+                    dead.append(entry)
+                    continue
+            retry[key] = entry
+
+        with self._lock:
+            self._failures += 1
+            self._dead += len(dead)
+            self.dead_letters.extend(dead)
+        print(f"  Warning (Learned bonds): flush failed, {len(group) - len(dead)} bonds kept: {error}")
+        for entry in dead:
+            print(f"  Warning (Learned bonds): dropped {entry.adj} {entry.noun} "
+                  f"after {entry.failures} failed writes")
+
+    def _write_through(self, key: Tuple[str, str], entry: PendingBond):
+        """Write one entry now (buffer full); drop it if that fails."""
+        try:
+            self._write({key: entry})
+        except Exception as e:
+            with self._lock:
+                self._dropped += 1
+            print(f"  Warning (Learned bonds): buffer full and write failed, "
+                  f"dropped {entry.adj} {entry.noun}: {e}")
+            return
+        if self._on_flush:
+            self._on_flush([key])
+        with self._lock:
+            self._rows += 1
+
+    def _write(self, batch: Dict[Tuple[str, str], PendingBond]):
+        # Sorted keys: concurrent flushes lock rows in the same order
+        entries = [batch[key] for key in sorted(batch)]
+        upserts = [(e.adj, e.noun, e.A, e.S, e.tau, e.source, e.confidence, e.uses)
+                   for e in entries if e.insert]
+        bumps = [(e.adj, e.noun, e.uses) for e in entries if not e.insert]
+
+        with self._connection() as conn:
+            cur = conn.cursor()
+            if upserts:
+                execute_values(cur, _UPSERT, upserts, page_size=self.config.flush_size)
+            if bumps:
+                execute_values(cur, _BUMP, bumps, page_size=self.config.flush_size)
+            conn.commit()
+
+    def _ensure_thread(self):
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name='learned-bond-flush',
+                                            daemon=True)
+            self._thread.start()
+        atexit.register(self.close)
+
+    def _run(self):
+        while not self._closed:
+            self._wake.wait(self.config.flush_interval)
+            self._wake.clear()
+            if not self._closed:
+                self.flush()
+
+    def close(self):
+        """Stop the background thread and flush what is left (durable shutdown)."""
+        self._closed = True
+        self._wake.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=max(1.0, self.config.flush_interval))
+        self.flush()
+
+    # ========================================================================
+    # STATS
+    # ========================================================================
+
+    def stats(self) -> Dict:
+        """Buffered writes vs rows written (the coalescing factor)."""
+        with self._lock:
+            return {
+                'pending': len(self._pending),
+                'writes': self._writes,
+                'flushes': self._flushes,
+                'rows_written': self._rows,
+                'failures': self._failures,
+                'dead_lettered': self._dead,
+                'dropped': self._dropped,
+                'coalescing': self._writes / self._rows if self._rows else 0.0,
+                'avg_flush_ms': 1000 * self._flush_seconds / self._flushes if self._flushes else 0.0,
+            }
@@ -9,11 +9,14 @@ The core generation algorithm:
 
 from typing import List, Optional
 
+import numpy as np
+
 from ..data.models import Bond, SemanticState, GenerationResult, Parameters, Trajectory
 from ..semantic.storm import Storm, get_storm
 from ..semantic.dialectic import Dialectic, get_dialectic
 from ..semantic.chain import ChainReaction, get_chain
 from ..semantic.state import StateManager
+from ..semantic.physics import bonds_to_array
 
 
 class Pipeline:
@@ -54,24 +57,31 @@ class Pipeline:
             # Fallback: widen search
             candidates = self.storm.explode(Q, radius=params.storm_radius * 2)
 
+        # Stages 2-3 run on coordinate arrays; bonds are only indexed
+        coords = bonds_to_array(candidates)
+        history_coords = bonds_to_array(history)
+
         # 2. DIALECTIC: Filter by tension
-        filtered = self.dialectic.filter(
-            candidates,
+        filtered = self.dialectic.filter_indices(
+            coords,
             Q,
             tension_weight=params.dialectic_tension,
             coherence_threshold=params.coherence_threshold,
         )
 
-        if not filtered:
+        if len(filtered) == 0:
             # Fallback: use all candidates
-            filtered = candidates
+            filtered = np.arange(len(candidates))
 
         # 3. CHAIN: Select via resonance
-        winner = self.chain.select(
-            filtered,
-            history,
+        scores = self.chain.score_array(
+            coords[filtered],
+            history_coords,
             decay=params.chain_decay,
         )
+        # sample_index raises ValueError when there are no candidates
+        choice = self.chain.sample_index(scores) if len(scores) != 1 else 0
+        winner = candidates[filtered[choice]]
 
         # 4. UPDATE: Advance state
         new_state = self.state.state
@@ -83,7 +93,7 @@ class Pipeline:
             new_state=new_state,
             candidates_count=len(candidates),
             filtered_count=len(filtered),
-            winner_score=self.chain._score(winner, history),
+            winner_score=float(scores[choice]),
         )
 
     def generate_sentence(self, Q: SemanticState,
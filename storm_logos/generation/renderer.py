@@ -1,10 +1,9 @@
 """Renderer: Convert bond skeletons to text via LLM."""
 
 from typing import List, Optional
-import requests
-import json
 
 from ..data.models import Bond
+from ..llm import LLMClient, LLMError, get_llm
 
 
 class Renderer:
@@ -12,14 +11,23 @@ class Renderer:
 
     Supports:
     - Ollama (Mistral, Llama)
-    - Direct API calls
+    - Claude / Groq (any storm_logos.llm model spec)
     """
 
     def __init__(self,
                  model: str = 'mistral:7b',
-                 base_url: str = 'http://localhost:11434'):
+                 base_url: str = 'http://localhost:11434',
+                 llm: Optional[LLMClient] = None):
         self.model = model
         self.base_url = base_url
+        self._llm = llm
+
+    @property
+    def llm(self) -> LLMClient:
+        """Shared LLM client (created on first render)."""
+        if self._llm is None:
+            self._llm = get_llm(self.model, base_url=self.base_url)
+        return self._llm
 
     def render(self, skeleton: List[List[Bond]],
                genre: str = 'literary',
@@ -67,28 +75,10 @@ Generated text:"""
         return prompt
 
     def _call_llm(self, prompt: str, max_tokens: int) -> str:
-        """Call LLM via Ollama API."""
+        """Call LLM with a single prompt."""
         try:
-            response = requests.post(
-                f'{self.base_url}/api/generate',
-                json={
-                    'model': self.model,
-                    'prompt': prompt,
-                    'stream': False,
-                    'options': {
-                        'num_predict': max_tokens,
-                        'temperature': 0.7,
-                    }
-                },
-                timeout=60,
-            )
-
-            if response.status_code == 200:
-                return response.json().get('response', '')
-            else:
-                return f"[LLM Error: {response.status_code}]"
-
-        except Exception as e:
+            return self.llm.generate('', prompt, max_tokens=max_tokens, temperature=0.7)
+        except (LLMError, ValueError) as e:
             return f"[LLM Error: {e}]"
 
     def render_therapeutic(self, skeleton: List[Bond],
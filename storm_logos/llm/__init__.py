@@ -0,0 +1,48 @@
+"""Storm-Logos LLM Layer: One async client for Claude, Groq and Ollama.
+
+Every application (Therapist, DreamEngine, Renderer, scripts) calls LLMs
+through get_llm(). Clients are shared per model spec, so connection
+pools, the process-wide concurrency limit, deadlines, retries and token
+accounting are handled in one place.
+
+Model specs:
+    'claude' / 'claude:<model-id>'  Anthropic (ANTHROPIC_API_KEY)
+    'groq:<model>'                  Groq (GROQ_API_KEY)
+    'fake'                          Local FakeBackend (tests)
+    '<name>'                        Ollama model (OLLAMA_URL)
+
+Usage:
+    from storm_logos.llm import get_llm, LLMError
+
+    llm = get_llm('groq:llama-3.3-70b-versatile')
+    try:
+        text = llm.generate(system_prompt, user_message, max_tokens=200)
+    except LLMError as e:
+        ...
+
+    completion = await llm.complete(system_prompt, user_message)
+    print(completion.text, completion.total_tokens, completion.latency)
+"""
+
+from .base import Backend, Completion, LLMError, LLMTimeout
+from .backends import AnthropicBackend, GroqBackend, OllamaBackend, FakeBackend
+from .cache import ResponseCache, get_response_cache
+from .client import LLMClient, TokenUsage, create_backend, get_llm, get_usage
+
+__all__ = [
+    'Backend',
+    'Completion',
+    'LLMError',
+    'LLMTimeout',
+    'AnthropicBackend',
+    'GroqBackend',
+    'OllamaBackend',
+    'FakeBackend',
+    'ResponseCache',
+    'get_response_cache',
+    'LLMClient',
+    'TokenUsage',
+    'create_backend',
+    'get_llm',
+    'get_usage',
+]
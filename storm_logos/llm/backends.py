@@ -0,0 +1,287 @@
+"""LLM Backends: Claude, Groq, Ollama and a local fake.
+
+Claude and Groq use the vendors' async SDK clients (SDK retries off;
+LLMClient retries). Ollama is called over a pooled httpx.AsyncClient.
+One backend instance per model is shared through get_llm(), so all
+callers reuse the same connection pool.
+"""
+
+import asyncio
+import json
+from typing import Callable, Dict, List, Optional, Sequence, Union
+
+import httpx
+
+from .base import Backend, Completion, LLMError, RETRYABLE_STATUS, wrap_error
+
+
+def _openai_messages(system: str, messages: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    if system:
+        return [{"role": "system", "content": system}] + list(messages)
+    return list(messages)
+
+
+def _prompt(system: str, messages: List[Dict[str, str]]) -> str:
+    """Flatten to a single prompt (Ollama /api/generate)."""
+    parts = [system] if system else []
+    if len(messages) == 1 and messages[0]['role'] == 'user':
+        parts.append(messages[0]['content'])
+    else:
+        parts.extend(f"{m['role'].capitalize()}: {m['content']}" for m in messages)
+    return '\n\n'.join(parts)
+
+
+# ============================================================================
+# CLAUDE
+# ============================================================================
+
+class AnthropicBackend(Backend):
+    """Claude via anthropic.AsyncAnthropic."""
+
+    provider = 'claude'
+    label = 'Claude'
+
+    def __init__(self, model: str, api_key: str):
+        super().__init__(model)
+        import anthropic
+        self._client = anthropic.AsyncAnthropic(api_key=api_key, max_retries=0)
+
+    def _params(self, system, messages, max_tokens, temperature) -> Dict:
+        params = dict(model=self.model, max_tokens=max_tokens,
+                      messages=list(messages), temperature=temperature)
+        if system:
+            params['system'] = system
+        return params
+
+    async def complete(self, system, messages, max_tokens, temperature, timeout):
+        try:
+            response = await self._client.messages.create(
+                timeout=timeout, **self._params(system, messages, max_tokens, temperature))
+        except Exception as e:
+            raise wrap_error(e, self.provider)
+
+        text = ''.join(getattr(block, 'text', '') for block in response.content)
+        usage = response.usage
+        return Completion(text, self.model, self.provider,
+                          input_tokens=usage.input_tokens, output_tokens=usage.output_tokens)
+
+    async def stream(self, system, messages, max_tokens, temperature, timeout, completion):
+        try:
+            async with self._client.messages.stream(
+                timeout=timeout, **self._params(system, messages, max_tokens, temperature)
+            ) as stream:
+                async for text in stream.text_stream:
+                    yield text
+                final = await stream.get_final_message()
+        except Exception as e:
+            raise wrap_error(e, self.provider)
+        completion.input_tokens = final.usage.input_tokens
+        completion.output_tokens = final.usage.output_tokens
+
+    async def aclose(self):
+        await self._client.close()
+
+
+# ============================================================================
+# GROQ
+# ============================================================================
+
+class GroqBackend(Backend):
+    """Groq via groq.AsyncGroq (OpenAI-style chat completions)."""
+
+    provider = 'groq'
+    label = 'Groq'
+
+    def __init__(self, model: str, api_key: str):
+        super().__init__(model)
+        from groq import AsyncGroq
+        self._client = AsyncGroq(api_key=api_key, max_retries=0)
+
+    async def complete(self, system, messages, max_tokens, temperature, timeout):
+        try:
+            response = await self._client.chat.completions.create(
+                model=self.model,
+                messages=_openai_messages(system, messages),
+                max_tokens=max_tokens,
+                temperature=temperature,
+                timeout=timeout,
+            )
+        except Exception as e:
+            raise wrap_error(e, self.provider)
+
+        usage = response.usage
+        return Completion(response.choices[0].message.content or '', self.model, self.provider,
+                          input_tokens=getattr(usage, 'prompt_tokens', 0) or 0,
+                          output_tokens=getattr(usage, 'completion_tokens', 0) or 0)
+
+    async def stream(self, system, messages, max_tokens, temperature, timeout, completion):
+        try:
+            chunks = await self._client.chat.completions.create(
+                model=self.model,
+                messages=_openai_messages(system, messages),
+                max_tokens=max_tokens,
+                temperature=temperature,
+                timeout=timeout,
+                stream=True,
+            )
+            async for chunk in chunks:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+                # Groq reports usage on the final chunk
+                usage = getattr(getattr(chunk, 'x_groq', None), 'usage', None)
+                if usage is not None:
+                    completion.input_tokens = usage.prompt_tokens or 0
+                    completion.output_tokens = usage.completion_tokens or 0
+        except LLMError:
+            raise
+        except Exception as e:
+            raise wrap_error(e, self.provider)
+
+    async def aclose(self):
+        await self._client.close()
+
+
+# ============================================================================
+# OLLAMA
+# ============================================================================
+
+class OllamaBackend(Backend):
+    """Local Ollama server (/api/generate) over a pooled httpx client."""
+
+    provider = 'ollama'
+    label = 'Ollama'
+
+    def __init__(self, model: str, base_url: str = 'http://localhost:11434',
+                 max_connections: int = 32):
+        super().__init__(model)
+        self.base_url = base_url.rstrip('/')
+        self._client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=max_connections,
+                                max_keepalive_connections=max_connections),
+        )
+
+    def _body(self, system, messages, max_tokens, temperature, stream: bool) -> Dict:
+        return {
+            'model': self.model,
+            'prompt': _prompt(system, messages),
+            'stream': stream,
+            'options': {'num_predict': max_tokens, 'temperature': temperature},
+        }
+
+    def _check(self, response: httpx.Response):
+        if response.status_code != 200:
+            raise wrap_error(httpx.HTTPStatusError(
+                f"HTTP {response.status_code}", request=response.request, response=response,
+            ), self.provider)
+
+    async def complete(self, system, messages, max_tokens, temperature, timeout):
+        try:
+            response = await self._client.post(
+                f'{self.base_url}/api/generate',
+                json=self._body(system, messages, max_tokens, temperature, stream=False),
+                timeout=timeout,
+            )
+            self._check(response)
+            data = response.json()
+        except LLMError:
+            raise
+        except Exception as e:
+            raise wrap_error(e, self.provider)
+
+        return Completion(data.get('response', ''), self.model, self.provider,
+                          input_tokens=data.get('prompt_eval_count', 0),
+                          output_tokens=data.get('eval_count', 0))
+
+    async def stream(self, system, messages, max_tokens, temperature, timeout, completion):
+        try:
+            async with self._client.stream(
+                'POST', f'{self.base_url}/api/generate',
+                json=self._body(system, messages, max_tokens, temperature, stream=True),
+                timeout=timeout,
+            ) as response:
+                self._check(response)
+                async for line in response.aiter_lines():
+                    if not line.strip():
+                        continue
+                    data = json.loads(line)
+                    if data.get('response'):
+                        yield data['response']
+                    if data.get('done'):
+                        completion.input_tokens = data.get('prompt_eval_count', 0)
+                        completion.output_tokens = data.get('eval_count', 0)
+        except LLMError:
+            raise
+        except Exception as e:
+            raise wrap_error(e, self.provider)
+
+    async def aclose(self):
+        await self._client.aclose()
+
+
+# ============================================================================
+# FAKE (tests, offline development)
+# ============================================================================
+
+Responder = Callable[[str, List[Dict[str, str]]], str]
+
+
+class FakeBackend(Backend):
+    """Deterministic local backend.
+
+    Responses are returned in order (cycling), produced by a callable
+    (system, messages) -> str, or echo the last user message. Failures
+    and latency can be injected to exercise retries and deadlines.
+    """
+
+    provider = 'fake'
+    label = 'Fake'
+
+    def __init__(self, model: str = 'fake',
+                 responses: Optional[Union[Sequence[str], Responder]] = None,
+                 latency: float = 0.0, failures: int = 0, status: int = 503):
+        """Initialize fake backend.
+
+        Args:
+            model: Model name reported in completions
+            responses: Scripted responses, or a callable producing them
+            latency: Seconds to sleep per call
+            failures: Number of initial calls that fail
+            status: HTTP status reported by injected failures (decides
+                whether they are retryable)
+        """
+        super().__init__(model)
+        self.responses = responses if callable(responses) else list(responses or [])
+        self.latency = latency
+        self.failures = failures
+        self.status = status
+        self.calls: List[Dict] = []
+
+    def _respond(self, system: str, messages: List[Dict[str, str]]) -> str:
+        if callable(self.responses):
+            return self.responses(system, messages)
+        if self.responses:
+            return self.responses[(len(self.calls) - 1) % len(self.responses)]
+        return f"[fake] {messages[-1]['content'][:80]}" if messages else "[fake]"
+
+    async def complete(self, system, messages, max_tokens, temperature, timeout):
+        self.calls.append({'system': system, 'messages': list(messages),
+                           'max_tokens': max_tokens, 'temperature': temperature})
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.failures > 0:
+            self.failures -= 1
+            raise LLMError('injected failure', self.provider,
+                           retryable=self.status in RETRYABLE_STATUS, status=self.status)
+
+        text = self._respond(system, messages)
+        prompt = ' '.join([system] + [m['content'] for m in messages])
+        return Completion(text, self.model, self.provider,
+                          input_tokens=len(prompt.split()), output_tokens=len(text.split()))
+
+    async def stream(self, system, messages, max_tokens, temperature, timeout, completion):
+        result = await self.complete(system, messages, max_tokens, temperature, timeout)
+        words = result.text.split(' ')
+        for i, word in enumerate(words):
+            yield word if i == len(words) - 1 else word + ' '
+        completion.input_tokens = result.input_tokens
+        completion.output_tokens = result.output_tokens
@@ -0,0 +1,113 @@
+"""LLM Base: Completion record, errors and the backend interface."""
+
+import asyncio
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, List, Optional
+
+
+# HTTP statuses worth retrying (rate limit, overload, transient server errors)
+RETRYABLE_STATUS = {408, 409, 429, 500, 502, 503, 504, 529}
+
+
+@dataclass
+class Completion:
+    """Result of one LLM call."""
+    text: str
+    model: str
+    provider: str
+    input_tokens: int = 0
+    output_tokens: int = 0
+    latency: float = 0.0      # seconds, including retries
+    attempts: int = 1
+    cached: bool = False      # served from the response cache
+
+    @property
+    def total_tokens(self) -> int:
+        return self.input_tokens + self.output_tokens
+
+
+class LLMError(Exception):
+    """LLM call failed.
+
+    Attributes:
+        provider: Backend provider name
+        retryable: Whether another attempt may succeed
+        status: HTTP status, if any
+        retry_after: Server-requested delay in seconds, if any
+    """
+
+    def __init__(self, message: str, provider: str = '', retryable: bool = False,
+                 status: Optional[int] = None, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.provider = provider
+        self.retryable = retryable
+        self.status = status
+        self.retry_after = retry_after
+
+
+class LLMTimeout(LLMError):
+    """The call's deadline passed."""
+
+
+def wrap_error(error: Exception, provider: str) -> LLMError:
+    """Classify an SDK/HTTP exception as a (retryable) LLMError."""
+    if isinstance(error, LLMError):
+        return error
+
+    status = getattr(error, 'status_code', None)
+    retry_after = None
+    response = getattr(error, 'response', None)
+    if response is not None:
+        status = status or getattr(response, 'status_code', None)
+        try:
+            retry_after = float(response.headers.get('retry-after'))
+        except (AttributeError, TypeError, ValueError):
+            retry_after = None
+
+    # SDK connection/timeout errors and httpx transport errors share names
+    transient = type(error).__name__ in (
+        'APIConnectionError', 'APITimeoutError', 'ConnectError', 'ReadError',
+        'ReadTimeout', 'ConnectTimeout', 'WriteError', 'PoolTimeout',
+        'RemoteProtocolError',
+    ) or isinstance(error, (ConnectionError, asyncio.TimeoutError))
+
+    return LLMError(
+        str(error) or type(error).__name__,
+        provider=provider,
+        retryable=transient or status in RETRYABLE_STATUS,
+        status=status,
+        retry_after=retry_after,
+    )
+
+
+class Backend(ABC):
+    """Async LLM backend.
+
+    Subclasses implement complete(); stream() defaults to a single chunk.
+    """
+
+    provider = 'base'
+    label = 'LLM'     # Shown in error strings ("[Groq error: ...]")
+
+    def __init__(self, model: str):
+        self.model = model
+
+    @abstractmethod
+    async def complete(self, system: str, messages: List[Dict[str, str]],
+                       max_tokens: int, temperature: float,
+                       timeout: float) -> Completion:
+        """One completion attempt (no retries)."""
+        pass
+
+    async def stream(self, system: str, messages: List[Dict[str, str]],
+                     max_tokens: int, temperature: float, timeout: float,
+                     completion: Completion) -> AsyncIterator[str]:
+        """Yield text chunks; fill completion's token counts when done."""
+        result = await self.complete(system, messages, max_tokens, temperature, timeout)
+        completion.input_tokens = result.input_tokens
+        completion.output_tokens = result.output_tokens
+        yield result.text
+
+    async def aclose(self):
+        """Release connections."""
@@ -0,0 +1,185 @@
+"""LLM Response Cache: Reuse completions for repeated prompts.
+
+Dream interpretation sends the same prompts again and again (the
+archetype detector sees "dark forest" and "old house" in dream after
+dream). Completions are cached under a fingerprint of the normalized
+prompt (whitespace collapsed, case folded) plus model and sampling
+parameters.
+
+Tiers (same as the coordinate cache):
+    1. Local:  in-process LRU, bounded size
+    2. Shared: Redis (LLM_CACHE_REDIS_URL / REDIS_URL), survives restarts
+       and is shared by all workers
+
+Caching is opt-in per call (LLMClient.complete(..., cache=True)), so
+conversational turns and best-of-N candidates never see cached text.
+
+Usage:
+    llm = get_llm()
+    text = llm.generate(system, prompt, cache=True)
+    get_response_cache().stats()   # hits, misses, hit_rate, ...
+"""
+
+import hashlib
+import json
+import re
+import threading
+from typing import Dict, List, Optional
+
+from .base import Completion
+from ..config import get_config, LLMConfig
+from ..data.cache import LocalTier, RedisTier, _MISSING
+
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def _normalize(text: str) -> str:
+    return _WHITESPACE.sub(' ', text).strip().casefold()
+
+
+def fingerprint(model: str, system: str, messages: List[Dict[str, str]],
+                max_tokens: int, temperature: float) -> str:
+    """Stable hash of a request (normalized prompt + model + parameters)."""
+    payload = json.dumps({
+        'model': model,
+        'system': _normalize(system),
+        'messages': [[m['role'], _normalize(m['content'])] for m in messages],
+        'max_tokens': max_tokens,
+        'temperature': round(temperature, 3),
+    }, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class ResponseCache:
+    """Two-tier (local LRU + optional Redis) completion cache."""
+
+    NAMESPACE = 'completion'
+
+    def __init__(self, config: Optional[LLMConfig] = None,
+                 shared: Optional[RedisTier] = None):
+        """Initialize cache.
+
+        Args:
+            config: LLM configuration (defaults to get_config().llm)
+            shared: Shared tier (defaults to Redis if config.cache_redis_url is set)
+        """
+        self.config = config or get_config().llm
+        self.ttl = self.config.cache_ttl
+        self._local = LocalTier(self.config.cache_size, self.ttl)
+        self._shared = shared
+        if self._shared is None and self.config.cache_redis_url:
+            try:
+                self._shared = RedisTier(self.config.cache_redis_url, 'storm:llm')
+            except ImportError:
+                print("  Warning (LLM cache): redis not installed, using local tier only")
+
+        self._stats_lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._shared_hits = 0
+        self._stores = 0
+
+    @property
+    def blocking(self) -> bool:
+        """Whether lookup()/store() may wait on the network (shared tier)."""
+        return self._shared is not None
+
+    def lookup(self, key: str) -> Optional[Completion]:
+        """Cached completion for a fingerprint, or None.
+
+        Blocks on the shared tier when there is one; async callers run
+        it via asyncio.to_thread (see blocking).
+        """
+        full_key = (self.NAMESPACE, key)
+
+        completion = self._local.get(full_key)
+        if completion is not _MISSING and completion is not None:
+            self._count(hit=True)
+            return _copy(completion)
+
+        if self._shared is not None:
+            raw = self._shared.get(full_key)
+            if raw is not None:
+                try:
+                    completion = Completion(**json.loads(raw))
+                except (ValueError, TypeError):
+                    completion = None
+                if completion is not None:
+                    self._local.set(full_key, completion)
+                    self._count(hit=True, shared=True)
+                    return _copy(completion)
+
+        self._count(hit=False)
+        return None
+
+    def store(self, key: str, completion: Completion):
+        """Cache a completion."""
+        full_key = (self.NAMESPACE, key)
+        self._local.set(full_key, completion, self.ttl)
+        if self._shared is not None:
+            self._shared.set(full_key, json.dumps({
+                'text': completion.text,
+                'model': completion.model,
+                'provider': completion.provider,
+                'input_tokens': completion.input_tokens,
+                'output_tokens': completion.output_tokens,
+            }), self.ttl)
+        with self._stats_lock:
+            self._stores += 1
+
+    def clear(self):
+        """Clear the local tier and statistics."""
+        self._local.clear()
+        with self._stats_lock:
+            self._hits = self._misses = self._shared_hits = self._stores = 0
+
+    def _count(self, hit: bool, shared: bool = False):
+        with self._stats_lock:
+            if hit:
+                self._hits += 1
+                if shared:
+                    self._shared_hits += 1
+            else:
+                self._misses += 1
+
+    def stats(self) -> Dict:
+        """Get cache statistics."""
+        with self._stats_lock:
+            total = self._hits + self._misses
+            return {
+                'size': len(self._local),
+                'max_size': self._local.max_size,
+                'hits': self._hits,
+                'misses': self._misses,
+                'shared_hits': self._shared_hits,
+                'stores': self._stores,
+                'evictions': self._local.evictions,
+                'hit_rate': self._hits / total if total else 0.0,
+                'shared': self._shared is not None,
+                'shared_errors': self._shared.errors if self._shared else 0,
+            }
+
+
+def _copy(completion: Completion) -> Completion:
+    return Completion(completion.text, completion.model, completion.provider,
+                      input_tokens=completion.input_tokens,
+                      output_tokens=completion.output_tokens,
+                      latency=0.0, attempts=0, cached=True)
+
+
+# ============================================================================
+# SINGLETON
+# ============================================================================
+
+_cache_instance: Optional[ResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """Get singleton ResponseCache instance."""
+    global _cache_instance
+    with _cache_lock:
+        if _cache_instance is None:
+            _cache_instance = ResponseCache()
+        return _cache_instance
@@ -0,0 +1,621 @@
+"""LLM Client: Deadlines, retries, concurrency and token accounting.
+
+All LLM traffic in the process runs on one background event loop, so
+connection pools, the concurrency limit and usage counters live in one
+place no matter whether the caller is async (FastAPI handlers) or
+synchronous (Therapist/DreamEngine running in executor threads).
+
+Per call:
+    - deadline: `timeout` seconds covering queueing, attempts and backoff
+    - retries: retryable errors (429, 5xx, connection errors) are retried
+      up to max_retries times with full-jitter exponential backoff,
+      honouring Retry-After when it fits in the deadline
+    - accounting: calls, errors, retries, tokens and latency per model
+
+Usage:
+    llm = get_llm('groq:llama-3.3-70b-versatile')
+    text = llm.generate(system, user, max_tokens=200)            # sync
+    text = llm.generate(system, user, cache=True)                # via response cache
+    completion = await llm.complete(system, user, max_tokens=200)  # async
+    async for chunk in llm.stream(system, user):
+        ...
+
+    # Best of N concurrent candidates, early exit on the first good one
+    completion, score = llm.best_of_sync(system, user, n=3, score=rate,
+                                         threshold=0.6, hedge_percentile=0.9)
+
+    # Tests
+    llm = LLMClient(FakeBackend(responses=['Tell me more.']))
+"""
+
+import asyncio
+import os
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from .base import Backend, Completion, LLMError, LLMTimeout, wrap_error
+from .backends import AnthropicBackend, FakeBackend, GroqBackend, OllamaBackend
+from .cache import ResponseCache, fingerprint, get_response_cache
+from ..config import get_config, LLMConfig
+
+
+# ============================================================================
+# RUNTIME (shared event loop)
+# ============================================================================
+
+class _Runtime:
+    """Background event loop owning all LLM connections."""
+
+    def __init__(self, max_concurrency: int):
+        self.max_concurrency = max(1, max_concurrency)
+        self.loop = asyncio.new_event_loop()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._thread = threading.Thread(
+            target=self._run, name='storm-llm-loop', daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        """Process-wide in-flight limit (only used on self.loop)."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    def submit(self, coro) -> Future:
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def in_loop(self) -> bool:
+        try:
+            return asyncio.get_running_loop() is self.loop
+        except RuntimeError:
+            return False
+
+
+_runtime: Optional[_Runtime] = None
+_runtime_lock = threading.Lock()
+
+
+def _get_runtime() -> _Runtime:
+    global _runtime
+    with _runtime_lock:
+        if _runtime is None:
+            _runtime = _Runtime(get_config().llm.max_concurrency)
+        return _runtime
+
+
+# ============================================================================
+# USAGE ACCOUNTING
+# ============================================================================
+
+class TokenUsage:
+    """Thread-safe call/token counters keyed by (provider, model)."""
+
+    FIELDS = ('calls', 'errors', 'retries', 'timeouts', 'hedges',
+              'input_tokens', 'output_tokens', 'latency_seconds')
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts: Dict[Tuple[str, str], Dict[str, float]] = {}
+
+    def _row(self, provider: str, model: str) -> Dict[str, float]:
+        key = (provider, model)
+        row = self._counts.get(key)
+        if row is None:
+            row = self._counts[key] = {name: 0 for name in self.FIELDS}
+        return row
+
+    def record(self, provider: str, model: str, **deltas):
+        with self._lock:
+            row = self._row(provider, model)
+            for name, value in deltas.items():
+                row[name] += value
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Counters per 'provider:model' plus a 'total' row."""
+        with self._lock:
+            result = {f"{p}:{m}": dict(row) for (p, m), row in self._counts.items()}
+        total = {name: 0 for name in self.FIELDS}
+        for row in result.values():
+            for name in self.FIELDS:
+                total[name] += row[name]
+        result['total'] = total
+        return result
+
+    def reset(self):
+        with self._lock:
+            self._counts.clear()
+
+
+_usage = TokenUsage()
+
+
+def get_usage() -> TokenUsage:
+    """Process-wide LLM usage counters."""
+    return _usage
+
+
+# ============================================================================
+# CLIENT
+# ============================================================================
+
+class LLMClient:
+    """Backend wrapper adding deadlines, retries and accounting."""
+
+    def __init__(self, backend: Backend, config: Optional[LLMConfig] = None,
+                 usage: Optional[TokenUsage] = None,
+                 cache: Optional[ResponseCache] = None):
+        """Initialize client.
+
+        Args:
+            backend: Backend to call
+            config: LLM configuration (defaults to get_config().llm)
+            usage: Usage counters (defaults to the process-wide ones)
+            cache: Response cache for cache=True calls (defaults to the
+                shared one when config.cache_enabled)
+        """
+        self.backend = backend
+        self.config = config or get_config().llm
+        self.usage = usage or _usage
+        self._cache = cache
+        # Recent successful call latencies (hedging threshold)
+        self._latencies = deque(maxlen=256)
+
+    @property
+    def model(self) -> str:
+        return self.backend.model
+
+    @property
+    def provider(self) -> str:
+        return self.backend.provider
+
+    @property
+    def label(self) -> str:
+        return self.backend.label
+
+    @property
+    def response_cache(self) -> Optional[ResponseCache]:
+        if self._cache is None and self.config.cache_enabled:
+            self._cache = get_response_cache()
+        return self._cache
+
+    def _cache_key(self, use_cache: bool, system, messages, max_tokens, temperature):
+        """(cache, fingerprint) for a cacheable call, else (None, None)."""
+        cache = self.response_cache if use_cache else None
+        if cache is None:
+            return None, None
+        return cache, fingerprint(f"{self.provider}:{self.model}", system, messages,
+                                  max_tokens, temperature)
+
+    # ========================================================================
+    # ASYNC API
+    # ========================================================================
+
+    async def complete(self, system: str = '', user: Optional[str] = None,
+                       messages: Optional[List[Dict[str, str]]] = None,
+                       max_tokens: int = 512, temperature: float = 0.7,
+                       timeout: Optional[float] = None,
+                       retries: Optional[int] = None,
+                       cache: bool = False) -> Completion:
+        """Complete a prompt.
+
+        Args:
+            system: System prompt
+            user: User message (shortcut for messages=[{'role': 'user', ...}])
+            messages: Chat history (role/content dicts)
+            max_tokens: Output token limit
+            temperature: Sampling temperature
+            timeout: Deadline in seconds (defaults to config.timeout)
+            retries: Retry budget (defaults to config.max_retries)
+            cache: Serve/store this request via the response cache
+
+        Returns:
+            Completion (completion.cached is True for cache hits)
+
+        Raises:
+            LLMError: After retries are exhausted or on a permanent error
+            LLMTimeout: If the deadline passes
+        """
+        msgs = _messages(user, messages)
+        response_cache, key = self._cache_key(cache, system, msgs, max_tokens, temperature)
+        if response_cache is not None:
+            hit = await _off_loop(response_cache, response_cache.lookup, key)
+            if hit is not None:
+                return hit
+
+        coro = self._complete(system, msgs, max_tokens, temperature,
+                              self.config.timeout if timeout is None else timeout,
+                              self.config.max_retries if retries is None else retries)
+        runtime = _get_runtime()
+        if runtime.in_loop():
+            completion = await coro
+        else:
+            completion = await asyncio.wrap_future(runtime.submit(coro))
+
+        if response_cache is not None:
+            await _off_loop(response_cache, response_cache.store, key, completion)
+        return completion
+
+    async def stream(self, system: str = '', user: Optional[str] = None,
+                     messages: Optional[List[Dict[str, str]]] = None,
+                     max_tokens: int = 512, temperature: float = 0.7,
+                     timeout: Optional[float] = None,
+                     completion: Optional[Completion] = None) -> AsyncIterator[str]:
+        """Stream text chunks.
+
+        Connection errors before the first chunk are retried like
+        complete(); once text has been yielded, errors propagate.
+
+        Args:
+            completion: Optional record filled with the full text, token
+                counts and latency when the stream ends
+        """
+        completion = completion or Completion('', self.model, self.provider)
+        msgs = _messages(user, messages)
+        timeout = self.config.timeout if timeout is None else timeout
+
+        caller = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        done = object()
+
+        def put(item):
+            caller.call_soon_threadsafe(queue.put_nowait, item)
+
+        async def produce():
+            try:
+                async for chunk in self._stream(system, msgs, max_tokens, temperature,
+                                                timeout, completion):
+                    put(chunk)
+                put(done)
+            except BaseException as e:
+                put(e)
+
+        runtime = _get_runtime()
+        future = runtime.submit(produce())
+        try:
+            while True:
+                item = await queue.get()
+                if item is done:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            future.cancel()
+
+    # ========================================================================
+    # SYNC API
+    # ========================================================================
+
+    def complete_sync(self, system: str = '', user: Optional[str] = None,
+                      messages: Optional[List[Dict[str, str]]] = None,
+                      max_tokens: int = 512, temperature: float = 0.7,
+                      timeout: Optional[float] = None,
+                      retries: Optional[int] = None,
+                      cache: bool = False) -> Completion:
+        """Blocking complete() for synchronous callers (not on the LLM loop)."""
+        msgs = _messages(user, messages)
+        response_cache, key = self._cache_key(cache, system, msgs, max_tokens, temperature)
+        if response_cache is not None:
+            hit = response_cache.lookup(key)
+            if hit is not None:
+                return hit
+
+        coro = self._complete(system, msgs, max_tokens, temperature,
+                              self.config.timeout if timeout is None else timeout,
+                              self.config.max_retries if retries is None else retries)
+        completion = _get_runtime().submit(coro).result()
+
+        if response_cache is not None:
+            response_cache.store(key, completion)
+        return completion
+
+    def generate(self, system: str, user: str, max_tokens: int = 512,
+                 temperature: float = 0.7, timeout: Optional[float] = None,
+                 cache: bool = False) -> str:
+        """Blocking completion returning just the text."""
+        return self.complete_sync(system, user, max_tokens=max_tokens,
+                                  temperature=temperature, timeout=timeout,
+                                  cache=cache).text
+
+    # ========================================================================
+    # BEST OF N
+    # ========================================================================
+
+    def latency_percentile(self, q: float, min_samples: int = 20) -> Optional[float]:
+        """Latency at quantile q of recent calls (None until min_samples)."""
+        samples = sorted(self._latencies)
+        if len(samples) < max(1, min_samples):
+            return None
+        return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+    async def best_of(self, system: str, user: str, n: int,
+                      score: Callable[[str], float], threshold: float = 1.0,
+                      hedge_percentile: Optional[float] = None,
+                      max_tokens: int = 512, temperature: float = 0.7,
+                      timeout: Optional[float] = None) -> Tuple[Completion, float]:
+        """Generate n candidates concurrently and keep the best.
+
+        Candidates are scored as they complete; the first one scoring at
+        least `threshold` wins and the rest are cancelled. With
+        hedge_percentile (e.g. 0.9), one extra candidate is started if
+        nothing acceptable has arrived by that latency percentile.
+
+        Args:
+            system: System prompt
+            user: User message
+            n: Number of concurrent candidates
+            score: Candidate text -> score
+            threshold: Early-exit score
+            hedge_percentile: Latency quantile that triggers a hedge
+            max_tokens: Output token limit
+            temperature: Sampling temperature
+            timeout: Deadline in seconds (defaults to config.timeout)
+
+        Returns:
+            (best completion, its score)
+
+        Raises:
+            LLMError: If every candidate failed
+        """
+        coro = self._best_of(system, _messages(user, None), n, score, threshold,
+                             hedge_percentile, max_tokens, temperature,
+                             self.config.timeout if timeout is None else timeout)
+        runtime = _get_runtime()
+        if runtime.in_loop():
+            return await coro
+        return await asyncio.wrap_future(runtime.submit(coro))
+
+    def best_of_sync(self, system: str, user: str, n: int,
+                     score: Callable[[str], float], threshold: float = 1.0,
+                     hedge_percentile: Optional[float] = None,
+                     max_tokens: int = 512, temperature: float = 0.7,
+                     timeout: Optional[float] = None) -> Tuple[Completion, float]:
+        """Blocking best_of() for synchronous callers."""
+        coro = self._best_of(system, _messages(user, None), n, score, threshold,
+                             hedge_percentile, max_tokens, temperature,
+                             self.config.timeout if timeout is None else timeout)
+        return _get_runtime().submit(coro).result()
+
+    async def _best_of(self, system, messages, n, score, threshold, hedge_percentile,
+                       max_tokens, temperature, timeout) -> Tuple[Completion, float]:
+        def launch():
+            return asyncio.ensure_future(self._complete(
+                system, messages, max_tokens, temperature, timeout, self.config.max_retries))
+
+        pending = {launch() for _ in range(max(1, n))}
+        hedge_at = None
+        if hedge_percentile:
+            delay = self.latency_percentile(hedge_percentile)
+            if delay is not None:
+                hedge_at = time.monotonic() + delay
+
+        best: Optional[Tuple[Completion, float]] = None
+        error: Optional[LLMError] = None
+        try:
+            while pending:
+                wait = None if hedge_at is None else max(0.0, hedge_at - time.monotonic())
+                done, pending = await asyncio.wait(
+                    pending, timeout=wait, return_when=asyncio.FIRST_COMPLETED)
+
+                if not done:
+                    # Hedge: the slow tail is past the usual latency
+                    hedge_at = None
+                    pending.add(launch())
+                    self.usage.record(self.provider, self.model, hedges=1)
+                    continue
+
+                for task in done:
+                    try:
+                        completion = task.result()
+                    except LLMError as e:
+                        error = e
+                        continue
+                    value = score(completion.text)
+                    if best is None or value > best[1]:
+                        best = (completion, value)
+                if best is not None and best[1] >= threshold:
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+
+        if best is None:
+            raise error or LLMError('no candidates completed', provider=self.provider)
+        return best
+
+    # ========================================================================
+    # RETRY LOOP (runs on the LLM loop)
+    # ========================================================================
+
+    async def _complete(self, system, messages, max_tokens, temperature,
+                        timeout, retries) -> Completion:
+        started = time.monotonic()
+        deadline = started + timeout
+        attempt = 0
+
+        while True:
+            attempt += 1
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining <= 0:
+                    raise asyncio.TimeoutError()
+                completion = await asyncio.wait_for(
+                    self._attempt(system, messages, max_tokens, temperature, remaining),
+                    remaining,
+                )
+            except asyncio.TimeoutError:
+                self.usage.record(self.provider, self.model, errors=1, timeouts=1)
+                raise LLMTimeout(f"deadline of {timeout:.1f}s exceeded",
+                                 provider=self.provider)
+            except Exception as e:
+                error = wrap_error(e, self.provider)
+                self.usage.record(self.provider, self.model, errors=1)
+                delay = self._backoff(attempt, error)
+                if (not error.retryable or attempt > retries
+                        or time.monotonic() + delay >= deadline):
+                    raise error
+                self.usage.record(self.provider, self.model, retries=1)
+                await asyncio.sleep(delay)
+                continue
+
+            completion.attempts = attempt
+            completion.latency = time.monotonic() - started
+            self._latencies.append(completion.latency)
+            self.usage.record(
+                self.provider, self.model, calls=1,
+                input_tokens=completion.input_tokens,
+                output_tokens=completion.output_tokens,
+                latency_seconds=completion.latency,
+            )
+            return completion
+
+    async def _attempt(self, system, messages, max_tokens, temperature, timeout) -> Completion:
+        async with _get_runtime().semaphore:
+            return await self.backend.complete(system, messages, max_tokens, temperature, timeout)
+
+    def _backoff(self, attempt: int, error: LLMError) -> float:
+        """Full-jitter exponential backoff, at least Retry-After."""
+        cap = min(self.config.backoff_max, self.config.backoff_base * 2 ** (attempt - 1))
+        delay = random.uniform(0, cap)
+        if error.retry_after:
+            delay = max(delay, error.retry_after)
+        return delay
+
+    async def _stream(self, system, messages, max_tokens, temperature, timeout,
+                      completion: Completion) -> AsyncIterator[str]:
+        started = time.monotonic()
+        deadline = started + timeout
+        attempt = 0
+        parts: List[str] = []
+
+        async with _get_runtime().semaphore:
+            while True:
+                attempt += 1
+                try:
+                    async for chunk in _with_deadline(
+                        self.backend.stream(system, messages, max_tokens, temperature,
+                                            deadline - time.monotonic(), completion),
+                        deadline,
+                    ):
+                        parts.append(chunk)
+                        yield chunk
+                    break
+                except asyncio.TimeoutError:
+                    self.usage.record(self.provider, self.model, errors=1, timeouts=1)
+                    raise LLMTimeout(f"deadline of {timeout:.1f}s exceeded",
+                                     provider=self.provider)
+                except Exception as e:
+                    error = wrap_error(e, self.provider)
+                    self.usage.record(self.provider, self.model, errors=1)
+                    delay = self._backoff(attempt, error)
+                    if (parts or not error.retryable or attempt > self.config.max_retries
+                            or time.monotonic() + delay >= deadline):
+                        raise error
+                    self.usage.record(self.provider, self.model, retries=1)
+                    await asyncio.sleep(delay)
+
+        completion.text = ''.join(parts)
+        completion.attempts = attempt
+        completion.latency = time.monotonic() - started
+        self.usage.record(
+            self.provider, self.model, calls=1,
+            input_tokens=completion.input_tokens,
+            output_tokens=completion.output_tokens,
+            latency_seconds=completion.latency,
+        )
+
+
+async def _with_deadline(chunks: AsyncIterator[str], deadline: float) -> AsyncIterator[str]:
+    """Re-yield chunks, raising asyncio.TimeoutError once deadline passes."""
+    iterator = chunks.__aiter__()
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise asyncio.TimeoutError()
+        try:
+            chunk = await asyncio.wait_for(iterator.__anext__(), remaining)
+        except StopAsyncIteration:
+            return
+        yield chunk
+
+
+def _messages(user: Optional[str],
+              messages: Optional[List[Dict[str, str]]]) -> List[Dict[str, str]]:
+    if messages is not None:
+        return list(messages)
+    return [{"role": "user", "content": user or ''}]
+
+
+async def _off_loop(response_cache: ResponseCache, fn: Callable, *args):
+    """Call a response-cache method, in a thread if it may block on Redis."""
+    if response_cache.blocking:
+        return await asyncio.to_thread(fn, *args)
+    return fn(*args)
+
+
+# ============================================================================
+# BACKEND SELECTION
+# ============================================================================
+
+def create_backend(model: str, api_key: Optional[str] = None,
+                   base_url: Optional[str] = None,
+                   config: Optional[LLMConfig] = None) -> Backend:
+    """Build a backend from a model spec.
+
+    Specs:
+        'claude' / 'claude:<model-id>'  Claude (ANTHROPIC_API_KEY)
+        'groq:<model>'                  Groq (GROQ_API_KEY)
+        'fake' / 'fake:<name>'          FakeBackend
+        anything else                   Ollama model name
+
+    Raises:
+        ValueError: If the provider's API key is missing
+    """
+    config = config or get_config().llm
+    lowered = model.lower()
+
+    if lowered == 'fake' or lowered.startswith('fake:'):
+        return FakeBackend(model=model)
+
+    if lowered.startswith('claude'):
+        api_key = api_key or os.environ.get('ANTHROPIC_API_KEY')
+        if not api_key:
+            raise ValueError("ANTHROPIC_API_KEY not set")
+        model_id = model.split(':', 1)[1] if ':' in model else config.claude_model
+        return AnthropicBackend(model_id, api_key)
+
+    if lowered.startswith('groq:'):
+        api_key = api_key or os.environ.get('GROQ_API_KEY')
+        if not api_key:
+            raise ValueError("GROQ_API_KEY not set")
+        return GroqBackend(model.split(':', 1)[1], api_key)
+
+    return OllamaBackend(model, base_url or config.ollama_url, config.max_connections)
+
+
+_clients: Dict[Tuple[str, Optional[str], Optional[str]], LLMClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_llm(model: Optional[str] = None, api_key: Optional[str] = None,
+            base_url: Optional[str] = None) -> LLMClient:
+    """Get the shared LLMClient for a model spec (defaults to LLM_MODEL).
+
+    Clients (and their connection pools) are cached per spec, so every
+    Therapist, DreamEngine and Renderer using a model shares one pool.
+    """
+    model = model or get_config().llm.model
+    key = (model, api_key, base_url)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = _clients[key] = LLMClient(create_backend(model, api_key, base_url))
+        return client
@@ -10,7 +10,8 @@ Based on Carl Jung's archetypal theory, identifies patterns of:
 - Trickster: agent of change, boundary-crossing
 - Death/Rebirth: transformation through symbolic death
 
-Uses LLM for dynamic archetype detection when symbols are not in static config.
+Uses LLM for dynamic archetype detection when symbols are not in static config
+(batched: one call for all unknown symbols of a dream).
 Config file (config/archetypes.json) provides fallback patterns.
 """
 
@@ -23,6 +24,21 @@ from dataclasses import dataclass
 from ...data.models import Bond, DreamState
 
 
+# Shared by single-symbol and batched LLM detection
+_DETECT_SYSTEM = """You are a Jungian symbol analyst. Identify the archetype a dream symbol belongs to.
+
+Available archetypes (choose ONE):
+- shadow: repressed, unknown aspects of self (dark, threatening, hidden)
+- anima_animus: contrasexual aspect (mysterious stranger, lover, guide)
+- self: wholeness, integration (center, light, divine, mandala)
+- mother: nurturing/devouring maternal (water, cave, earth, home)
+- father: authority, order, spiritual principle (king, sky, law, tower)
+- hero: ego's journey, individuation (battle, quest, victory, bridge)
+- trickster: change, boundary-crossing (fool, transform, chaos, animal)
+- death_rebirth: transformation (dying, renewal, phoenix, egg)
+"""
+
+
 @dataclass
 class ArchetypePattern:
     """Pattern definition for an archetype."""
@@ -71,12 +87,15 @@ class ArchetypeAnalyzer:
     """
 
     def __init__(self, config_path: Optional[Path] = None,
-                 llm_caller: Optional[Callable[[str, str], str]] = None):
+                 llm_caller: Optional[Callable[[str, str], str]] = None,
+                 batch_llm_caller: Optional[Callable[[str, str], str]] = None):
         """Initialize analyzer with patterns from config.
 
         Args:
             config_path: Optional custom config path.
             llm_caller: Optional function(system, prompt) -> response for LLM calls.
+            batch_llm_caller: Optional caller with a larger output budget for
+                batched detection (defaults to llm_caller).
         """
         config = load_archetypes_config(config_path)
 
@@ -84,6 +103,7 @@ class ArchetypeAnalyzer:
         self.dream_symbols: Dict[str, Tuple[str, str]] = {}
         self._compiled_patterns: Dict[str, List] = {}
         self._llm_caller = llm_caller
+        self._batch_llm_caller = batch_llm_caller
 
         # Load archetypes from config
         for name, data in config.get("archetypes", {}).items():
@@ -176,13 +196,16 @@ class ArchetypeAnalyzer:
 
         return scores
 
-    def set_llm_caller(self, llm_caller: Callable[[str, str], str]):
+    def set_llm_caller(self, llm_caller: Callable[[str, str], str],
+                       batch_llm_caller: Optional[Callable[[str, str], str]] = None):
         """Set LLM caller for dynamic archetype detection.
 
         Args:
             llm_caller: Function(system, prompt) -> response
+            batch_llm_caller: Caller for batched detection (defaults to llm_caller)
         """
         self._llm_caller = llm_caller
+        self._batch_llm_caller = batch_llm_caller
 
     def _detect_archetype_via_llm(self, symbol_text: str, A: float, S: float) -> Tuple[str, str]:
         """Use LLM to detect archetype for a symbol.
@@ -198,20 +221,7 @@ class ArchetypeAnalyzer:
         if not self._llm_caller:
             return ("", "")
 
-        archetype_names = ", ".join(self.archetypes.keys())
-
-        system = """You are a Jungian symbol analyst. Identify the archetype a dream symbol belongs to.
-
-Available archetypes (choose ONE):
-- shadow: repressed, unknown aspects of self (dark, threatening, hidden)
-- anima_animus: contrasexual aspect (mysterious stranger, lover, guide)
-- self: wholeness, integration (center, light, divine, mandala)
-- mother: nurturing/devouring maternal (water, cave, earth, home)
-- father: authority, order, spiritual principle (king, sky, law, tower)
-- hero: ego's journey, individuation (battle, quest, victory, bridge)
-- trickster: change, boundary-crossing (fool, transform, chaos, animal)
-- death_rebirth: transformation (dying, renewal, phoenix, egg)
-
+        system = _DETECT_SYSTEM + """
 Respond with ONLY a JSON object: {"archetype": "name", "interpretation": "brief meaning"}
 If the symbol doesn't clearly fit any archetype, use the closest match based on symbolic meaning."""
 
@@ -229,20 +239,85 @@ What archetype does this symbol represent?"""
             end = response.rfind('}') + 1
             if start >= 0 and end > start:
                 data = json_module.loads(response[start:end])
-                archetype = data.get("archetype", "").lower().replace(" ", "_")
-                interpretation = data.get("interpretation", "")
-                # Validate archetype is known
-                if archetype in self.archetypes:
-                    return (archetype, interpretation)
-                # Try to match partial names
-                for name in self.archetypes:
-                    if archetype in name or name in archetype:
-                        return (name, interpretation)
+                return self._validate_detection(data)
         except Exception:
             pass
 
         return ("", "")
 
+    def _validate_detection(self, data: Dict) -> Tuple[str, str]:
+        """Map an LLM {"archetype", "interpretation"} object to a known archetype."""
+        archetype = str(data.get("archetype") or "").lower().replace(" ", "_")
+        interpretation = data.get("interpretation", "")
+        if not archetype:
+            return ("", "")
+        # Validate archetype is known
+        if archetype in self.archetypes:
+            return (archetype, interpretation)
+        # Try to match partial names
+        for name in self.archetypes:
+            if archetype in name or name in archetype:
+                return (name, interpretation)
+        return ("", "")
+
+    def _detect_archetypes_via_llm(self, symbols: List[Tuple[str, float, float]]
+                                   ) -> Optional[Dict[str, Tuple[str, str]]]:
+        """Detect archetypes for several symbols with one LLM call.
+
+        Args:
+            symbols: (symbol_text, A, S) per symbol
+
+        Returns:
+            symbol_text -> (archetype, interpretation) for the symbols the
+            response covered, or None if the response could not be parsed
+        """
+        caller = self._batch_llm_caller or self._llm_caller
+        if not caller or not symbols:
+            return {}
+
+        system = _DETECT_SYSTEM + """
+You will receive a numbered list of symbols. Respond with ONLY a JSON array,
+one object per symbol in the same order:
+[{"symbol": "text", "archetype": "name", "interpretation": "brief meaning"}]
+If a symbol doesn't clearly fit any archetype, use the closest match based on symbolic meaning."""
+
+        lines = [
+            f'{i}. "{text}" (A={A:+.2f}, S={S:+.2f})'
+            for i, (text, A, S) in enumerate(symbols, 1)
+        ]
+        prompt = f"""Semantic coordinates: A (positive=affirming, negative=threatening), S (positive=sacred, negative=profane)
+
+Symbols:
+{chr(10).join(lines)}
+
+What archetype does each symbol represent?"""
+
+        try:
+            response = caller(system, prompt)
+            start = response.find('[')
+            end = response.rfind(']') + 1
+            if start < 0 or end <= start:
+                return None
+            items = json.loads(response[start:end])
+        except Exception:
+            return None
+        if not isinstance(items, list):
+            return None
+
+        texts = set(text for text, _, _ in symbols)
+        results = {}
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            # Match by name only: an unknown name is not guessed by position
+            text = str(item.get("symbol") or "").lower().strip()
+            if text not in texts:
+                continue
+            detected = self._validate_detection(item)
+            if detected[0]:
+                results[text] = detected
+        return results
+
     def get_symbol_interpretation(self, symbol: Bond, use_llm: bool = True) -> Tuple[str, str]:
         """Get archetype and interpretation for a specific symbol.
 
@@ -253,12 +328,68 @@ What archetype does this symbol represent?"""
         Returns:
             (archetype_name, interpretation_text)
         """
+        best_match, confident = self._static_interpretation(symbol)
+        if confident:
+            return best_match
+
+        # Use LLM for dynamic detection
+        if use_llm and self._llm_caller:
+            llm_result = self._detect_archetype_via_llm(symbol.text.lower(), symbol.A, symbol.S)
+            if llm_result[0]:
+                return llm_result
+
+        # Return best static match even if score < 2
+        return best_match
+
+    def get_symbol_interpretations(self, symbols: List[Bond],
+                                   use_llm: bool = True) -> List[Tuple[str, str]]:
+        """Archetype and interpretation for many symbols.
+
+        Symbols without a confident static match are sent to the LLM in
+        one batched prompt. Symbols the response leaves out (or names
+        differently) keep their best static match; single-symbol calls
+        are made only when the batch response cannot be parsed at all.
+
+        Args:
+            symbols: Bonds to interpret
+            use_llm: Whether to use LLM for detection (default True)
+
+        Returns:
+            (archetype_name, interpretation_text) per symbol, in order
+        """
+        results = []
+        unknown: Dict[str, Tuple[float, float]] = {}
+        for symbol in symbols:
+            best_match, confident = self._static_interpretation(symbol)
+            results.append(best_match)
+            if not confident:
+                unknown.setdefault(symbol.text.lower(), (symbol.A, symbol.S))
+
+        if not (use_llm and unknown and (self._batch_llm_caller or self._llm_caller)):
+            return results
+
+        batch = [(text, A, S) for text, (A, S) in unknown.items()]
+        detected = self._detect_archetypes_via_llm(batch) if len(batch) > 1 else None
+        if detected is None:
+            detected = {}
+            if self._llm_caller:
+                for text, A, S in batch:
+                    detected[text] = self._detect_archetype_via_llm(text, A, S)
+
+        for i, symbol in enumerate(symbols):
+            llm_result = detected.get(symbol.text.lower())
+            if llm_result and llm_result[0]:
+                results[i] = llm_result
+        return results
+
+    def _static_interpretation(self, symbol: Bond) -> Tuple[Tuple[str, str], bool]:
+        """Config-based match: ((archetype, interpretation), confident)."""
         text = symbol.text.lower()
 
         # Check known symbols first (fast path)
         for sym_word, (archetype, interpretation) in self.dream_symbols.items():
             if sym_word in text:
-                return (archetype, interpretation)
+                return (archetype, interpretation), True
 
         # Check keyword matches
         best_match = ("", "")
@@ -278,17 +409,7 @@ What archetype does this symbol represent?"""
                 best_match = (name, pattern.description)
 
         # If good static match found, use it
-        if best_score >= 2:
-            return best_match
-
-        # Use LLM for dynamic detection
-        if use_llm and self._llm_caller:
-            llm_result = self._detect_archetype_via_llm(text, symbol.A, symbol.S)
-            if llm_result[0]:
-                return llm_result
-
-        # Return best static match even if score < 2
-        return best_match
+        return best_match, best_score >= 2
 
     def create_dream_state(self, text: str, symbols: List[Bond]) -> DreamState:
         """Create a DreamState from text and symbols.
@@ -346,9 +467,9 @@ What archetype does this symbol represent?"""
     def reload_config(self, config_path: Optional[Path] = None):
         """Reload patterns from config file.
 
-        Useful for hot-reloading after config edits.
+        Useful for hot-reloading after config edits. LLM callers are kept.
         """
-        self.__init__(config_path)
+        self.__init__(config_path, self._llm_caller, self._batch_llm_caller)
 
 
 # Singleton instance
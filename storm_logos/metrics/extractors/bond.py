@@ -115,3 +115,29 @@ class BondExtractor:
             WordCoordinates or None
         """
         return self.data.get(word)
+
+    def find_neighbors(self, bond: Bond, radius: float = 0.5) -> List[Bond]:
+        """Find corpus bonds near a bond in (A, S, τ) space.
+
+        Args:
+            bond: Bond to search around (coordinates computed if missing)
+            radius: Search radius
+
+        Returns:
+            List of nearby bonds
+        """
+        A, S, tau = self.get_coordinates(bond)
+        return self.data.get_neighbors(A, S, tau, radius)
+
+    def nearest_bond(self, bond: Bond) -> Optional[Bond]:
+        """Find the corpus bond closest to a bond in (A, S, τ) space.
+
+        Args:
+            bond: Bond to search around (coordinates computed if missing)
+
+        Returns:
+            Nearest bond or None if no bonds are loaded
+        """
+        A, S, tau = self.get_coordinates(bond)
+        nearest = self.data.get_nearest(A, S, tau, k=1)
+        return nearest[0] if nearest else None
@@ -8,6 +8,7 @@ from typing import List, Optional, Tuple
 from dataclasses import dataclass, field
 
 from ...data.models import Bond
+from ...data.nlp import get_nlp_service
 
 
 @dataclass
@@ -45,11 +46,11 @@ class TextExtractor:
             self._load_spacy()
 
     def _load_spacy(self):
-        """Load spaCy model."""
-        try:
-            import spacy
-            self._nlp = spacy.load('en_core_web_sm')
-        except (ImportError, OSError):
+        """Use the shared spaCy pipeline."""
+        service = get_nlp_service()
+        if service.available():
+            self._nlp = service
+        else:
             print("spaCy not available, using regex fallback")
             self.use_spacy = False
 
@@ -69,7 +70,7 @@ class TextExtractor:
 
     def _extract_spacy(self, text: str) -> ExtractedText:
         """Extract using spaCy dependency parsing."""
-        doc = self._nlp(text)
+        doc = self._nlp.parse(text)
         result = ExtractedText()
 
         for sent in doc.sents:
@@ -3,3 +3,4 @@
 from .engine import Orchestrator, get_orchestrator
 from .session import Session
 from .loop import MainLoop
+from .executor import StageExecutor, StageOverloaded, get_executor
@@ -0,0 +1,265 @@
+"""Stage Executor: Run blocking engine work off the asyncio event loop.
+
+The FastAPI handlers are async, but the engine underneath is
+synchronous (spaCy, LLM SDKs, Neo4j and PostgreSQL drivers). Called
+inline, one slow LLM call stalls every other request on the worker.
+Handlers await executor.run(stage, fn, ...) instead.
+
+Stages:
+    llm       io   LLM API calls
+    neo4j     io   Neo4j sessions (Storm, user graph)
+    postgres  io   PostgreSQL queries
+    engine    io   Stateful pipelines (Therapist, DreamEngine) that mix
+                   parsing, LLM and database calls on shared objects
+    nlp       cpu  spaCy parsing
+    metrics   cpu  Text metrics and archetype scoring
+
+I/O stages share a thread pool. CPU stages run in a process pool, so
+their callables and arguments must be picklable (top-level functions
+such as those in orchestration/tasks.py). Every process worker is a
+fresh interpreter that builds its own copy of whatever state the task
+needs; work on large in-process state (the MetricsEngine: spaCy plus
+the coordinate tables) goes through run_in_thread() instead, which
+keeps the stage's limit and counters but uses the thread pool.
+
+Each stage admits at most `limit` concurrent calls. Further callers
+wait in the stage queue; once max_queue are waiting, run() raises
+StageOverloaded (handlers answer 503). stats() reports queue depth,
+running calls, and totals for /metrics.
+
+Usage:
+    executor = get_executor()
+    analysis = await executor.run('llm', engine._call_llm, system, prompt)
+    scores = await executor.run('metrics', archetype_scores, text)
+    metrics = await executor.run_in_thread('metrics', service.metrics.measure, text=text)
+"""
+
+import asyncio
+import functools
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from ..config import get_config, ExecutorConfig
+
+
+# Stage name -> pool kind
+STAGES: Dict[str, str] = {
+    'llm': 'io',
+    'neo4j': 'io',
+    'postgres': 'io',
+    'engine': 'io',
+    'nlp': 'cpu',
+    'metrics': 'cpu',
+}
+
+
+class StageOverloaded(RuntimeError):
+    """Raised when a stage's wait queue is full."""
+
+    def __init__(self, stage: str, queued: int):
+        super().__init__(f"Stage '{stage}' overloaded ({queued} calls waiting)")
+        self.stage = stage
+        self.queued = queued
+
+
+class Stage:
+    """Concurrency limit and counters for one stage.
+
+    Counters are only touched from the event loop thread.
+    """
+
+    def __init__(self, name: str, kind: str, limit: int, max_queue: int = 0):
+        self.name = name
+        self.kind = kind
+        self.limit = max(1, limit)
+        self.max_queue = max_queue
+        self._semaphores: Dict[int, asyncio.Semaphore] = {}
+
+        self.queued = 0
+        self.running = 0
+        self.max_queued = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.wait_seconds = 0.0
+        self.run_seconds = 0.0
+
+    def semaphore(self, loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+        """Semaphore for the running loop (asyncio primitives are loop-bound)."""
+        sem = self._semaphores.get(id(loop))
+        if sem is None:
+            sem = asyncio.Semaphore(self.limit)
+            self._semaphores = {id(loop): sem}
+        return sem
+
+    def stats(self) -> Dict:
+        return {
+            'kind': self.kind,
+            'limit': self.limit,
+            'queued': self.queued,
+            'running': self.running,
+            'max_queued': self.max_queued,
+            'completed': self.completed,
+            'failed': self.failed,
+            'rejected': self.rejected,
+            'wait_seconds_total': self.wait_seconds,
+            'run_seconds_total': self.run_seconds,
+        }
+
+
+class StageExecutor:
+    """Bounded thread/process pools behind named stages."""
+
+    def __init__(self, config: Optional[ExecutorConfig] = None):
+        """Initialize executor (pools start on first use).
+
+        Args:
+            config: Executor configuration (defaults to get_config().executor)
+        """
+        self.config = config or get_config().executor
+        self.stages: Dict[str, Stage] = {
+            name: Stage(name, kind, self.config.limits.get(name, 4), self.config.max_queue)
+            for name, kind in STAGES.items()
+        }
+        self._threads: Optional[ThreadPoolExecutor] = None
+        self._processes: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    # ========================================================================
+    # POOLS
+    # ========================================================================
+
+    def _pool(self, kind: str) -> Executor:
+        with self._lock:
+            if kind == 'cpu' and self.config.cpu_workers > 0:
+                if self._processes is None:
+                    # spawn: forked children would share the parent's
+                    # database sockets and driver threads
+                    self._processes = ProcessPoolExecutor(
+                        max_workers=self.config.cpu_workers,
+                        mp_context=multiprocessing.get_context('spawn'),
+                    )
+                return self._processes
+
+            if self._threads is None:
+                self._threads = ThreadPoolExecutor(
+                    max_workers=max(1, self.config.io_workers),
+                    thread_name_prefix='storm-exec',
+                )
+            return self._threads
+
+    def shutdown(self, wait: bool = True):
+        """Shut down both pools (they restart on next use)."""
+        with self._lock:
+            threads, self._threads = self._threads, None
+            processes, self._processes = self._processes, None
+        if threads is not None:
+            threads.shutdown(wait=wait)
+        if processes is not None:
+            processes.shutdown(wait=wait)
+
+    # ========================================================================
+    # MAIN INTERFACE
+    # ========================================================================
+
+    async def run(self, stage: str, fn: Callable, *args, **kwargs) -> Any:
+        """Run fn(*args, **kwargs) in the stage's pool and await the result.
+
+        Args:
+            stage: Stage name (see STAGES)
+            fn: Blocking callable (picklable for cpu stages)
+
+        Returns:
+            fn's return value (its exceptions propagate)
+
+        Raises:
+            StageOverloaded: If the stage queue is full
+        """
+        return await self._run(stage, None, fn, args, kwargs)
+
+    async def run_in_thread(self, stage: str, fn: Callable, *args, **kwargs) -> Any:
+        """Like run(), but always on the thread pool (fn shares this process's state).
+
+        For CPU stages whose work needs objects too large to rebuild in
+        every process worker. The stage's concurrency limit still applies.
+        """
+        return await self._run(stage, 'io', fn, args, kwargs)
+
+    async def _run(self, stage: str, kind: Optional[str], fn: Callable,
+                   args: tuple, kwargs: Dict) -> Any:
+        st = self.stages.get(stage)
+        if st is None:
+            raise ValueError(f"Unknown stage: {stage}")
+
+        if st.max_queue and st.queued >= st.max_queue:
+            st.rejected += 1
+            raise StageOverloaded(stage, st.queued)
+
+        loop = asyncio.get_running_loop()
+        sem = st.semaphore(loop)
+
+        queued_at = time.monotonic()
+        st.queued += 1
+        st.max_queued = max(st.max_queued, st.queued)
+        try:
+            await sem.acquire()
+        finally:
+            st.queued -= 1
+
+        started = time.monotonic()
+        st.wait_seconds += started - queued_at
+        st.running += 1
+
+        def finished(failed: bool):
+            st.running -= 1
+            st.run_seconds += time.monotonic() - started
+            if failed:
+                st.failed += 1
+            else:
+                st.completed += 1
+            sem.release()
+
+        def job_done(future):
+            # The slot is held until the job itself ends, not its awaiter:
+            # a cancelled request must not free room for another job while
+            # this one still occupies a worker
+            failed = future.cancelled() or future.exception() is not None
+            try:
+                loop.call_soon_threadsafe(finished, failed)
+            except RuntimeError:
+                pass    # loop already closed
+
+        try:
+            call = functools.partial(fn, *args, **kwargs)
+            future = self._pool(kind or st.kind).submit(call)
+        except BaseException:
+            finished(failed=True)
+            raise
+        future.add_done_callback(job_done)
+        return await asyncio.wrap_future(future, loop=loop)
+
+    # ========================================================================
+    # STATS
+    # ========================================================================
+
+    def stats(self) -> Dict[str, Dict]:
+        """Per-stage queue depth, running calls and totals."""
+        return {name: stage.stats() for name, stage in self.stages.items()}
+
+
+# ============================================================================
+# SINGLETON
+# ============================================================================
+
+_executor_instance: Optional[StageExecutor] = None
+
+
+def get_executor() -> StageExecutor:
+    """Get singleton StageExecutor instance."""
+    global _executor_instance
+    if _executor_instance is None:
+        _executor_instance = StageExecutor()
+    return _executor_instance
@@ -0,0 +1,23 @@
+"""CPU Tasks: Top-level functions for the executor's process pool.
+
+Arguments and return values cross the process boundary, so they stay
+plain. Each worker is a spawned interpreter holding its own copy of
+whatever a task loads, so tasks here only use small state (the
+keyword/phrase archetype analyzer, a few MB per worker).
+
+Text metrics are not a task: a MetricsEngine per worker would load
+spaCy and the coordinate tables again in every process (several
+hundred MB each without a snapshot). The semantic service measures
+on its own engine with executor.run_in_thread('metrics', ...).
+
+Usage:
+    scores = await get_executor().run('metrics', archetype_scores, text)
+"""
+
+from typing import Dict
+
+
+def archetype_scores(text: str) -> Dict[str, float]:
+    """Keyword/phrase archetype scores for text."""
+    from ..metrics.analyzers.archetype import get_archetype_analyzer
+    return get_archetype_analyzer().analyze_text(text)
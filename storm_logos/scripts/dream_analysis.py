@@ -53,9 +53,11 @@ def load_env():
 load_env()
 
 from storm_logos.data.postgres import get_data
+from storm_logos.data.nlp import get_nlp_service
 from storm_logos.data.neo4j import get_neo4j
 from storm_logos.data.models import Bond
 from storm_logos.data.book_parser import BookParser
+from storm_logos.llm import get_llm
 
 
 @dataclass
@@ -204,66 +206,19 @@ class DreamAnalyzer:
 
     def _get_llm_client(self):
         """Get LLM client based on model."""
-        if self._llm_client is not None:
-            return self._llm_client
-
-        if self.model.startswith("groq:"):
-            from groq import Groq
-            self._llm_client = ("groq", Groq())
-        elif self.model == "claude":
-            import anthropic
-            self._llm_client = ("claude", anthropic.Anthropic())
-        else:
-            # Assume Ollama
-            import requests
-            self._llm_client = ("ollama", None)
-
+        if self._llm_client is None:
+            self._llm_client = get_llm(self.model)
         return self._llm_client
 
     def _call_llm(self, system_prompt: str, user_prompt: str) -> str:
         """Call the LLM."""
-        client_type, client = self._get_llm_client()
-
-        if client_type == "groq":
-            model_name = self.model.split(":", 1)[1]
-            response = client.chat.completions.create(
-                model=model_name,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
-                max_tokens=1024,
-                temperature=0.7,
-            )
-            return response.choices[0].message.content
-
-        elif client_type == "claude":
-            response = client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=1024,
-                system=system_prompt,
-                messages=[{"role": "user", "content": user_prompt}],
-            )
-            return response.content[0].text
-
-        else:  # Ollama
-            import requests
-            response = requests.post(
-                "http://localhost:11434/api/generate",
-                json={
-                    "model": self.model,
-                    "prompt": f"{system_prompt}\n\nUser: {user_prompt}",
-                    "stream": False,
-                },
-            )
-            return response.json()["response"]
+        return self._get_llm_client().generate(system_prompt, user_prompt,
+                                               max_tokens=1024, temperature=0.7)
 
     def extract_symbols(self, dream_text: str) -> List[DreamSymbol]:
         """Extract symbolic bonds from dream text."""
         # Use spaCy to extract bonds
-        import spacy
-        nlp = spacy.load("en_core_web_sm")
-        doc = nlp(dream_text)
+        doc = get_nlp_service().parse(dream_text)
 
         symbols = []
         seen = set()
@@ -49,8 +49,10 @@ def load_env():
 load_env()
 
 from storm_logos.data.postgres import get_data
+from storm_logos.data.nlp import get_nlp_service
 from storm_logos.data.neo4j import get_neo4j
 from storm_logos.data.models import Bond
+from storm_logos.llm import get_llm
 
 
 @dataclass
@@ -97,73 +99,25 @@ class DreamTherapist:
             print("Warning: Neo4j not connected (corpus search disabled)")
 
         # Initialize Claude (dreamer)
-        import anthropic
-        self._claude = anthropic.Anthropic()
+        self._claude = get_llm("claude")
         print(f"API key loaded: {os.environ.get('ANTHROPIC_API_KEY', '')[:20]}...")
 
         # Initialize therapist
-        if self.therapist_model.startswith("groq:"):
-            from groq import Groq
-            self._therapist = ("groq", Groq(), self.therapist_model.split(":", 1)[1])
-        elif self.therapist_model == "claude":
-            self._therapist = ("claude", self._claude, "claude-sonnet-4-20250514")
-        else:
-            self._therapist = ("ollama", None, self.therapist_model)
+        self._therapist = get_llm(self.therapist_model)
 
         return True
 
     def _call_claude(self, system: str, messages: List[Dict]) -> str:
         """Call Claude as dreamer."""
-        response = self._claude.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=1024,
-            system=system,
-            messages=messages,
-        )
-        return response.content[0].text
+        return self._claude.complete_sync(system, messages=messages, max_tokens=1024).text
 
     def _call_therapist(self, system: str, user: str) -> str:
         """Call therapist LLM."""
-        client_type, client, model = self._therapist
-
-        if client_type == "groq":
-            response = client.chat.completions.create(
-                model=model,
-                messages=[
-                    {"role": "system", "content": system},
-                    {"role": "user", "content": user},
-                ],
-                max_tokens=512,
-                temperature=0.7,
-            )
-            return response.choices[0].message.content
-
-        elif client_type == "claude":
-            response = client.messages.create(
-                model=model,
-                max_tokens=512,
-                system=system,
-                messages=[{"role": "user", "content": user}],
-            )
-            return response.content[0].text
-
-        else:  # Ollama
-            import requests
-            response = requests.post(
-                "http://localhost:11434/api/generate",
-                json={
-                    "model": model,
-                    "prompt": f"{system}\n\nUser: {user}",
-                    "stream": False,
-                },
-            )
-            return response.json()["response"]
+        return self._therapist.generate(system, user, max_tokens=512, temperature=0.7)
 
     def extract_symbols(self, text: str) -> List[Dict]:
         """Extract dream symbols from text."""
-        import spacy
-        nlp = spacy.load("en_core_web_sm")
-        doc = nlp(text)
+        doc = get_nlp_service().parse(text)
 
         symbols = []
         seen = set()
@@ -5,6 +5,9 @@ Usage:
     python -m storm_logos.scripts.process_books --priority
     python -m storm_logos.scripts.process_books --file "path/to/book.txt"
     python -m storm_logos.scripts.process_books --all --limit 10
+
+    # Parallel: 4 books at a time, resumable after interruption
+    python -m storm_logos.scripts.process_books --all --workers 4 --checkpoint ingest.json
 """
 
 import argparse
@@ -16,6 +19,7 @@ from datetime import datetime
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from storm_logos.data.book_parser import BookProcessor, BookParser
+from storm_logos.data.ingest import BookIngestor
 from storm_logos.data.neo4j import get_neo4j
 
 
@@ -23,7 +27,8 @@ from storm_logos.data.neo4j import get_neo4j
 DEFAULT_GUTENBERG_DIR = Path('/home/chukiss/text_project/data/gutenberg')
 
 
-def process_priority_books(gutenberg_dir: Path) -> None:
+def process_priority_books(gutenberg_dir: Path, workers: int = 1, n_process: int = 1,
+                           queue_size: int = 2, checkpoint: Path = None) -> None:
     """Process the 10 priority books (5 Jung + 5 Mythology)."""
     print("=" * 60)
     print("Storm-Logos Book Processor")
@@ -43,39 +48,21 @@ def process_priority_books(gutenberg_dir: Path) -> None:
     print("Connected!")
     print()
 
+    books = []
+    for filename, meta in BookProcessor.BOOK_METADATA.items():
+        filepath = gutenberg_dir / filename
+        if filepath.exists():
+            books.append((filepath, meta))
+        else:
+            print(f"File not found: {filepath}")
+
     # Process priority books
-    start_time = datetime.now()
-    results = processor.process_priority_books(gutenberg_dir)
-    end_time = datetime.now()
+    ingestor = BookIngestor(processor, workers=workers, n_process=n_process,
+                            queue_size=queue_size, checkpoint_path=checkpoint)
+    report = ingestor.run(books)
 
     # Summary
-    print()
-    print("=" * 60)
-    print("PROCESSING COMPLETE")
-    print("=" * 60)
-    print()
-
-    total_bonds = 0
-    total_sentences = 0
-    successful = 0
-    failed = 0
-
-    for r in results:
-        if 'error' in r:
-            failed += 1
-            print(f"FAILED: {r.get('file', 'Unknown')}: {r['error']}")
-        else:
-            successful += 1
-            total_bonds += r['n_bonds']
-            total_sentences += r['n_sentences']
-            print(f"OK: {r['title']} by {r['author']}: "
-                  f"{r['n_bonds']} bonds, {r['n_sentences']} sentences")
-
-    print()
-    print(f"Time: {end_time - start_time}")
-    print(f"Books processed: {successful}/{len(results)}")
-    print(f"Total bonds: {total_bonds:,}")
-    print(f"Total sentences: {total_sentences:,}")
+    print_report(report)
 
     # Neo4j stats
     stats = processor.neo4j.stats()
@@ -128,10 +115,12 @@ def process_single_file(filepath: Path, author: str = '', title: str = '') -> No
     print(f"  Time: {end_time - start_time}")
 
 
-def process_directory(directory: Path, limit: int = None) -> None:
+def process_directory(directory: Path, limit: int = None, workers: int = 1,
+                      n_process: int = 1, queue_size: int = 2, checkpoint: Path = None) -> None:
     """Process all .txt files in a directory."""
     print(f"Processing directory: {directory}")
     print(f"Limit: {limit if limit else 'None'}")
+    print(f"Workers: {workers} (spaCy processes per book: {n_process})")
     print()
 
     processor = BookProcessor()
@@ -145,31 +134,47 @@ def process_directory(directory: Path, limit: int = None) -> None:
     print("Connected!")
     print()
 
+    files = sorted(directory.glob('*.txt'))
+    if limit:
+        files = files[:limit]
+
     # Process
-    start_time = datetime.now()
-    results = processor.process_directory(directory, pattern='*.txt', limit=limit)
-    end_time = datetime.now()
+    ingestor = BookIngestor(processor, workers=workers, n_process=n_process,
+                            queue_size=queue_size, checkpoint_path=checkpoint)
+    report = ingestor.run([(filepath, None) for filepath in files])
 
     # Summary
+    print_report(report)
+
+
+def print_report(report: dict) -> None:
+    """Print an ingestion summary with throughput."""
     print()
     print("=" * 60)
     print("PROCESSING COMPLETE")
     print("=" * 60)
+    print()
 
-    total_bonds = 0
-    successful = 0
-    failed = 0
-
-    for r in results:
+    total_sentences = 0
+    for r in report['results']:
         if 'error' in r:
-            failed += 1
+            print(f"FAILED: {r.get('file', 'Unknown')}: {r['error']}")
+        elif r.get('skipped'):
+            print(f"SKIPPED: {r['file']} (already loaded)")
         else:
-            successful += 1
-            total_bonds += r.get('n_bonds', 0)
+            total_sentences += r['n_sentences']
+            print(f"OK: {r['title']} by {r['author']}: "
+                  f"{r['n_bonds']} bonds, {r['n_sentences']} sentences")
 
-    print(f"Time: {end_time - start_time}")
-    print(f"Books: {successful} successful, {failed} failed")
-    print(f"Total bonds: {total_bonds:,}")
+    print()
+    print(f"Time: {report['elapsed_seconds']:.1f}s "
+          f"(parse {report['parse_seconds']:.1f}s, load {report['load_seconds']:.1f}s)")
+    print(f"Books: {report['books_loaded']} loaded, {report['books_skipped']} skipped, "
+          f"{report['books_failed']} failed")
+    print(f"Total bonds: {report['bonds']:,}")
+    print(f"Total sentences: {total_sentences:,}")
+    print(f"Throughput: {report['bonds_per_second']:,.0f} bonds/s overall, "
+          f"{report['load_bonds_per_second']:,.0f} bonds/s into Neo4j")
 
 
 def test_parser(filepath: Path) -> None:
@@ -243,6 +248,16 @@ def main():
     parser.add_argument('--title', '-t', type=str, default='',
                         help='Book title (for --file)')
 
+    # Parallel ingestion (--priority, --all)
+    parser.add_argument('--workers', '-w', type=int, default=1,
+                        help='Books parsed concurrently, one process each')
+    parser.add_argument('--n-process', type=int, default=1,
+                        help='spaCy processes per book (chapters sharded across them)')
+    parser.add_argument('--queue-size', type=int, default=2,
+                        help='Parsed books buffered ahead of the Neo4j writer')
+    parser.add_argument('--checkpoint', '-c', type=Path,
+                        help='Checkpoint file; rerun to resume an interrupted ingestion')
+
     args = parser.parse_args()
 
     # Validate
@@ -256,11 +271,13 @@ def main():
 
     # Process
     if args.priority:
-        process_priority_books(args.gutenberg_dir)
+        process_priority_books(args.gutenberg_dir, args.workers, args.n_process,
+                               args.queue_size, args.checkpoint)
     elif args.file:
         process_single_file(args.file, args.author, args.title)
     elif args.all:
-        process_directory(args.gutenberg_dir, args.limit)
+        process_directory(args.gutenberg_dir, args.limit, args.workers, args.n_process,
+                          args.queue_size, args.checkpoint)
     elif args.test:
         if not args.test.exists():
             print(f"ERROR: File not found: {args.test}")
@@ -114,55 +114,15 @@ class TherapyCLI:
         else:
             print("Warning: User tracking unavailable (Neo4j not connected)")
 
-        # Initialize LLM client
-        if self.model.startswith("groq:"):
-            from groq import Groq
-            self._llm_client = ("groq", Groq(), self.model.split(":", 1)[1])
-        elif self.model.startswith("claude"):
-            import anthropic
-            self._llm_client = ("claude", anthropic.Anthropic(), "claude-sonnet-4-20250514")
-        else:
-            self._llm_client = ("ollama", None, self.model)
+        # Shared LLM client (same pool as the DreamEngine)
+        self._llm_client = self._engine.llm
 
         return True
 
     def _call_llm(self, system: str, user: str, max_tokens: int = 400) -> str:
         """Call LLM for responses."""
-        client_type, client, model_name = self._llm_client
-
-        if client_type == "groq":
-            response = client.chat.completions.create(
-                model=model_name,
-                max_tokens=max_tokens,
-                temperature=0.7,
-                messages=[
-                    {"role": "system", "content": system},
-                    {"role": "user", "content": user}
-                ]
-            )
-            return response.choices[0].message.content.strip()
-
-        elif client_type == "claude":
-            response = client.messages.create(
-                model=model_name,
-                max_tokens=max_tokens,
-                system=system,
-                messages=[{"role": "user", "content": user}]
-            )
-            return response.content[0].text.strip()
-
-        else:  # Ollama
-            import requests
-            response = requests.post(
-                "http://localhost:11434/api/generate",
-                json={
-                    "model": model_name,
-                    "prompt": f"{system}\n\nUser: {user}",
-                    "stream": False,
-                },
-                timeout=60,
-            )
-            return response.json().get("response", "")
+        return self._llm_client.generate(system, user, max_tokens=max_tokens,
+                                         temperature=0.7).strip()
 
     def _analyze_input(self, user_input: str) -> Dict[str, Any]:
         """Analyze user input to understand intent and content."""
@@ -13,8 +13,8 @@ from pathlib import Path
 # Add parent to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-import anthropic
 from storm_logos.applications.therapist import Therapist
+from storm_logos.llm import get_llm
 
 
 # Load API keys from env file if not set
@@ -49,7 +49,7 @@ def load_api_key():
 
 def create_patient_client(api_key: str):
     """Create Claude client for patient role."""
-    return anthropic.Anthropic(api_key=api_key)
+    return get_llm('claude', api_key=api_key)
 
 
 def patient_respond(client, therapist_message: str, history: list) -> str:
@@ -79,14 +79,9 @@ Keep responses 1-3 sentences."""
         messages.append({"role": turn["role"], "content": turn["content"]})
     messages.append({"role": "user", "content": f"Therapist: {therapist_message}\n\nRespond as the patient:"})
 
-    response = client.messages.create(
-        model="claude-sonnet-4-20250514",
-        max_tokens=150,
-        system=system,
-        messages=messages,
-    )
+    completion = client.complete_sync(system, messages=messages, max_tokens=150)
 
-    return response.content[0].text.strip()
+    return completion.text.strip()
 
 
 def run_therapy_session(n_turns: int = 10, model: str = 'claude'):
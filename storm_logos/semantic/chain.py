@@ -16,7 +16,7 @@ import numpy as np
 
 from ..data.models import Bond, SemanticState
 from ..config import get_config, ChainConfig
-from .physics import coherence
+from .physics import coherence, coherence_matrix, bonds_to_array
 
 
 class ChainReaction:
@@ -60,30 +60,53 @@ class ChainReaction:
         if len(candidates) == 1:
             return candidates[0]
 
-        decay = decay or self.config.decay
-        threshold = threshold or self.config.threshold
+        index = self.select_index(
+            bonds_to_array(candidates), bonds_to_array(history),
+            decay=decay, threshold=threshold,
+        )
+        return candidates[index]
+
+    def select_index(self, coords: np.ndarray,
+                     history: np.ndarray,
+                     decay: Optional[float] = None,
+                     threshold: Optional[float] = None) -> int:
+        """Array version of select().
+
+        Args:
+            coords: (N, 3) candidate coordinates
+            history: (H, 3) history coordinates (most recent last)
+            decay: Resonance decay factor
+            threshold: Lasing threshold
+
+        Returns:
+            Index of the winning candidate
+        """
+        if len(coords) == 0:
+            raise ValueError("No candidates to select from")
+        if len(coords) == 1:
+            return 0
 
         # Score all candidates
-        scored = []
-        for bond in candidates:
-            power = self._score(bond, history, decay)
-            lased = self._lasing(power, threshold)
-            scored.append((bond, lased))
+        return self.sample_index(self.score_array(coords, history, decay), threshold)
+
+    def sample_index(self, power: np.ndarray,
+                     threshold: Optional[float] = None) -> int:
+        """Apply lasing to resonance powers and sample a winner index."""
+        n = len(power)
+        if n == 0:
+            raise ValueError("No candidates to select from")
+
+        lased = self.lasing_array(power, threshold)
 
         # Weighted random selection
-        total = sum(s for _, s in scored)
+        cumsum = np.cumsum(lased)
+        total = cumsum[-1]
         if total <= 0:
-            return random.choice(candidates)
+            return random.randrange(n)
 
-        # Sample
+        # Sample: first candidate whose cumulative weight reaches r
         r = random.random() * total
-        cumsum = 0
-        for bond, score in scored:
-            cumsum += score
-            if cumsum >= r:
-                return bond
-
-        return scored[-1][0]  # Fallback
+        return min(int(np.searchsorted(cumsum, r, side='left')), n - 1)
 
     def select_deterministic(self, candidates: List[Bond],
                              history: List[Bond]) -> Bond:
@@ -94,9 +117,9 @@ class ChainReaction:
         if len(candidates) == 1:
             return candidates[0]
 
-        # Score and return max
-        scored = [(bond, self._score(bond, history)) for bond in candidates]
-        return max(scored, key=lambda x: x[1])[0]
+        # Score and return max (first on ties)
+        scores = self.score_array(bonds_to_array(candidates), bonds_to_array(history))
+        return candidates[int(np.argmax(scores))]
 
     # ========================================================================
     # SCORING
@@ -118,22 +141,41 @@ class ChainReaction:
         Returns:
             Resonance power
         """
-        decay = decay or self.config.decay
-
         if not history:
             return 1.0
 
-        power = 0.0
-        for i, prev in enumerate(reversed(history)):
-            # State from previous bond
-            state = SemanticState(A=prev.A, S=prev.S, tau=prev.tau)
-            coh = coherence(state, candidate)
+        return float(self.score_array(
+            bonds_to_array([candidate]), bonds_to_array(history), decay
+        )[0])
+
+    def score_array(self, coords: np.ndarray, history: np.ndarray,
+                    decay: Optional[float] = None) -> np.ndarray:
+        """Resonance power for N candidates against H history bonds.
+
+        Vectorized _score: one (H, N) coherence matrix, weighted by
+        decay^i with i = 0 for the most recent history entry.
+
+        Args:
+            coords: (N, 3) candidate coordinates
+            history: (H, 3) history coordinates (most recent last)
+            decay: Decay factor
+
+        Returns:
+            (N,) resonance power
+        """
+        decay = decay or self.config.decay
+        n = len(coords)
+
+        if len(history) == 0:
+            return np.ones(n)
 
-            # Positive coherence only contributes
-            if coh > 0:
-                power += coh * (decay ** i)
+        # Row i of the matrix is the i-th most recent history bond
+        coh = coherence_matrix(np.asarray(history)[::-1], coords)
+        weights = decay ** np.arange(len(history), dtype=np.float64)
 
-        return max(power, 0.01)  # Minimum score
+        # Positive coherence only contributes
+        power = weights @ np.maximum(coh, 0.0)
+        return np.maximum(power, 0.01)  # Minimum score
 
     def _lasing(self, power: float, threshold: Optional[float] = None) -> float:
         """Apply lasing: exponential amplification above threshold.
@@ -152,6 +194,13 @@ class ChainReaction:
         else:
             return power
 
+    def lasing_array(self, power: np.ndarray,
+                     threshold: Optional[float] = None) -> np.ndarray:
+        """Vectorized _lasing."""
+        threshold = threshold or self.config.threshold
+        excess = power - threshold
+        return np.where(power > threshold, threshold + excess ** 2, power)
+
     # ========================================================================
     # BATCH OPERATIONS
     # ========================================================================
@@ -163,9 +212,11 @@ class ChainReaction:
         Returns:
             List of (bond, score) tuples sorted by score descending
         """
-        scored = [(bond, self._score(bond, history)) for bond in candidates]
-        scored.sort(key=lambda x: x[1], reverse=True)
-        return scored
+        if not candidates:
+            return []
+        scores = self.score_array(bonds_to_array(candidates), bonds_to_array(history))
+        order = np.argsort(-scores, kind='stable')
+        return [(candidates[i], float(scores[i])) for i in order]
 
     def top_k(self, candidates: List[Bond],
               history: List[Bond],
@@ -12,10 +12,11 @@ Principle: Tension > Purity
 
 from typing import List, Dict, Optional, Tuple
 import math
+import numpy as np
 
 from ..data.models import Bond, SemanticState
 from ..config import get_config, DialecticConfig, HealthTarget
-from .physics import coherence
+from .physics import coherence, coherence_matrix, bonds_to_array
 
 
 class Dialectic:
@@ -52,28 +53,62 @@ class Dialectic:
         Returns:
             Filtered candidates sorted by dialectical score
         """
+        if not candidates:
+            return []
+
+        order = self.filter_indices(
+            bonds_to_array(candidates), Q,
+            tension_weight=tension_weight,
+            coherence_threshold=coherence_threshold,
+        )
+        return [candidates[i] for i in order]
+
+    def filter_indices(self, coords: np.ndarray,
+                       Q: SemanticState,
+                       tension_weight: Optional[float] = None,
+                       coherence_threshold: Optional[float] = None) -> np.ndarray:
+        """Array version of filter().
+
+        Args:
+            coords: (N, 3) candidate coordinates (A, S, τ)
+            Q: Current state (thesis)
+            tension_weight: Weight for tension vs coherence
+            coherence_threshold: Minimum coherence to pass
+
+        Returns:
+            Indices of passing candidates, sorted by dialectical score
+        """
         tension_weight = tension_weight or self.config.tension_weight
         coherence_threshold = coherence_threshold or self.config.coherence_threshold
 
-        # Compute antithesis
-        antithesis = self._compute_antithesis(Q)
+        scores, coh = self.score_array(coords, Q, tension_weight)
+
+        # Apply coherence threshold, sort by score (higher = better, stable)
+        passing = np.flatnonzero(coh >= coherence_threshold)
+        return passing[np.argsort(-scores[passing], kind='stable')]
+
+    def score_array(self, coords: np.ndarray,
+                    Q: SemanticState,
+                    tension_weight: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Dialectical scores and thesis coherence for N candidates.
+
+        Vectorized _dialectical_score over an (N, 3) coordinate array.
 
-        # Score each candidate
-        scored = []
-        for bond in candidates:
-            score = self._dialectical_score(
-                bond, Q, antithesis, tension_weight
-            )
-            coh = coherence(Q, bond)
+        Returns:
+            (scores, coherence with thesis), each of shape (N,)
+        """
+        antithesis = self._compute_antithesis(Q)
+        poles = np.array([[Q.A, Q.S], [antithesis.A, antithesis.S]])
+        coh_thesis, coh_anti = coherence_matrix(poles, coords)
 
-            # Apply coherence threshold
-            if coh >= coherence_threshold:
-                scored.append((bond, score, coh))
+        score = coh_thesis * (1 - tension_weight) + coh_anti * tension_weight
 
-        # Sort by dialectical score (higher = better)
-        scored.sort(key=lambda x: x[1], reverse=True)
+        # Bonus for holding both poles (geometric mean)
+        both = (coh_thesis > 0) & (coh_anti > 0)
+        bonus = np.sqrt(np.where(both, coh_thesis * coh_anti, 0.0))
+        score = np.where(both, score * 0.7 + bonus * 0.3, score)
 
-        return [bond for bond, score, coh in scored]
+        return score, coh_thesis
 
     # ========================================================================
     # DIALECTICAL OPERATIONS
@@ -278,6 +278,39 @@ def coherence(state: SemanticState, bond: Bond) -> float:
     return np.dot(state_vec, bond_vec) / (state_mag * bond_mag)
 
 
+def bonds_to_array(bonds) -> np.ndarray:
+    """Stack bond coordinates into an (N, 3) array of (A, S, τ)."""
+    coords = np.fromiter(
+        (c for b in bonds for c in (b.A, b.S, b.tau)),
+        dtype=np.float64, count=3 * len(bonds),
+    )
+    return coords.reshape(-1, 3)
+
+
+def coherence_matrix(states: np.ndarray, coords: np.ndarray) -> np.ndarray:
+    """Batch coherence between H states and N bonds.
+
+    Same as coherence() for every pair: cosine similarity in the A-S
+    plane, 0 where either vector is shorter than 0.01.
+
+    Args:
+        states: (H, 2+) array, columns A, S[, τ]
+        coords: (N, 2+) array, columns A, S[, τ]
+
+    Returns:
+        (H, N) coherence matrix
+    """
+    states = np.atleast_2d(np.asarray(states, dtype=np.float64))[:, :2]
+    coords = np.atleast_2d(np.asarray(coords, dtype=np.float64))[:, :2]
+
+    state_mag = np.linalg.norm(states, axis=1)
+    bond_mag = np.linalg.norm(coords, axis=1)
+    valid = (state_mag >= 0.01)[:, None] & (bond_mag >= 0.01)[None, :]
+
+    denom = np.where(valid, state_mag[:, None] * bond_mag[None, :], 1.0)
+    return np.where(valid, (states @ coords.T) / denom, 0.0)
+
+
 def trajectory_coherence(bonds: list, window: int = 5) -> float:
     """Compute coherence of a trajectory.
 
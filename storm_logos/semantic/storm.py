@@ -11,11 +11,10 @@ then filter via Logos.
 
 from typing import List, Dict, Optional, Tuple
 import numpy as np
-from scipy.spatial import cKDTree
-import math
 
 from ..data.models import Bond, SemanticState
 from ..data.postgres import PostgresData, get_data
+from ..data.spatial import SpatialIndex
 from ..data.neo4j import Neo4jData, get_neo4j
 from ..config import get_config, StormConfig
 
@@ -39,25 +38,14 @@ class Storm:
         self.neo4j = neo4j or get_neo4j()
         self.config = config or get_config().storm
 
-        # Build spatial index
-        self._tree: Optional[cKDTree] = None
-        self._indexed_bonds: List[Bond] = []
-        self._build_spatial_index()
+    @property
+    def index(self) -> SpatialIndex:
+        """Shared spatial index owned by the data layer."""
+        return self.data.spatial_index
 
-    def _build_spatial_index(self):
-        """Build KD-tree for spatial queries."""
-        if not self.data.bonds:
-            return
-
-        coords = []
-        self._indexed_bonds = []
-
-        for bond in self.data.bonds:
-            coords.append([bond.A, bond.S, bond.tau])
-            self._indexed_bonds.append(bond)
-
-        if coords:
-            self._tree = cKDTree(np.array(coords))
+    def bonds_for(self, rows) -> List[Bond]:
+        """Materialize bond table rows (e.g. from explode_many) as bonds."""
+        return self.data.bonds.bonds(rows)
 
     # ========================================================================
     # MAIN INTERFACE
@@ -119,6 +107,75 @@ class Storm:
 
         return unique
 
+    def explode_many(self, states: List[SemanticState],
+                     radius: Optional[float] = None,
+                     max_candidates: Optional[int] = None) -> List[np.ndarray]:
+        """Explode candidates around many states at once.
+
+        Batched version of explode():
+            - FOLLOWS seeds from one k-NN query, followers from one Neo4j query
+            - SPATIAL and GRAVITY from one radius query over 2M points
+            - Dedupe and variety cap with array ops
+
+        FOLLOWS targets that are not in the loaded bond table are dropped,
+        since results are table rows.
+
+        Args:
+            states: Query states
+            radius: Search radius (uses config default if None)
+            max_candidates: Maximum candidates per state
+
+        Returns:
+            Per-state arrays of bond table rows (see bonds_for)
+        """
+        radius = radius or self.config.radius
+        max_candidates = max_candidates or self.config.max_candidates
+        weights = self.config.sources_weight
+
+        n = len(states)
+        if n == 0:
+            return []
+        points = np.array([(Q.A, Q.S, Q.tau) for Q in states], dtype=np.float64)
+        parts: List[List[np.ndarray]] = [[] for _ in range(n)]
+
+        # Source 1: FOLLOWS edges
+        if weights.get('follows', 0) > 0:
+            for i, rows in enumerate(self._get_follows_rows_many(points)):
+                parts[i].append(rows)
+
+        # Sources 2 + 3: spatial neighbors and gravity direction
+        queries = []
+        if weights.get('spatial', 0) > 0:
+            queries.append(points)
+        if weights.get('gravity', 0) > 0:
+            queries.append(self._gravity_targets(points))
+        if queries:
+            results = self.index.query_radius_many(np.vstack(queries), radius)
+            for q in range(len(queries)):
+                for i in range(n):
+                    parts[i].append(results[q * n + i])
+
+        return [self._merge_rows(p, max_candidates) for p in parts]
+
+    def _merge_rows(self, parts: List[np.ndarray], max_candidates: int) -> np.ndarray:
+        """Concatenate source rows, dedupe by (adj, noun), cap by variety."""
+        if not parts:
+            return np.empty(0, dtype=np.intp)
+        rows = np.concatenate(parts).astype(np.intp, copy=False)
+        if len(rows) == 0:
+            return rows
+
+        # Keep the first occurrence of each pair, in source order
+        table = self.data.bonds
+        _, first = np.unique(table.pair_keys(rows), return_index=True)
+        rows = rows[np.sort(first)]
+
+        # Limit to max candidates: top variety, stable on ties
+        if len(rows) > max_candidates:
+            order = np.argsort(-table.variety[rows], kind='stable')
+            rows = rows[order[:max_candidates]]
+        return rows
+
     # ========================================================================
     # SOURCE: FOLLOWS
     # ========================================================================
@@ -131,10 +188,6 @@ class Storm:
         candidates = []
 
         # Find current position's nearest bond
-        if not self._tree or not self._indexed_bonds:
-            return candidates
-
-        # Query Neo4j for followers
         # For now, we use spatial nearest as seed
         nearest = self._get_nearest_bond(Q)
         if nearest:
@@ -144,17 +197,32 @@ class Storm:
 
         return candidates
 
+    def _get_follows_rows_many(self, points: np.ndarray) -> List[np.ndarray]:
+        """FOLLOWS candidates for many positions, as bond table rows."""
+        empty = [np.empty(0, dtype=np.intp) for _ in range(len(points))]
+        _, nearest = self.index.query_knn_many(points, k=1)
+        if nearest.shape[1] == 0:
+            return empty
+
+        table = self.data.bonds
+        seeds = [table.bond(int(row)) for row in nearest[:, 0]]
+        seed_ids = [f"{b.adj}_{b.noun}" if b.adj else b.noun for b in seeds]
+        followers = self.neo4j.get_followers_many(sorted(set(seed_ids)))
+
+        # Map followers of each distinct seed to table rows once
+        seed_rows: Dict[str, np.ndarray] = {}
+        for bond_id, bonds in followers.items():
+            rows = [table.find(b.adj, b.noun) for b in bonds]
+            seed_rows[bond_id] = np.array([r for r in rows if r >= 0], dtype=np.intp)
+
+        return [seed_rows.get(bond_id, empty[0]) for bond_id in seed_ids]
+
     def _get_nearest_bond(self, Q: SemanticState) -> Optional[Bond]:
         """Get nearest bond to Q in coordinate space."""
-        if not self._tree:
+        _, indices = self.index.query_knn((Q.A, Q.S, Q.tau), k=1)
+        if len(indices) == 0:
             return None
-
-        query = np.array([Q.A, Q.S, Q.tau])
-        dist, idx = self._tree.query(query, k=1)
-
-        if idx < len(self._indexed_bonds):
-            return self._indexed_bonds[idx]
-        return None
+        return self.data.bonds.bond(int(indices[0]))
 
     # ========================================================================
     # SOURCE: SPATIAL
@@ -163,18 +231,8 @@ class Storm:
     def _get_spatial_candidates(self, Q: SemanticState,
                                 radius: float) -> List[Bond]:
         """Get candidates within radius in (A, S, τ) space."""
-        if not self._tree:
-            return []
-
-        query = np.array([Q.A, Q.S, Q.tau])
-        indices = self._tree.query_ball_point(query, radius)
-
-        candidates = []
-        for idx in indices:
-            if idx < len(self._indexed_bonds):
-                candidates.append(self._indexed_bonds[idx])
-
-        return candidates
+        indices = self.index.query_radius((Q.A, Q.S, Q.tau), radius)
+        return self.bonds_for(indices)
 
     # ========================================================================
     # SOURCE: GRAVITY
@@ -188,24 +246,17 @@ class Storm:
             - Lower τ (more concrete)
             - Higher A (more affirming)
         """
-        if not self._tree:
-            return []
+        target = self._gravity_targets(np.array([[Q.A, Q.S, Q.tau]]))[0]
+        indices = self.index.query_radius(target, radius)
+        return self.bonds_for(indices)
 
-        # Gravity target: shift Q toward concrete/good
+    @staticmethod
+    def _gravity_targets(points: np.ndarray) -> np.ndarray:
+        """Shift (M, 3) positions toward concrete/good."""
         from ..config import LAMBDA, MU
 
-        target_A = Q.A + MU * 0.3  # Move toward +A
-        target_tau = Q.tau - LAMBDA * 0.3  # Move toward lower τ
-
-        target = np.array([target_A, Q.S, target_tau])
-        indices = self._tree.query_ball_point(target, radius)
-
-        candidates = []
-        for idx in indices:
-            if idx < len(self._indexed_bonds):
-                candidates.append(self._indexed_bonds[idx])
-
-        return candidates
+        # Move toward +A and lower τ
+        return points + np.array([MU * 0.3, 0.0, -LAMBDA * 0.3])
 
     # ========================================================================
     # UTILITY
@@ -214,24 +265,13 @@ class Storm:
     def get_candidates_by_coords(self, A: float, S: float, tau: float,
                                  radius: float = 0.5) -> List[Bond]:
         """Get candidates around specific coordinates."""
-        if not self._tree:
-            return []
-
-        query = np.array([A, S, tau])
-        indices = self._tree.query_ball_point(query, radius)
-
-        candidates = []
-        for idx in indices:
-            if idx < len(self._indexed_bonds):
-                candidates.append(self._indexed_bonds[idx])
-
-        return candidates
+        return self.data.get_neighbors(A, S, tau, radius)
 
     def stats(self) -> Dict:
         """Return storm statistics."""
         return {
-            'n_indexed_bonds': len(self._indexed_bonds),
-            'tree_size': self._tree.n if self._tree else 0,
+            'n_indexed_bonds': self.data.n_bonds,
+            'tree_size': self.index.n,
             'config': {
                 'radius': self.config.radius,
                 'max_candidates': self.config.max_candidates,
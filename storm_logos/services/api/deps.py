@@ -1,8 +1,10 @@
 """API Dependencies: Shared state and authentication."""
 
+import asyncio
 import os
 import jwt
 import secrets
+import weakref
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 from fastapi import Depends, HTTPException, status
@@ -132,9 +134,13 @@ def get_superuser(
 
 _user_graph = None
 _dream_engine = None
-_therapist = None
+_therapist_pool = None
 _data = None
 
+# Therapist pool bounds (per-session state, LRU + idle TTL)
+THERAPIST_POOL_SIZE = int(os.environ.get("THERAPIST_POOL_SIZE", "1000"))
+THERAPIST_POOL_TTL_SECONDS = float(os.environ.get("THERAPIST_POOL_TTL_SECONDS", "3600"))
+
 
 def get_user_graph():
     """Get UserGraph singleton."""
@@ -157,8 +163,28 @@ def get_dream_engine():
     return _dream_engine
 
 
-def get_therapist():
-    """Get Therapist singleton with full theory implementation.
+def get_therapist_pool():
+    """Get TherapistPool singleton.
+
+    A template Therapist builds the heavy, read-only components once
+    (MetricsEngine, Dialectic, coordinate tables); each session then gets
+    a lightweight fork with its own trajectory and PI controller state.
+    """
+    global _therapist_pool
+    if _therapist_pool is None:
+        model = os.environ.get("LLM_MODEL", "groq:llama-3.3-70b-versatile")
+        from storm_logos.applications import Therapist, TherapistPool
+        template = Therapist(model=model)
+        _therapist_pool = TherapistPool(
+            factory=template.fork,
+            max_size=THERAPIST_POOL_SIZE,
+            ttl_seconds=THERAPIST_POOL_TTL_SECONDS,
+        )
+    return _therapist_pool
+
+
+def get_therapist(session_id: str):
+    """Get the Therapist for a session with full theory implementation.
 
     Uses the complete Storm-Logos pipeline:
     - MetricsEngine for semantic analysis
@@ -167,12 +193,27 @@ def get_therapist():
     - Dialectic for thesis-antithesis filtering
     - RC-circuit dynamics for state evolution
     """
-    global _therapist
-    if _therapist is None:
-        model = os.environ.get("LLM_MODEL", "groq:llama-3.3-70b-versatile")
-        from storm_logos.applications import Therapist
-        _therapist = Therapist(model=model)
-    return _therapist
+    return get_therapist_pool().get(session_id)
+
+
+def peek_therapist(session_id: str):
+    """Get a session's Therapist if the pool still holds it (never creates one)."""
+    if _therapist_pool is None:
+        return None
+    return _therapist_pool.peek(session_id)
+
+
+def release_therapist(session_id: str):
+    """Drop a session's Therapist state from the pool."""
+    if _therapist_pool is not None:
+        _therapist_pool.release(session_id)
+
+
+def get_therapist_pool_stats() -> Optional[Dict[str, Any]]:
+    """Get therapist pool statistics (None if the pool is not built yet)."""
+    if _therapist_pool is None:
+        return None
+    return _therapist_pool.stats()
 
 
 def get_semantic_data():
@@ -191,12 +232,25 @@ def get_semantic_data():
 # Active sessions: {session_id: SessionState}
 _active_sessions: Dict[str, Any] = {}
 
+# Per-session locks: handlers await the executor mid-turn, so two
+# messages for one session must not interleave
+_session_locks: 'weakref.WeakValueDictionary[str, asyncio.Lock]' = weakref.WeakValueDictionary()
+
 
 def get_session(session_id: str) -> Optional[Any]:
     """Get active session by ID."""
     return _active_sessions.get(session_id)
 
 
+def get_session_lock(session_id: str) -> asyncio.Lock:
+    """Get the lock serializing turns of a session."""
+    lock = _session_locks.get(session_id)
+    if lock is None:
+        lock = asyncio.Lock()
+        _session_locks[session_id] = lock
+    return lock
+
+
 def store_session(session_id: str, session_state: Any):
     """Store active session."""
     _active_sessions[session_id] = session_state
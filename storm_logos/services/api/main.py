@@ -7,6 +7,7 @@ Or in Docker:
     docker-compose up api
 """
 
+import asyncio
 import logging
 import os
 import sys
@@ -35,9 +36,15 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 from storm_logos.data.neo4j import get_neo4j
 from storm_logos.data.book_parser import BookParser
 from storm_logos.data.postgres import get_data
+from storm_logos.data.cache import get_cache
 from storm_logos.data.models import Bond
+from storm_logos.orchestration.executor import StageOverloaded, get_executor
+from storm_logos.llm import get_response_cache, get_usage
 
-from .deps import load_env, get_user_graph, get_dream_engine, get_semantic_data, get_superuser, get_current_user
+from .deps import (
+    load_env, get_user_graph, get_dream_engine, get_semantic_data, get_superuser, get_current_user,
+    get_therapist_pool_stats,
+)
 from .routers import auth_router, sessions_router, evolution_router
 
 # Load environment
@@ -151,6 +158,10 @@ async def lifespan(app: FastAPI):
 
     # Cleanup
     logger.info("Shutting down...")
+    # Let running engine/data stage work finish before the pool closes;
+    # wait off the event loop so in-flight requests can still complete
+    await asyncio.to_thread(get_executor().shutdown, wait=True)
+    data.close()
 
 
 app = FastAPI(
@@ -215,6 +226,16 @@ async def rate_limit_middleware(request: Request, call_next):
     response = await call_next(request)
     return response
 
+@app.exception_handler(StageOverloaded)
+async def stage_overloaded_handler(request: Request, exc: StageOverloaded):
+    """Shed load when an executor stage queue is full."""
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": f"Server busy ({exc.stage}). Please try again shortly."},
+        headers={"Retry-After": "5"},
+    )
+
+
 # Include routers
 app.include_router(auth_router)
 app.include_router(sessions_router)
@@ -353,6 +374,26 @@ async def metrics():
     metrics_data.append(f"# TYPE storm_logos_requests_last_minute gauge")
     metrics_data.append(f"storm_logos_requests_last_minute {total_requests}")
 
+    # Therapist pool (per-session state)
+    pool_stats = get_therapist_pool_stats() or {}
+    metrics_data.append(f"# HELP storm_logos_therapist_pool_size Therapist sessions held in memory")
+    metrics_data.append(f"# TYPE storm_logos_therapist_pool_size gauge")
+    metrics_data.append(f"storm_logos_therapist_pool_size {pool_stats.get('size', 0)}")
+
+    metrics_data.append(f"# HELP storm_logos_therapist_pool_max_size Therapist pool capacity")
+    metrics_data.append(f"# TYPE storm_logos_therapist_pool_max_size gauge")
+    metrics_data.append(f"storm_logos_therapist_pool_max_size {pool_stats.get('max_size', 0)}")
+
+    for name, help_text in (
+        ("hits", "Therapist lookups served from the pool"),
+        ("misses", "Therapist lookups that forked a new session"),
+        ("evictions", "Therapist sessions evicted by the size cap"),
+        ("expirations", "Therapist sessions dropped after idle TTL"),
+    ):
+        metrics_data.append(f"# HELP storm_logos_therapist_pool_{name}_total {help_text}")
+        metrics_data.append(f"# TYPE storm_logos_therapist_pool_{name}_total counter")
+        metrics_data.append(f"storm_logos_therapist_pool_{name}_total {pool_stats.get(name, 0)}")
+
     # Service info
     metrics_data.append(f"# HELP storm_logos_info Service information")
     metrics_data.append(f"# TYPE storm_logos_info gauge")
@@ -375,6 +416,120 @@ async def metrics():
     metrics_data.append(f"# TYPE storm_logos_postgres_up gauge")
     metrics_data.append(f"storm_logos_postgres_up {postgres_up}")
 
+    # PostgreSQL connection pool
+    try:
+        pg_pool = get_semantic_data().pool_stats()
+    except Exception:
+        pg_pool = {}
+
+    metrics_data.append(f"# HELP storm_logos_postgres_pool_in_use Pooled connections checked out")
+    metrics_data.append(f"# TYPE storm_logos_postgres_pool_in_use gauge")
+    metrics_data.append(f"storm_logos_postgres_pool_in_use {pg_pool.get('in_use', 0)}")
+
+    metrics_data.append(f"# HELP storm_logos_postgres_pool_max_size Connection pool capacity")
+    metrics_data.append(f"# TYPE storm_logos_postgres_pool_max_size gauge")
+    metrics_data.append(f"storm_logos_postgres_pool_max_size {pg_pool.get('max_size', 0)}")
+
+    for name, help_text in (
+        ("checkouts", "Connections checked out of the pool"),
+        ("timeouts", "Checkouts that timed out waiting for a connection"),
+        ("discarded", "Broken or stale connections discarded"),
+    ):
+        metrics_data.append(f"# HELP storm_logos_postgres_pool_{name}_total {help_text}")
+        metrics_data.append(f"# TYPE storm_logos_postgres_pool_{name}_total counter")
+        metrics_data.append(f"storm_logos_postgres_pool_{name}_total {pg_pool.get(name, 0)}")
+
+    metrics_data.append(f"# HELP storm_logos_postgres_pool_wait_seconds_total Time spent waiting for a connection")
+    metrics_data.append(f"# TYPE storm_logos_postgres_pool_wait_seconds_total counter")
+    metrics_data.append(f"storm_logos_postgres_pool_wait_seconds_total {pg_pool.get('wait_seconds_total', 0.0):.6f}")
+
+    metrics_data.append(f"# HELP storm_logos_postgres_pool_wait_seconds_max Longest wait for a connection")
+    metrics_data.append(f"# TYPE storm_logos_postgres_pool_wait_seconds_max gauge")
+    metrics_data.append(f"storm_logos_postgres_pool_wait_seconds_max {pg_pool.get('wait_seconds_max', 0.0):.6f}")
+
+    # Coordinate cache (local LRU + shared Redis tier)
+    try:
+        cache_stats = get_cache().stats()
+    except Exception:
+        cache_stats = {}
+
+    metrics_data.append(f"# HELP storm_logos_coord_cache_size Entries in the local cache tier")
+    metrics_data.append(f"# TYPE storm_logos_coord_cache_size gauge")
+    metrics_data.append(f"storm_logos_coord_cache_size {cache_stats.get('size', 0)}")
+
+    metrics_data.append(f"# HELP storm_logos_coord_cache_hit_rate Coordinate cache hit rate")
+    metrics_data.append(f"# TYPE storm_logos_coord_cache_hit_rate gauge")
+    metrics_data.append(f"storm_logos_coord_cache_hit_rate {cache_stats.get('hit_rate', 0.0):.4f}")
+
+    for name, help_text in (
+        ("hits", "Coordinate cache hits (both tiers)"),
+        ("misses", "Coordinate cache misses"),
+        ("local_hits", "Hits served from the local tier"),
+        ("shared_hits", "Hits served from the shared tier"),
+        ("negative_hits", "Hits on cached misses"),
+        ("invalidations", "Entries invalidated by writes"),
+        ("evictions", "Local tier LRU evictions"),
+        ("shared_errors", "Shared tier errors"),
+    ):
+        metrics_data.append(f"# HELP storm_logos_coord_cache_{name}_total {help_text}")
+        metrics_data.append(f"# TYPE storm_logos_coord_cache_{name}_total counter")
+        metrics_data.append(f"storm_logos_coord_cache_{name}_total {cache_stats.get(name, 0)}")
+
+    # Executor stages (blocking work offloaded from handlers)
+    stage_stats = get_executor().stats()
+    for name, metric_type, help_text in (
+        ("queued", "gauge", "Calls waiting for a stage slot"),
+        ("running", "gauge", "Calls running in a stage"),
+        ("max_queued", "gauge", "Deepest stage queue seen"),
+        ("completed", "counter", "Stage calls completed"),
+        ("failed", "counter", "Stage calls that raised"),
+        ("rejected", "counter", "Stage calls rejected with a full queue"),
+        ("wait_seconds_total", "counter", "Time spent queued for a stage slot"),
+        ("run_seconds_total", "counter", "Time spent running in a stage"),
+    ):
+        metric = f"storm_logos_stage_{name}"
+        if metric_type == "counter" and not metric.endswith("_total"):
+            metric += "_total"
+        metrics_data.append(f"# HELP {metric} {help_text}")
+        metrics_data.append(f"# TYPE {metric} {metric_type}")
+        for stage, values in stage_stats.items():
+            metrics_data.append(f'{metric}{{stage="{stage}",kind="{values["kind"]}"}} {values[name]}')
+
+    # LLM calls and token usage (per provider:model)
+    llm_usage = get_usage().stats()
+    llm_usage.pop("total", None)
+    for name, help_text in (
+        ("calls", "LLM calls completed"),
+        ("errors", "LLM attempts that failed"),
+        ("retries", "LLM attempts retried after a transient error"),
+        ("timeouts", "LLM calls that hit their deadline"),
+        ("hedges", "Extra LLM candidates started after the latency percentile"),
+        ("input_tokens", "LLM prompt tokens"),
+        ("output_tokens", "LLM completion tokens"),
+        ("latency_seconds", "LLM call latency including retries"),
+    ):
+        metric = f"storm_logos_llm_{name}_total"
+        metrics_data.append(f"# HELP {metric} {help_text}")
+        metrics_data.append(f"# TYPE {metric} counter")
+        for spec, values in llm_usage.items():
+            provider, model = spec.split(":", 1)
+            metrics_data.append(f'{metric}{{provider="{provider}",model="{model}"}} {values[name]}')
+
+    # LLM response cache
+    llm_cache_stats = get_response_cache().stats()
+    metrics_data.append("# HELP storm_logos_llm_cache_size LLM responses held in the local tier")
+    metrics_data.append("# TYPE storm_logos_llm_cache_size gauge")
+    metrics_data.append(f"storm_logos_llm_cache_size {llm_cache_stats['size']}")
+    for name, help_text in (
+        ("hits", "LLM response cache hits"),
+        ("misses", "LLM response cache misses"),
+        ("shared_hits", "LLM response cache hits served by Redis"),
+        ("evictions", "LLM responses evicted from the local tier"),
+    ):
+        metrics_data.append(f"# HELP storm_logos_llm_cache_{name}_total {help_text}")
+        metrics_data.append(f"# TYPE storm_logos_llm_cache_{name}_total counter")
+        metrics_data.append(f"storm_logos_llm_cache_{name}_total {llm_cache_stats[name]}")
+
     metrics_data.append(f"# HELP storm_logos_neo4j_up Neo4j connectivity")
     metrics_data.append(f"# TYPE storm_logos_neo4j_up gauge")
     metrics_data.append(f"storm_logos_neo4j_up {neo4j_up}")
@@ -168,6 +168,7 @@ class SessionHistory(BaseModel):
 
 class DreamAnalysisRequest(BaseModel):
     dream_text: str
+    use_cache: bool = True  # False = always ask the LLM for a fresh interpretation
 
 
 # Note: The canonical DreamSymbol dataclass is in storm_logos.data.models
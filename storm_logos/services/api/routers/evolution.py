@@ -7,6 +7,8 @@ from ..models import (
     UserProfile, ArchetypeEvolution, SessionHistory,
     DreamAnalysisRequest, DreamAnalysisResponse, DreamSymbolResponse, ArchetypeManifestationResponse
 )
+from storm_logos.orchestration.executor import get_executor
+
 from ..deps import get_current_user, get_optional_user, get_user_graph, get_dream_engine
 from ..rate_limiter import get_rate_limiter
 
@@ -139,8 +141,8 @@ async def analyze_dream(
 
     engine = get_dream_engine()
 
-    # Get full analysis
-    analysis = engine.analyze(data.dream_text)
+    # Get full analysis (spaCy + LLM + corpus lookups, off the event loop)
+    analysis = await get_executor().run('engine', engine.analyze, data.dream_text, data.use_cache)
 
     # Convert symbols
     symbols = [
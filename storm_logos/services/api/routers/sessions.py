@@ -5,14 +5,20 @@ Now uses the full Storm-Logos theoretical framework:
 - RC-circuit dynamics for state evolution
 - Dialectic analysis for thesis-antithesis filtering
 - DreamEngine for symbol extraction in dream mode
+
+Messages can be sent with POST /{id}/message (full response) or
+POST /{id}/message/stream (server-sent events: `token` events as the LLM
+produces text, then a trailing `done` event with state and metrics).
 """
 
 import json
 import logging
+import time
 from datetime import datetime
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, AsyncIterator, Tuple
 from dataclasses import dataclass, field
 from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi.responses import StreamingResponse
 
 from storm_logos.data.user_graph import SessionRecord, ArchetypeManifestation as AM
 
@@ -20,10 +26,13 @@ from ..models import (
     SessionStart, SessionMessage, SessionResponse, SessionEnd,
     SessionMode
 )
+from storm_logos.orchestration.executor import StageOverloaded, get_executor
+from storm_logos.llm import LLMError
+
 from ..deps import (
     get_current_user, get_optional_user, get_dream_engine, get_user_graph,
     get_session, store_session, remove_session, get_user_active_session,
-    get_therapist
+    get_therapist, peek_therapist, release_therapist, get_session_lock
 )
 
 logger = logging.getLogger(__name__)
@@ -121,13 +130,18 @@ def _generate_therapy_response(therapist, patient_text: str, state: SessionState
     """
     # Generate response using the full pipeline
     response = therapist.respond(patient_text)
+    return _therapy_result(therapist, response)
 
+
+def _therapy_result(therapist, response: str, dial: Optional[Dict] = None) -> Dict[str, Any]:
+    """Collect state, dialectic and metrics of the therapist's last turn."""
     # Get the latest state from therapist's trajectory
     trajectory = therapist.get_trajectory()
     current_state = trajectory.current
 
     # Get dialectic analysis
-    dial = therapist.dialectic.analyze(current_state) if current_state else {}
+    if dial is None:
+        dial = therapist.dialectic.analyze(current_state) if current_state else {}
 
     # Extract metrics from the therapist's last analysis
     metrics_data = {}
@@ -149,6 +163,12 @@ def _generate_dream_response(engine, text: str, state: SessionState, analysis: D
     Uses DreamEngine for symbol extraction but still maintains
     therapeutic frame through context-aware prompting.
     """
+    system, prompt = _dream_prompt(text, state)
+    return engine._call_llm(system, prompt, max_tokens=300, use_cache=False)
+
+
+def _dream_prompt(text: str, state: SessionState) -> Tuple[str, str]:
+    """Build (system, prompt) for a dream exploration turn."""
     # Build context with dream and symbols
     dream_context = ""
     if state.dream_text:
@@ -190,7 +210,7 @@ Your approach:
 
 Respond with depth psychological insight. Focus on one aspect at a time."""
 
-    return engine._call_llm(system, prompt, max_tokens=300)
+    return system, prompt
 
 
 def _extract_archetypes(engine, state: SessionState) -> List[Dict[str, Any]]:
@@ -252,9 +272,8 @@ async def start_session(
 
     mode = data.mode.value if data and data.mode else "hybrid"
 
-    # Reset therapist state for new session
-    therapist = get_therapist()
-    therapist.reset()
+    # Fresh therapist state for new session (forked on first message)
+    release_therapist(session_id)
 
     state = SessionState(
         session_id=session_id,
@@ -294,6 +313,9 @@ async def send_message(
     Uses the full Storm-Logos theoretical framework:
     - Therapy mode: Uses Therapist with MetricsEngine + Dialectic + RC-dynamics
     - Dream mode: Uses DreamEngine for symbol extraction + therapeutic framing
+
+    Blocking stages (LLM calls, Therapist/DreamEngine pipelines) run on
+    the executor; turns of one session are serialized.
     """
     state = get_session(session_id)
     if not state:
@@ -316,6 +338,47 @@ async def send_message(
                 detail="This is not your session"
             )
 
+    async with get_session_lock(session_id):
+        return await _process_message(session_id, state, data, current_user)
+
+
+async def _process_message(
+    session_id: str,
+    state: SessionState,
+    data: SessionMessage,
+    current_user: Optional[Dict[str, Any]],
+) -> SessionResponse:
+    """Run one session turn (caller holds the session lock)."""
+    executor = get_executor()
+    user_input, analysis = await _analyze_turn(state, data)
+
+    # Check for goodbye
+    if analysis.get("type") == "goodbye":
+        return await end_session(session_id, current_user)
+
+    await _absorb_analysis(state, user_input, analysis)
+
+    # Generate response based on mode
+    dialectic_info = {}
+
+    if _is_therapy_turn(state, analysis):
+        # Use full Therapist pipeline with theory
+        therapist = get_therapist(session_id)
+        result = await executor.run('engine', _generate_therapy_response, therapist, user_input, state)
+        response_text = result["response"]
+        dialectic_info = _apply_therapy_result(state, result)
+
+    else:
+        # Dream mode - use DreamEngine with therapeutic framing
+        response_text = await executor.run(
+            'llm', _generate_dream_response, get_dream_engine(), user_input, state, analysis)
+        _update_dream_position(state)
+
+    return _complete_turn(session_id, state, user_input, response_text, dialectic_info)
+
+
+async def _analyze_turn(state: SessionState, data: SessionMessage) -> Tuple[str, Dict[str, Any]]:
+    """Apply the requested mode and classify the input."""
     user_input = data.message.strip()
 
     # Get mode from request if provided, otherwise use session mode
@@ -323,17 +386,14 @@ async def send_message(
     if requested_mode and requested_mode != "auto":
         state.mode = requested_mode
 
-    # Get engines
-    dream_engine = get_dream_engine()
-    therapist = get_therapist()
-
     # Analyze input for mode detection
-    analysis = _analyze_input_mode(dream_engine, user_input, state.mode)
+    analysis = await get_executor().run(
+        'llm', _analyze_input_mode, get_dream_engine(), user_input, state.mode)
+    return user_input, analysis
 
-    # Check for goodbye
-    if analysis.get("type") == "goodbye":
-        return await end_session(session_id, current_user)
 
+async def _absorb_analysis(state: SessionState, user_input: str, analysis: Dict[str, Any]):
+    """Update mode, symbols, emotions and themes from the input analysis."""
     # Update mode if hybrid and we can determine it
     if state.mode == "hybrid":
         if analysis.get("contains_dream") or analysis.get("mode_hint") == "dream":
@@ -345,7 +405,8 @@ async def send_message(
     if analysis.get("contains_dream") or analysis.get("type") == "dream_content":
         if not state.dream_text:
             state.dream_text = user_input
-        new_symbols = dream_engine.extract_symbols(user_input)
+        new_symbols = await get_executor().run(
+            'engine', get_dream_engine().extract_symbols, user_input)
         for s in new_symbols:
             state.symbols.append({
                 "text": s.raw_text,
@@ -362,47 +423,51 @@ async def send_message(
     if analysis.get("key_symbols"):
         state.themes.extend(analysis["key_symbols"])
 
-    # Generate response based on mode
-    response_text = ""
+
+def _is_therapy_turn(state: SessionState, analysis: Dict[str, Any]) -> bool:
+    return state.mode == "therapy" or (state.mode == "hybrid" and not analysis.get("contains_dream"))
+
+
+def _apply_therapy_result(state: SessionState, result: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy the therapist's analysis into session state; returns the dialectic."""
     dialectic_info = {}
 
-    if state.mode == "therapy" or (state.mode == "hybrid" and not analysis.get("contains_dream")):
-        # Use full Therapist pipeline with theory
-        result = _generate_therapy_response(therapist, user_input, state)
-        response_text = result["response"]
+    # Update semantic state from therapist's analysis
+    if result.get("state"):
+        semantic_state = result["state"]
+        state.A = semantic_state.A
+        state.S = semantic_state.S
+        state.tau = semantic_state.tau
+        state.irony = semantic_state.irony
 
-        # Update semantic state from therapist's analysis
-        if result.get("state"):
-            semantic_state = result["state"]
-            state.A = semantic_state.A
-            state.S = semantic_state.S
-            state.tau = semantic_state.tau
-            state.irony = semantic_state.irony
-
-        # Store dialectic analysis
-        if result.get("dialectic"):
-            dial = result["dialectic"]
-            state.thesis_description = dial.get("thesis", {}).get("description", "")
-            state.antithesis_description = dial.get("antithesis", {}).get("description", "")
-            intervention = dial.get("intervention", {})
-            state.intervention_direction = intervention.get("direction", "")
-            dialectic_info = dial
-
-        # Store defenses from metrics
-        if result.get("metrics", {}).get("defenses"):
-            state.defenses = result["metrics"]["defenses"]
+    # Store dialectic analysis
+    if result.get("dialectic"):
+        dial = result["dialectic"]
+        state.thesis_description = dial.get("thesis", {}).get("description", "")
+        state.antithesis_description = dial.get("antithesis", {}).get("description", "")
+        intervention = dial.get("intervention", {})
+        state.intervention_direction = intervention.get("direction", "")
+        dialectic_info = dial
+
+    # Store defenses from metrics
+    if result.get("metrics", {}).get("defenses"):
+        state.defenses = result["metrics"]["defenses"]
+
+    return dialectic_info
 
-    else:
-        # Dream mode - use DreamEngine with therapeutic framing
-        response_text = _generate_dream_response(dream_engine, user_input, state, analysis)
 
-        # Still update coordinates from symbols if available
-        if state.symbols:
-            recent_symbols = state.symbols[-5:]
-            state.A = sum(s.get("A", 0) for s in recent_symbols) / len(recent_symbols)
-            state.S = sum(s.get("S", 0) for s in recent_symbols) / len(recent_symbols)
-            state.tau = sum(s.get("tau", 2.5) for s in recent_symbols) / len(recent_symbols)
+def _update_dream_position(state: SessionState):
+    """Still update coordinates from symbols if available."""
+    if state.symbols:
+        recent_symbols = state.symbols[-5:]
+        state.A = sum(s.get("A", 0) for s in recent_symbols) / len(recent_symbols)
+        state.S = sum(s.get("S", 0) for s in recent_symbols) / len(recent_symbols)
+        state.tau = sum(s.get("tau", 2.5) for s in recent_symbols) / len(recent_symbols)
+
 
+def _complete_turn(session_id: str, state: SessionState, user_input: str,
+                   response_text: str, dialectic_info: Dict[str, Any]) -> SessionResponse:
+    """Append the turn to history, store the session and build the response."""
     # Update state
     state.turn += 1
     state.history.append({
@@ -433,6 +498,184 @@ async def send_message(
     )
 
 
+# =============================================================================
+# STREAMING
+# =============================================================================
+
+@router.post("/{session_id}/message/stream")
+async def stream_message(
+    session_id: str,
+    data: SessionMessage,
+    current_user: Optional[Dict[str, Any]] = Depends(get_optional_user)
+):
+    """Send a message and stream the response as server-sent events.
+
+    Events:
+        token: {"text": "..."} for each chunk the LLM produces
+        done:  SessionResponse fields plus semantic_state, dialectic,
+               metrics and timing (first_token_seconds, total_seconds)
+        end:   SessionEnd payload when the message ended the session
+        error: {"detail": "..."}
+
+    The therapist's response is streamed from a single generation: text
+    that has already reached the client cannot be regenerated, so the
+    response score is reported in `done` instead of triggering retries.
+    """
+    state = get_session(session_id)
+    if not state:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Session not found"
+        )
+
+    # Security: Verify ownership for user-owned sessions
+    if state.user_id:
+        # Session belongs to a user - require authentication
+        if not current_user:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Authentication required to access this session"
+            )
+        if state.user_id != current_user["user_id"]:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="This is not your session"
+            )
+
+    return StreamingResponse(
+        _stream_turn(session_id, state, data, current_user),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _sse(event: str, data: Dict[str, Any]) -> str:
+    """Format one server-sent event."""
+    return f"event: {event}\ndata: {json.dumps(data, default=_json_default)}\n\n"
+
+
+def _json_default(value):
+    # numpy scalars from the dialectic/metrics
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
+
+
+async def _stream_turn(
+    session_id: str,
+    state: SessionState,
+    data: SessionMessage,
+    current_user: Optional[Dict[str, Any]],
+) -> AsyncIterator[str]:
+    """Run one turn, yielding SSE frames (holds the session lock).
+
+    A turn that fails after it has started changing session or therapist
+    state, or whose client disconnects mid-stream, is still recorded with
+    the error text as the response (as the sync path does), so a retried
+    message counts as a new turn instead of replaying half of the failed one.
+    """
+    started = time.monotonic()
+    first_token = None
+    user_input = ""
+    therapist = turn = None
+    pending = False         # state changed, turn not yet recorded
+    turn_finished = False   # therapist has recorded the turn
+    detail = "Client disconnected"
+
+    async with get_session_lock(session_id):
+        try:
+            user_input, analysis = await _analyze_turn(state, data)
+
+            if analysis.get("type") == "goodbye":
+                summary = await end_session(session_id, current_user)
+                yield _sse("end", summary.model_dump())
+                return
+
+            pending = True
+            await _absorb_analysis(state, user_input, analysis)
+
+            therapy = _is_therapy_turn(state, analysis)
+            if therapy:
+                therapist = get_therapist(session_id)
+                turn = await get_executor().run('engine', therapist.prepare_turn, user_input)
+                llm = therapist.llm
+                chunks = llm.stream(turn['system'], turn['user'],
+                                    max_tokens=turn['max_tokens'], temperature=0.7)
+            else:
+                llm = get_dream_engine().llm
+                system, prompt = _dream_prompt(user_input, state)
+                chunks = llm.stream(system, prompt, max_tokens=300, temperature=0.7)
+
+            parts = []
+            async for chunk in chunks:
+                if first_token is None:
+                    first_token = time.monotonic() - started
+                parts.append(chunk)
+                yield _sse("token", {"text": chunk})
+            response_text = "".join(parts).strip()
+
+            dialectic_info = {}
+            metrics_data = {}
+            score = None
+            if therapy:
+                score = therapist.finish_turn(turn, response_text)
+                turn_finished = True
+                result = _therapy_result(therapist, response_text, dial=turn['dial'])
+                dialectic_info = _apply_therapy_result(state, result)
+                metrics_data = result["metrics"]
+            else:
+                _update_dream_position(state)
+
+            response = _complete_turn(session_id, state, user_input, response_text, dialectic_info)
+            pending = False
+            payload = response.model_dump()
+            payload.update({
+                "semantic_state": {"A": state.A, "S": state.S, "tau": state.tau, "irony": state.irony},
+                "dialectic": dialectic_info or None,
+                "metrics": metrics_data,
+                "score": score,
+                "timing": {
+                    "first_token_seconds": first_token,
+                    "total_seconds": time.monotonic() - started,
+                },
+            })
+            yield _sse("done", payload)
+
+        except LLMError as e:
+            logger.warning(f"Streaming LLM call failed: {e}")
+            detail = f"{e.provider or 'LLM'} error: {e}"
+        except StageOverloaded as e:
+            detail = f"Server busy ({e.stage}). Please try again shortly."
+        except Exception as e:
+            logger.exception(f"Streaming turn failed: {e}")
+            detail = "Internal error"
+        else:
+            return
+        finally:
+            # Also runs on GeneratorExit / CancelledError from a client
+            # disconnect, so it must not yield
+            if pending:
+                _record_failed_turn(session_id, state, user_input,
+                                    None if turn_finished else turn, therapist, f"[{detail}]")
+
+        yield _sse("error", {"detail": detail})
+
+
+def _record_failed_turn(session_id: str, state: SessionState, user_input: str,
+                        turn: Optional[Dict[str, Any]], therapist, error_text: str):
+    """Finish a failed turn with the error text as the response.
+
+    turn is the therapist's prepared turn, None if it has none to record.
+    Errors are logged, not raised (this runs while the stream is torn down).
+    """
+    try:
+        if turn is not None:
+            therapist.finish_turn(turn, error_text)
+        _complete_turn(session_id, state, user_input, error_text, {})
+    except Exception as e:
+        logger.exception(f"Could not record failed turn: {e}")
+
+
 @router.post("/{session_id}/end", response_model=SessionEnd)
 async def end_session(
     session_id: str,
@@ -462,21 +705,24 @@ async def end_session(
 
     # Once security checks pass, ensure session cleanup happens no matter what
     archetypes: List[Dict[str, Any]] = []
+    executor = get_executor()
     try:
         engine = get_dream_engine()
-        therapist = get_therapist()
+        # An evicted session has nothing left to summarise
+        therapist = peek_therapist(session_id)
 
         # Extract archetypes (optional - don't fail if this errors)
         try:
-            archetypes = _extract_archetypes(engine, state)
+            archetypes = await executor.run('llm', _extract_archetypes, engine, state)
         except Exception as e:
             logger.warning(f"Could not extract archetypes: {e}")
 
         # Get session summary from therapist if available
-        try:
-            session_data = therapist.get_session_data()
-        except Exception as e:
-            logger.warning(f"Could not get session data: {e}")
+        if therapist is not None:
+            try:
+                session_data = therapist.get_session_data()
+            except Exception as e:
+                logger.warning(f"Could not get session data: {e}")
 
         # Save to user graph if authenticated (optional - don't fail if this errors)
         if state.user_id:
@@ -505,17 +751,13 @@ async def end_session(
                 )
 
                 ug = get_user_graph()
-                ug.save_session(record)
+                await executor.run('neo4j', ug.save_session, record)
             except Exception as e:
                 logger.warning(f"Could not save to user graph: {e}")
 
     finally:
         # ALWAYS clean up session state, even if errors occurred above
-        try:
-            therapist = get_therapist()
-            therapist.reset()
-        except Exception:
-            pass
+        release_therapist(session_id)
 
         # ALWAYS remove from active sessions
         remove_session(session_id)
@@ -599,10 +841,7 @@ async def delete_session(
 
     # Once security checks pass, ensure cleanup happens no matter what
     try:
-        therapist = get_therapist()
-        therapist.reset()
-    except Exception:
-        pass
+        release_therapist(session_id)
     finally:
         # ALWAYS remove from active sessions
         remove_session(session_id)
@@ -658,11 +897,7 @@ async def pause_session(
 
     finally:
         # ALWAYS clean up session state, even if errors occurred above
-        try:
-            therapist = get_therapist()
-            therapist.reset()
-        except Exception:
-            pass
+        release_therapist(session_id)
 
         # ALWAYS remove from active sessions
         remove_session(session_id)
@@ -732,9 +967,8 @@ async def resume_session(
 
     store_session(session_id, state)
 
-    # Reset therapist for resumed session
-    therapist = get_therapist()
-    therapist.reset()
+    # Fresh therapist state for resumed session
+    release_therapist(session_id)
 
     # Update status in Neo4j
     ug.update_session_status(session_id, "active")
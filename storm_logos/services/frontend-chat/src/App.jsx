@@ -154,19 +154,49 @@ export default function App() {
     setMessages(prev => [...prev, { type, content, time: new Date().toLocaleTimeString() }])
   }
 
+  function appendToLastMessage(text) {
+    setMessages(prev => {
+      const last = prev[prev.length - 1]
+      return [...prev.slice(0, -1), { ...last, content: last.content + text }]
+    })
+  }
+
+  function replaceLastMessage(content) {
+    setMessages(prev => [...prev.slice(0, -1), { ...prev[prev.length - 1], content }])
+  }
+
   async function handleSendMessage(message, mode = null) {
     if (!sessionId) {
       await handleStartSession()
     }
     addMessage('user', message)
     setLoading(true)
+    let started = false
     try {
-      const data = await api.sendMessage(sessionId, message, mode)
-      addMessage('therapist', data.response)
-      setSessionInfo(prev => ({ ...prev, mode: data.mode, turn: data.turn }))
-      setSymbols(data.symbols || [])
-      setThemes(data.themes || [])
-      setEmotions(data.emotions || [])
+      const data = await api.streamMessage(sessionId, message, mode, {
+        onToken: (text) => {
+          if (!started) {
+            started = true
+            setLoading(false)
+            addMessage('therapist', '')
+          }
+          appendToLastMessage(text)
+        },
+      })
+      if (data?.event === 'end') {
+        addMessage('therapist', `Session complete.\n\n${data.summary}`)
+        setSessionId(null)
+        setSessionInfo(prev => ({ ...prev, mode: '-', turn: 0 }))
+        return
+      }
+      if (data) {
+        if (started) replaceLastMessage(data.response)
+        else addMessage('therapist', data.response)
+        setSessionInfo(prev => ({ ...prev, mode: data.mode, turn: data.turn }))
+        setSymbols(data.symbols || [])
+        setThemes(data.themes || [])
+        setEmotions(data.emotions || [])
+      }
     } catch (e) {
       addMessage('therapist', `Error: ${e.message}`)
     } finally {
@@ -49,6 +49,67 @@ export async function api(endpoint, method = 'GET', body = null) {
   return data;
 }
 
+// Server-sent events over POST: calls handlers.onToken(text) per chunk,
+// handlers[event](data) for other events, and resolves with the final
+// `done` (or `end`) payload.
+export async function stream(endpoint, body, handlers = {}) {
+  const headers = { 'Content-Type': 'application/json', Accept: 'text/event-stream' };
+  if (token) {
+    headers['Authorization'] = `Bearer ${token}`;
+  }
+
+  const response = await fetch(`${API_BASE}${endpoint}`, {
+    method: 'POST',
+    headers,
+    body: JSON.stringify(body),
+  });
+
+  if (!response.ok) {
+    const data = await response.json().catch(() => ({}));
+    throw new Error(data.detail || 'API Error');
+  }
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+  let result = null;
+
+  const dispatch = (frame) => {
+    let event = 'message';
+    let data = '';
+    for (const line of frame.split('\n')) {
+      if (line.startsWith('event:')) event = line.slice(6).trim();
+      else if (line.startsWith('data:')) data += line.slice(5).trim();
+    }
+    if (!data) return;
+    const payload = JSON.parse(data);
+
+    if (event === 'token') {
+      handlers.onToken?.(payload.text);
+    } else if (event === 'error') {
+      throw new Error(payload.detail || 'Stream error');
+    } else {
+      if (event === 'done' || event === 'end') result = { event, ...payload };
+      handlers[event]?.(payload);
+    }
+  };
+
+  while (true) {
+    const { value, done } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+
+    let split;
+    while ((split = buffer.indexOf('\n\n')) !== -1) {
+      dispatch(buffer.slice(0, split));
+      buffer = buffer.slice(split + 2);
+    }
+  }
+  if (buffer.trim()) dispatch(buffer);
+
+  return result;
+}
+
 // Auth
 export async function login(username, password) {
   const data = await api('/auth/login', 'POST', { username, password });
@@ -95,6 +156,8 @@ export async function getCurrentUser() {
 // Sessions
 export const startSession = (mode) => api('/sessions/start', 'POST', { mode });
 export const sendMessage = (sessionId, message, mode = null) => api(`/sessions/${sessionId}/message`, 'POST', { message, mode });
+export const streamMessage = (sessionId, message, mode = null, handlers = {}) =>
+  stream(`/sessions/${sessionId}/message/stream`, { message, mode }, handlers);
 export const endSession = (sessionId) => api(`/sessions/${sessionId}/end`, 'POST');
 export const pauseSession = (sessionId) => api(`/sessions/${sessionId}/pause`, 'POST');
 export const resumeSession = (sessionId) => api(`/sessions/${sessionId}/resume`, 'POST');
@@ -23,6 +23,7 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException, status, Request, Response
 from pydantic import BaseModel
 from prometheus_client import Counter, Histogram, Gauge, generate_latest, CONTENT_TYPE_LATEST
+from prometheus_client.core import REGISTRY, CounterMetricFamily, GaugeMetricFamily
 
 # Ensure storm_logos is importable
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
@@ -39,6 +40,8 @@ from storm_logos.semantic.physics import (
     boltzmann_factor, transition_probability, master_score
 )
 from storm_logos.metrics.analyzers.archetype import get_archetype_analyzer
+from storm_logos.orchestration.executor import StageOverloaded, get_executor
+from storm_logos.orchestration.tasks import archetype_scores
 
 
 # =============================================================================
@@ -74,6 +77,39 @@ ACTIVE_REQUESTS = Gauge(
 )
 
 
+class StageCollector:
+    """Exports executor stage queue depth and totals on each scrape."""
+
+    GAUGES = (
+        ('queued', 'semantic_stage_queue_depth', 'Calls waiting for a stage slot'),
+        ('running', 'semantic_stage_running', 'Calls running in a stage'),
+        ('max_queued', 'semantic_stage_max_queue_depth', 'Deepest stage queue seen'),
+    )
+    COUNTERS = (
+        ('completed', 'semantic_stage_completed', 'Stage calls completed'),
+        ('failed', 'semantic_stage_failed', 'Stage calls that raised'),
+        ('rejected', 'semantic_stage_rejected', 'Stage calls rejected with a full queue'),
+        ('wait_seconds_total', 'semantic_stage_wait_seconds', 'Time spent queued for a stage slot'),
+        ('run_seconds_total', 'semantic_stage_run_seconds', 'Time spent running in a stage'),
+    )
+
+    def collect(self):
+        stats = get_executor().stats()
+        for key, name, help_text in self.GAUGES:
+            family = GaugeMetricFamily(name, help_text, labels=['stage', 'kind'])
+            for stage, values in stats.items():
+                family.add_metric([stage, values['kind']], values[key])
+            yield family
+        for key, name, help_text in self.COUNTERS:
+            family = CounterMetricFamily(name, help_text, labels=['stage', 'kind'])
+            for stage, values in stats.items():
+                family.add_metric([stage, values['kind']], values[key])
+            yield family
+
+
+REGISTRY.register(StageCollector())
+
+
 # =============================================================================
 # MODELS
 # =============================================================================
@@ -140,6 +176,18 @@ class StormResponse(BaseModel):
     sources: Dict[str, int]
 
 
+class StormBatchRequest(BaseModel):
+    """Request for Storm candidates around many positions."""
+    states: List[Dict[str, float]]  # [{"A": .., "S": .., "tau": ..}, ...]
+    radius: float = 1.0
+    max_candidates: int = 50
+
+
+class StormBatchResponse(BaseModel):
+    """Response with Storm candidates per position."""
+    results: List[StormResponse]
+
+
 class ArchetypeRequest(BaseModel):
     """Request for archetype detection."""
     text: str
@@ -275,6 +323,7 @@ async def lifespan(app: FastAPI):
     yield
 
     print("Shutting down Semantic Microservice...")
+    get_executor().shutdown(wait=False)
 
 
 # =============================================================================
@@ -336,6 +385,38 @@ async def metrics_middleware(request: Request, call_next):
 # ENDPOINTS
 # =============================================================================
 
+def _overloaded(e: StageOverloaded) -> HTTPException:
+    """503 for a full executor stage queue."""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=str(e),
+        headers={"Retry-After": "5"},
+    )
+
+
+def _interpret_symbols(analyzer, symbols: List[Dict[str, float]]) -> List[Dict[str, Any]]:
+    """Archetype and interpretation per symbol (one batched LLM call at most)."""
+    bonds = [
+        Bond(
+            noun=sym.get("text", ""),
+            A=sym.get("A", 0),
+            S=sym.get("S", 0),
+            tau=sym.get("tau", 2.5),
+        )
+        for sym in symbols
+    ]
+    return [
+        {
+            "text": bond.noun,
+            "archetype": arch,
+            "interpretation": interp,
+            "A": bond.A,
+            "S": bond.S,
+        }
+        for bond, (arch, interp) in zip(bonds, analyzer.get_symbol_interpretations(bonds))
+    ]
+
+
 @app.get("/metrics")
 async def prometheus_metrics():
     """Prometheus metrics endpoint."""
@@ -410,7 +491,10 @@ async def analyze_metrics(request: MetricsRequest):
         )
 
     try:
-        metrics = service.metrics.measure(text=request.text)
+        # CPU-bound, but on the service's own engine (a process worker would
+        # load its own spaCy model and coordinate tables): thread pool
+        metrics = await get_executor().run_in_thread(
+            'metrics', service.metrics.measure, text=request.text)
 
         return MetricsResponse(
             coherence=metrics.coherence,
@@ -423,6 +507,8 @@ async def analyze_metrics(request: MetricsRequest):
             defenses=metrics.defenses,
         )
 
+    except StageOverloaded as e:
+        raise _overloaded(e)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -480,7 +566,9 @@ async def explode_candidates(request: StormRequest):
     try:
         state = SemanticState(A=request.A, S=request.S, tau=request.tau)
 
-        candidates = service.storm.explode(
+        candidates = await get_executor().run(
+            'neo4j',
+            service.storm.explode,
             Q=state,
             radius=request.radius,
             max_candidates=request.max_candidates,
@@ -503,6 +591,62 @@ async def explode_candidates(request: StormRequest):
             sources={"spatial": len(candidates_list)},  # Simplified
         )
 
+    except StageOverloaded as e:
+        raise _overloaded(e)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Storm explosion error: {str(e)}"
+        )
+
+
+@app.post("/storm/batch", response_model=StormBatchResponse)
+async def explode_candidates_batch(request: StormBatchRequest):
+    """Generate candidate bonds for many positions in one batched query."""
+    service = get_service()
+
+    if not service.storm:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Storm engine not initialized"
+        )
+
+    try:
+        states = [
+            SemanticState(A=s.get("A", 0.0), S=s.get("S", 0.0), tau=s.get("tau", 2.5))
+            for s in request.states
+        ]
+
+        batches = await get_executor().run(
+            'neo4j',
+            service.storm.explode_many,
+            states,
+            radius=request.radius,
+            max_candidates=request.max_candidates,
+        )
+
+        results = []
+        for rows in batches:
+            candidates_list = [
+                {
+                    "text": bond.text,
+                    "A": bond.A,
+                    "S": bond.S,
+                    "tau": bond.tau,
+                    "variety": bond.variety,
+                }
+                for bond in service.storm.bonds_for(rows)
+            ]
+            results.append(StormResponse(
+                candidates=candidates_list,
+                count=len(candidates_list),
+                sources={"spatial": len(candidates_list)},  # Simplified
+            ))
+
+        return StormBatchResponse(results=results)
+
+    except StageOverloaded as e:
+        raise _overloaded(e)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -522,8 +666,10 @@ async def detect_archetypes(request: ArchetypeRequest):
         )
 
     try:
-        # Analyze text for archetypes
-        scores = service.archetype.analyze_text(request.text)
+        executor = get_executor()
+
+        # Analyze text for archetypes (regex scoring: process pool)
+        scores = await executor.run('metrics', archetype_scores, request.text)
 
         # Find dominant
         dominant = max(scores.items(), key=lambda x: x[1]) if scores else ("unknown", 0.0)
@@ -531,21 +677,8 @@ async def detect_archetypes(request: ArchetypeRequest):
         # Process symbols if provided
         symbols = []
         if request.symbols:
-            for sym in request.symbols:
-                bond = Bond(
-                    noun=sym.get("text", ""),
-                    A=sym.get("A", 0),
-                    S=sym.get("S", 0),
-                    tau=sym.get("tau", 2.5),
-                )
-                arch, interp = service.archetype.get_symbol_interpretation(bond)
-                symbols.append({
-                    "text": bond.noun,
-                    "archetype": arch,
-                    "interpretation": interp,
-                    "A": bond.A,
-                    "S": bond.S,
-                })
+            symbols = await executor.run(
+                'llm', _interpret_symbols, service.archetype, request.symbols)
 
         return ArchetypeResponse(
             archetypes=scores,
@@ -554,6 +687,8 @@ async def detect_archetypes(request: ArchetypeRequest):
             symbols=symbols,
         )
 
+    except StageOverloaded as e:
+        raise _overloaded(e)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
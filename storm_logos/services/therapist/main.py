@@ -23,11 +23,12 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException, status, Request, Response
 from pydantic import BaseModel
 from prometheus_client import Counter, Histogram, Gauge, generate_latest, CONTENT_TYPE_LATEST
+from prometheus_client.core import REGISTRY, CounterMetricFamily, GaugeMetricFamily
 
 # Ensure storm_logos is importable
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
-from storm_logos.applications import Therapist
+from storm_logos.applications import Therapist, TherapistPool
 from storm_logos.data.models import SemanticState
 
 
@@ -48,11 +49,6 @@ REQUEST_LATENCY = Histogram(
     buckets=[0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0]
 )
 
-ACTIVE_SESSIONS = Gauge(
-    'therapist_active_sessions',
-    'Number of active therapy sessions'
-)
-
 ACTIVE_REQUESTS = Gauge(
     'therapist_active_requests',
     'Number of currently active requests'
@@ -63,6 +59,25 @@ THERAPY_TURNS = Counter(
     'Total therapy turns processed'
 )
 
+class PoolCollector:
+    """Exports therapist pool size and lookup totals on each scrape."""
+
+    COUNTERS = (
+        (('hits',), 'therapist_pool_hits', 'Session lookups served from the therapist pool'),
+        (('misses',), 'therapist_pool_misses', 'Session lookups that forked a new therapist'),
+        (('evictions', 'expirations'), 'therapist_pool_evictions',
+         'Sessions evicted by the pool size cap or idle TTL'),
+    )
+
+    def collect(self):
+        # Never build the pool just to report on it
+        pool = _service._pool if _service is not None else None
+        stats = pool.stats() if pool is not None else {}
+        yield GaugeMetricFamily('therapist_active_sessions', 'Number of active therapy sessions',
+                                value=stats.get('size', 0))
+        for keys, name, help_text in self.COUNTERS:
+            yield CounterMetricFamily(name, help_text, value=sum(stats.get(k, 0) for k in keys))
+
 
 # =============================================================================
 # MODELS
@@ -111,19 +126,34 @@ class HealthResponse(BaseModel):
 # =============================================================================
 
 class TherapistService:
-    """Manages Therapist instances per session."""
+    """Manages Therapist instances per session.
+
+    A default therapist holds the shared components (MetricsEngine,
+    Dialectic); sessions are forks of it kept in a bounded LRU/TTL pool.
+    """
 
     def __init__(self):
         self.model = os.environ.get("LLM_MODEL", "groq:llama-3.3-70b-versatile")
-        self._sessions: Dict[str, Therapist] = {}
+        self.pool_size = int(os.environ.get("THERAPIST_POOL_SIZE", "1000"))
+        self.pool_ttl = float(os.environ.get("THERAPIST_POOL_TTL_SECONDS", "3600"))
         self._default_therapist: Optional[Therapist] = None
+        self._pool: Optional[TherapistPool] = None
+
+    @property
+    def pool(self) -> TherapistPool:
+        """Session pool (built on first use)."""
+        if self._pool is None:
+            self._pool = TherapistPool(
+                factory=self.get_therapist().fork,
+                max_size=self.pool_size,
+                ttl_seconds=self.pool_ttl,
+            )
+        return self._pool
 
     def get_therapist(self, session_id: Optional[str] = None) -> Therapist:
         """Get or create therapist for session."""
         if session_id:
-            if session_id not in self._sessions:
-                self._sessions[session_id] = Therapist(model=self.model)
-            return self._sessions[session_id]
+            return self.pool.get(session_id)
 
         if self._default_therapist is None:
             self._default_therapist = Therapist(model=self.model)
@@ -131,14 +161,17 @@ class TherapistService:
 
     def reset_session(self, session_id: str):
         """Reset a session's therapist."""
-        if session_id in self._sessions:
-            self._sessions[session_id].reset()
-            del self._sessions[session_id]
+        self.pool.release(session_id)
+
+    def cleanup_old_sessions(self) -> int:
+        """Remove sessions idle for longer than the pool TTL.
 
-    def cleanup_old_sessions(self, max_age_hours: int = 24):
-        """Remove old inactive sessions."""
-        # In production, implement proper session timeout
-        pass
+        Does nothing before the pool exists (building it would load the
+        default therapist).
+        """
+        if self._pool is None:
+            return 0
+        return self._pool.evict_expired()
 
 
 _service: Optional[TherapistService] = None
@@ -152,6 +185,9 @@ def get_service() -> TherapistService:
     return _service
 
 
+REGISTRY.register(PoolCollector())
+
+
 # =============================================================================
 # LIFESPAN
 # =============================================================================
@@ -238,8 +274,8 @@ async def prometheus_metrics():
     """Prometheus metrics endpoint."""
     service = get_service()
 
-    # Update gauges
-    ACTIVE_SESSIONS.set(len(service._sessions))
+    # Pool size and totals are read by PoolCollector
+    service.cleanup_old_sessions()
 
     return Response(
         content=generate_latest(),
@@ -389,7 +425,10 @@ async def list_sessions():
     """List active therapy sessions."""
     service = get_service()
     sessions = []
-    for sid, therapist in service._sessions.items():
+    for sid in service.pool.session_ids():
+        therapist = service.pool.peek(sid)
+        if therapist is None:
+            continue
         sessions.append({
             "session_id": sid,
             "turns": len(therapist._turns),
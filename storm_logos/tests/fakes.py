@@ -0,0 +1,31 @@
+"""
+Shared test stand-ins.
+
+    FakeSharedTier  dict-backed replacement for the Redis cache tier
+                    (data/cache.py RedisTier), used by the coordinate
+                    and LLM response cache tests
+"""
+
+class FakeSharedTier:
+    """Dict-backed stand-in for RedisTier (stores encoded values)."""
+
+    errors = 0
+
+    def __init__(self):
+        self.data = {}
+        self.index = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, raw, ttl, words=(), index_ttl=None):
+        self.data[key] = raw
+        for word in words:
+            self.index.setdefault((key[0], word), set()).add(key[1])
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+    def delete_word(self, namespace, word):
+        for member in self.index.pop((namespace, word), set()):
+            self.data.pop((namespace, member), None)
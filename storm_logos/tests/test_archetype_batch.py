@@ -0,0 +1,135 @@
+"""
+Tests for batched archetype detection.
+
+Run with:
+    python -m storm_logos.tests.test_archetype_batch
+    python storm_logos/tests/test_archetype_batch.py
+"""
+
+import json
+import unittest
+import sys
+from pathlib import Path
+
+# Setup path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from storm_logos.data.models import Bond
+from storm_logos.metrics.analyzers.archetype import ArchetypeAnalyzer
+
+
+class RecordingCaller:
+    """LLM caller stand-in returning canned responses in order."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.prompts = []
+
+    def __call__(self, system, prompt):
+        self.prompts.append(prompt)
+        return self.responses[min(len(self.prompts), len(self.responses)) - 1]
+
+
+def bond(noun, adj=None, A=-0.3, S=0.1):
+    return Bond(noun=noun, adj=adj, A=A, S=S)
+
+
+class TestBatchedDetection(unittest.TestCase):
+    """One LLM call per dream, per-symbol fallback on parse failure."""
+
+    def test_single_call_for_unknown_symbols(self):
+        batch = RecordingCaller(json.dumps([
+            {'symbol': 'murky swamp', 'archetype': 'shadow', 'interpretation': 'stagnation'},
+            {'symbol': 'glass staircase', 'archetype': 'Hero', 'interpretation': 'ascent'},
+            {'symbol': 'copper kettle', 'archetype': 'mother', 'interpretation': 'nourishment'},
+        ]))
+        single = RecordingCaller('{}')
+        analyzer = ArchetypeAnalyzer(llm_caller=single, batch_llm_caller=batch)
+
+        results = analyzer.get_symbol_interpretations([
+            bond('swamp', 'murky'),
+            bond('staircase', 'glass'),
+            bond('kettle', 'copper'),
+            bond('swamp', 'murky'),
+        ])
+
+        self.assertEqual(len(batch.prompts), 1)
+        self.assertEqual(len(single.prompts), 0)
+        self.assertEqual(batch.prompts[0].count('murky swamp'), 1)
+        self.assertEqual([arch for arch, _ in results], ['shadow', 'hero', 'mother', 'shadow'])
+
+    def test_unknown_names_not_matched_by_position(self):
+        batch = RecordingCaller('Here you go: [{"symbol": "kettle of copper", "archetype": "trickster",'
+                                ' "interpretation": "change"}, {"archetype": "father", "interpretation": "order"}]')
+        single = RecordingCaller('{"archetype": "hero", "interpretation": "ascent"}')
+        analyzer = ArchetypeAnalyzer(llm_caller=single, batch_llm_caller=batch)
+
+        symbols = [bond('kettle', 'copper'), bond('staircase', 'glass')]
+        results = analyzer.get_symbol_interpretations(symbols)
+        self.assertEqual(results, [analyzer._static_interpretation(s)[0] for s in symbols])
+        self.assertEqual(single.prompts, [])
+
+    def test_fallback_on_parse_failure(self):
+        batch = RecordingCaller('I cannot answer in JSON.')
+        single = RecordingCaller('{"archetype": "self", "interpretation": "wholeness"}')
+        analyzer = ArchetypeAnalyzer(llm_caller=single, batch_llm_caller=batch)
+
+        results = analyzer.get_symbol_interpretations([bond('kettle', 'copper'), bond('staircase', 'glass')])
+        self.assertEqual(len(batch.prompts), 1)
+        self.assertEqual(len(single.prompts), 2)
+        self.assertEqual(results, [('self', 'wholeness')] * 2)
+
+    def test_missing_symbol_keeps_static_match(self):
+        batch = RecordingCaller('[{"symbol": "copper kettle", "archetype": "mother", "interpretation": "home"}]')
+        single = RecordingCaller('{"archetype": "hero", "interpretation": "ascent"}')
+        analyzer = ArchetypeAnalyzer(llm_caller=single, batch_llm_caller=batch)
+
+        staircase = bond('staircase', 'glass')
+        results = analyzer.get_symbol_interpretations([bond('kettle', 'copper'), staircase])
+        self.assertEqual(results, [('mother', 'home'), analyzer._static_interpretation(staircase)[0]])
+        self.assertEqual(single.prompts, [])
+
+    def test_static_symbols_skip_llm(self):
+        caller = RecordingCaller('[]')
+        analyzer = ArchetypeAnalyzer(llm_caller=caller)
+
+        results = analyzer.get_symbol_interpretations([bond('snake'), bond('wolf', 'grey')])
+        self.assertEqual([arch for arch, _ in results], ['shadow', 'shadow'])
+        self.assertEqual(caller.prompts, [])
+
+    def test_without_llm(self):
+        analyzer = ArchetypeAnalyzer()
+        results = analyzer.get_symbol_interpretations([bond('kettle', 'copper')])
+        self.assertEqual(len(results), 1)
+
+    def test_reload_keeps_callers(self):
+        caller = RecordingCaller('{}')
+        analyzer = ArchetypeAnalyzer(llm_caller=caller, batch_llm_caller=caller)
+        analyzer.reload_config()
+        self.assertIs(analyzer._llm_caller, caller)
+        self.assertIs(analyzer._batch_llm_caller, caller)
+
+
+def run_tests():
+    """Run all tests and print summary."""
+    print("=" * 60)
+    print("Archetype Batch Tests")
+    print("=" * 60)
+
+    loader = unittest.TestLoader()
+    suite = loader.loadTestsFromModule(sys.modules[__name__])
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    print("\n" + "=" * 60)
+    print(f"Tests run: {result.testsRun}")
+    print(f"Failures: {len(result.failures)}")
+    print(f"Errors: {len(result.errors)}")
+    print("=" * 60)
+
+    return len(result.failures) + len(result.errors)
+
+
+if __name__ == "__main__":
+    sys.exit(run_tests())
@@ -186,6 +186,9 @@ class TestBondLearnerWithMocks(unittest.TestCase):
         self.mock_postgres = Mock()
         self.mock_postgres.get_learned_bond.return_value = None
         self.mock_postgres._compute_bond_coordinates.return_value = (0.5, 0.2, 2.0)
+        self.mock_postgres._compute_bond_coordinates_many.side_effect = (
+            lambda pairs: [(0.5, 0.2, 2.0)] * len(pairs)
+        )
         self.mock_postgres.learn_bond.return_value = Bond(
             adj="dark", noun="forest",
             A=0.5, S=0.2, tau=2.0
@@ -195,7 +198,9 @@ class TestBondLearnerWithMocks(unittest.TestCase):
         # Mock Neo4j
         self.mock_neo4j = Mock()
         self.mock_neo4j.learn_bond.return_value = "dark_forest"
-        self.mock_neo4j.learn_trajectory.return_value = 2
+        self.mock_neo4j.learn_trajectory.return_value = {
+            'bonds': 3, 'edges': 2, 'created': 1, 'reinforced': 1,
+        }
         self.learner.neo4j = self.mock_neo4j
         self.learner._connected = True
 
@@ -243,8 +248,27 @@ class TestBondLearnerWithMocks(unittest.TestCase):
         # Should have learned all bonds
         self.assertEqual(len(result.bonds), 3)
 
-        # Should have created trajectory
+        # Should have created trajectory (nodes merged with the edges)
         self.mock_neo4j.learn_trajectory.assert_called_once()
+        self.mock_neo4j.learn_bond.assert_not_called()
+        self.assertEqual(result.trajectory_edges, 2)
+        self.assertEqual(result.edges_created, 1)
+        self.assertEqual(result.edges_reinforced, 1)
+
+    def test_learn_from_text_batches_coordinates(self):
+        """Coordinates for all bonds should be resolved in one batch."""
+        self.learner.extract_bonds = Mock(return_value=[
+            ("dark", "forest"),
+            ("ancient", "secrets"),
+        ])
+
+        result = self.learner.learn_from_text("test text")
+
+        self.mock_postgres._compute_bond_coordinates_many.assert_called_once_with(
+            [("dark", "forest"), ("ancient", "secrets")]
+        )
+        self.mock_postgres._compute_bond_coordinates.assert_not_called()
+        self.assertEqual(result.bonds[1].tau, 2.0)
 
     def test_learn_from_text_generates_conversation_id(self):
         """Learning should generate conversation ID if not provided."""
@@ -332,6 +356,60 @@ class TestCoordinateHeuristics(unittest.TestCase):
             self.assertGreater(tau, 2.5, f"{noun} should have tau > 2.5")
 
 
+class TestNeo4jLearnTrajectory(unittest.TestCase):
+    """Single-statement trajectory learning."""
+
+    def setUp(self):
+        from storm_logos.data.neo4j import Neo4jData
+
+        self.neo4j = Neo4jData()
+        self.neo4j._connected = True
+        self.tx = Mock()
+        session = MagicMock()
+        session.__enter__.return_value = session
+        session.execute_write.side_effect = lambda fn: fn(self.tx)
+        self.neo4j._driver = Mock()
+        self.neo4j._driver.session.return_value = session
+        self.session = session
+
+    def test_one_round_trip(self):
+        """Nodes and edges are merged by one query in one transaction."""
+        bonds = [Bond(adj="dark", noun="forest"), Bond(adj="old", noun="house"),
+                 Bond(adj="dark", noun="forest"), Bond(adj="old", noun="house")]
+        # dark_forest -> old_house is new; old_house -> dark_forest existed;
+        # the repeated dark_forest -> old_house reinforces the edge created above
+        self.tx.run.return_value = [
+            {'index': 1, 'created': True},
+            {'index': 2, 'created': False},
+            {'index': 3, 'created': True},
+        ]
+
+        counts = self.neo4j.learn_trajectory(bonds, conversation_id="c1")
+
+        self.session.execute_write.assert_called_once()
+        self.tx.run.assert_called_once()
+        params = self.tx.run.call_args.kwargs
+        self.assertEqual([n['id'] for n in params['nodes']], ["dark_forest", "old_house"])
+        self.assertEqual(len(params['edges']), 3)
+        self.assertEqual(params['conv_id'], "c1")
+        self.assertEqual(params['init_weight'], 0.2)
+        self.assertEqual(counts, {'bonds': 2, 'edges': 3, 'created': 1, 'reinforced': 2})
+
+    def test_context_weight(self):
+        """Context-inferred edges start at the context weight."""
+        self.tx.run.return_value = []
+        self.neo4j.learn_trajectory([Bond(adj="a", noun="b")], source_type='context')
+        self.assertEqual(self.tx.run.call_args.kwargs['init_weight'], 0.1)
+        self.assertEqual(self.tx.run.call_args.kwargs['edges'], [])
+
+    def test_disconnected(self):
+        """Nothing is written without a connection."""
+        self.neo4j._connected = False
+        counts = self.neo4j.learn_trajectory([Bond(adj="a", noun="b"), Bond(adj="c", noun="d")])
+        self.assertEqual(counts['edges'], 0)
+        self.session.execute_write.assert_not_called()
+
+
 def run_tests():
     """Run all tests and print summary."""
     print("=" * 60)
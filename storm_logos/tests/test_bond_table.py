@@ -0,0 +1,154 @@
+"""
+Tests for the columnar BondTable.
+
+Run with:
+    python -m storm_logos.tests.test_bond_table
+    python storm_logos/tests/test_bond_table.py
+"""
+
+import random
+import threading
+import unittest
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+
+import numpy as np
+
+# Setup path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from storm_logos.data.models import Bond
+from storm_logos.data.bond_table import BondTable, Vocabulary
+
+
+class TestVocabulary(unittest.TestCase):
+    """Test string interning."""
+
+    def test_codes_are_stable(self):
+        """Repeated words should get the same code."""
+        vocab = Vocabulary(["dark", "old"])
+        self.assertEqual(vocab.add("dark"), 0)
+        self.assertEqual(vocab.add("new"), 2)
+        self.assertEqual(vocab.word(1), "old")
+        self.assertEqual(vocab.code("missing"), -1)
+        self.assertEqual(len(vocab), 3)
+
+
+class TestBondTable(unittest.TestCase):
+    """Test column storage, lookups and lazy materialization."""
+
+    def setUp(self):
+        self.table = BondTable(capacity=1)
+        self.table.extend(
+            ["dark", "old", "old"], ["forest", "forest", "house"], [50, 30, 20],
+            [(-0.25, 0.5, 1.5), (0.25, 0.0, 1.5), (0.5, 0.0, 1.25)],
+        )
+
+    def test_columns(self):
+        """Columns should be NumPy arrays aligned by row."""
+        self.assertEqual(len(self.table), 3)
+        self.assertEqual(self.table.coords.shape, (3, 3))
+        np.testing.assert_array_equal(self.table.variety, [50, 30, 20])
+        np.testing.assert_array_equal(self.table.tau, [1.5, 1.5, 1.25])
+        self.assertEqual(len(self.table.noun_vocab), 2)
+
+    def test_materialize(self):
+        """Indexing should build an equivalent Bond."""
+        bond = self.table[2]
+        self.assertEqual(bond, Bond(noun="house", adj="old", variety=20,
+                                    A=0.5, S=0.0, tau=1.25))
+        self.assertEqual([b.adj for b in self.table[:2]], ["dark", "old"])
+        with self.assertRaises(IndexError):
+            self.table[3]
+
+    def test_find_first_wins(self):
+        """Duplicate pairs should resolve to the first row."""
+        self.table.append(Bond(noun="forest", adj="dark", variety=5))
+        self.assertEqual(self.table.find("dark", "forest"), 0)
+        self.assertEqual(self.table.find("old", "house"), 2)
+        self.assertEqual(self.table.find("dark", "house"), -1)
+        self.assertEqual(self.table.find("bright", "forest"), -1)
+
+    def test_find_during_appends(self):
+        """Lookups racing appends and index rebuilds should stay correct."""
+        self.table.PAIR_TAIL_MAX = 4
+        errors = []
+
+        def read():
+            try:
+                for _ in range(2000):
+                    for row, (adj, noun) in enumerate([("dark", "forest"), ("old", "forest"),
+                                                       ("old", "house")]):
+                        if self.table.find(adj, noun) != row:
+                            errors.append((adj, noun))
+            except Exception as e:
+                errors.append(e)
+
+        reader = threading.Thread(target=read)
+        reader.start()
+        for i in range(2000):
+            row = self.table.append(Bond(noun="sky", adj=f"adj{i}"))
+            self.assertEqual(self.table.find(f"adj{i}", "sky"), row)
+        reader.join()
+        self.assertEqual(errors, [])
+
+    def test_noun_only_bonds(self):
+        """Bonds without an adjective should round-trip."""
+        row = self.table.append(Bond(noun="sky"))
+        self.assertIsNone(self.table[row].adj)
+        self.assertEqual(self.table.find(None, "sky"), row)
+
+    def test_rows_for_noun(self):
+        """Noun index should track appends in insertion order."""
+        np.testing.assert_array_equal(self.table.rows_for_noun("forest"), [0, 1])
+        self.table.append(Bond(noun="forest", adj="deep"))
+        np.testing.assert_array_equal(self.table.rows_for_noun("forest"), [0, 1, 3])
+        self.assertEqual(len(self.table.rows_for_noun("castle")), 0)
+
+    def test_compact(self):
+        """Compacting should drop spare capacity but keep rows."""
+        self.table.compact()
+        self.assertEqual(self.table.nbytes, 3 * (24 + 4 + 4 + 4))
+        self.assertEqual(self.table[0].noun, "forest")
+
+    def test_coordinates_keep_full_precision(self):
+        """Stored coordinates should round-trip exactly as Python floats."""
+        coords = (0.1, -0.3333333333333333, 2.7182818284590455)
+        self.table.extend(["pale"], ["moon"], [1], [coords])
+        bond = self.table[-1]
+        self.assertEqual((bond.A, bond.S, bond.tau), coords)
+
+    def test_is_sequence(self):
+        """The table should work wherever a sequence of Bonds is expected."""
+        self.assertIsInstance(self.table, Sequence)
+        self.assertEqual(self.table[-1].noun, "house")
+        self.assertEqual([b.variety for b in reversed(self.table)], [20, 30, 50])
+        sample = random.Random(3).sample(self.table, 2)
+        self.assertEqual(len(sample), 2)
+        self.assertTrue(all(isinstance(b, Bond) for b in sample))
+
+
+def run_tests():
+    """Run all tests and print summary."""
+    print("=" * 60)
+    print("Bond Table Tests")
+    print("=" * 60)
+
+    loader = unittest.TestLoader()
+    suite = loader.loadTestsFromModule(sys.modules[__name__])
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    print("\n" + "=" * 60)
+    print(f"Tests run: {result.testsRun}")
+    print(f"Failures: {len(result.failures)}")
+    print(f"Errors: {len(result.errors)}")
+    print("=" * 60)
+
+    return len(result.failures) + len(result.errors)
+
+
+if __name__ == "__main__":
+    sys.exit(run_tests())
@@ -0,0 +1,300 @@
+"""
+Tests for book parsing stages, batched Neo4j writes and the ingestion pipeline.
+
+Run with:
+    python -m storm_logos.tests.test_book_ingest
+    python storm_logos/tests/test_book_ingest.py
+"""
+
+import json
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+
+# Setup path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import spacy
+
+from storm_logos.config import NLPConfig
+from storm_logos.data.book_parser import BookParser, BookProcessor
+from storm_logos.data.ingest import BookIngestor, IngestCheckpoint
+from storm_logos.data.models import Bond
+from storm_logos.data.neo4j import Neo4jData
+from storm_logos.data.nlp import NLPService
+
+
+class StubParser(BookParser):
+    """BookParser on a blank pipeline: first two words of a sentence form a bond."""
+
+    def __init__(self):
+        nlp = spacy.blank('en')
+        nlp.add_pipe('sentencizer')
+        super().__init__(nlp=NLPService(config=NLPConfig(doc_cache_size=0), nlp=nlp))
+        self._data = {}
+
+    def _extract_bonds_from_sentence(self, sent):
+        return [(sent[0].lower_, sent[1].lower_)]
+
+
+class FakeNeo4j:
+    """Records batched writes; optionally fails once n bonds are written."""
+
+    def __init__(self, fail_at: int = 0):
+        self.fail_at = fail_at
+        self.bonds = []
+        self.contains = []
+        self.follows = []
+        self.books = []
+
+    def add_author(self, author):
+        return True
+
+    def add_book(self, book):
+        self.books.append(book.id)
+        return True
+
+    def write_bonds(self, bonds, batch_size=None):
+        if self.fail_at and len(self.bonds) + len(bonds) >= self.fail_at:
+            raise ConnectionError('neo4j went away')
+        self.bonds.extend(bond.text for bond in bonds)
+        return len(bonds)
+
+    def write_contains(self, book_id, rows, batch_size=None):
+        self.contains.extend(rows)
+        return len(rows)
+
+    def write_follows(self, book_id, rows, batch_size=None):
+        self.follows.extend((row['source_id'], row['target_id']) for row in rows)
+        return len(rows)
+
+
+class FakeSession:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute_write(self, fn, *args):
+        tx = FakeTx()
+        fn(tx, *args)
+        self.driver.transactions.append(tx.runs)
+
+
+class FakeTx:
+    def __init__(self):
+        self.runs = []
+
+    def run(self, query, **params):
+        self.runs.append((query, params))
+        return self
+
+    def consume(self):
+        return None
+
+
+class FakeDriver:
+    def __init__(self):
+        self.transactions = []
+
+    def session(self):
+        return FakeSession(self)
+
+
+CHAPTERED = """CHAPTER I. The Forest
+Dark trees stood. Cold wind blew.
+
+CHAPTER II. The River
+Deep water ran. Old stones lay. Grey fog rose.
+"""
+
+
+class TestBookParser(unittest.TestCase):
+    """Chapters parsed in one pipe, numbering preserved."""
+
+    def setUp(self):
+        self.parser = StubParser()
+
+    def test_chapters(self):
+        parsed = self.parser.parse_text(CHAPTERED)
+        self.assertEqual(parsed.n_chapters, 2)
+        self.assertEqual({b.chapter for b in parsed.bonds}, {1, 2})
+        self.assertIn('cold', [b.adj for b in parsed.bonds if b.chapter == 1])
+        self.assertIn('grey', [b.adj for b in parsed.bonds if b.chapter == 2])
+        self.assertEqual([b.position for b in parsed.bonds], list(range(len(parsed.bonds))))
+
+        # Sentence numbers restart in every chapter
+        second = [b.sentence for b in parsed.bonds if b.chapter == 2]
+        self.assertEqual(second[0], 1)
+
+    def test_chunks_cover_text(self):
+        text = ('Some words here. ' * 50).strip()
+        chunks = self.parser._chunk_text(text, chunk_size=100)
+        self.assertEqual(''.join(chunks), text)
+        self.assertTrue(all(len(c) <= 100 for c in chunks))
+        self.assertTrue(all(c.endswith('.') for c in chunks[:-1]))
+
+
+class TestBookIngestor(unittest.TestCase):
+    """Pipeline, checkpoints and throughput report."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+        self.checkpoint = self.dir / 'ingest.json'
+        self.parser = StubParser()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write_book(self, name: str, n_sentences: int) -> Path:
+        path = self.dir / name
+        path.write_text(' '.join(f'Word{i} forest grows.' for i in range(n_sentences)))
+        return path
+
+    def ingestor(self, neo4j: FakeNeo4j) -> BookIngestor:
+        processor = BookProcessor(neo4j=neo4j, parser=self.parser, batch_size=1000)
+        return BookIngestor(processor, workers=1, queue_size=1, checkpoint_path=self.checkpoint)
+
+    def test_ingest_and_skip_done(self):
+        books = [(self.write_book('a.txt', 5), None), (self.write_book('b.txt', 3), {'title': 'B'})]
+        neo4j = FakeNeo4j()
+        report = self.ingestor(neo4j).run(books)
+
+        self.assertEqual(report['books_loaded'], 2)
+        self.assertEqual(report['bonds'], 8)
+        self.assertGreater(report['bonds_per_second'], 0)
+        self.assertEqual(sorted(neo4j.books), ['a', 'b'])
+
+        saved = json.loads(self.checkpoint.read_text())['books']
+        self.assertEqual(saved['a']['status'], 'done')
+        self.assertEqual(saved['b']['loaded'], 3)
+
+        # Rerun: nothing to do
+        again = FakeNeo4j()
+        report = self.ingestor(again).run(books)
+        self.assertEqual(report['books_skipped'], 2)
+        self.assertEqual(again.bonds, [])
+
+    def test_resume_partial_book(self):
+        book = self.write_book('long.txt', 1500)
+        report = self.ingestor(FakeNeo4j(fail_at=1200)).run([(book, None)])
+        self.assertEqual(report['books_failed'], 1)
+        self.assertEqual(IngestCheckpoint(self.checkpoint).get('long')['loaded'], 1000)
+
+        neo4j = FakeNeo4j()
+        report = self.ingestor(neo4j).run([(book, None)])
+        self.assertEqual(report['bonds'], 500)
+        self.assertEqual(neo4j.bonds[0], 'word1000 forest')
+        self.assertEqual(neo4j.contains[0]['position'], 1000)
+        # FOLLOWS continues from the last bond already loaded
+        self.assertEqual(neo4j.follows[0], ('word999_forest', 'word1000_forest'))
+
+    def test_changed_file_reprocessed(self):
+        book = self.write_book('a.txt', 2)
+        self.ingestor(FakeNeo4j()).run([(book, None)])
+
+        book.write_text('Changed text here. Another one here. And a third.')
+        neo4j = FakeNeo4j()
+        report = self.ingestor(neo4j).run([(book, None)])
+        self.assertEqual(report['books_loaded'], 1)
+        self.assertEqual(len(neo4j.bonds), 3)
+
+    def test_parse_error_reported(self):
+        report = self.ingestor(FakeNeo4j()).run([(self.dir / 'missing.txt', None)])
+        self.assertEqual(report['books_failed'], 1)
+
+    def test_checkpoint_error_keeps_draining(self):
+        books = [(self.write_book(f'{name}.txt', 2), None) for name in 'abc']
+        ingestor = self.ingestor(FakeNeo4j())
+        update = ingestor.checkpoint.update
+
+        def flaky_update(book_id, **fields):
+            if book_id == 'a':
+                raise OSError('disk full')
+            update(book_id, **fields)
+
+        ingestor.checkpoint.update = flaky_update
+        report = ingestor.run(books)
+        self.assertEqual(report['books_failed'], 1)
+        self.assertEqual(report['books_loaded'], 2)
+
+    def test_dead_writer_stops_producer(self):
+        class Fatal(BaseException):
+            pass
+
+        def die(*args):
+            raise Fatal('writer crashed')
+
+        books = [(self.write_book(f'{name}.txt', 2), None) for name in 'abcde']
+        ingestor = self.ingestor(FakeNeo4j())
+        ingestor.put_timeout = 0.01
+        ingestor._write_book = die
+        with self.assertRaises(Fatal):
+            ingestor.run(books)
+
+
+class TestBatchedWrites(unittest.TestCase):
+    """Chunked UNWIND writers: one transaction per chunk."""
+
+    def setUp(self):
+        self.neo4j = Neo4jData()
+        self.neo4j._driver = FakeDriver()
+        self.neo4j._connected = True
+
+    def test_write_bonds_chunked_and_deduplicated(self):
+        bonds = [Bond(adj='dark', noun=f'n{i}') for i in range(5)] + [Bond(adj='dark', noun='n0')]
+        self.assertEqual(self.neo4j.write_bonds(bonds, batch_size=2), 5)
+
+        transactions = self.neo4j._driver.transactions
+        self.assertEqual([len(t[0][1]['rows']) for t in transactions], [2, 2, 1])
+        self.assertEqual(transactions[0][0][1]['rows'][0]['id'], 'dark_n0')
+
+    def test_write_follows_params(self):
+        rows = [{'source_id': 'a_b', 'target_id': 'c_d', 'chapter': 1, 'sentence': 2, 'position': 3}]
+        self.neo4j.write_follows('book', rows, batch_size=10)
+
+        (query, params), = self.neo4j._driver.transactions[0]
+        self.assertIn('UNWIND $rows', query)
+        self.assertEqual(params['book_id'], 'book')
+        self.assertEqual(params['weight'], 1.0)
+        self.assertEqual(params['edge_source'], 'corpus')
+
+    def test_default_batch_size(self):
+        self.neo4j.write_batch_size = 3
+        rows = [{'bond_id': str(i), 'chapter': 0, 'sentence': 0, 'position': i} for i in range(7)]
+        self.assertEqual(self.neo4j.write_contains('book', rows), 7)
+        self.assertEqual(len(self.neo4j._driver.transactions), 3)
+
+    def test_disconnected(self):
+        self.assertEqual(Neo4jData().write_bonds([Bond(adj='a', noun='b')]), 0)
+
+
+def run_tests():
+    """Run all tests and print summary."""
+    print("=" * 60)
+    print("Book Ingest Tests")
+    print("=" * 60)
+
+    loader = unittest.TestLoader()
+    suite = loader.loadTestsFromModule(sys.modules[__name__])
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    print("\n" + "=" * 60)
+    print(f"Tests run: {result.testsRun}")
+    print(f"Failures: {len(result.failures)}")
+    print(f"Errors: {len(result.errors)}")
+    print("=" * 60)
+
+    return len(result.failures) + len(result.errors)
+
+
+if __name__ == "__main__":
+    sys.exit(run_tests())
@@ -0,0 +1,140 @@
+"""
+Tests for the PostgreSQL connection pool.
+
+Uses a fake psycopg2 pool, no database required.
+
+Run with:
+    python -m storm_logos.tests.test_connection_pool
+    python storm_logos/tests/test_connection_pool.py
+"""
+
+import threading
+import unittest
+import sys
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import psycopg2
+
+# Setup path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from storm_logos.config import DatabaseConfig
+from storm_logos.data.connection_pool import ConnectionPool, PoolTimeout
+
+
+class FakePool:
+    """Stand-in for psycopg2 ThreadedConnectionPool."""
+
+    def __init__(self, minconn, maxconn, **kwargs):
+        self.idle = []
+        self.created = 0
+        self.closed_conns = []
+
+    def getconn(self):
+        if self.idle:
+            return self.idle.pop()
+        self.created += 1
+        conn = Mock()
+        conn.closed = 0
+        return conn
+
+    def putconn(self, conn, close=False):
+        if close:
+            self.closed_conns.append(conn)
+        else:
+            self.idle.append(conn)
+
+    def closeall(self):
+        self.idle.clear()
+
+
+class TestConnectionPool(unittest.TestCase):
+    """Test checkout, reuse, timeouts and broken-connection handling."""
+
+    def setUp(self):
+        patcher = patch('storm_logos.data.connection_pool.ThreadedConnectionPool', FakePool)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.pool = ConnectionPool(DatabaseConfig(), minconn=0, maxconn=2,
+                                   timeout=0.05, health_check_interval=60)
+
+    def test_connection_is_reused(self):
+        """Sequential checkouts should reuse one connection."""
+        with self.pool.connection() as first:
+            pass
+        with self.pool.connection() as second:
+            pass
+        self.assertIs(first, second)
+        self.assertEqual(self.pool._pool.created, 1)
+        self.assertEqual(self.pool.stats()['checkouts'], 2)
+
+    def test_timeout_when_exhausted(self):
+        """Checkout beyond maxconn should time out."""
+        both_held = threading.Barrier(3)
+        release = threading.Event()
+
+        def hold():
+            with self.pool.connection():
+                both_held.wait(1)
+                release.wait(1)
+
+        threads = [threading.Thread(target=hold) for _ in range(2)]
+        for t in threads:
+            t.start()
+        both_held.wait(1)
+
+        with self.assertRaises(PoolTimeout):
+            with self.pool.connection():
+                pass
+
+        release.set()
+        for t in threads:
+            t.join()
+        self.assertEqual(self.pool.stats()['timeouts'], 1)
+        self.assertEqual(self.pool.stats()['in_use'], 0)
+
+    def test_broken_connection_discarded(self):
+        """OperationalError inside the block should discard the connection."""
+        with self.assertRaises(psycopg2.OperationalError):
+            with self.pool.connection() as conn:
+                raise psycopg2.OperationalError("server closed the connection")
+
+        self.assertIn(conn, self.pool._pool.closed_conns)
+        self.assertEqual(self.pool.stats()['discarded'], 1)
+
+    def test_closed_connection_replaced(self):
+        """A connection closed while idle should be replaced on checkout."""
+        with self.pool.connection() as conn:
+            pass
+        conn.closed = 1
+
+        with self.pool.connection() as fresh:
+            pass
+        self.assertIsNot(conn, fresh)
+        self.assertEqual(self.pool.stats()['health_failures'], 1)
+
+
+def run_tests():
+    """Run all tests and print summary."""
+    print("=" * 60)
+    print("Connection Pool Tests")
+    print("=" * 60)
+
+    loader = unittest.TestLoader()
+    suite = loader.loadTestsFromModule(sys.modules[__name__])
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    print("\n" + "=" * 60)
+    print(f"Tests run: {result.testsRun}")
+    print(f"Failures: {len(result.failures)}")
+    print(f"Errors: {len(result.errors)}")
+    print("=" * 60)
+
+    return len(result.failures) + len(result.errors)
+
+
+if __name__ == "__main__":
+    sys.exit(run_tests())
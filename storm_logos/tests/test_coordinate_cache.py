@@ -0,0 +1,301 @@
+"""
+Tests for the two-tier coordinate cache.
+
+Uses an in-memory stand-in for the Redis tier, no server required.
+
+Run with:
+    python -m storm_logos.tests.test_coordinate_cache
+    python storm_logos/tests/test_coordinate_cache.py
+"""
+
+import unittest
+import sys
+from contextlib import contextmanager
+from dataclasses import replace
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# Setup path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from storm_logos.config import CacheConfig
+from storm_logos.data.bloom import BloomFilter
+from storm_logos.data.cache import CoordinateCache
+from storm_logos.data.models import Bond, WordCoordinates
+from storm_logos.data.postgres import PostgresData
+from storm_logos.tests.fakes import FakeSharedTier
+
+
+class TestCoordinateCache(unittest.TestCase):
+    """Test tiers, negative entries, LRU bound, TTL and invalidation."""
+
+    def setUp(self):
+        self.config = CacheConfig(max_size=2, ttl=60, negative_ttl=10, local_ttl=60, redis_url='')
+        self.shared = FakeSharedTier()
+        self.cache = CoordinateCache(self.config, shared=self.shared)
+        self.local_only = CoordinateCache(self.config)
+
+    def test_positive_and_negative_entries(self):
+        """Cached misses should be distinguishable from unknown keys."""
+        self.assertEqual(self.cache.lookup('bond', 'dark|forest'), (False, None))
+        self.cache.store('bond', 'dark|forest', None)
+        self.assertEqual(self.cache.lookup('bond', 'dark|forest'), (True, None))
+
+        bond = Bond(noun='forest', adj='old', A=0.1)
+        self.cache.store('bond', 'old|forest', bond)
+        self.assertEqual(self.cache.lookup('bond', 'old|forest'), (True, bond))
+
+        stats = self.cache.stats()
+        self.assertEqual(stats['hits'], 2)
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['negative_hits'], 1)
+
+    def test_shared_tier_fills_local(self):
+        """A new process should be served from the shared tier."""
+        coords = WordCoordinates('glimmer', 0.2, 0.1, 1.5, 'learned')
+        self.cache.set('glimmer', coords)
+
+        other = CoordinateCache(self.config, shared=self.shared)
+        self.assertEqual(other.get('glimmer'), coords)
+        self.assertEqual(other.stats()['shared_hits'], 1)
+        self.assertEqual(other.get('glimmer'), coords)
+        self.assertEqual(other.stats()['local_hits'], 1)
+
+    def test_lru_bound(self):
+        """Local tier should evict least recently used entries."""
+        self.local_only.store('estimate', 'a', (0.0, 0.0, 2.5))
+        self.local_only.store('estimate', 'b', (0.0, 0.0, 2.5))
+        self.local_only.lookup('estimate', 'a')
+        self.local_only.store('estimate', 'c', (0.0, 0.0, 2.5))
+
+        self.assertTrue(self.local_only.lookup('estimate', 'a')[0])
+        self.assertFalse(self.local_only.lookup('estimate', 'b')[0])
+        self.assertEqual(self.local_only.stats()['evictions'], 1)
+
+    def test_local_ttl(self):
+        """Expired local entries should be dropped."""
+        with patch('storm_logos.data.cache.time.monotonic', return_value=0.0):
+            self.local_only.store('bond', 'x|y', None)
+        with patch('storm_logos.data.cache.time.monotonic', return_value=11.0):
+            self.assertFalse(self.local_only.lookup('bond', 'x|y')[0])
+
+    def test_local_only_uses_ttl(self):
+        """Without a shared tier, positive entries should live for ttl, not local_ttl."""
+        self.local_only = CoordinateCache(replace(self.config, ttl=3600))
+        with patch('storm_logos.data.cache.time.monotonic', return_value=0.0):
+            self.local_only.store('bond', 'x|y', Bond(adj='x', noun='y'))
+        with patch('storm_logos.data.cache.time.monotonic', return_value=120.0):
+            self.assertTrue(self.local_only.lookup('bond', 'x|y')[0])
+
+    def test_invalidate_word(self):
+        """Word invalidation should clear the word's bond keys in both tiers."""
+        for key in ('dark|forest', 'old|forest', 'dark|moon'):
+            self.cache.store('bond', key, None)
+        self.cache.store('word', 'forest', None)
+
+        self.cache.invalidate_word('bond', 'forest')
+        self.assertEqual(sorted(k for _, k in self.shared.data), ['dark|moon', 'forest'])
+        self.assertFalse(self.cache.lookup('bond', 'old|forest')[0])
+        self.assertNotIn(('bond', 'forest'), self.shared.index)
+
+    def test_word_index_follows_eviction(self):
+        """Evicted keys should leave the local word index."""
+        self.local_only.store('bond', 'dark|forest', None)
+        self.local_only.store('bond', 'old|forest', None)
+        self.local_only.store('bond', 'dark|moon', None)
+
+        self.assertEqual(self.local_only.invalidate_word('bond', 'forest'), 1)
+        self.assertEqual(self.local_only.invalidate_word('bond', 'dark'), 1)
+        self.assertEqual(self.local_only._local._index, {})
+        self.assertEqual(self.local_only._local._words, {})
+
+    def test_invalidate(self):
+        """Invalidation should clear both tiers."""
+        self.cache.store('word', 'glimmer', None)
+        self.cache.invalidate('word', 'glimmer')
+        self.assertFalse(self.cache.lookup('word', 'glimmer')[0])
+        self.assertEqual(self.shared.data, {})
+
+
+class TestPostgresDataCaching(unittest.TestCase):
+    """Test cache use in lookup_bond, estimates and learn_bond."""
+
+    def setUp(self):
+        self.config = CacheConfig(max_size=100, ttl=60, negative_ttl=10, local_ttl=60, redis_url='')
+        self.cache = CoordinateCache(self.config)
+        with patch.object(PostgresData, 'load_coordinates', return_value=0):
+            self.data = PostgresData(cache=self.cache, write_behind=False)
+
+    def test_lookup_bond_cached(self):
+        """Repeated lookups, including misses, should query once."""
+        with patch.object(PostgresData, '_lookup_bond_db', return_value=None) as db:
+            self.assertIsNone(self.data.lookup_bond('Pale', 'Moon'))
+            self.assertIsNone(self.data.lookup_bond('pale', 'moon'))
+        db.assert_called_once_with('pale', 'moon')
+
+    def test_lookup_bond_error_not_cached(self):
+        """Database errors should not be cached as misses."""
+        with patch.object(PostgresData, '_lookup_bond_db', side_effect=RuntimeError):
+            self.assertIsNone(self.data.lookup_bond('pale', 'moon'))
+        self.assertFalse(self.cache.lookup('bond', 'pale|moon')[0])
+
+    def test_estimate_cached(self):
+        """Estimates should be cached per word."""
+        first = self.data.estimate_word_coordinates('unholiness')
+        self.assertEqual(self.cache.lookup('estimate', 'unholiness'), (True, first))
+
+    def test_learn_bond_invalidates(self):
+        """learn_bond should drop cached lookups for the pair."""
+        self.cache.store('bond', 'pale|moon', None)
+        self.cache.store('learned_bond', 'pale|moon', None)
+
+        conn = MagicMock()
+        conn.cursor.return_value.fetchone.return_value = (1, 0.1, 0.2, 1.5, 1)
+
+        @contextmanager
+        def fake_connection():
+            yield conn
+
+        with patch.object(self.data, '_connection', fake_connection):
+            bond = self.data.learn_bond('pale', 'moon', A=0.1, S=0.2, tau=1.5)
+
+        self.assertEqual(bond.variety, 1)
+        self.assertFalse(self.cache.lookup('bond', 'pale|moon')[0])
+        self.assertFalse(self.cache.lookup('learned_bond', 'pale|moon')[0])
+
+    def test_learn_word_invalidates_bonds(self):
+        """learn_word should drop cached corpus bonds that use the word."""
+        for key in ('glimmer|forest', 'pale|glimmer', 'pale|moon'):
+            self.cache.store('bond', key, Bond(adj=key.split('|')[0], noun=key.split('|')[1]))
+
+        conn = MagicMock()
+        conn.cursor.return_value.fetchone.return_value = (0.2, 0.1, 1.5)
+
+        @contextmanager
+        def fake_connection():
+            yield conn
+
+        with patch.object(self.data, '_connection', fake_connection):
+            self.data.learn_word('Glimmer', A=0.2, S=0.1, tau=1.5)
+
+        self.assertFalse(self.cache.lookup('bond', 'glimmer|forest')[0])
+        self.assertFalse(self.cache.lookup('bond', 'pale|glimmer')[0])
+        self.assertTrue(self.cache.lookup('bond', 'pale|moon')[0])
+
+    def test_lookup_bonds_many_one_query(self):
+        """Batch lookup should resolve all pairs in one query, aligned and cached."""
+        self.data._coordinates['bright'] = WordCoordinates(word='bright', A=0.4, S=0.2, tau=1.0)
+        self.data._coordinates['star'] = WordCoordinates(word='star', A=0.2, S=0.4, tau=2.0)
+        self.cache.store('bond', 'old|house', Bond(adj='old', noun='house', A=0.3))
+
+        cur = MagicMock()
+        # (ord, A, S, tau, in hyp_bond_vocab) for dark|forest, bright|star, pale|moon
+        cur.fetchall.return_value = [
+            (1, -0.2, 0.1, 1.5, True),
+            (2, None, None, None, True),
+            (3, None, None, None, False),
+        ]
+        conn = MagicMock()
+        conn.cursor.return_value = cur
+
+        @contextmanager
+        def fake_connection():
+            yield conn
+
+        pairs = [('Dark', 'forest'), ('bright', 'star'), ('old', 'house'),
+                 ('pale', 'moon'), ('dark', 'forest')]
+        with patch.object(self.data, '_connection', fake_connection):
+            bonds = self.data.lookup_bonds_many(pairs)
+
+        cur.execute.assert_called_once()
+        self.assertEqual(cur.execute.call_args[0][1],
+                         (['dark', 'bright', 'pale'], ['forest', 'star', 'moon']))
+
+        self.assertEqual(bonds[0].A, -0.2)
+        self.assertAlmostEqual(bonds[1].A, 0.3)
+        self.assertAlmostEqual(bonds[1].tau, 1.5)
+        self.assertEqual(bonds[2].noun, 'house')
+        self.assertIsNone(bonds[3])
+        self.assertIs(bonds[4], bonds[0])
+
+        # Fed the shared cache, misses included
+        self.assertEqual(self.cache.lookup('bond', 'bright|star')[1].A, bonds[1].A)
+        self.assertEqual(self.cache.lookup('bond', 'pale|moon'), (True, None))
+        with patch.object(PostgresData, '_lookup_bond_db') as db:
+            self.assertEqual(self.data.lookup_bond('dark', 'forest').tau, 1.5)
+        db.assert_not_called()
+
+    def test_lookup_bonds_many_error_not_cached(self):
+        """Database errors should return Nones without caching."""
+        with patch.object(PostgresData, '_lookup_bonds_many_db', side_effect=RuntimeError):
+            self.assertEqual(self.data.lookup_bonds_many([('pale', 'moon')]), [None])
+        self.assertFalse(self.cache.lookup('bond', 'pale|moon')[0])
+
+    def test_lookup_bonds_many_all_cached(self):
+        """Fully cached batches should not touch the database."""
+        self.cache.store('bond', 'pale|moon', None)
+        with patch.object(PostgresData, '_lookup_bonds_many_db') as db:
+            self.assertEqual(self.data.lookup_bonds_many([('pale', 'moon')]), [None])
+        db.assert_not_called()
+
+    def test_compute_coordinates_many_without_cache(self):
+        """Batch coordinates should not depend on the cache to avoid per-pair queries."""
+        with patch.object(PostgresData, 'load_coordinates', return_value=0):
+            data = PostgresData(cache=CoordinateCache(replace(self.config, max_size=0)), write_behind=False)
+        data._coordinates['pale'] = WordCoordinates(word='pale', A=0.4, S=0.2, tau=1.0)
+
+        found = {('dark', 'forest'): Bond(adj='dark', noun='forest', A=-0.2, S=0.1, tau=1.5),
+                 ('pale', 'moon'): None}
+        with patch.object(PostgresData, '_lookup_bonds_many_db', return_value=found) as many, \
+                patch.object(PostgresData, '_lookup_bond_db') as single, \
+                patch.object(PostgresData, 'get_learned_word', return_value=None):
+            coords = data._compute_bond_coordinates_many([('dark', 'forest'), ('pale', 'moon')])
+
+        many.assert_called_once()
+        single.assert_not_called()
+        self.assertEqual(coords, [(-0.2, 0.1, 1.5), (0.4, 0.2, 1.0)])
+
+    def test_vocab_filter_skips_lookups(self):
+        """Pairs the vocab filter rules out should not reach the cache or database."""
+        bloom = BloomFilter.create(10)
+        bloom.add('dark|forest')
+        self.data._vocab_filter = bloom
+
+        dark = Bond(adj='dark', noun='forest', A=-0.2)
+        with patch.object(PostgresData, '_lookup_bond_db', return_value=dark) as db:
+            self.assertIsNone(self.data.lookup_bond('pale', 'moon'))
+            self.assertIs(self.data.lookup_bond('dark', 'forest'), dark)
+        db.assert_called_once_with('dark', 'forest')
+
+        with patch.object(PostgresData, '_lookup_bonds_many_db', return_value={}) as many:
+            self.assertEqual(self.data.lookup_bonds_many([('pale', 'moon'), ('dark', 'forest')]),
+                             [None, dark])
+        many.assert_not_called()
+
+        self.assertFalse(self.cache.lookup('bond', 'pale|moon')[0])
+        self.assertEqual(self.data.stats()['vocab_filter_skips'], 2)
+
+
+def run_tests():
+    """Run all tests and print summary."""
+    print("=" * 60)
+    print("Coordinate Cache Tests")
+    print("=" * 60)
+
+    loader = unittest.TestLoader()
+    suite = loader.loadTestsFromModule(sys.modules[__name__])
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    print("\n" + "=" * 60)
+    print(f"Tests run: {result.testsRun}")
+    print(f"Failures: {len(result.failures)}")
+    print(f"Errors: {len(result.errors)}")
+    print("=" * 60)
+
+    return len(result.failures) + len(result.errors)
+
+
+if __name__ == "__main__":
+    sys.exit(run_tests())
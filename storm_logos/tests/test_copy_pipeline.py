@@ -0,0 +1,195 @@
+"""
+Tests for the COPY pipeline used by the PostgreSQL data loaders.
+
+Tests docker/scripts/copy_pipeline.py against a recording stand-in for
+the psycopg2 connection, no database required:
+    - CSV encoding and the file-like reader handed to COPY
+    - Source parsers (coordinates JSON, bonds CSV)
+    - Merge SQL (last row per key wins, conflict columns)
+    - Direct COPY into an empty target
+
+Run with:
+    python -m storm_logos.tests.test_copy_pipeline
+    python storm_logos/tests/test_copy_pipeline.py
+"""
+
+import io
+import unittest
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# Setup path
+ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / 'docker' / 'scripts'))
+
+from copy_pipeline import CopyLoader, _RowReader, bond_rows, coordinate_rows
+
+
+class RecordingCursor:
+    """Cursor stand-in: records statements and reads what COPY is given."""
+
+    def __init__(self, empty: bool):
+        self.empty = empty
+        self.executed = []
+        self.copied = {}
+        self.rowcount = 0
+
+    def execute(self, query, params=None):
+        self.executed.append(' '.join(query.split()))
+        if query.lstrip().startswith('INSERT'):
+            self.rowcount = 2
+
+    def fetchone(self):
+        return (self.empty,)
+
+    def copy_expert(self, sql, f):
+        chunks = []
+        while True:
+            chunk = f.read(7)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        self.copied[sql] = ''.join(chunks)
+
+    def close(self):
+        pass
+
+
+class TestRowReader(unittest.TestCase):
+    """Test the file-like view handed to copy_expert."""
+
+    def test_sized_reads(self):
+        """Sized reads should return the chunks' text in order, then ''."""
+        reader = _RowReader(iter(['abc', 'defg', 'h']))
+        self.assertEqual(reader.read(2), 'ab')
+        self.assertEqual(reader.read(4), 'cdef')
+        self.assertEqual(reader.read(10), 'gh')
+        self.assertEqual(reader.read(10), '')
+
+    def test_read_all(self):
+        """A negative size should drain every chunk."""
+        self.assertEqual(_RowReader(iter(['a', 'b', 'c'])).read(), 'abc')
+
+
+class TestParsers(unittest.TestCase):
+    """Test the source parsers."""
+
+    def test_coordinate_rows(self):
+        """Dict and list entries, the 'coordinates' wrapper and bad entries."""
+        data = {'coordinates': {
+            'Forest': {'A': 0.25, 'S': 0.5, 'tau': 1.5},
+            'dark': [-0.5, 0.0, 2],
+            'broken': [1.0],
+            'empty': {},
+        }}
+        rows = list(coordinate_rows(data, source='test'))
+        self.assertEqual(rows, [
+            ('forest', 0.25, 0.5, 1.5, 'test'),
+            ('dark', -0.5, 0.0, 2.0, 'test'),
+            ('empty', 0.0, 0.0, 2.5, 'test'),
+        ])
+
+    def test_bond_rows(self):
+        """Quoted CSV lines should be lowercased; short or bad lines skipped."""
+        lines = [
+            '"1", "Dark", "Forest", -0.2, 0.1, 1.5, "corpus"\n',
+            '"2", "pale", "moon", x, 0.1, 1.5, "corpus"\n',
+            '"3", "old"\n',
+        ]
+        self.assertEqual(list(bond_rows(lines)), [('dark', 'forest', -0.2, 0.1, 1.5)])
+
+
+class TestCopyLoader(unittest.TestCase):
+    """Test staging, merge SQL and the direct path."""
+
+    def setUp(self):
+        self.conn = MagicMock()
+        self.cur = RecordingCursor(empty=False)
+        self.conn.cursor.return_value = self.cur
+        self.loader = CopyLoader(self.conn, 'bonds', columns=['adj', 'noun', 'a'],
+                                 key=['adj', 'noun'], update=['a'],
+                                 progress_every=0, batch_rows=2)
+
+    def test_merge_keeps_last_row(self):
+        """Rows go through the stage; the merge keeps the last row per key."""
+        rows = [('dark', 'forest', 0.1), ('pale', 'moon', 0.2), ('dark', 'forest', 0.3)]
+        stats = self.loader.load(rows)
+
+        self.assertEqual(stats['mode'], 'merge')
+        self.assertEqual((stats['rows'], stats['merged']), (3, 2))
+        self.assertEqual(self.cur.copied['COPY _stage_bonds (adj, noun, a) FROM STDIN WITH (FORMAT csv)'],
+                         'dark,forest,0.1\npale,moon,0.2\ndark,forest,0.3\n')
+
+        merge = self.cur.executed[-1]
+        self.assertIn('SELECT DISTINCT ON (adj, noun) adj, noun, a FROM _stage_bonds', merge)
+        self.assertIn('ORDER BY adj, noun, _ord DESC', merge)
+        self.assertIn('ON CONFLICT (adj, noun) DO UPDATE SET a = EXCLUDED.a', merge)
+        self.conn.commit.assert_called_once()
+
+    def test_no_update_columns(self):
+        """Without update columns existing rows should be kept."""
+        loader = CopyLoader(self.conn, 'bonds', columns=['adj', 'noun'], key=['adj', 'noun'])
+        self.assertTrue(loader._merge_sql().strip().endswith('ON CONFLICT (adj, noun) DO NOTHING'))
+
+    def test_csv_quoting(self):
+        """Commas and quotes in values should survive CSV encoding."""
+        self.loader.load([('say "hi"', 'a,b', 1.0)])
+        copied = next(iter(self.cur.copied.values()))
+        self.assertEqual(copied, '"say ""hi""","a,b",1.0\n')
+
+    def test_load_csv_passthrough(self):
+        """CSV files should be passed through without the header line."""
+        stats = self.loader.load_csv(io.StringIO('adj,noun,a\ndark,forest,0.1\npale,moon,0.2\n'))
+        self.assertEqual(stats['rows'], 2)
+        self.assertEqual(next(iter(self.cur.copied.values())), 'dark,forest,0.1\npale,moon,0.2\n')
+
+    def test_direct_copy_into_empty_target(self):
+        """Unique input into an empty table should skip the stage and the merge."""
+        self.cur.empty = True
+        self.loader.unique_keys = True
+        stats = self.loader.load([('dark', 'forest', 0.1), ('pale', 'moon', 0.2)])
+
+        self.assertEqual(stats['mode'], 'direct')
+        self.assertEqual(stats['merged'], 2)
+        self.assertEqual(list(self.cur.copied), ['COPY bonds (adj, noun, a) FROM STDIN WITH (FORMAT csv)'])
+        self.assertFalse(any('_stage_' in q or q.startswith('INSERT') for q in self.cur.executed))
+
+    def test_populated_target_merges(self):
+        """Unique input into a populated table should still merge."""
+        self.loader.unique_keys = True
+        self.assertEqual(self.loader.load([('dark', 'forest', 0.1)])['mode'], 'merge')
+
+    def test_error_rolls_back(self):
+        """A failed load should roll back and re-raise."""
+        self.cur.copy_expert = MagicMock(side_effect=RuntimeError('bad row'))
+        with self.assertRaises(RuntimeError):
+            self.loader.load([('dark', 'forest', 0.1)])
+        self.conn.rollback.assert_called_once()
+        self.conn.commit.assert_not_called()
+
+
+def run_tests():
+    """Run all tests and print summary."""
+    print("=" * 60)
+    print("COPY Pipeline Tests")
+    print("=" * 60)
+
+    loader = unittest.TestLoader()
+    suite = loader.loadTestsFromModule(sys.modules[__name__])
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    print("\n" + "=" * 60)
+    print(f"Tests run: {result.testsRun}")
+    print(f"Failures: {len(result.failures)}")
+    print(f"Errors: {len(result.errors)}")
+    print("=" * 60)
+
+    return len(result.failures) + len(result.errors)
+
+
+if __name__ == "__main__":
+    sys.exit(run_tests())
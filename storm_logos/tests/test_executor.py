@@ -0,0 +1,194 @@
+"""
+Tests for StageExecutor.
+
+Run with:
+    python -m storm_logos.tests.test_executor
+    python storm_logos/tests/test_executor.py
+"""
+
+import asyncio
+import math
+import threading
+import time
+import unittest
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+# Setup path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from storm_logos.config import ExecutorConfig
+from storm_logos.orchestration.executor import StageExecutor, StageOverloaded
+
+
+class TestStageExecutor(unittest.TestCase):
+    """Test stage limits, queueing and stats."""
+
+    def setUp(self):
+        self.config = ExecutorConfig(io_workers=8, cpu_workers=0, max_queue=0)
+        self.executor = StageExecutor(self.config)
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    def test_runs_off_event_loop(self):
+        loop_thread = threading.get_ident()
+
+        async def main():
+            return await self.executor.run('llm', threading.get_ident)
+
+        self.assertNotEqual(asyncio.run(main()), loop_thread)
+
+    def test_kwargs_and_result(self):
+
+        async def main():
+            return await self.executor.run('postgres', sorted, [3, 1, 2], reverse=True)
+
+        self.assertEqual(asyncio.run(main()), [3, 2, 1])
+
+    def test_stage_limit(self):
+        self.executor = StageExecutor(replace(self.config, limits=dict(self.config.limits, llm=2)))
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def work():
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            time.sleep(0.02)
+            with lock:
+                active.pop()
+
+        async def main():
+            await asyncio.gather(*(self.executor.run('llm', work) for _ in range(6)))
+
+        asyncio.run(main())
+        self.assertLessEqual(max(peak), 2)
+
+        stats = self.executor.stats()['llm']
+        self.assertEqual(stats['completed'], 6)
+        self.assertEqual(stats['queued'], 0)
+        self.assertEqual(stats['running'], 0)
+        self.assertGreaterEqual(stats['max_queued'], 4)
+        self.assertGreater(stats['wait_seconds_total'], 0.0)
+
+    def test_full_queue_rejects(self):
+        self.executor = StageExecutor(replace(self.config, max_queue=1,
+                                                limits=dict(self.config.limits, neo4j=1)))
+
+        async def main():
+            return await asyncio.gather(
+                *(self.executor.run('neo4j', time.sleep, 0.02) for _ in range(4)),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(main())
+        rejected = [r for r in results if isinstance(r, StageOverloaded)]
+        self.assertEqual(len(rejected), 2)
+        self.assertEqual(self.executor.stats()['neo4j']['rejected'], 2)
+
+    def test_failure_counted(self):
+
+        async def main():
+            await self.executor.run('engine', int, 'not a number')
+
+        with self.assertRaises(ValueError):
+            asyncio.run(main())
+        self.assertEqual(self.executor.stats()['engine']['failed'], 1)
+
+    def test_cancelled_call_keeps_slot(self):
+        """A cancelled awaiter should hold the stage slot until its job ends."""
+        self.executor = StageExecutor(replace(self.config, limits=dict(self.config.limits, llm=1)))
+        release = threading.Event()
+        started = threading.Event()
+
+        def block():
+            started.set()
+            release.wait(5)
+
+        async def main():
+            first = asyncio.ensure_future(self.executor.run('llm', block))
+            await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+            first.cancel()
+            await asyncio.gather(first, return_exceptions=True)
+
+            second = asyncio.ensure_future(self.executor.run('llm', time.time))
+            await asyncio.sleep(0.05)
+            waiting = (second.done(), self.executor.stats()['llm']['running'])
+            release.set()
+            await second
+            return waiting
+
+        self.assertEqual(asyncio.run(main()), (False, 1))
+        stats = self.executor.stats()['llm']
+        self.assertEqual((stats['running'], stats['completed']), (0, 2))
+
+    def test_unknown_stage(self):
+        with self.assertRaises(ValueError):
+            asyncio.run(self.executor.run('gpu', int))
+
+    def test_cpu_stage_in_process_pool(self):
+        self.executor = StageExecutor(replace(self.config, cpu_workers=1))
+
+        async def main():
+            return await self.executor.run('metrics', math.factorial, 20)
+
+        self.assertEqual(asyncio.run(main()), math.factorial(20))
+        self.assertIsNotNone(self.executor._processes)
+
+    def test_cpu_stage_without_processes(self):
+
+        async def main():
+            # Closures are not picklable: only works on the thread pool
+            return await self.executor.run('nlp', lambda: 'parsed')
+
+        self.assertEqual(asyncio.run(main()), 'parsed')
+        self.assertIsNone(self.executor._processes)
+
+    def test_run_in_thread_keeps_stage_accounting(self):
+        self.executor = StageExecutor(replace(self.config, cpu_workers=1))
+        state = {'engine': 'shared'}
+
+        async def main():
+            # Closure over this process's state: thread pool even for a CPU stage
+            return await self.executor.run_in_thread('metrics', lambda: state['engine'])
+
+        self.assertEqual(asyncio.run(main()), 'shared')
+        self.assertIsNone(self.executor._processes)
+        self.assertEqual(self.executor.stats()['metrics']['completed'], 1)
+
+    def test_reused_across_event_loops(self):
+        self.executor = StageExecutor(replace(self.config, limits=dict(self.config.limits, llm=1)))
+
+        async def main():
+            return await self.executor.run('llm', len, 'abc')
+
+        self.assertEqual(asyncio.run(main()), 3)
+        self.assertEqual(asyncio.run(main()), 3)
+
+
+def run_tests():
+    """Run all tests and print summary."""
+    print("=" * 60)
+    print("Stage Executor Tests")
+    print("=" * 60)
+
+    loader = unittest.TestLoader()
+    suite = loader.loadTestsFromModule(sys.modules[__name__])
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    print("\n" + "=" * 60)
+    print(f"Tests run: {result.testsRun}")
+    print(f"Failures: {len(result.failures)}")
+    print(f"Errors: {len(result.errors)}")
+    print("=" * 60)
+
+    return len(result.failures) + len(result.errors)
+
+
+if __name__ == "__main__":
+    sys.exit(run_tests())
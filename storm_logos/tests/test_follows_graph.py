@@ -0,0 +1,235 @@
+"""
+Tests for FollowsGraph and Neo4jData's use of it.
+
+Neo4j is replaced by a fake driver that answers the bulk and
+incremental queries from in-memory records.
+
+Run with:
+    python -m storm_logos.tests.test_follows_graph
+    python storm_logos/tests/test_follows_graph.py
+"""
+
+import time
+import unittest
+import sys
+from pathlib import Path
+
+# Setup path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from storm_logos.data.follows_graph import FollowsGraph
+from storm_logos.data.neo4j import Neo4jData
+
+
+def node(bond_id, A=0.0, S=0.0, tau=2.0):
+    adj, _, noun = bond_id.rpartition('_')
+    return {'id': bond_id, 'adj': adj or None, 'noun': noun, 'A': A, 'S': S, 'tau': tau}
+
+
+def changed(source, target, weight, ts):
+    record = {'source': source, 'target': target, 'weight': weight, 'ts': ts}
+    for prefix, bond_id in (('source', source), ('target', target)):
+        for key, value in node(bond_id).items():
+            if key != 'id':
+                record[f'{prefix}_{key}'] = value
+    return record
+
+
+class FakeResult(list):
+    def consume(self):
+        return None
+
+
+class FakeSession:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def run(self, query, **params):
+        self.driver.queries.append(query)
+        if 'CREATE INDEX' in query:
+            return FakeResult()
+        if 'MATCH (b:Bond)\n' in query:
+            return list(self.driver.nodes)
+        if '$since' in query:
+            return [r for r in self.driver.changes if r['ts'] >= params['since']]
+        if 'UNWIND $bond_ids' in query:
+            return [{'bond_id': bond_id, 'next.adj': 'live', 'next.noun': 'hit',
+                     'next.A': 0.0, 'next.S': 0.0, 'next.tau': 2.0}
+                    for bond_id in params['bond_ids']]
+        return list(self.driver.edges)
+
+
+class FakeDriver:
+    def __init__(self):
+        self.nodes = [node('dark_forest'), node('old_tree', A=0.5), node('light', tau=0.0)]
+        self.edges = [
+            {'source': 'dark_forest', 'target': 'old_tree', 'weight': 0.3, 'ts': 100},
+            {'source': 'dark_forest', 'target': 'light', 'weight': 0.9, 'ts': 200},
+            {'source': 'old_tree', 'target': 'light', 'weight': 1.0, 'ts': None},
+        ]
+        self.changes = []
+        self.queries = []
+
+    def session(self):
+        return FakeSession(self)
+
+    def close(self):
+        pass
+
+
+class TestFollowsGraph(unittest.TestCase):
+    """Test the CSR adjacency."""
+
+    def setUp(self):
+        self.driver = FakeDriver()
+        self.graph = FollowsGraph(self.driver, max_staleness=1e9, reload_interval=0)
+        self.graph.load()
+
+    def test_followers_by_weight(self):
+        followers = self.graph.get_followers('dark_forest')
+        self.assertEqual([b.noun for b in followers], ['light', 'tree'])
+        self.assertEqual(followers[1].adj, 'old')
+        self.assertAlmostEqual(followers[1].A, 0.5)
+        # Missing tau gets the same default as the Neo4j query path
+        self.assertAlmostEqual(followers[0].tau, 2.5)
+
+    def test_limit(self):
+        self.assertEqual(len(self.graph.get_followers('dark_forest', limit=1)), 1)
+
+    def test_known_bond_without_edges(self):
+        self.assertEqual(self.graph.get_followers('light'), [])
+
+    def test_unknown_bond_is_miss(self):
+        self.assertIsNone(self.graph.get_followers('bright_sun'))
+        self.assertEqual(self.graph.stats()['misses'], 1)
+
+    def test_incremental_refresh(self):
+        self.driver.changes = [
+            changed('dark_forest', 'old_tree', 1.0, 250),   # reinforced
+            changed('light', 'bright_sun', 0.2, 300),       # new nodes + edge
+            changed('dark_forest', 'light', 0.9, 50),       # older than watermark
+        ]
+        self.assertEqual(self.graph.refresh(), 2)
+
+        self.assertEqual([b.noun for b in self.graph.get_followers('dark_forest')],
+                         ['tree', 'light'])
+        self.assertEqual([b.noun for b in self.graph.get_followers('light')], ['sun'])
+        self.assertEqual(self.graph.get_followers('bright_sun'), [])
+        self.assertEqual(self.graph.stats()['delta_edges'], 2)
+
+    def test_compaction_keeps_delta_weights(self):
+        self.graph.delta_max = 0
+        self.graph.apply_changes([changed('dark_forest', 'old_tree', 1.0, 300),
+                                  changed('light', 'bright_sun', 0.2, 300)])
+
+        stats = self.graph.stats()
+        self.assertEqual(stats['delta_edges'], 0)
+        self.assertEqual(stats['n_edges'], 4)
+        self.assertEqual([b.noun for b in self.graph.get_followers('dark_forest')],
+                         ['tree', 'light'])
+        self.assertEqual([b.noun for b in self.graph.get_followers('light')], ['sun'])
+
+    def test_reads_never_query(self):
+        self.graph.max_staleness = 0.0
+        n_queries = len(self.driver.queries)
+        self.graph.get_followers('dark_forest')
+        self.assertEqual(len(self.driver.queries), n_queries)
+
+    def test_changed_query_uses_indexed_predicates(self):
+        self.graph.refresh()
+        query = self.driver.queries[-1]
+        self.assertIn('f.last_used >= datetime', query)
+        self.assertIn('f.created_at >= datetime', query)
+        self.assertNotIn('coalesce(f.last_used, f.created_at) >=', query)
+
+
+class TestFollowsGraphBackground(unittest.TestCase):
+    """Test the background load/refresh thread."""
+
+    def setUp(self):
+        self.driver = FakeDriver()
+        self.graph = FollowsGraph(self.driver, max_staleness=0.01, reload_interval=0)
+        self.addCleanup(self.graph.stop)
+
+    def test_unloaded_graph_answers_none(self):
+        self.assertIsNone(self.graph.get_followers('dark_forest'))
+        self.assertEqual(self.driver.queries, [])
+
+    def test_load_and_refresh_in_background(self):
+        self.driver.changes = [changed('light', 'old_tree', 0.5, 500)]
+        self.graph.start()
+        self.assertTrue(self.graph.wait_loaded(5))
+        self.assertTrue(any('CREATE INDEX' in q for q in self.driver.queries))
+
+        for _ in range(500):
+            if self.graph.refreshes:
+                break
+            time.sleep(0.01)
+        self.assertEqual([b.noun for b in self.graph.get_followers('light')], ['tree'])
+
+
+class TestNeo4jFollowsCache(unittest.TestCase):
+    """Test Neo4jData serving followers from the graph."""
+
+    def setUp(self):
+        self.driver = FakeDriver()
+        self.neo4j = Neo4jData()
+        self.neo4j._driver = self.driver
+        self.neo4j._connected = True
+        self.neo4j.follows_cache_enabled = True
+        self.addCleanup(self.neo4j.close)
+
+    def load_graph(self):
+        self.assertTrue(self.neo4j.follows_graph.wait_loaded(5))
+
+    def test_hit_served_from_memory(self):
+        self.load_graph()
+        followers = self.neo4j.get_followers('dark_forest')
+        self.assertEqual([b.noun for b in followers], ['light', 'tree'])
+        n_queries = len(self.driver.queries)
+        self.neo4j.get_followers('old_tree')
+        self.assertEqual(len(self.driver.queries), n_queries)
+
+    def test_miss_falls_back_to_neo4j(self):
+        self.load_graph()
+        followers = self.neo4j.get_followers_many(['dark_forest', 'bright_sun'])
+        self.assertEqual(len(followers['dark_forest']), 2)
+        self.assertEqual([b.adj for b in followers['bright_sun']], ['live'])
+        self.assertIn('UNWIND $bond_ids', self.driver.queries[-1])
+
+    def test_disabled(self):
+        self.neo4j.follows_cache_enabled = False
+        followers = self.neo4j.get_followers('dark_forest')
+        self.assertEqual([b.adj for b in followers], ['live'])
+        self.assertIsNone(self.neo4j.follows_graph)
+
+
+def run_tests():
+    """Run all tests and print summary."""
+    print("=" * 60)
+    print("FOLLOWS Graph Tests")
+    print("=" * 60)
+
+    loader = unittest.TestLoader()
+    suite = loader.loadTestsFromModule(sys.modules[__name__])
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    print("\n" + "=" * 60)
+    print(f"Tests run: {result.testsRun}")
+    print(f"Failures: {len(result.failures)}")
+    print(f"Errors: {len(result.errors)}")
+    print("=" * 60)
+
+    return len(result.failures) + len(result.errors)
+
+
+if __name__ == "__main__":
+    sys.exit(run_tests())
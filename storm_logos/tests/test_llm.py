@@ -0,0 +1,329 @@
+"""
+Tests for the LLM client layer.
+
+Run with:
+    python -m storm_logos.tests.test_llm
+    python storm_logos/tests/test_llm.py
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+import sys
+from pathlib import Path
+
+# Setup path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from storm_logos.config import LLMConfig
+from storm_logos.llm import (
+    Completion, FakeBackend, LLMClient, LLMError, LLMTimeout, OllamaBackend,
+    TokenUsage, create_backend,
+)
+from storm_logos.llm.base import Backend, wrap_error
+
+
+class TestLLMClient(unittest.TestCase):
+    """Test completion, retries, deadlines and accounting."""
+
+    def setUp(self):
+        self.config = LLMConfig(timeout=5.0, max_retries=2, backoff_base=0.001, backoff_max=0.01)
+        self.backend = FakeBackend()
+        self.llm = LLMClient(self.backend, config=self.config, usage=TokenUsage())
+
+    def test_generate_sync(self):
+        self.backend.responses = ['Tell me more.']
+        self.assertEqual(self.llm.generate('system', 'hello'), 'Tell me more.')
+        call = self.backend.calls[0]
+        self.assertEqual(call['system'], 'system')
+        self.assertEqual(call['messages'], [{'role': 'user', 'content': 'hello'}])
+
+    def test_complete_async(self):
+        async def main():
+            return await self.llm.complete('', 'the dark forest', max_tokens=20)
+
+        completion = asyncio.run(main())
+        self.assertEqual(completion.text, '[fake] the dark forest')
+        self.assertEqual(completion.input_tokens, 3)
+        self.assertEqual(completion.output_tokens, 4)
+        self.assertEqual(completion.attempts, 1)
+
+    def test_multi_turn_messages(self):
+        messages = [
+            {'role': 'user', 'content': 'I dreamt of water'},
+            {'role': 'assistant', 'content': 'What kind of water?'},
+            {'role': 'user', 'content': 'a flood'},
+        ]
+        completion = self.llm.complete_sync('dreamer', messages=messages)
+        self.assertEqual(completion.text, '[fake] a flood')
+        self.assertEqual(len(self.backend.calls[0]['messages']), 3)
+
+    def test_retries_transient_failures(self):
+        self.backend.responses = ['ok']
+        self.backend.failures = 2
+        completion = self.llm.complete_sync('', 'hi')
+        self.assertEqual(completion.text, 'ok')
+        self.assertEqual(completion.attempts, 3)
+
+        stats = self.llm.usage.stats()['fake:fake']
+        self.assertEqual(stats['calls'], 1)
+        self.assertEqual(stats['errors'], 2)
+        self.assertEqual(stats['retries'], 2)
+
+    def test_retries_exhausted(self):
+        self.backend.failures = 5
+        self.config.max_retries = 1
+        with self.assertRaises(LLMError) as ctx:
+            self.llm.complete_sync('', 'hi')
+        self.assertTrue(ctx.exception.retryable)
+        self.assertEqual(len(self.backend.calls), 2)
+
+    def test_permanent_error_not_retried(self):
+        self.backend.failures = 1
+        self.backend.status = 400
+        with self.assertRaises(LLMError) as ctx:
+            self.llm.complete_sync('', 'hi')
+        self.assertFalse(ctx.exception.retryable)
+        self.assertEqual(len(self.backend.calls), 1)
+
+    def test_deadline(self):
+        self.backend.latency = 0.5
+        with self.assertRaises(LLMTimeout):
+            self.llm.complete_sync('', 'hi', timeout=0.05)
+        self.assertEqual(self.llm.usage.stats()['total']['timeouts'], 1)
+
+    def test_token_accounting(self):
+        self.backend.responses = ['one two three']
+        for _ in range(3):
+            self.llm.generate('sys', 'a b')
+
+        stats = self.llm.usage.stats()
+        self.assertEqual(stats['fake:fake']['calls'], 3)
+        self.assertEqual(stats['fake:fake']['input_tokens'], 9)
+        self.assertEqual(stats['fake:fake']['output_tokens'], 9)
+        self.assertEqual(stats['total']['calls'], 3)
+
+    def test_stream(self):
+        self.backend.responses = ['the water rises slowly']
+
+        async def main():
+            completion = Completion('', self.llm.model, self.llm.provider)
+            chunks = [c async for c in self.llm.stream('', 'hi', completion=completion)]
+            return chunks, completion
+
+        chunks, completion = asyncio.run(main())
+        self.assertEqual(len(chunks), 4)
+        self.assertEqual(''.join(chunks), 'the water rises slowly')
+        self.assertEqual(completion.text, 'the water rises slowly')
+        self.assertEqual(completion.output_tokens, 4)
+        self.assertEqual(self.llm.usage.stats()['fake:fake']['calls'], 1)
+
+    def test_stream_retries_before_first_chunk(self):
+        self.backend.responses = ['ok']
+        self.backend.failures = 1
+
+        async def main():
+            return [c async for c in self.llm.stream('', 'hi')]
+
+        self.assertEqual(asyncio.run(main()), ['ok'])
+
+    def test_concurrent_threads(self):
+        self.backend.latency = 0.01
+        results = []
+
+        def worker(i):
+            results.append(self.llm.generate('', f'msg {i}'))
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(sorted(results), sorted(f'[fake] msg {i}' for i in range(8)))
+
+
+class ScriptedBackend(FakeBackend):
+    """FakeBackend with per-call (latency, text) scripts."""
+
+    def __init__(self, script):
+        super().__init__()
+        self.script = list(script)
+
+    async def complete(self, system, messages, max_tokens, temperature, timeout):
+        latency, text = self.script[len(self.calls) % len(self.script)]
+        self.calls.append({'messages': messages})
+        await asyncio.sleep(latency)
+        if text is None:
+            raise LLMError('injected failure', self.provider, retryable=False)
+        return Completion(text, self.model, self.provider, output_tokens=len(text.split()))
+
+
+class TestBestOf(unittest.TestCase):
+    """Concurrent candidates with early exit and hedging."""
+
+    def setUp(self):
+        self.config = LLMConfig(timeout=5.0, max_retries=2, backoff_base=0.001, backoff_max=0.01)
+        self.backend = ScriptedBackend([])
+        self.llm = LLMClient(self.backend, config=self.config, usage=TokenUsage())
+
+    def score(self, text: str) -> float:
+        return len(text.split()) / 10
+
+    def test_early_exit_on_threshold(self):
+        self.backend.script = [
+            (0.5, 'slow but very long answer with many many words'),
+            (0.01, 'fast answer with enough words to pass'),
+            (0.5, 'slow'),
+        ]
+        started = time.monotonic()
+        completion, score = self.llm.best_of_sync('', 'hi', n=3, score=self.score, threshold=0.5)
+        self.assertEqual(completion.text, 'fast answer with enough words to pass')
+        self.assertGreaterEqual(score, 0.5)
+        self.assertLess(time.monotonic() - started, 0.4)
+        self.assertEqual(len(self.backend.calls), 3)
+
+    def test_best_when_none_pass(self):
+        self.backend.script = [(0.01, 'one two'), (0.02, 'one two three'), (0.01, 'one')]
+        completion, score = self.llm.best_of_sync('', 'hi', n=3, score=self.score, threshold=0.9)
+        self.assertEqual(completion.text, 'one two three')
+        self.assertAlmostEqual(score, 0.3)
+
+    def test_failed_candidates_skipped(self):
+        self.backend.script = [(0.01, None), (0.02, 'fine')]
+        completion, _ = self.llm.best_of_sync('', 'hi', n=2, score=self.score, threshold=0.9)
+        self.assertEqual(completion.text, 'fine')
+
+    def test_all_failed(self):
+        self.backend.script = [(0.01, None)]
+        with self.assertRaises(LLMError):
+            self.llm.best_of_sync('', 'hi', n=2, score=self.score)
+
+    def test_hedge_after_percentile(self):
+        self.backend.script = [(0.6, 'stuck request'), (0.01, 'hedged answer is good enough')]
+        self.llm._latencies.extend([0.05] * 20)
+
+        started = time.monotonic()
+        completion, _ = self.llm.best_of_sync('', 'hi', n=1, score=self.score,
+                                              threshold=0.3, hedge_percentile=0.9)
+        self.assertEqual(completion.text, 'hedged answer is good enough')
+        self.assertLess(time.monotonic() - started, 0.5)
+        self.assertEqual(self.llm.usage.stats()['total']['hedges'], 1)
+
+    def test_no_hedge_without_history(self):
+        self.backend.script = [(0.05, 'only answer')]
+        self.llm.best_of_sync('', 'hi', n=1, score=self.score, hedge_percentile=0.9)
+        self.assertEqual(len(self.backend.calls), 1)
+        self.assertIsNone(LLMClient(FakeBackend(), config=self.config).latency_percentile(0.9))
+
+
+class TestBackendSelection(unittest.TestCase):
+    """Test model spec parsing and error classification."""
+
+    def test_fake_spec(self):
+        self.assertIsInstance(create_backend('fake'), FakeBackend)
+
+    def test_ollama_spec(self):
+        backend = create_backend('mistral:7b', base_url='http://ollama:11434/')
+        self.assertIsInstance(backend, OllamaBackend)
+        self.assertEqual(backend.model, 'mistral:7b')
+        self.assertEqual(backend.base_url, 'http://ollama:11434')
+
+    def test_missing_key(self):
+        import os
+        saved = os.environ.pop('GROQ_API_KEY', None)
+        try:
+            with self.assertRaises(ValueError):
+                create_backend('groq:llama-3.3-70b-versatile')
+        finally:
+            if saved is not None:
+                os.environ['GROQ_API_KEY'] = saved
+
+    def test_wrap_error(self):
+        self.assertTrue(wrap_error(ConnectionError('reset'), 'x').retryable)
+        self.assertFalse(wrap_error(ValueError('bad'), 'x').retryable)
+
+        class StatusError(Exception):
+            status_code = 429
+
+        self.assertTrue(wrap_error(StatusError(), 'x').retryable)
+
+    def test_backend_requires_complete(self):
+        class Incomplete(Backend):
+            pass
+
+        with self.assertRaises(TypeError):
+            Incomplete('model')
+
+
+class TestApplications(unittest.TestCase):
+    """Applications route through the shared client."""
+
+    def setUp(self):
+        self.config = LLMConfig(timeout=5.0, max_retries=2, backoff_base=0.001, backoff_max=0.01)
+        self.backend = FakeBackend()
+        self.llm = LLMClient(self.backend, config=self.config, usage=TokenUsage())
+
+    def test_dream_engine_uses_client(self):
+        from storm_logos.applications.dream import DreamEngine
+        self.backend.responses = ['A shadow figure.']
+        engine = DreamEngine(model='fake', llm=self.llm)
+        self.assertEqual(engine._call_llm('sys', 'dream'), 'A shadow figure.')
+
+    def test_dream_engine_error_string(self):
+        from storm_logos.applications.dream import DreamEngine
+        self.backend.failures = 5
+        self.config.max_retries = 0
+        engine = DreamEngine(model='fake', llm=self.llm)
+        self.assertTrue(engine._call_llm('sys', 'dream').startswith('[Fake error:'))
+
+    def test_therapist_candidates(self):
+        from unittest.mock import Mock
+        from storm_logos.applications.therapist import Therapist
+        from storm_logos.config import TherapistConfig
+        from storm_logos.data.models import SemanticState
+
+        llm = LLMClient(ScriptedBackend([
+            (0.01, 'Safe space, growth.'),
+            (0.02, 'You keep saying fine, but your voice drops.'),
+        ]), config=self.config, usage=TokenUsage())
+        therapist = Therapist(model='fake', metrics=Mock(), dialectic=Mock(), llm=llm,
+                              config=TherapistConfig(candidates=2, hedge_percentile=0))
+        turn = {'system': 's', 'user': 'u', 'max_tokens': 50,
+                'state': SemanticState(), 'dial': {}}
+        self.assertEqual(therapist._generate_candidates(turn),
+                         'You keep saying fine, but your voice drops.')
+        self.assertIs(therapist.fork().config, therapist.config)
+
+    def test_renderer_uses_client(self):
+        from storm_logos.generation.renderer import Renderer
+        self.backend.responses = ['Rendered.']
+        renderer = Renderer(model='fake', llm=self.llm)
+        self.assertEqual(renderer.render([]), 'Rendered.')
+        self.assertEqual(self.backend.calls[0]['system'], '')
+
+
+def run_tests():
+    """Run all tests and print summary."""
+    print("=" * 60)
+    print("LLM Client Tests")
+    print("=" * 60)
+
+    loader = unittest.TestLoader()
+    suite = loader.loadTestsFromModule(sys.modules[__name__])
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    print("\n" + "=" * 60)
+    print(f"Tests run: {result.testsRun}")
+    print(f"Failures: {len(result.failures)}")
+    print(f"Errors: {len(result.errors)}")
+    print("=" * 60)
+
+    return len(result.failures) + len(result.errors)
+
+
+if __name__ == "__main__":
+    sys.exit(run_tests())
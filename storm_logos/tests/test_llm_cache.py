@@ -0,0 +1,171 @@
+"""
+Tests for the LLM response cache.
+
+Run with:
+    python -m storm_logos.tests.test_llm_cache
+    python storm_logos/tests/test_llm_cache.py
+"""
+
+import asyncio
+import time
+import unittest
+import sys
+from dataclasses import replace
+from pathlib import Path
+from unittest.mock import patch
+
+# Setup path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from storm_logos.config import LLMConfig
+from storm_logos.llm import FakeBackend, LLMClient, ResponseCache, TokenUsage
+from storm_logos.llm.cache import fingerprint
+from storm_logos.tests.fakes import FakeSharedTier
+
+
+MESSAGES = [{'role': 'user', 'content': 'Symbol: "dark forest"'}]
+
+
+class TestFingerprint(unittest.TestCase):
+    """Normalized prompt + model + parameters."""
+
+    def test_whitespace_and_case_normalized(self):
+        a = fingerprint('groq:m', 'You are  an analyst.\n', MESSAGES, 100, 0.7)
+        b = fingerprint('groq:m', 'you are an analyst.',
+                        [{'role': 'user', 'content': 'Symbol:  "Dark Forest"'}], 100, 0.7)
+        self.assertEqual(a, b)
+
+    def test_model_and_params_distinguish(self):
+        base = fingerprint('groq:m', 's', MESSAGES, 100, 0.7)
+        self.assertNotEqual(base, fingerprint('claude:m', 's', MESSAGES, 100, 0.7))
+        self.assertNotEqual(base, fingerprint('groq:m', 's', MESSAGES, 200, 0.7))
+        self.assertNotEqual(base, fingerprint('groq:m', 's', MESSAGES, 100, 0.2))
+
+
+class TestResponseCache(unittest.TestCase):
+    """Hits, bypass, bounds and the shared tier."""
+
+    def setUp(self):
+        self.config = LLMConfig(timeout=5.0, max_retries=0, cache_size=2, cache_ttl=60,
+                                cache_redis_url='')
+        self.cache = ResponseCache(self.config)
+        self.backend = FakeBackend()
+        self.llm = LLMClient(self.backend, config=self.config, usage=TokenUsage(), cache=self.cache)
+
+    def test_hit_skips_backend(self):
+        self.backend.responses = ['shadow']
+        first = self.llm.complete_sync('system', 'dark forest', cache=True)
+        second = self.llm.complete_sync('System', '  dark   forest ', cache=True)
+
+        self.assertFalse(first.cached)
+        self.assertTrue(second.cached)
+        self.assertEqual(second.text, 'shadow')
+        self.assertEqual(len(self.backend.calls), 1)
+
+        stats = self.cache.stats()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['hit_rate'], 0.5)
+
+    def test_bypass(self):
+        self.backend.responses = ['one', 'two']
+        self.assertEqual(self.llm.generate('s', 'u', cache=True), 'one')
+        self.assertEqual(self.llm.generate('s', 'u'), 'two')
+        self.assertEqual(len(self.backend.calls), 2)
+        self.assertEqual(self.cache.stats()['hits'], 0)
+
+    def test_errors_not_cached(self):
+        self.backend.responses = ['ok']
+        self.backend.failures, self.backend.status = 1, 400
+        with self.assertRaises(Exception):
+            self.llm.generate('s', 'u', cache=True)
+        self.assertEqual(self.llm.generate('s', 'u', cache=True), 'ok')
+        self.assertEqual(self.cache.stats()['stores'], 1)
+
+    def test_size_bound(self):
+        for word in ('river', 'tower', 'cave'):
+            self.llm.generate('s', word, cache=True)
+        self.assertEqual(self.cache.stats()['size'], 2)
+        self.assertEqual(self.cache.stats()['evictions'], 1)
+
+    def test_ttl(self):
+        self.llm._cache = ResponseCache(replace(self.config, cache_ttl=0.05))
+        self.llm.generate('s', 'u', cache=True)
+        time.sleep(0.1)
+        self.llm.generate('s', 'u', cache=True)
+        self.assertEqual(len(self.backend.calls), 2)
+
+    def test_shared_tier(self):
+        shared = FakeSharedTier()
+        self.backend.responses = ['mother']
+        self.llm._cache = ResponseCache(self.config, shared=shared)
+        self.llm.generate('s', 'old house', cache=True)
+
+        # Another worker with an empty local tier
+        reader_cache = ResponseCache(self.config, shared=shared)
+        reader = LLMClient(FakeBackend(responses=['different']), config=self.config,
+                           usage=TokenUsage(), cache=reader_cache)
+        self.assertEqual(reader.generate('s', 'old house', cache=True), 'mother')
+        self.assertEqual(len(reader.backend.calls), 0)
+        self.assertEqual(reader_cache.stats()['shared_hits'], 1)
+
+    def test_shared_tier_off_event_loop(self):
+        """With a shared tier, async lookups and stores should run in a thread."""
+        self.llm._cache = ResponseCache(self.config, shared=FakeSharedTier())
+        with patch('storm_logos.llm.client.asyncio.to_thread', wraps=asyncio.to_thread) as to_thread:
+            asyncio.run(self.llm.complete('s', 'u', cache=True))
+        self.assertEqual([c.args[0].__name__ for c in to_thread.call_args_list], ['lookup', 'store'])
+
+    def test_disabled(self):
+        llm = LLMClient(self.backend, config=replace(self.config, cache_enabled=False), usage=TokenUsage())
+        llm.generate('s', 'u', cache=True)
+        llm.generate('s', 'u', cache=True)
+        self.assertIsNone(llm.response_cache)
+        self.assertEqual(len(self.backend.calls), 2)
+
+
+class TestDreamEngineCaching(unittest.TestCase):
+    """Archetype detection reuses answers for repeated symbols."""
+
+    def test_symbol_detection_cached(self):
+        from storm_logos.applications.dream import DreamEngine
+        from storm_logos.metrics.analyzers.archetype import ArchetypeAnalyzer
+
+        config = LLMConfig(timeout=5.0, max_retries=0, cache_size=100, cache_redis_url='')
+        llm = LLMClient(FakeBackend(responses=['{"archetype": "shadow", "interpretation": "unknown"}']),
+                        config=config, usage=TokenUsage(), cache=ResponseCache(config))
+        engine = DreamEngine(model='fake', llm=llm)
+        analyzer = ArchetypeAnalyzer(llm_caller=engine._call_llm_short)
+
+        for _ in range(3):
+            self.assertEqual(analyzer._detect_archetype_via_llm('murky swamp', -0.3, 0.1)[0], 'shadow')
+        self.assertEqual(len(llm.backend.calls), 1)
+
+        engine._call_llm('s', 'a conversational turn', use_cache=False)
+        engine._call_llm('s', 'a conversational turn', use_cache=False)
+        self.assertEqual(len(llm.backend.calls), 3)
+
+
+def run_tests():
+    """Run all tests and print summary."""
+    print("=" * 60)
+    print("LLM Response Cache Tests")
+    print("=" * 60)
+
+    loader = unittest.TestLoader()
+    suite = loader.loadTestsFromModule(sys.modules[__name__])
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    print("\n" + "=" * 60)
+    print(f"Tests run: {result.testsRun}")
+    print(f"Failures: {len(result.failures)}")
+    print(f"Errors: {len(result.errors)}")
+    print("=" * 60)
+
+    return len(result.failures) + len(result.errors)
+
+
+if __name__ == "__main__":
+    sys.exit(run_tests())
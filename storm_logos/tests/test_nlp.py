@@ -0,0 +1,123 @@
+"""
+Tests for the shared spaCy pipeline service.
+
+Run with:
+    python -m storm_logos.tests.test_nlp
+    python storm_logos/tests/test_nlp.py
+"""
+
+import unittest
+import sys
+from dataclasses import replace
+from pathlib import Path
+from unittest.mock import patch
+
+# Setup path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import spacy
+
+from storm_logos.config import NLPConfig
+from storm_logos.data.nlp import NLPService
+
+
+class TestNLPService(unittest.TestCase):
+    """Parsing, batching and the recent-docs LRU."""
+
+    def setUp(self):
+        self.config = NLPConfig(model='en_core_web_sm', exclude=['ner'], batch_size=8,
+                                n_process=1, doc_cache_size=4)
+        self.nlp = NLPService(config=self.config, nlp=spacy.blank('en'))
+
+    def test_parse_cached(self):
+        first = self.nlp.parse('The dark forest held ancient secrets.')
+        second = self.nlp.parse('The dark forest held ancient secrets.')
+
+        self.assertIs(first, second)
+        stats = self.nlp.stats()
+        self.assertEqual(stats['parsed'], 1)
+        self.assertEqual(stats['cache_hits'], 1)
+        self.assertEqual(stats['cache_misses'], 1)
+
+    def test_parse_uncached(self):
+        self.assertIsNot(self.nlp.parse('a river', cache=False), self.nlp.parse('a river', cache=False))
+
+        disabled = NLPService(config=replace(self.config, doc_cache_size=0), nlp=spacy.blank('en'))
+        self.assertIsNot(disabled.parse('a river'), disabled.parse('a river'))
+
+    def test_long_texts_not_cached(self):
+        text = 'word ' * NLPService.MAX_CACHED_CHARS
+        self.nlp.parse(text)
+        self.nlp.parse(text)
+        self.assertEqual(self.nlp.stats()['parsed'], 2)
+        self.assertEqual(self.nlp.stats()['cache_size'], 0)
+
+    def test_parse_many_order_and_reuse(self):
+        cached = self.nlp.parse('old house')
+
+        texts = ['cold water', 'old house', 'cold water', 'bright tower']
+        docs = self.nlp.parse_many(texts)
+
+        self.assertEqual([doc.text for doc in docs], texts)
+        self.assertIs(docs[1], cached)
+        self.assertIs(docs[0], docs[2])
+        # 'old house' from the LRU, the duplicate 'cold water' parsed once
+        self.assertEqual(self.nlp.stats()['parsed'], 3)
+
+    def test_pipe_streams_uncached(self):
+        docs = list(self.nlp.pipe(['one chunk', 'two chunk'], batch_size=1))
+        self.assertEqual([doc.text for doc in docs], ['one chunk', 'two chunk'])
+        self.assertEqual(self.nlp.stats()['cache_size'], 0)
+
+    def test_lru_bound(self):
+        self.nlp = NLPService(config=replace(self.config, doc_cache_size=2), nlp=spacy.blank('en'))
+        for text in ('a', 'b', 'c'):
+            self.nlp.parse(text)
+        self.assertEqual(self.nlp.stats()['cache_size'], 2)
+
+
+class TestLoading(unittest.TestCase):
+    """Lazy, trimmed loading."""
+
+    def test_lazy_load_with_exclude(self):
+        config = NLPConfig(model='en_core_web_sm', exclude=['ner', 'textcat'])
+        nlp = NLPService(config=config)
+        self.assertFalse(nlp.loaded)
+
+        with patch.object(spacy, 'load', return_value=spacy.blank('en')) as load:
+            nlp.parse('hello')
+            nlp.parse('world')
+
+        load.assert_called_once_with('en_core_web_sm', exclude=['ner', 'textcat'])
+        self.assertTrue(nlp.loaded)
+
+    def test_missing_model(self):
+        nlp = NLPService(model='no_such_model_xx', config=NLPConfig())
+        self.assertFalse(nlp.available())
+        with self.assertRaises(OSError):
+            nlp.parse('hello')
+
+
+def run_tests():
+    """Run all tests and print summary."""
+    print("=" * 60)
+    print("NLP Service Tests")
+    print("=" * 60)
+
+    loader = unittest.TestLoader()
+    suite = loader.loadTestsFromModule(sys.modules[__name__])
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    print("\n" + "=" * 60)
+    print(f"Tests run: {result.testsRun}")
+    print(f"Failures: {len(result.failures)}")
+    print(f"Errors: {len(result.errors)}")
+    print("=" * 60)
+
+    return len(result.failures) + len(result.errors)
+
+
+if __name__ == "__main__":
+    sys.exit(run_tests())
@@ -0,0 +1,242 @@
+"""
+Tests for PostgresData in-memory lookups.
+
+Bonds are added directly, no database required.
+
+Run with:
+    python -m storm_logos.tests.test_postgres_data
+    python storm_logos/tests/test_postgres_data.py
+"""
+
+import threading
+import unittest
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# Setup path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from storm_logos.data.models import Bond
+from storm_logos.data.postgres import PostgresData
+from storm_logos.data.word_table import WordTable
+
+
+class TestBondIndexes(unittest.TestCase):
+    """Test get_bond, get_bonds_many and get_bonds_for_noun."""
+
+    def setUp(self):
+        # PostgresData without touching the database
+        with patch.object(PostgresData, 'load_coordinates', return_value=0):
+            self.data = PostgresData()
+        self.data.add_bond(Bond(adj="dark", noun="forest", variety=50, A=-0.2, S=0.1, tau=1.5))
+        self.data.add_bond(Bond(adj="old", noun="forest", variety=30, A=0.1, S=0.2, tau=1.5))
+        self.data.add_bond(Bond(adj="old", noun="house", variety=20, A=0.3, S=0.0, tau=1.2))
+
+    def test_get_bond(self):
+        """Lookup should be case-insensitive."""
+        bond = self.data.get_bond("Dark", "FOREST")
+        self.assertIsNotNone(bond)
+        self.assertEqual(bond.variety, 50)
+        self.assertIsNone(self.data.get_bond("bright", "forest"))
+
+    def test_first_bond_wins(self):
+        """Duplicate pairs should resolve to the first loaded bond."""
+        self.data.add_bond(Bond(adj="dark", noun="forest", variety=5))
+        self.assertEqual(self.data.get_bond("dark", "forest").variety, 50)
+        self.assertEqual(self.data.n_bonds, 4)
+
+    def test_get_bonds_many(self):
+        """Batch lookup should stay aligned with the input pairs."""
+        bonds = self.data.get_bonds_many([("old", "house"), ("x", "y"), ("dark", "forest")])
+        self.assertEqual(bonds[0].noun, "house")
+        self.assertIsNone(bonds[1])
+        self.assertEqual(bonds[2].adj, "dark")
+
+    def test_get_bonds_for_noun(self):
+        """Noun lookup should return all bonds for that noun."""
+        adjs = sorted(b.adj for b in self.data.get_bonds_for_noun("forest"))
+        self.assertEqual(adjs, ["dark", "old"])
+        self.assertEqual(self.data.get_bonds_for_noun("castle"), [])
+
+
+class TestSpatialQueries(unittest.TestCase):
+    """Test get_neighbors, get_neighbors_many and get_nearest."""
+
+    def setUp(self):
+        # PostgresData without touching the database
+        with patch.object(PostgresData, 'load_coordinates', return_value=0):
+            self.data = PostgresData()
+        self.data.add_bond(Bond(adj="dark", noun="forest", A=0.0, S=0.0, tau=1.0))
+        self.data.add_bond(Bond(adj="old", noun="house", A=0.3, S=0.0, tau=1.0))
+        self.data.add_bond(Bond(adj="far", noun="star", A=2.0, S=2.0, tau=3.0))
+
+    def test_get_neighbors(self):
+        """Radius query should return only bonds within radius."""
+        nouns = [b.noun for b in self.data.get_neighbors(0.0, 0.0, 1.0, radius=0.5)]
+        self.assertEqual(nouns, ["forest", "house"])
+        self.assertEqual(self.data.get_neighbors(5.0, 5.0, 5.0, radius=0.5), [])
+
+    def test_get_neighbors_many(self):
+        """Batch radius query should stay aligned with the input points."""
+        results = self.data.get_neighbors_many([(2.0, 2.0, 3.0), (9.0, 9.0, 9.0)], radius=0.1)
+        self.assertEqual([b.noun for b in results[0]], ["star"])
+        self.assertEqual(results[1], [])
+
+    def test_get_nearest(self):
+        """k-NN should return closest bonds first."""
+        nearest = self.data.get_nearest(0.25, 0.0, 1.0, k=2)
+        self.assertEqual([b.noun for b in nearest], ["house", "forest"])
+        self.assertEqual(len(self.data.get_nearest(0.0, 0.0, 0.0, k=10)), 3)
+
+    def test_index_rebuilt_after_add(self):
+        """Adding a bond should make it visible to spatial queries."""
+        self.data.get_neighbors(0.0, 0.0, 1.0)
+        self.data.add_bond(Bond(adj="new", noun="moon", A=5.0, S=5.0, tau=5.0))
+        self.assertEqual(self.data.get_nearest(5.0, 5.0, 5.0)[0].noun, "moon")
+
+    def test_empty_index(self):
+        """Queries against no bonds should return nothing."""
+        with patch.object(PostgresData, 'load_coordinates', return_value=0):
+            data = PostgresData()
+        self.assertEqual(data.get_neighbors(0.0, 0.0, 1.0), [])
+        self.assertEqual(data.get_nearest(0.0, 0.0, 1.0), [])
+
+
+class FakeNamedCursor:
+    """Server-side cursor stand-in serving fixed chunks via fetchmany."""
+
+    def __init__(self, chunks, gate=None):
+        self.chunks = list(chunks)
+        self.gate = gate
+        self.itersize = None
+        self.closed = False
+
+    def execute(self, query, params=()):
+        self.query = query
+
+    def fetchmany(self, size):
+        if len(self.chunks) == 1 and self.gate is not None:
+            self.gate.wait(5)   # hold back the last chunk
+        return self.chunks.pop(0) if self.chunks else []
+
+    def fetchall(self):
+        raise AssertionError("loaders must not fetchall()")
+
+    def close(self):
+        self.closed = True
+
+
+class TestStreamingLoaders(unittest.TestCase):
+    """Test chunked loading through named cursors."""
+
+    def setUp(self):
+        # PostgresData without touching the database
+        with patch.object(PostgresData, 'load_coordinates', return_value=0):
+            self.data = PostgresData()
+        self.data._coordinates = WordTable.from_rows([
+            ("forest", 0.25, 0.5, 1.5, "db"),
+            ("house", 0.5, 0.0, 1.25, "db"),
+            ("moon", 0.1, 0.9, 2.0, "db"),
+        ])
+        self.chunks = [
+            [("dark|forest", 50), ("old|forest", 30)],
+            [("old|house", 20), ("bad", 10), ("pale|moon", 5)],
+        ]
+
+    def patch_connection(self, cursor):
+        conn = MagicMock()
+        conn.cursor.return_value = cursor
+
+        @contextmanager
+        def fake_connection():
+            yield conn
+
+        return patch.object(self.data, '_connection', fake_connection), conn
+
+    def test_load_bonds_chunked(self):
+        """Bonds should be built chunk by chunk with progress reports."""
+        cursor = FakeNamedCursor(self.chunks)
+        patcher, conn = self.patch_connection(cursor)
+        progress = []
+        with patcher:
+            n = self.data.load_bonds(limit=100, progress=lambda *p: progress.append(p),
+                                     ready_after=0)
+
+        self.assertEqual(n, 4)
+        self.assertEqual(progress, [(2, 2), (5, 4)])
+        self.assertEqual(conn.cursor.call_args.kwargs['name'], 'hyp_bond_vocab_stream')
+        self.assertEqual(cursor.itersize, self.data.config.stream_batch_size)
+        self.assertTrue(cursor.closed)
+        self.assertEqual(self.data.get_bond("pale", "moon").tau, 2.0)
+
+    def test_early_readiness(self):
+        """Top bonds should be usable before the background load finishes."""
+        gate = threading.Event()
+        patcher, _ = self.patch_connection(FakeNamedCursor(self.chunks, gate))
+        self.data.add_bond(Bond(adj="bright", noun="star", A=1.0))
+
+        with patcher:
+            n = self.data.load_bonds(limit=100, ready_after=2)
+            self.assertEqual(n, 2)
+            self.assertTrue(self.data.stats()['bonds_loading'])
+            self.assertIsNotNone(self.data.get_bond("dark", "forest"))
+            self.assertIsNone(self.data.get_bond("pale", "moon"))
+            self.data.add_bond(Bond(adj="new", noun="moon", A=5.0))
+
+            gate.set()
+            self.assertTrue(self.data.wait_for_bonds(timeout=5))
+
+        self.assertEqual(self.data.n_bonds, 6)
+        self.assertEqual(self.data.get_bond("dark", "forest").variety, 50)
+        self.assertIsNotNone(self.data.get_bond("pale", "moon"))
+        self.assertIsNotNone(self.data.get_bond("bright", "star"))
+        self.assertIsNotNone(self.data.get_bond("new", "moon"))
+        self.assertFalse(self.data.stats()['bonds_loading'])
+
+    def test_load_error_releases_caller(self):
+        """A failing background load should not block load_bonds."""
+        with patch.object(self.data, '_connection', side_effect=RuntimeError("down")):
+            self.assertEqual(self.data.load_bonds(ready_after=2), 0)
+        self.assertTrue(self.data.wait_for_bonds(timeout=5))
+        self.assertFalse(self.data._bonds_loaded)
+
+    def test_coordinates_streamed(self):
+        """word_coordinates should be read through a named cursor."""
+        cursor = FakeNamedCursor([
+            [("Forest", 0.25, 0.5, 1.5, "db")],
+            [("house", None, 0.0, None, None)],
+        ])
+        patcher, conn = self.patch_connection(cursor)
+        with patcher:
+            self.assertTrue(self.data._load_from_database())
+
+        self.assertEqual(conn.cursor.call_args.kwargs['name'], 'word_coordinates_stream')
+        self.assertEqual(self.data.get("forest").A, 0.25)
+        self.assertEqual(self.data.get("house").tau, 2.5)
+
+
+def run_tests():
+    """Run all tests and print summary."""
+    print("=" * 60)
+    print("PostgresData Tests")
+    print("=" * 60)
+
+    loader = unittest.TestLoader()
+    suite = loader.loadTestsFromModule(sys.modules[__name__])
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    print("\n" + "=" * 60)
+    print(f"Tests run: {result.testsRun}")
+    print(f"Failures: {len(result.failures)}")
+    print(f"Errors: {len(result.errors)}")
+    print("=" * 60)
+
+    return len(result.failures) + len(result.errors)
+
+
+if __name__ == "__main__":
+    sys.exit(run_tests())
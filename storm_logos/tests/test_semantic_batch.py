@@ -0,0 +1,178 @@
+"""
+Tests for the vectorized Dialectic and ChainReaction scoring.
+
+Batch results are checked against the per-candidate formulas.
+
+Run with:
+    python -m storm_logos.tests.test_semantic_batch
+    python storm_logos/tests/test_semantic_batch.py
+"""
+
+import math
+import random
+import unittest
+import sys
+from pathlib import Path
+from unittest.mock import Mock
+
+import numpy as np
+
+# Setup path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from storm_logos.data.models import Bond, Parameters, SemanticState
+from storm_logos.generation.pipeline import Pipeline
+from storm_logos.semantic.physics import coherence, coherence_matrix, bonds_to_array
+from storm_logos.semantic.dialectic import Dialectic
+from storm_logos.semantic.chain import ChainReaction
+
+
+def random_bonds(n: int, seed: int):
+    rng = random.Random(seed)
+    bonds = [
+        Bond(noun=f"n{i}", adj=f"a{i}", A=rng.uniform(-1, 1),
+             S=rng.uniform(-1, 1), tau=rng.uniform(0.5, 4.5))
+        for i in range(n)
+    ]
+    # Degenerate vector: coherence is defined as 0
+    bonds.append(Bond(noun="zero", adj="zero", A=0.0, S=0.005, tau=2.0))
+    return bonds
+
+
+class TestCoherenceMatrix(unittest.TestCase):
+    """Batch coherence should match coherence() pairwise."""
+
+    def test_matches_scalar(self):
+        states = random_bonds(5, seed=1)
+        bonds = random_bonds(20, seed=2)
+        matrix = coherence_matrix(bonds_to_array(states), bonds_to_array(bonds))
+
+        self.assertEqual(matrix.shape, (len(states), len(bonds)))
+        for i, s in enumerate(states):
+            state = SemanticState(A=s.A, S=s.S, tau=s.tau)
+            for j, b in enumerate(bonds):
+                self.assertAlmostEqual(matrix[i, j], coherence(state, b))
+
+
+class TestDialecticBatch(unittest.TestCase):
+    """Vectorized filter should match the per-candidate definition."""
+
+    def reference_filter(self, candidates, Q, w, threshold):
+        anti = SemanticState(A=-Q.A, S=-Q.S, tau=4.0 - Q.tau)
+        scored = []
+        for bond in candidates:
+            coh_t = coherence(Q, bond)
+            coh_a = coherence(anti, bond)
+            score = coh_t * (1 - w) + coh_a * w
+            if coh_t > 0 and coh_a > 0:
+                score = score * 0.7 + math.sqrt(coh_t * coh_a) * 0.3
+            if coh_t >= threshold:
+                scored.append((bond, score))
+        scored.sort(key=lambda x: x[1], reverse=True)
+        return [b for b, _ in scored]
+
+    def test_filter_matches_reference(self):
+        candidates = random_bonds(50, seed=3)
+        Q = SemanticState(A=0.4, S=-0.2, tau=2.0)
+        result = Dialectic().filter(candidates, Q, tension_weight=0.3,
+                                    coherence_threshold=0.1)
+        self.assertEqual(result, self.reference_filter(candidates, Q, 0.3, 0.1))
+
+    def test_empty(self):
+        self.assertEqual(Dialectic().filter([], SemanticState()), [])
+
+
+class TestChainBatch(unittest.TestCase):
+    """Vectorized resonance should match the per-pair definition."""
+
+    def reference_score(self, candidate, history, decay):
+        power = 0.0
+        for i, prev in enumerate(reversed(history)):
+            coh = coherence(SemanticState(A=prev.A, S=prev.S, tau=prev.tau), candidate)
+            if coh > 0:
+                power += coh * decay ** i
+        return max(power, 0.01)
+
+    def setUp(self):
+        self.chain = ChainReaction()
+        self.candidates = random_bonds(30, seed=4)
+        self.history = random_bonds(6, seed=5)
+
+    def test_score_array_matches_reference(self):
+        scores = self.chain.score_array(bonds_to_array(self.candidates),
+                                        bonds_to_array(self.history), decay=0.8)
+        for bond, score in zip(self.candidates, scores):
+            self.assertAlmostEqual(score, self.reference_score(bond, self.history, 0.8))
+
+    def test_no_history(self):
+        scores = self.chain.score_array(bonds_to_array(self.candidates), np.empty((0, 3)))
+        np.testing.assert_array_equal(scores, np.ones(len(self.candidates)))
+
+    def test_lasing_array(self):
+        power = np.array([0.2, 0.5, 1.5])
+        expected = [self.chain._lasing(p, 0.5) for p in power]
+        np.testing.assert_allclose(self.chain.lasing_array(power, 0.5), expected)
+
+    def test_select_is_weighted_sample(self):
+        """select() should return the first candidate whose cumulative weight reaches r."""
+        power = self.chain.score_array(bonds_to_array(self.candidates),
+                                       bonds_to_array(self.history), decay=0.8)
+        weights = self.chain.lasing_array(power)
+
+        random.seed(7)
+        winner = self.chain.select(self.candidates, self.history, decay=0.8)
+
+        random.seed(7)
+        r = random.random() * sum(weights)
+        expected = next(i for i, c in enumerate(np.cumsum(weights)) if c >= r)
+        self.assertIs(winner, self.candidates[expected])
+
+    def test_select_deterministic(self):
+        winner = self.chain.select_deterministic(self.candidates, self.history)
+        best = max(self.candidates,
+                   key=lambda b: self.reference_score(b, self.history, self.chain.config.decay))
+        self.assertIs(winner, best)
+
+
+class TestPipelineSelection(unittest.TestCase):
+    """generate_next() over the array stages."""
+
+    def setUp(self):
+        self.storm = Mock()
+        self.pipeline = Pipeline(storm=self.storm, dialectic=Dialectic(), chain=ChainReaction())
+        self.Q = SemanticState(A=0.3, S=0.2, tau=2.0)
+
+    def test_single_candidate(self):
+        self.storm.explode.return_value = random_bonds(0, seed=6)
+        result = self.pipeline.generate_next(self.Q, [], Parameters())
+        self.assertEqual(result.bond.noun, 'zero')
+
+    def test_no_candidates(self):
+        self.storm.explode.return_value = []
+        with self.assertRaises(ValueError):
+            self.pipeline.generate_next(self.Q, [], Parameters())
+
+
+def run_tests():
+    """Run all tests and print summary."""
+    print("=" * 60)
+    print("Semantic Batch Tests")
+    print("=" * 60)
+
+    loader = unittest.TestLoader()
+    suite = loader.loadTestsFromModule(sys.modules[__name__])
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    print("\n" + "=" * 60)
+    print(f"Tests run: {result.testsRun}")
+    print(f"Failures: {len(result.failures)}")
+    print(f"Errors: {len(result.errors)}")
+    print("=" * 60)
+
+    return len(result.failures) + len(result.errors)
+
+
+if __name__ == "__main__":
+    sys.exit(run_tests())
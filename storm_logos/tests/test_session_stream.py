@@ -0,0 +1,234 @@
+"""
+Tests for the streaming session endpoint.
+
+Run with:
+    python -m storm_logos.tests.test_session_stream
+    python storm_logos/tests/test_session_stream.py
+"""
+
+import asyncio
+import json
+import unittest
+import sys
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+# Setup path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from storm_logos.config import LLMConfig
+from storm_logos.data.models import Metrics, SemanticState
+from storm_logos.llm import FakeBackend, LLMClient, LLMError, TokenUsage
+from storm_logos.services.api.models import SessionMessage
+from storm_logos.services.api.routers import sessions
+
+
+def parse_events(frames):
+    events = []
+    for frame in frames:
+        lines = frame.strip().split('\n')
+        events.append((lines[0][len('event: '):], json.loads(lines[1][len('data: '):])))
+    return events
+
+
+class TestStreamTurn(unittest.TestCase):
+    """Token events followed by a trailing state event."""
+
+    def setUp(self):
+        self.state = sessions.SessionState(session_id='s1', user_id=None, mode='therapy')
+        config = LLMConfig(timeout=5.0, max_retries=0)
+
+        self.engine = Mock()
+        self.engine._call_llm.return_value = '{"type": "emotion", "mode_hint": "therapy"}'
+        self.engine.llm = LLMClient(FakeBackend(responses=['Where is the dream taking you?']),
+                                    config=config, usage=TokenUsage())
+
+        patient_state = SemanticState(A=-0.2, S=0.1, irony=0.3)
+        self.therapist = Mock()
+        self.therapist_backend = FakeBackend(responses=['You keep saying fine.'])
+        self.therapist.llm = LLMClient(self.therapist_backend, config=config, usage=TokenUsage())
+        self.therapist.prepare_turn.return_value = {
+            'system': 'sys', 'user': 'usr', 'max_tokens': 50,
+            'state': patient_state, 'dial': {'thesis': {'description': 'stuck'}},
+        }
+        self.therapist.finish_turn.return_value = 0.8
+        self.therapist.get_trajectory.return_value = Mock(current=patient_state)
+        self.therapist._turns = [{'metrics': {'defenses': ['humor']}}]
+
+        self.patches = [
+            patch.object(sessions, 'get_dream_engine', return_value=self.engine),
+            patch.object(sessions, 'get_therapist', return_value=self.therapist),
+            patch.object(sessions, 'store_session'),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+
+    def run_turn(self, message: str):
+        async def main():
+            return [frame async for frame in sessions._stream_turn(
+                's1', self.state, SessionMessage(message=message), None)]
+        return parse_events(asyncio.run(main()))
+
+    def test_therapy_tokens_then_done(self):
+        events = self.run_turn("Everything's fine.")
+        names = [name for name, _ in events]
+        self.assertEqual(names, ['token'] * 4 + ['done'])
+        self.assertEqual(''.join(data['text'] for _, data in events[:-1]), 'You keep saying fine.')
+
+        done = events[-1][1]
+        self.assertEqual(done['response'], 'You keep saying fine.')
+        self.assertEqual(done['turn'], 1)
+        self.assertEqual(done['score'], 0.8)
+        self.assertAlmostEqual(done['semantic_state']['A'], -0.2)
+        self.assertEqual(done['dialectic']['thesis']['description'], 'stuck')
+        self.assertIsNotNone(done['timing']['first_token_seconds'])
+
+        self.therapist.finish_turn.assert_called_once()
+        self.assertEqual(self.state.defenses, ['humor'])
+        self.assertEqual(self.state.history[-1]['therapist'], 'You keep saying fine.')
+
+    def test_dream_mode(self):
+        self.state.mode = 'dream'
+        self.state.symbols = [{'text': 'river', 'A': 0.4, 'S': 0.2, 'tau': 2.0}]
+        events = self.run_turn('It felt cold.')
+
+        self.assertEqual(events[-1][0], 'done')
+        self.assertEqual(events[-1][1]['response'], 'Where is the dream taking you?')
+        self.assertAlmostEqual(self.state.A, 0.4)
+        self.therapist.prepare_turn.assert_not_called()
+
+    def test_llm_error_event(self):
+        self.therapist_backend.failures, self.therapist_backend.status = 1, 400
+        events = self.run_turn('Hello there.')
+
+        self.assertEqual(events[-1][0], 'error')
+        self.assertEqual(self.state.turn, 1)
+        self.assertTrue(self.state.history[-1]['therapist'].startswith('[fake error:'))
+        self.therapist.finish_turn.assert_called_once()
+
+
+class BrokenStreamBackend(FakeBackend):
+    """Fails the stream after `after` chunks."""
+
+    def __init__(self, after: int, **kwargs):
+        super().__init__(**kwargs)
+        self.after = after
+
+    async def stream(self, system, messages, max_tokens, temperature, timeout, completion):
+        chunks = super().stream(system, messages, max_tokens, temperature, timeout, completion)
+        sent = 0
+        async for chunk in chunks:
+            if sent == self.after:
+                raise LLMError('connection reset', self.provider, status=400)
+            sent += 1
+            yield chunk
+
+
+class TestStreamFailure(unittest.TestCase):
+    """A failed stream is recorded once; a retry is a new turn."""
+
+    def setUp(self):
+        from storm_logos.applications.therapist import Therapist
+
+        self.state = sessions.SessionState(session_id='s1', user_id=None, mode='therapy')
+        self.config = LLMConfig(timeout=5.0, max_retries=0)
+
+        self.engine = Mock()
+        self.engine._call_llm.return_value = '{"type": "emotion", "mode_hint": "therapy"}'
+
+        metrics = Mock()
+        metrics.measure.return_value = Metrics(irony=0.3, A_position=-0.2, S_position=0.1)
+        dialectic = Mock()
+        dialectic.analyze.return_value = {}
+        self.therapist = Therapist(model='fake', metrics=metrics, dialectic=dialectic,
+                                   llm=self.client(FakeBackend(responses=['Say more.'])))
+
+        self.patches = [
+            patch.object(sessions, 'get_dream_engine', return_value=self.engine),
+            patch.object(sessions, 'get_therapist', return_value=self.therapist),
+            patch.object(sessions, 'store_session'),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+
+    def client(self, backend):
+        return LLMClient(backend, config=self.config, usage=TokenUsage())
+
+    def run_turn(self, message: str):
+        async def main():
+            return [frame async for frame in sessions._stream_turn(
+                's1', self.state, SessionMessage(message=message), None)]
+        return parse_events(asyncio.run(main()))
+
+    def assert_turns(self, n: int):
+        self.assertEqual(len(self.therapist.trajectory.history), n)
+        self.assertEqual(len(self.therapist._turns), n)
+        self.assertEqual(self.state.turn, n)
+        self.assertEqual(len(self.state.history), n)
+
+    def test_fails_before_first_token(self):
+        self.therapist.llm = self.client(BrokenStreamBackend(after=0, responses=['Say more.']))
+        events = self.run_turn('I am fine.')
+
+        self.assertEqual([name for name, _ in events], ['error'])
+        self.assert_turns(1)
+        self.assertTrue(self.state.history[-1]['therapist'].startswith('[fake error:'))
+
+        self.therapist.llm = self.client(FakeBackend(responses=['Say more.']))
+        events = self.run_turn('I am fine.')
+        self.assertEqual(events[-1][0], 'done')
+        self.assertEqual(events[-1][1]['turn'], 2)
+        self.assert_turns(2)
+
+    def test_client_disconnect(self):
+        """Closing the stream after the first token should still record the turn."""
+        async def main():
+            frames = sessions._stream_turn('s1', self.state, SessionMessage(message='I am fine.'), None)
+            first = await frames.__anext__()
+            await frames.aclose()
+            return first
+
+        self.assertTrue(asyncio.run(main()).startswith('event: token'))
+        self.assert_turns(1)
+        self.assertEqual(self.state.history[-1]['therapist'], '[Client disconnected]')
+
+    def test_fails_mid_stream(self):
+        self.therapist.llm = self.client(BrokenStreamBackend(after=1, responses=['Say more.']))
+        events = self.run_turn('I am fine.')
+
+        self.assertEqual([name for name, _ in events], ['token', 'error'])
+        self.assert_turns(1)
+        self.assertEqual(self.therapist._turns[-1]['therapist'], self.state.history[-1]['therapist'])
+
+
+def run_tests():
+    """Run all tests and print summary."""
+    print("=" * 60)
+    print("Session Stream Tests")
+    print("=" * 60)
+
+    loader = unittest.TestLoader()
+    suite = loader.loadTestsFromModule(sys.modules[__name__])
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    print("\n" + "=" * 60)
+    print(f"Tests run: {result.testsRun}")
+    print(f"Failures: {len(result.failures)}")
+    print(f"Errors: {len(result.errors)}")
+    print("=" * 60)
+
+    return len(result.failures) + len(result.errors)
+
+
+if __name__ == "__main__":
+    sys.exit(run_tests())
@@ -0,0 +1,247 @@
+"""
+Tests for the binary coordinate/bond snapshot.
+
+Snapshots are written to a temporary directory, no database required.
+
+Run with:
+    python -m storm_logos.tests.test_snapshot
+    python storm_logos/tests/test_snapshot.py
+"""
+
+import json
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+# Setup path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from storm_logos.config import SnapshotConfig, get_config
+from storm_logos.data.models import Bond, WordCoordinates
+from storm_logos.data.bloom import BloomFilter
+from storm_logos.data.bond_table import BondTable
+from storm_logos.data.word_table import WordTable
+from storm_logos.data.postgres import PostgresData
+from storm_logos.data.snapshot import (
+    load_snapshot, write_snapshot, current_digest, prune_snapshots,
+)
+
+
+class TestWordTable(unittest.TestCase):
+    """Test the columnar word mapping."""
+
+    def setUp(self):
+        self.words = WordTable.from_rows([
+            ("forest", 0.25, 0.5, 1.5, "db"),
+            ("house", 0.5, 0.0, 1.25, "abstraction"),
+            ("dark", -0.5, 0.0, 2.0, "db"),
+        ])
+
+    def test_mapping(self):
+        """Lookups should materialize WordCoordinates; writes go to the overlay."""
+        self.assertEqual(self.words["house"], WordCoordinates("house", 0.5, 0.0, 1.25, "abstraction"))
+        self.assertIsNone(self.words.get("castle"))
+        self.assertNotIn("castle", self.words)
+
+        self.words["castle"] = WordCoordinates("castle", 0.1, 0.2, 1.0, "learned")
+        self.assertIn("castle", self.words)
+        self.assertEqual(len(self.words), 4)
+        self.assertEqual(sorted(self.words), ["castle", "dark", "forest", "house"])
+
+
+class TestBloomFilter(unittest.TestCase):
+    """Test the corpus vocab filter."""
+
+    def test_no_false_negatives(self):
+        """Every added key should be reported present."""
+        keys = [f"adj{i}|noun{i}" for i in range(5000)]
+        bloom = BloomFilter.create(len(keys), fp_rate=0.01)
+        bloom.add_many(keys)
+        self.assertTrue(bloom.contains_many(keys).all())
+        self.assertIn("adj42|noun42", bloom)
+
+    def test_false_positive_rate(self):
+        """Unseen keys should mostly be ruled out."""
+        bloom = BloomFilter.create(5000, fp_rate=0.01)
+        bloom.add_many(f"adj{i}|noun{i}" for i in range(5000))
+        hits = bloom.contains_many([f"other{i}|key{i}" for i in range(5000)])
+        self.assertLess(hits.mean(), 0.03)
+        self.assertAlmostEqual(bloom.fp_rate, 0.01, delta=0.005)
+
+    def test_empty(self):
+        """An empty filter contains nothing."""
+        self.assertNotIn("dark|forest", BloomFilter.create(100))
+
+
+class TestSnapshot(unittest.TestCase):
+    """Test write/load round trip, CURRENT pointer and pruning."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.root = Path(self.tmp.name)
+
+        self.words = WordTable.from_rows([
+            ("forest", 0.25, 0.5, 1.5, "db"),
+            ("house", 0.5, 0.0, 1.25, "abstraction"),
+            ("dark", -0.5, 0.0, 2.0, "db"),
+        ])
+        self.bonds = BondTable()
+        self.bonds.extend(["dark", "old", "old"], ["forest", "forest", "house"], [50, 30, 20],
+                          [(0.25, 0.5, 1.5), (0.25, 0.5, 1.5), (0.5, 0.0, 1.25)])
+
+    def test_round_trip(self):
+        """Loaded snapshot should be memory-mapped and equivalent."""
+        write_snapshot(self.root, "abc123", self.words, self.bonds, bond_limit=100)
+        self.assertEqual(current_digest(self.root), "abc123")
+
+        snap = load_snapshot(self.root)
+        self.assertEqual(snap.content_hash, "abc123")
+        self.assertIsInstance(snap.words.coords, np.memmap)
+        self.assertIsInstance(snap.bonds.coords, np.memmap)
+
+        self.assertEqual(snap.words["forest"], self.words["forest"])
+        self.assertEqual(len(snap.bonds), 3)
+        self.assertEqual(snap.bonds.find("old", "house"), 2)
+        self.assertEqual(snap.bonds.bond(0), self.bonds.bond(0))
+        np.testing.assert_array_equal(snap.bonds.rows_for_noun("forest"), [0, 1])
+
+    def test_vocab_filter_round_trip(self):
+        """The vocab filter should be stored with the snapshot and mapped back."""
+        bloom = BloomFilter.create(10)
+        bloom.add_many(["dark|forest", "pale|moon"])
+        write_snapshot(self.root, "abc123", self.words, self.bonds, vocab_filter=bloom)
+
+        snap = load_snapshot(self.root)
+        self.assertIsInstance(snap.vocab_filter.bits, np.memmap)
+        self.assertIn("pale|moon", snap.vocab_filter)
+        self.assertEqual(snap.manifest["vocab_filter"]["n_items"], 2)
+
+        write_snapshot(self.root, "def456", self.words, self.bonds)
+        self.assertIsNone(load_snapshot(self.root).vocab_filter)
+
+    def test_append_after_mmap(self):
+        """Appending to a mapped table should copy, not write the file."""
+        write_snapshot(self.root, "abc123", self.words, self.bonds)
+        snap = load_snapshot(self.root)
+        row = snap.bonds.append(Bond(noun="sky", adj="blue", variety=3))
+        self.assertEqual(snap.bonds.find("blue", "sky"), row)
+        self.assertEqual(len(load_snapshot(self.root).bonds), 3)
+
+    def test_version_mismatch(self):
+        """Snapshots with another layout version should be ignored."""
+        path = write_snapshot(self.root, "abc123", self.words, self.bonds)
+        manifest = json.loads((path / "manifest.json").read_text())
+        manifest["version"] = -1
+        (path / "manifest.json").write_text(json.dumps(manifest))
+        self.assertIsNone(load_snapshot(self.root))
+
+    def test_missing(self):
+        """No CURRENT pointer means no snapshot."""
+        self.assertIsNone(load_snapshot(self.root))
+
+    def test_prune(self):
+        """Pruning should keep CURRENT plus the newest others."""
+        for digest in ("a", "b", "c"):
+            write_snapshot(self.root, digest, self.words, self.bonds)
+        self.assertEqual(prune_snapshots(self.root, keep=1), 2)
+        self.assertEqual([p.name for p in self.root.iterdir() if p.is_dir()], ["c"])
+
+    def test_postgres_data_uses_snapshot(self):
+        """PostgresData should map coordinates and bonds without the database."""
+        write_snapshot(self.root, "abc123", self.words, self.bonds)
+
+        config = get_config().snapshot
+        with patch.object(config, "path", self.root), patch.object(config, "verify", False):
+            with patch.object(PostgresData, "_load_from_database") as db:
+                data = PostgresData(load_bonds=True, use_snapshot=True)
+
+        db.assert_not_called()
+        self.assertEqual(data.stats()["snapshot"], "abc123")
+        self.assertEqual(data.get_bond("dark", "forest").variety, 50)
+        self.assertEqual(data.get("dark").A, -0.5)
+        self.assertNotIn("house", data.adjectives)
+        self.assertEqual(len(data.get_neighbors(0.25, 0.5, 1.5, radius=0.1)), 2)
+
+    def test_load_bonds_limit(self):
+        """load_bonds(limit) should serve only the top bonds of a snapshot."""
+        write_snapshot(self.root, "abc123", self.words, self.bonds, bond_limit=3)
+
+        config = get_config().snapshot
+        with patch.object(config, "path", self.root), patch.object(config, "verify", False):
+            data = PostgresData(use_snapshot=True, write_behind=False)
+        self.assertEqual(data.load_bonds(limit=2), 2)
+        self.assertEqual(data.get_bond("old", "forest").variety, 30)
+        self.assertIsNone(data.get_bond("old", "house"))
+        self.assertEqual(len(data.get_bonds_for_noun("forest")), 2)
+
+    def test_load_bonds_keeps_added(self):
+        """Bonds added before loading a snapshot should follow its bonds."""
+        write_snapshot(self.root, "abc123", self.words, self.bonds, bond_limit=3)
+
+        config = get_config().snapshot
+        with patch.object(config, "path", self.root), patch.object(config, "verify", False):
+            data = PostgresData(use_snapshot=True, write_behind=False)
+        data.add_bond(Bond(noun="sky", adj="blue", variety=3))
+        data.add_bond(Bond(noun="forest", adj="dark", variety=1))
+
+        self.assertEqual(data.load_bonds(), 5)
+        self.assertEqual(data.get_bond("blue", "sky").variety, 3)
+        self.assertEqual(data.get_bond("dark", "forest").variety, 50)
+
+    def test_config_defaults(self):
+        """Snapshots should be verified by default and live outside the package."""
+        with patch.dict("os.environ", {"XDG_CACHE_HOME": str(self.root)}):
+            config = SnapshotConfig()
+        self.assertTrue(config.verify)
+        self.assertEqual(config.path, self.root / "storm_logos" / "snapshot")
+
+    def test_vocab_filter_needs_verified_snapshot(self):
+        """The vocab filter should only be used when the snapshot matches the DB."""
+        bloom = BloomFilter.create(10)
+        bloom.add_many(["dark|forest"])
+        write_snapshot(self.root, "abc123", self.words, self.bonds, vocab_filter=bloom)
+
+        def load(verify, digest=None, error=None):
+            config = get_config().snapshot
+            hashed = patch("storm_logos.data.postgres.content_hash",
+                           return_value=digest, side_effect=error)
+            with patch.object(config, "path", self.root), patch.object(config, "verify", verify), \
+                    patch.object(PostgresData, "_connection", MagicMock()), hashed:
+                return PostgresData(use_snapshot=True, write_behind=False)
+
+        self.assertIsNone(load(verify=False)._vocab_filter)
+        self.assertIsNone(load(verify=True, error=ConnectionError("down"))._vocab_filter)
+        data = load(verify=True, digest="abc123")
+        self.assertIn("dark|forest", data._vocab_filter)
+        self.assertIsNone(data.lookup_bond("pale", "moon"))
+        self.assertEqual(data.stats()["vocab_filter_skips"], 1)
+
+
+def run_tests():
+    """Run all tests and print summary."""
+    print("=" * 60)
+    print("Snapshot Tests")
+    print("=" * 60)
+
+    loader = unittest.TestLoader()
+    suite = loader.loadTestsFromModule(sys.modules[__name__])
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    print("\n" + "=" * 60)
+    print(f"Tests run: {result.testsRun}")
+    print(f"Failures: {len(result.failures)}")
+    print(f"Errors: {len(result.errors)}")
+    print("=" * 60)
+
+    return len(result.failures) + len(result.errors)
+
+
+if __name__ == "__main__":
+    sys.exit(run_tests())
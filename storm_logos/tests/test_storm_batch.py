@@ -0,0 +1,120 @@
+"""
+Tests for Storm.explode_many.
+
+Bonds are added in memory and Neo4j is replaced by a stub.
+
+Run with:
+    python -m storm_logos.tests.test_storm_batch
+    python storm_logos/tests/test_storm_batch.py
+"""
+
+import random
+import unittest
+import sys
+from dataclasses import replace
+from pathlib import Path
+from unittest.mock import patch
+
+# Setup path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from storm_logos.config import StormConfig
+from storm_logos.data.models import Bond, SemanticState
+from storm_logos.data.postgres import PostgresData
+from storm_logos.semantic.storm import Storm
+
+
+class StubNeo4j:
+    """Every bond is followed by the 'next' bond of its noun."""
+
+    def get_followers(self, bond_id, limit=50):
+        noun = bond_id.split('_')[-1]
+        return [Bond(noun=noun, adj="next", A=0.0, S=0.0, tau=2.0),
+                Bond(noun="unknown", adj="gone")]
+
+    def get_followers_many(self, bond_ids, limit=50):
+        return {bond_id: self.get_followers(bond_id, limit) for bond_id in bond_ids}
+
+
+def pairs(bonds):
+    return [(b.adj, b.noun) for b in bonds]
+
+
+class TestExplodeMany(unittest.TestCase):
+    """explode_many should agree with explode for table-backed candidates."""
+
+    def setUp(self):
+        with patch.object(PostgresData, 'load_coordinates', return_value=0):
+            self.data = PostgresData()
+
+        rng = random.Random(0)
+        for i in range(300):
+            noun = f"n{i % 40}"
+            self.data.add_bond(Bond(noun=noun, adj=f"a{i % 17}", variety=rng.randint(3, 50),
+                                    A=rng.uniform(-1, 1), S=rng.uniform(-1, 1),
+                                    tau=rng.uniform(0.5, 4.5)))
+        for i in range(40):
+            self.data.add_bond(Bond(noun=f"n{i}", adj="next", variety=5, A=0.0, S=0.0, tau=2.0))
+
+        self.config = StormConfig(radius=0.6, max_candidates=100)
+        self.storm = Storm(data=self.data, neo4j=StubNeo4j(), config=self.config)
+
+        rng = random.Random(1)
+        self.states = [
+            SemanticState(A=rng.uniform(-1, 1), S=rng.uniform(-1, 1), tau=rng.uniform(1, 4))
+            for _ in range(12)
+        ]
+
+    def check_matches_explode(self, storm: Storm):
+        batch = storm.explode_many(self.states)
+        self.assertEqual(len(batch), len(self.states))
+        for Q, rows in zip(self.states, batch):
+            expected = [
+                key for key in pairs(storm.explode(Q))
+                if key != ("gone", "unknown")   # not in the bond table
+            ]
+            self.assertEqual(pairs(storm.bonds_for(rows)), expected)
+
+    def test_matches_explode(self):
+        self.check_matches_explode(self.storm)
+
+    def test_matches_explode_with_cap(self):
+        """Variety cap should keep the same top candidates in the same order."""
+        config = replace(self.config, max_candidates=5)
+        self.check_matches_explode(Storm(data=self.data, neo4j=StubNeo4j(), config=config))
+
+    def test_no_duplicates(self):
+        for rows in self.storm.explode_many(self.states):
+            keys = pairs(self.storm.bonds_for(rows))
+            self.assertEqual(len(keys), len(set(keys)))
+
+    def test_empty(self):
+        self.assertEqual(self.storm.explode_many([]), [])
+        far = self.storm.explode_many([SemanticState(A=50.0, S=50.0, tau=50.0)])
+        # Only FOLLOWS of the nearest bond remain
+        self.assertEqual([b.adj for b in self.storm.bonds_for(far[0])], ["next"])
+
+
+def run_tests():
+    """Run all tests and print summary."""
+    print("=" * 60)
+    print("Storm Batch Tests")
+    print("=" * 60)
+
+    loader = unittest.TestLoader()
+    suite = loader.loadTestsFromModule(sys.modules[__name__])
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    print("\n" + "=" * 60)
+    print(f"Tests run: {result.testsRun}")
+    print(f"Failures: {len(result.failures)}")
+    print(f"Errors: {len(result.errors)}")
+    print("=" * 60)
+
+    return len(result.failures) + len(result.errors)
+
+
+if __name__ == "__main__":
+    sys.exit(run_tests())
@@ -0,0 +1,138 @@
+"""
+Tests for the per-session Therapist pool.
+
+Run with:
+    python -m storm_logos.tests.test_therapist_pool
+    python storm_logos/tests/test_therapist_pool.py
+"""
+
+import unittest
+import sys
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+# Setup path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from storm_logos.applications.therapist_pool import TherapistPool
+
+
+class TestTherapistPool(unittest.TestCase):
+    """Test session keying, LRU eviction and TTL expiry."""
+
+    def setUp(self):
+        self.factory = Mock(side_effect=lambda: Mock())
+        self.pool = TherapistPool(factory=self.factory, max_size=2, ttl_seconds=60)
+
+    def test_same_session_same_therapist(self):
+        """Repeated lookups should return the same instance."""
+        first = self.pool.get("s1")
+        second = self.pool.get("s1")
+        self.assertIs(first, second)
+        self.assertEqual(self.factory.call_count, 1)
+
+    def test_sessions_are_isolated(self):
+        """Different sessions should get different therapists."""
+        self.assertIsNot(self.pool.get("s1"), self.pool.get("s2"))
+
+    def test_hit_miss_counters(self):
+        """Stats should count hits and misses."""
+        self.pool.get("s1")
+        self.pool.get("s1")
+        self.pool.get("s2")
+        stats = self.pool.stats()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 2)
+        self.assertEqual(stats['size'], 2)
+
+    def test_lru_eviction(self):
+        """Least recently used session should be evicted beyond max_size."""
+        self.pool.get("s1")
+        self.pool.get("s2")
+        self.pool.get("s1")  # s2 is now least recently used
+        self.pool.get("s3")
+
+        self.assertIn("s1", self.pool)
+        self.assertNotIn("s2", self.pool)
+        self.assertIn("s3", self.pool)
+        self.assertEqual(self.pool.stats()['evictions'], 1)
+
+    def test_ttl_expiry(self):
+        """Idle sessions should be replaced after the TTL."""
+        with patch('storm_logos.applications.therapist_pool.time.monotonic',
+                   return_value=0.0):
+            first = self.pool.get("s1")
+        with patch('storm_logos.applications.therapist_pool.time.monotonic',
+                   return_value=120.0):
+            second = self.pool.get("s1")
+
+        self.assertIsNot(first, second)
+        self.assertEqual(self.pool.stats()['expirations'], 1)
+
+    def test_evict_expired(self):
+        """evict_expired should drop only idle sessions."""
+        with patch('storm_logos.applications.therapist_pool.time.monotonic',
+                   return_value=0.0):
+            self.pool.get("s1")
+        with patch('storm_logos.applications.therapist_pool.time.monotonic',
+                   return_value=50.0):
+            self.pool.get("s2")
+        with patch('storm_logos.applications.therapist_pool.time.monotonic',
+                   return_value=90.0):
+            dropped = self.pool.evict_expired()
+
+        self.assertEqual(dropped, 1)
+        self.assertEqual(self.pool.session_ids(), ["s2"])
+
+    def test_release(self):
+        """Released sessions should start fresh on next lookup."""
+        first = self.pool.get("s1")
+        self.assertTrue(self.pool.release("s1"))
+        self.assertFalse(self.pool.release("s1"))
+        self.assertIsNot(first, self.pool.get("s1"))
+
+    def test_peek_never_creates(self):
+        """peek should not fork a therapist or count a lookup."""
+        self.assertIsNone(self.pool.peek("s1"))
+        first = self.pool.get("s1")
+        self.assertIs(self.pool.peek("s1"), first)
+        self.assertEqual(self.factory.call_count, 1)
+        self.assertEqual(self.pool.stats()['misses'], 1)
+
+
+class TestTherapistService(unittest.TestCase):
+    """Pool housekeeping in the therapist microservice."""
+
+    def test_cleanup_does_not_build_pool(self):
+        """A metrics scrape before any session should not load a therapist."""
+        from storm_logos.services.therapist import main
+
+        with patch.object(main, 'Therapist', side_effect=ValueError('GROQ_API_KEY not set')):
+            service = main.TherapistService()
+            self.assertEqual(service.cleanup_old_sessions(), 0)
+        self.assertIsNone(service._pool)
+
+
+def run_tests():
+    """Run all tests and print summary."""
+    print("=" * 60)
+    print("Therapist Pool Tests")
+    print("=" * 60)
+
+    loader = unittest.TestLoader()
+    suite = loader.loadTestsFromModule(sys.modules[__name__])
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    print("\n" + "=" * 60)
+    print(f"Tests run: {result.testsRun}")
+    print(f"Failures: {len(result.failures)}")
+    print(f"Errors: {len(result.errors)}")
+    print("=" * 60)
+
+    return len(result.failures) + len(result.errors)
+
+
+if __name__ == "__main__":
+    sys.exit(run_tests())
@@ -0,0 +1,281 @@
+"""
+Tests for the learned-bond write-behind buffer.
+
+Writes go to a recording stand-in for execute_values, no database required.
+
+Run with:
+    python -m storm_logos.tests.test_write_behind
+    python storm_logos/tests/test_write_behind.py
+"""
+
+import threading
+import unittest
+import sys
+from contextlib import contextmanager
+from dataclasses import replace
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import psycopg2
+
+# Setup path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from storm_logos.config import CacheConfig, LearningConfig
+from storm_logos.data.cache import CoordinateCache
+from storm_logos.data.models import Bond
+from storm_logos.data.postgres import PostgresData
+from storm_logos.data.write_behind import LearnedBondBuffer
+
+
+class RecordingDB:
+    """Connection factory recording execute_values calls (optionally failing)."""
+
+    def __init__(self):
+        self.calls = []
+        self.fail = False
+        self.written = threading.Event()
+        self.conn = MagicMock()
+        self.bad = set()       # nouns whose rows violate a constraint
+
+    @contextmanager
+    def connection(self):
+        if self.fail:
+            raise ConnectionError('postgres went away')
+        yield self.conn
+
+    def execute_values(self, cur, query, rows, page_size=None):
+        rows = list(rows)
+        if any(row[1] in self.bad for row in rows):
+            raise psycopg2.IntegrityError('check constraint violated')
+        self.calls.append((query, rows))
+        self.written.set()
+
+
+class TestLearnedBondBuffer(unittest.TestCase):
+    """Coalescing, triggers, retries and shutdown."""
+
+    def setUp(self):
+        self.db = RecordingDB()
+        patcher = patch('storm_logos.data.write_behind.execute_values', self.db.execute_values)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.config = LearningConfig(write_behind=True, flush_size=100, flush_interval=60.0)
+        self.buffer = LearnedBondBuffer(self.db.connection, config=self.config)
+
+    def test_coalesced_upsert(self):
+        """Repeated mentions should become one row with the summed count."""
+        self.buffer.learn('dark', 'forest', 0.1, 0.2, 1.5, confidence=0.4)
+        self.buffer.learn('dark', 'forest', 0.9, 0.9, 3.0, confidence=0.7)
+        self.buffer.touch('dark', 'forest')
+        self.buffer.learn('pale', 'moon', 0.3, 0.1, 2.0)
+
+        self.assertEqual(self.buffer.flush(), 2)
+        (query, rows), = self.db.calls
+        self.assertIn('ON CONFLICT (adj, noun) DO UPDATE', query)
+        self.assertEqual(rows[0], ('dark', 'forest', 0.1, 0.2, 1.5, 'conversation', 0.7, 3))
+        self.assertEqual(rows[1][:2], ('pale', 'moon'))
+        self.db.conn.commit.assert_called_once()
+
+        stats = self.buffer.stats()
+        self.assertEqual(stats['writes'], 4)
+        self.assertEqual(stats['rows_written'], 2)
+        self.assertEqual(self.buffer.flush(), 0)
+
+    def test_counter_only_bumps(self):
+        """mark_bond_used-style bumps should update, never insert."""
+        self.buffer.touch('dark', 'forest')
+        self.buffer.touch('dark', 'forest')
+        self.buffer.flush()
+
+        (query, rows), = self.db.calls
+        self.assertIn('UPDATE learned_bonds', query)
+        self.assertEqual(rows, [('dark', 'forest', 2)])
+
+    def test_pending_visible(self):
+        """Unwritten entries should be readable until flushed."""
+        self.assertIsNone(self.buffer.pending('dark', 'forest'))
+        self.buffer.touch('dark', 'forest')
+        self.buffer.learn('dark', 'forest', 0.1, 0.2, 1.5)
+
+        pending = self.buffer.pending('dark', 'forest')
+        self.assertTrue(pending.insert)
+        self.assertEqual((pending.A, pending.uses), (0.1, 2))
+        self.buffer.flush()
+        self.assertIsNone(self.buffer.pending('dark', 'forest'))
+
+    def test_size_trigger(self):
+        """Reaching flush_size should wake the background flush."""
+        self.buffer.config = replace(self.config, flush_size=2)
+        self.buffer.learn('dark', 'forest', 0.1, 0.2, 1.5)
+        self.assertFalse(self.db.written.wait(0.05))
+        self.buffer.learn('pale', 'moon', 0.3, 0.1, 2.0)
+
+        self.assertTrue(self.db.written.wait(5))
+        self.buffer.close()
+        self.assertEqual(len(self.db.calls), 1)
+
+    def test_interval_trigger(self):
+        """Pending entries should be written after flush_interval."""
+        self.buffer.config = replace(self.config, flush_interval=0.05)
+        self.buffer.learn('dark', 'forest', 0.1, 0.2, 1.5)
+        self.assertTrue(self.db.written.wait(5))
+        self.buffer.close()
+
+    def test_failed_flush_retried(self):
+        """A failed flush should keep its entries for the next one."""
+        self.buffer.learn('dark', 'forest', 0.1, 0.2, 1.5)
+        self.db.fail = True
+        self.assertEqual(self.buffer.flush(), 0)
+        self.buffer.learn('dark', 'forest', 0.5, 0.5, 2.5)
+
+        self.db.fail = False
+        self.assertEqual(self.buffer.flush(), 1)
+        rows = self.db.calls[0][1]
+        self.assertEqual(rows, [('dark', 'forest', 0.1, 0.2, 1.5, 'conversation', 0.5, 2)])
+        self.assertEqual(self.buffer.stats()['failures'], 1)
+
+    def test_bad_row_isolated_and_dead_lettered(self):
+        """A row that keeps failing should not block the others forever."""
+        self.buffer.config = replace(self.config, max_retries=2)
+        self.buffer.learn('dark', 'forest', 0.1, 0.2, 1.5)
+        self.buffer.learn('pale', 'moon', 0.3, 0.1, 2.0)
+        self.db.bad.add('moon')
+
+        self.assertEqual(self.buffer.flush(), 0)     # whole batch fails once
+        self.assertEqual(self.buffer.flush(), 1)     # retried row by row
+        self.assertEqual(self.db.calls[0][1][0][:2], ('dark', 'forest'))
+        self.assertEqual(len(self.buffer), 0)
+
+        stats = self.buffer.stats()
+        self.assertEqual(stats['dead_lettered'], 1)
+        self.assertEqual([e.noun for e in self.buffer.dead_letters], ['moon'])
+
+    def test_connection_errors_not_counted(self):
+        """Outages should be retried without dead-lettering anything."""
+        self.buffer.config = replace(self.config, max_retries=1)
+        self.buffer.learn('dark', 'forest', 0.1, 0.2, 1.5)
+        self.db.fail = True
+        for _ in range(3):
+            self.assertEqual(self.buffer.flush(), 0)
+        self.db.fail = False
+        self.assertEqual(self.buffer.flush(), 1)
+        self.assertEqual(self.buffer.stats()['dead_lettered'], 0)
+
+    def test_full_buffer_writes_through(self):
+        """New pairs beyond max_pending should be written (or dropped) directly."""
+        self.buffer.config = replace(self.config, max_pending=1)
+        self.buffer.learn('dark', 'forest', 0.1, 0.2, 1.5)
+        self.buffer.learn('pale', 'moon', 0.3, 0.1, 2.0)
+        self.assertEqual(len(self.buffer), 1)
+        self.assertEqual(self.db.calls[0][1][0][:2], ('pale', 'moon'))
+
+        self.db.fail = True
+        self.buffer.touch('old', 'tree')
+        self.assertEqual(len(self.buffer), 1)
+        self.assertEqual(self.buffer.stats()['dropped'], 1)
+
+    def test_close_flushes(self):
+        """Shutdown should write what is left, later writes go straight through."""
+        self.buffer.learn('dark', 'forest', 0.1, 0.2, 1.5)
+        self.buffer.close()
+        self.assertEqual(len(self.db.calls), 1)
+
+        self.buffer.touch('pale', 'moon')
+        self.assertEqual(len(self.db.calls), 2)
+
+
+class TestPostgresDataWriteBehind(unittest.TestCase):
+    """learn_bond / mark_bond_used through the buffer."""
+
+    def setUp(self):
+        self.db = RecordingDB()
+        patcher = patch('storm_logos.data.write_behind.execute_values', self.db.execute_values)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.cache = CoordinateCache(CacheConfig(max_size=100, redis_url=''))
+        with patch.object(PostgresData, 'load_coordinates', return_value=0):
+            self.data = PostgresData(cache=self.cache, write_behind=True)
+        self.data._write_buffer.config = LearningConfig(flush_size=100, flush_interval=60.0)
+        self.data._connection = self.db.connection
+        self.addCleanup(self.data._write_buffer.close)
+
+    def test_learn_bond_buffered(self):
+        """Learning should not write until flushed, but reads see it."""
+        self.cache.store('learned_bond', 'pale|moon', None)
+
+        first = self.data.learn_bond('pale', 'moon', A=0.1, S=0.2, tau=1.5)
+        second = self.data.learn_bond('pale', 'moon', A=0.9, S=0.9, tau=3.0)
+        self.assertEqual(self.db.calls, [])
+        self.assertEqual((first.variety, second.variety), (1, 2))
+        self.assertEqual(second.A, 0.1)
+
+        learned = self.data.get_learned_bond('pale', 'moon')
+        self.assertEqual((learned.A, learned.variety), (0.1, 2))
+
+        self.assertEqual(self.data.flush_learned(), 1)
+        self.assertEqual(self.db.calls[0][1][0][-1], 2)
+        self.assertFalse(self.cache.lookup('learned_bond', 'pale|moon')[0])
+
+    def test_learn_bond_skips_table_read(self):
+        """A cache miss should not read learned_bonds on the request path."""
+        bond = self.data.learn_bond('pale', 'moon', A=0.1, S=0.2, tau=1.5)
+        self.assertEqual((bond.A, bond.variety), (0.1, 1))
+        self.db.conn.cursor.assert_not_called()
+
+        stored = Bond(adj='dark', noun='forest', A=0.4, S=0.1, tau=2.0, variety=3)
+        bond = self.data.learn_bond('dark', 'forest', A=0.9, S=0.9, tau=3.0, existing=stored)
+        self.assertEqual((bond.A, bond.variety), (0.4, 4))
+        self.db.conn.cursor.assert_not_called()
+
+    def test_mark_used_adds_to_stored(self):
+        """Buffered bumps should add to the stored use count."""
+        self.cache.store('learned_bond', 'dark|forest',
+                         Bond(adj='dark', noun='forest', A=0.1, variety=5))
+        self.assertTrue(self.data.mark_bond_used('Dark', 'forest'))
+        self.assertEqual(self.data.get_learned_bond('dark', 'forest').variety, 6)
+        self.assertEqual(self.db.calls, [])
+
+    def test_mark_used_unknown_bond(self):
+        """Unknown bonds should report False and not be counted by a later learn."""
+        self.cache.store('learned_bond', 'pale|moon', None)
+        self.assertFalse(self.data.mark_bond_used('pale', 'moon'))
+        self.assertEqual(len(self.data._write_buffer), 0)
+
+        self.assertEqual(self.data.learn_bond('pale', 'moon', A=0.1, S=0.2, tau=1.5).variety, 1)
+        self.data.flush_learned()
+        self.assertEqual(self.db.calls[0][1][0][-1], 1)
+
+    def test_close_flushes(self):
+        """Closing PostgresData should flush the buffer first."""
+        self.cache.store('learned_bond', 'dark|forest', Bond(adj='dark', noun='forest', variety=1))
+        self.data.mark_bond_used('dark', 'forest')
+        self.data.close()
+        self.assertEqual(len(self.db.calls), 1)
+
+
+def run_tests():
+    """Run all tests and print summary."""
+    print("=" * 60)
+    print("Learned Bond Write-Behind Tests")
+    print("=" * 60)
+
+    loader = unittest.TestLoader()
+    suite = loader.loadTestsFromModule(sys.modules[__name__])
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    print("\n" + "=" * 60)
+    print(f"Tests run: {result.testsRun}")
+    print(f"Failures: {len(result.failures)}")
+    print(f"Errors: {len(result.errors)}")
+    print("=" * 60)
+
+    return len(result.failures) + len(result.errors)
+
+
+if __name__ == "__main__":
+    sys.exit(run_tests())